@@ -8,17 +8,66 @@
 # - Listens on Unix socket for JSON-RPC 2.0 requests
 # - Executes GPL tools (shellcheck, hadolint, yamllint)
 # - Returns results in structured format
-# - Single-threaded, sequential execution model
+# - One thread per connection reads requests; tool runs (execute,
+#   execute_many) go to a bounded pool of worker threads, so requests of
+#   one or several connections run concurrently and are answered as they
+#   finish. Other methods are answered right away.
+#
+# Worker pool:
+# - --workers tool runs at a time, --tool-limit TOOL=N caps a single tool
+# - at most --queue-size runs wait for a worker; further ones are turned
+#   away with a "server busy" error (SERVER_BUSY) for the client to retry
+# - a run is killed after the request's "timeout_ms", or as soon as its
+#   length-prefixed connection closes; runs still queued for a closed
+#   connection are dropped
+#
+# Streaming:
+# - on length-prefixed connections, an execute request with "stream": true
+#   gets the tool's output as it is produced, in notifications
+#   {"method": "output", "params": {"id", "stream", "data"}} of at most
+#   OUTPUT_CHUNK_SIZE bytes, followed by the response (with "streamed":
+#   true and empty stdout/stderr). Output never piles up in the server: a
+#   client that reads slowly slows the tool down instead.
+# - execute_many with "stream": true sends each file's share of stdout the
+#   same way, as it is split off, with the file in place of the stream
+#   name. The tool's output is split while it runs, never held whole.
+#
+# Content over IPC:
+# - execute takes the content to check in "stdin" (text) or "stdin_base64"
+#   (bytes) and pipes it to the tool (e.g. shellcheck -), so the sidecar
+#   does not need to see the client's files. Without either, tools get an
+#   empty stdin.
+#
+# Framing:
+# - legacy: one request per connection, read until the client half-closes
+#   the socket; the response is followed by closing the connection
+# - length-prefixed: a persistent connection carrying frames of a 4-byte
+#   big-endian length and a JSON message, agreed on with the "negotiate"
+#   method. Clients may send further requests before reading responses.
+# Legacy requests start with "{" (or "[" for a batch), framed connections
+# with a length header.
+#
+# Batches (JSON-RPC 2.0 arrays of requests) work in both framings. The
+# execute_many method runs shellcheck, hadolint or yamllint once over a
+# list of files and splits the findings per file.
 
 import argparse
+import base64
+import binascii
+import codecs
 import json
 import logging
 import os
+import re
 import socket
+import struct
 import subprocess
 import sys
+import threading
+import time
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 # Configure logging
 logging.basicConfig(
@@ -28,6 +77,142 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+FRAMING_LEGACY = "legacy"
+FRAMING_LENGTH_PREFIXED = "length-prefixed"
+
+# Length header of a frame
+FRAME_HEADER = struct.Struct(">I")
+
+# Largest frame accepted on a persistent connection
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+# Largest legacy request
+MAX_LEGACY_REQUEST = 1024 * 1024
+
+# Largest piece of tool output sent in one "output" notification (bytes)
+OUTPUT_CHUNK_SIZE = 64 * 1024
+
+# Tool runs executing at once, and waiting for a worker, by default
+DEFAULT_WORKERS = os.cpu_count() or 2
+DEFAULT_QUEUE_SIZE = 64
+
+# JSON-RPC error code of a request turned away because the queue is full
+SERVER_BUSY = -32001
+
+# Timeout of a tool run whose request sets no "timeout_ms"
+DEFAULT_TIMEOUT_MS = 30000
+
+# Seconds between checks whether the client of a tool run went away
+CANCEL_POLL_INTERVAL = 0.2
+
+# Methods that run a tool and therefore go through the worker pool
+TOOL_METHODS = ("execute", "execute_many")
+
+# Protocol features announced in the negotiate result
+FEATURES = ("batch", "execute_many", "stream", "stdin")
+
+
+class SplitError(Exception):
+    """Output of a multi-file tool run could not be split per file."""
+
+
+class RunCancelled(Exception):
+    """The client of a tool run went away, so the run was killed."""
+
+
+# yamllint -f parsable: "path:line:column: [level] message (rule)"
+YAMLLINT_LINE = re.compile(r"^(.*):\d+:\d+: \[(error|warning)\]")
+
+
+class _LineReader:
+    """Complete lines out of text that arrives in pieces."""
+
+    def __init__(self):
+        self._partial = ""
+
+    def feed(self, text: str) -> List[str]:
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        return lines
+
+    def close(self) -> List[str]:
+        """The last line, if the text did not end with a newline."""
+        partial, self._partial = self._partial, ""
+        return [partial] if partial else []
+
+
+class _JSONArrayReader:
+    """
+    Elements of a JSON array out of text that arrives in pieces.
+
+    Anything before the first "[" is skipped, e.g. '{"comments":' of
+    shellcheck's json1 format. Only the element being read is held.
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._state = "before"  # "before", "inside" or "after" the array
+        self._after_element = False  # the next element needs a "," first
+
+    def feed(self, text: str) -> List[Any]:
+        """
+        Elements completed by text.
+
+        Raises:
+            ValueError: The text is no JSON array
+        """
+        if self._state == "after":
+            return []  # whatever follows the array, e.g. json1's "}"
+        self._buffer += text
+        elements = []
+        while self._state != "after":
+            if self._state == "before":
+                start = self._buffer.find("[")
+                if start < 0:
+                    break
+                self._buffer = self._buffer[start + 1 :]
+                self._state = "inside"
+            self._buffer = self._buffer.lstrip()
+            if self._buffer.startswith("]"):
+                self._buffer = self._buffer[1:]
+                self._state = "after"
+            elif self._after_element:
+                if not self._buffer:
+                    break
+                if not self._buffer.startswith(","):
+                    raise ValueError(f"expected ',' at {self._buffer[:20]!r}")
+                self._buffer = self._buffer[1:]
+                self._after_element = False
+            elif not self._buffer:
+                break
+            else:
+                try:
+                    element, end = self._decoder.raw_decode(self._buffer)
+                except ValueError:
+                    break  # incomplete so far; wait for more text
+                if end == len(self._buffer) and not isinstance(
+                    element, (dict, list, str)
+                ):
+                    break  # a number or literal may go on in the next piece
+                elements.append(element)
+                self._buffer = self._buffer[end:]
+                self._after_element = True
+        return elements
+
+    def close(self) -> List[Any]:
+        """
+        Check that the text ended with the array (or was empty).
+
+        Raises:
+            ValueError: The array is incomplete
+        """
+        if self._state == "inside" or (
+            self._state == "before" and self._buffer.strip()
+        ):
+            raise ValueError(f"truncated JSON array: {self._buffer[:80]!r}")
+        return []
+
 
 class GPLToolExecutor:
     """Executes GPL-licensed validation tools."""
@@ -39,7 +224,16 @@ class GPLToolExecutor:
     }
 
     @classmethod
-    def execute(cls, tool: str, args: List[str], cwd: Optional[str] = None) -> Dict[str, Any]:
+    def execute(
+        cls,
+        tool: str,
+        args: List[str],
+        cwd: Optional[str] = None,
+        on_output: Optional[Callable[[str, str], None]] = None,
+        stdin: Optional[bytes] = None,
+        timeout: float = DEFAULT_TIMEOUT_MS / 1000,
+        cancelled: Optional[threading.Event] = None,
+    ) -> Dict[str, Any]:
         """
         Execute a GPL tool and return results.
 
@@ -47,9 +241,17 @@ class GPLToolExecutor:
             tool: Tool name (shellcheck, hadolint, yamllint)
             args: Command-line arguments for the tool
             cwd: Working directory (default: /workspace)
+            on_output: Called with the stream name ("stdout"/"stderr") and
+                each piece of output as the tool produces it; the result
+                then has empty stdout/stderr and "streamed" set
+            stdin: Content piped to the tool (default: none)
+            timeout: Seconds the tool may run
+            cancelled: Set when nobody waits for the result any more; the
+                tool is then killed
 
         Returns:
-            Dict with keys: success, stdout, stderr, exit_code
+            Dict with keys: success, stdout, stderr, exit_code (and
+            streamed when on_output was given)
         """
         if tool not in cls.SUPPORTED_TOOLS:
             return {
@@ -74,19 +276,24 @@ class GPLToolExecutor:
         logger.info(f"Executing: {' '.join(cmd)} (cwd={working_dir})")
 
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=working_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=30,
-                text=True,
-            )
+            if on_output is not None:
+                exit_code = cls._run_streamed(
+                    cmd, working_dir, on_output, timeout, stdin, cancelled
+                )
+                return {
+                    "success": exit_code == 0,
+                    "stdout": "",
+                    "stderr": "",
+                    "exit_code": exit_code,
+                    "streamed": True,
+                }
+
+            result = cls._run(cmd, working_dir, timeout, stdin, cancelled)
 
             return {
                 "success": result.returncode == 0,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
+                "stdout": result.stdout.decode("utf-8", errors="replace"),
+                "stderr": result.stderr.decode("utf-8", errors="replace"),
                 "exit_code": result.returncode,
             }
 
@@ -94,9 +301,16 @@ class GPLToolExecutor:
             return {
                 "success": False,
                 "stdout": "",
-                "stderr": f"Tool execution timed out after 30s",
+                "stderr": f"Tool execution timed out after {timeout:g}s",
                 "exit_code": 124,
             }
+        except RunCancelled:
+            return {
+                "success": False,
+                "stdout": "",
+                "stderr": "Tool execution cancelled",
+                "exit_code": 130,
+            }
         except Exception as e:
             return {
                 "success": False,
@@ -105,25 +319,438 @@ class GPLToolExecutor:
                 "exit_code": 1,
             }
 
+    @staticmethod
+    def _wait(
+        proc: subprocess.Popen,
+        wait: Callable[[float], Any],
+        timeout: float,
+        cancelled: Optional[threading.Event],
+    ) -> Any:
+        """
+        Call wait(seconds) until it returns, killing the command on timeout
+        or once cancelled is set.
+
+        Raises:
+            subprocess.TimeoutExpired: The command was killed after timeout
+            RunCancelled: The command was killed because of cancelled
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = max(0.0, deadline - time.monotonic())
+            if cancelled is not None:
+                remaining = min(remaining, CANCEL_POLL_INTERVAL)
+            try:
+                return wait(remaining)
+            except subprocess.TimeoutExpired:
+                gone = cancelled is not None and cancelled.is_set()
+                if not gone and time.monotonic() < deadline:
+                    continue
+                proc.kill()
+                proc.wait()
+                if gone:
+                    raise RunCancelled()
+                raise subprocess.TimeoutExpired(proc.args, timeout)
+
+    @classmethod
+    def _run(
+        cls,
+        cmd: List[str],
+        cwd: str,
+        timeout: float,
+        stdin: Optional[bytes] = None,
+        cancelled: Optional[threading.Event] = None,
+    ) -> "subprocess.CompletedProcess[bytes]":
+        """
+        Run a command to completion, collecting its output.
+
+        Raises:
+            subprocess.TimeoutExpired: The command was killed after timeout
+            RunCancelled: The command was killed because of cancelled
+        """
+        with subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            stdin=subprocess.PIPE if stdin is not None else subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        ) as proc:
+            feed = [stdin]
+
+            def communicate(seconds: float) -> Tuple[bytes, bytes]:
+                # Input goes in with the first call only
+                data, feed[0] = feed[0], None
+                return proc.communicate(data, timeout=seconds)
+
+            stdout, stderr = cls._wait(proc, communicate, timeout, cancelled)
+        return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+    @classmethod
+    def _run_streamed(
+        cls,
+        cmd: List[str],
+        cwd: str,
+        on_output: Callable[[str, str], None],
+        timeout: float,
+        stdin: Optional[bytes] = None,
+        cancelled: Optional[threading.Event] = None,
+    ) -> int:
+        """
+        Run a command, passing its output on in pieces as it is produced.
+
+        Returns:
+            Exit code
+
+        Raises:
+            subprocess.TimeoutExpired: The command was killed after timeout
+            RunCancelled: The command was killed because of cancelled
+        """
+        proc = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            stdin=subprocess.PIPE if stdin is not None else subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+        def feed():
+            try:
+                proc.stdin.write(stdin)
+            except BrokenPipeError:
+                pass  # the tool stopped reading, e.g. after a fatal error
+            finally:
+                try:
+                    proc.stdin.close()
+                except BrokenPipeError:
+                    pass
+
+        def pump(pipe, stream: str):
+            # Incremental decoding keeps multi-byte characters split across
+            # reads intact
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            with pipe:
+                while True:
+                    chunk = pipe.read1(OUTPUT_CHUNK_SIZE)
+                    text = decoder.decode(chunk, final=not chunk)
+                    if text:
+                        on_output(stream, text)
+                    if not chunk:
+                        return
+
+        pumps = [
+            threading.Thread(target=pump, args=(proc.stdout, "stdout"), daemon=True),
+            threading.Thread(target=pump, args=(proc.stderr, "stderr"), daemon=True),
+        ]
+        if stdin is not None:
+            # Written from a thread of its own: a tool may fill its output
+            # pipes before it has read all of its input
+            pumps.append(threading.Thread(target=feed, daemon=True))
+        for thread in pumps:
+            thread.start()
+        try:
+            return cls._wait(
+                proc, lambda seconds: proc.wait(seconds), timeout, cancelled
+            )
+        finally:
+            for thread in pumps:
+                thread.join()
+
+    # Output format each splittable tool runs with in execute_many()
+    SPLIT_FORMATS = {
+        "shellcheck": ["-f", "json1"],
+        "hadolint": ["-f", "json"],
+        "yamllint": ["-f", "parsable"],
+    }
+
+    @classmethod
+    def execute_many(
+        cls,
+        tool: str,
+        files: List[str],
+        args: List[str],
+        cwd: Optional[str] = None,
+        timeout: float = DEFAULT_TIMEOUT_MS / 1000,
+        cancelled: Optional[threading.Event] = None,
+        on_output: Optional[Callable[[str, str], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run a tool once over several files and split its findings per file.
+
+        Each file's share of the output comes back in the tool's
+        single-file format: a JSON array of comments for shellcheck,
+        "path:line code level: message" lines for hadolint and parsable
+        lines for yamllint. A file's exit code is 1 if it has findings
+        that fail the tool (any finding; errors only for yamllint).
+
+        The tool's output is split while it runs, without holding all of
+        it. With on_output, a file's share is passed on in pieces as it is
+        found (the pieces of a file joined give its stdout) and the result
+        has empty stdouts and "streamed" set.
+
+        Args:
+            tool: Tool name (shellcheck, hadolint, yamllint)
+            files: Files to check, as the client named them
+            args: Further command-line arguments placed before the files
+            cwd: Working directory (default: /workspace)
+            timeout: Seconds the tool may run
+            cancelled: Set when nobody waits for the result any more; the
+                tool is then killed
+            on_output: Called with the file and each piece of its output
+
+        Returns:
+            Dict with keys: exit_code, stderr, files (one dict of file,
+            exit_code and stdout per file, in input order)
+
+        Raises:
+            SplitError: The tool failed or its output could not be split
+        """
+        if tool not in cls.SPLIT_FORMATS:
+            raise SplitError(f"Cannot split output of {tool}")
+        tool_path = cls.SUPPORTED_TOOLS[tool]
+        if not os.path.exists(tool_path):
+            raise SplitError(f"Tool not found: {tool_path}")
+
+        working_dir = cwd or "/workspace"
+        index = {os.path.normpath(os.path.join(working_dir, f)): f for f in files}
+
+        def lookup(reported: str) -> str:
+            match = index.get(os.path.normpath(os.path.join(working_dir, reported)))
+            if match is None:
+                raise SplitError(f"unknown file {reported}")
+            return match
+
+        outputs: Dict[str, List[str]] = {f: [] for f in files}
+        emit = on_output or (lambda path, data: outputs[path].append(data))
+        failing: Dict[str, None] = {}  # files with failing findings, in order
+
+        def take(finding: Any) -> Optional[Tuple[str, str, bool]]:
+            """File, output line and whether it fails, of one finding."""
+            if tool == "shellcheck":
+                path = lookup(finding.get("file", ""))
+                sep = ", " if path in failing else "["
+                return path, sep + json.dumps(finding), True
+            if tool == "hadolint":
+                path = lookup(finding.get("file", ""))
+                line = (
+                    f"{finding.get('file')}:{finding.get('line')} "
+                    f"{finding.get('code')} {finding.get('level')}: "
+                    f"{finding.get('message')}\n"
+                )
+                return path, line, True
+            match = YAMLLINT_LINE.match(finding)
+            if match is None:
+                return None
+            return lookup(match.group(1)), f"{finding}\n", match.group(2) == "error"
+
+        reader = _LineReader() if tool == "yamllint" else _JSONArrayReader()
+        stderr: List[str] = []
+        errors: List[Exception] = []
+
+        def parse(read: Callable[[], List[Any]]):
+            if errors:
+                return  # the rest of the output is only drained
+            pieces: Dict[str, List[str]] = {}
+            try:
+                for finding in read():
+                    taken = take(finding)
+                    if taken is None:
+                        continue
+                    path, line, fails = taken
+                    pieces.setdefault(path, []).append(line)
+                    if fails:
+                        failing[path] = None
+            except (SplitError, ValueError, AttributeError) as e:
+                errors.append(e)
+                return
+            # One piece per file and read, rather than one per finding
+            for path, lines in pieces.items():
+                emit(path, "".join(lines))
+
+        def split(stream: str, data: str):
+            if stream == "stderr":
+                stderr.append(data)
+            else:
+                parse(lambda: reader.feed(data))
+
+        cmd = [tool_path] + cls.SPLIT_FORMATS[tool] + args + files
+        logger.info(f"Executing: {tool} over {len(files)} files (cwd={working_dir})")
+        try:
+            exit_code = cls._run_streamed(
+                cmd, working_dir, split, timeout, cancelled=cancelled
+            )
+        except subprocess.TimeoutExpired:
+            raise SplitError(f"Tool execution timed out after {timeout:g}s")
+        except RunCancelled:
+            raise SplitError("Tool execution cancelled")
+        except OSError as e:
+            raise SplitError(f"Execution error: {e}")
+        if exit_code not in (0, 1):
+            raise SplitError(f"exit code {exit_code}: {''.join(stderr).strip()}")
+        parse(reader.close)
+        if errors:
+            error = errors[0]
+            if isinstance(error, SplitError):
+                raise error
+            raise SplitError(f"unexpected output: {error}")
+        if exit_code and not failing:
+            raise SplitError(f"exit code {exit_code} without findings")
+        if tool == "shellcheck":
+            for path in failing:
+                emit(path, "]")
+
+        result: Dict[str, Any] = {
+            "exit_code": exit_code,
+            "stderr": "".join(stderr),
+            "files": [
+                {
+                    "file": path,
+                    "exit_code": int(path in failing),
+                    "stdout": "".join(outputs[path]),
+                }
+                for path in files
+            ],
+        }
+        if on_output is not None:
+            result["streamed"] = True
+        return result
+
+
+class WorkerPool:
+    """
+    Bounded pool of threads running tool invocations.
+
+    Jobs wait in one queue in arrival order. A free worker takes the oldest
+    job whose tool is below its concurrency cap, so a capped tool does not
+    hold up the others. Jobs beyond the workers plus queue_size waiting
+    ones are not accepted.
+    """
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        tool_limits: Optional[Dict[str, int]] = None,
+    ):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.tool_limits = dict(tool_limits or {})
+        self._queue: Deque[Tuple[str, Callable[[], None]]] = deque()
+        self._running: Dict[str, int] = {}
+        self._cond = threading.Condition()
+        self._closed = False
+        for index in range(workers):
+            threading.Thread(
+                target=self._work, name=f"gpl-worker-{index}", daemon=True
+            ).start()
+
+    def submit(self, tool: str, job: Callable[[], None]) -> bool:
+        """Queue a job running the given tool.
+
+        Returns:
+            False if the queue is full (or the pool closed) and the job was
+            not accepted
+        """
+        with self._cond:
+            pending = len(self._queue) + sum(self._running.values())
+            if self._closed or pending >= self.workers + self.queue_size:
+                return False
+            self._queue.append((tool, job))
+            self._cond.notify()
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        """Number of workers, running jobs and queued jobs."""
+        with self._cond:
+            return {
+                "workers": self.workers,
+                "running": sum(self._running.values()),
+                "queued": len(self._queue),
+            }
+
+    def close(self):
+        """Stop the workers once they finish their current job."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def _take(self) -> Optional[Tuple[str, Callable[[], None]]]:
+        """Dequeue the oldest job whose tool may run now (lock held)."""
+        for index, (tool, job) in enumerate(self._queue):
+            if self._running.get(tool, 0) < self.tool_limits.get(tool, self.workers):
+                del self._queue[index]
+                self._running[tool] = self._running.get(tool, 0) + 1
+                return tool, job
+        return None
+
+    def _work(self):
+        while True:
+            with self._cond:
+                taken = self._take()
+                while taken is None:
+                    if self._closed:
+                        return
+                    self._cond.wait()
+                    taken = self._take()
+            tool, job = taken
+            try:
+                job()
+            except Exception as e:
+                logger.error(f"Worker error: {e}")
+            finally:
+                with self._cond:
+                    self._running[tool] -= 1
+                    # A finished job may unblock a job of a capped tool
+                    self._cond.notify_all()
+
+
+class _Batch:
+    """Collects the responses to a batch and replies once all are in."""
+
+    def __init__(self, size: int, reply: Callable[[Any], None]):
+        self._responses: List[Optional[Dict[str, Any]]] = [None] * size
+        self._left = size
+        self._lock = threading.Lock()
+        self._reply = reply
+
+    def set(self, index: int, response: Optional[Dict[str, Any]]):
+        with self._lock:
+            self._responses[index] = response
+            self._left -= 1
+            if self._left:
+                return
+        answered = [r for r in self._responses if r is not None]
+        self._reply(answered or None)
+
 
 class JSONRPCServer:
     """JSON-RPC 2.0 server over Unix socket."""
 
-    def __init__(self, socket_path: str):
+    def __init__(self, socket_path: str, pool: Optional[WorkerPool] = None):
         self.socket_path = socket_path
         self.executor = GPLToolExecutor()
+        self.pool = pool or WorkerPool()
 
-    def handle_request(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
+    def handle_request(
+        self,
+        request_data: Dict[str, Any],
+        notify: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cancelled: Optional[threading.Event] = None,
+    ) -> Dict[str, Any]:
         """
         Handle JSON-RPC 2.0 request.
 
         Supported methods:
         - execute: Execute a GPL tool
+        - execute_many: Execute a GPL tool once over several files
         - list_tools: List available tools
         - health: Health check
+        - negotiate: Agree on the framing of further requests
 
         Args:
             request_data: JSON-RPC 2.0 request dict
+            notify: Sends a notification to the client ahead of the
+                response (None: the connection cannot stream)
+            cancelled: Set once the client went away; tool runs are then
+                killed
 
         Returns:
             JSON-RPC 2.0 response dict
@@ -143,19 +770,112 @@ class JSONRPCServer:
 
         # Route to method handler
         if method == "execute":
-            return self._handle_execute(request_id, params)
+            return self._handle_execute(request_id, params, notify, cancelled)
+        elif method == "execute_many":
+            return self._handle_execute_many(request_id, params, notify, cancelled)
         elif method == "list_tools":
             return self._handle_list_tools(request_id)
         elif method == "health":
             return self._handle_health(request_id)
+        elif method == "negotiate":
+            return self._handle_negotiate(request_id, params)
         else:
             return self._error_response(request_id, -32601, f"Method not found: {method}")
 
-    def _handle_execute(self, request_id: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+    def dispatch(
+        self,
+        message: Any,
+        reply: Callable[[Optional[Any]], None],
+        notify: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cancelled: Optional[threading.Event] = None,
+    ):
+        """
+        Handle a JSON-RPC 2.0 request or batch (array of requests).
+
+        Tool runs go through the worker pool, so reply() may be called
+        later and from a worker thread. It is called exactly once: with the
+        response, the list of responses to a batch, or None if there is
+        nothing to answer (requests without an id are notifications).
+        notify() sends streamed output ahead of the reply, and tool runs
+        stop once cancelled is set (see handle_request).
+        """
+        if not isinstance(message, list):
+            self._dispatch_request(message, reply, notify, cancelled)
+            return
+        if not message:
+            reply(self._error_response(None, -32600, "Invalid Request"))
+            return
+        batch = _Batch(len(message), reply)
+        for index, request in enumerate(message):
+            self._dispatch_request(
+                request,
+                lambda response, index=index: batch.set(index, response),
+                notify,
+                cancelled,
+            )
+
+    def _dispatch_request(
+        self,
+        request: Any,
+        reply: Callable[[Optional[Dict[str, Any]]], None],
+        notify: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cancelled: Optional[threading.Event] = None,
+    ):
+        """Answer a single request now, or once a worker has run it."""
+        if not isinstance(request, dict):
+            reply(self._error_response(None, -32600, "Invalid Request"))
+            return
+        if request.get("method") not in TOOL_METHODS:
+            reply(self._respond(request, notify))
+            return
+
+        def job():
+            if cancelled is not None and cancelled.is_set():
+                reply(None)  # the client went away while this waited
+            else:
+                reply(self._respond(request, notify, cancelled))
+
+        params = request.get("params")
+        tool = str(params.get("tool")) if isinstance(params, dict) else ""
+        if not self.pool.submit(tool, job):
+            stats = self.pool.stats()
+            logger.warning(f"Queue full ({stats['queued']} waiting), rejecting {tool}")
+            reply(
+                self._error_response(
+                    request.get("id"), SERVER_BUSY, "Server busy: queue full", stats
+                )
+                if "id" in request
+                else None
+            )
+
+    def _respond(
+        self,
+        request: Dict[str, Any],
+        notify: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cancelled: Optional[threading.Event] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Response to a request (None for a notification)."""
+        try:
+            response = self.handle_request(request, notify, cancelled)
+        except Exception as e:
+            logger.error(f"Request handling error: {e}")
+            response = self._error_response(
+                request.get("id"), -32603, f"Internal error: {str(e)}"
+            )
+        return response if "id" in request else None
+
+    def _handle_execute(
+        self,
+        request_id: Any,
+        params: Dict[str, Any],
+        notify: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cancelled: Optional[threading.Event] = None,
+    ) -> Dict[str, Any]:
         """Handle 'execute' method."""
         tool = params.get("tool")
         args = params.get("args", [])
         cwd = params.get("cwd")
+        timeout = self._timeout(params)
 
         if not tool:
             return self._error_response(request_id, -32602, "Missing 'tool' parameter")
@@ -163,7 +883,42 @@ class JSONRPCServer:
         if not isinstance(args, list):
             return self._error_response(request_id, -32602, "'args' must be a list")
 
-        result = self.executor.execute(tool, args, cwd)
+        if timeout is None:
+            return self._error_response(
+                request_id, -32602, "'timeout_ms' must be a positive number"
+            )
+
+        stdin: Optional[bytes] = None
+        if "stdin_base64" in params:
+            try:
+                stdin = base64.b64decode(params["stdin_base64"], validate=True)
+            except (binascii.Error, TypeError, ValueError):
+                return self._error_response(
+                    request_id, -32602, "'stdin_base64' must be base64"
+                )
+        elif "stdin" in params:
+            if not isinstance(params["stdin"], str):
+                return self._error_response(request_id, -32602, "'stdin' must be a string")
+            stdin = params["stdin"].encode("utf-8")
+
+        if params.get("stream") and notify is not None and request_id is not None:
+
+            def on_output(stream: str, data: str):
+                notify(
+                    {
+                        "jsonrpc": "2.0",
+                        "method": "output",
+                        "params": {"id": request_id, "stream": stream, "data": data},
+                    }
+                )
+
+            result = self.executor.execute(
+                tool, args, cwd, on_output, stdin, timeout, cancelled
+            )
+        else:
+            result = self.executor.execute(
+                tool, args, cwd, stdin=stdin, timeout=timeout, cancelled=cancelled
+            )
 
         return {
             "jsonrpc": "2.0",
@@ -171,6 +926,67 @@ class JSONRPCServer:
             "result": result,
         }
 
+    def _handle_execute_many(
+        self,
+        request_id: Any,
+        params: Dict[str, Any],
+        notify: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cancelled: Optional[threading.Event] = None,
+    ) -> Dict[str, Any]:
+        """Handle 'execute_many' method."""
+        tool = params.get("tool")
+        files = params.get("files")
+        args = params.get("args", [])
+        timeout = self._timeout(params)
+
+        if not tool:
+            return self._error_response(request_id, -32602, "Missing 'tool' parameter")
+        if not isinstance(files, list) or not files:
+            return self._error_response(
+                request_id, -32602, "'files' must be a non-empty list"
+            )
+        if not isinstance(args, list):
+            return self._error_response(request_id, -32602, "'args' must be a list")
+        if timeout is None:
+            return self._error_response(
+                request_id, -32602, "'timeout_ms' must be a positive number"
+            )
+
+        on_output: Optional[Callable[[str, str], None]] = None
+        if params.get("stream") and notify is not None and request_id is not None:
+
+            def send(path: str, data: str):
+                notify(
+                    {
+                        "jsonrpc": "2.0",
+                        "method": "output",
+                        "params": {"id": request_id, "stream": path, "data": data},
+                    }
+                )
+
+            on_output = send
+
+        try:
+            result = self.executor.execute_many(
+                tool, files, args, params.get("cwd"), timeout, cancelled, on_output
+            )
+        except SplitError as e:
+            return self._error_response(request_id, -32000, f"Cannot split output: {e}")
+
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "result": result,
+        }
+
+    @staticmethod
+    def _timeout(params: Dict[str, Any]) -> Optional[float]:
+        """Seconds a tool run may take from "timeout_ms" (None if invalid)."""
+        timeout_ms = params.get("timeout_ms", DEFAULT_TIMEOUT_MS)
+        if isinstance(timeout_ms, bool) or not isinstance(timeout_ms, (int, float)):
+            return None
+        return timeout_ms / 1000.0 if timeout_ms > 0 else None
+
     def _handle_list_tools(self, request_id: Any) -> Dict[str, Any]:
         """Handle 'list_tools' method."""
         tools = []
@@ -209,20 +1025,47 @@ class JSONRPCServer:
         return {
             "jsonrpc": "2.0",
             "id": request_id,
-            "result": {"status": "healthy", "server": "huskycat-gpl-sidecar"},
+            "result": {
+                "status": "healthy",
+                "server": "huskycat-gpl-sidecar",
+                "pool": self.pool.stats(),
+            },
         }
 
-    def _error_response(self, request_id: Any, code: int, message: str) -> Dict[str, Any]:
-        """Create JSON-RPC 2.0 error response."""
+    def _handle_negotiate(self, request_id: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle 'negotiate' method: pick a framing the client offered."""
+        offered = params.get("framing", [])
+        framing = (
+            FRAMING_LENGTH_PREFIXED
+            if FRAMING_LENGTH_PREFIXED in offered
+            else FRAMING_LEGACY
+        )
         return {
             "jsonrpc": "2.0",
             "id": request_id,
-            "error": {
-                "code": code,
-                "message": message,
+            "result": {
+                "framing": framing,
+                "server": "huskycat-gpl-sidecar",
+                "features": list(FEATURES),
             },
         }
 
+    def _error_response(
+        self, request_id: Any, code: int, message: str, data: Any = None
+    ) -> Dict[str, Any]:
+        """Create JSON-RPC 2.0 error response."""
+        error: Dict[str, Any] = {
+            "code": code,
+            "message": message,
+        }
+        if data is not None:
+            error["data"] = data
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "error": error,
+        }
+
     def start(self):
         """Start the Unix socket server."""
         # Remove stale socket
@@ -232,7 +1075,7 @@ class JSONRPCServer:
         # Create socket
         sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         sock.bind(self.socket_path)
-        sock.listen(5)
+        sock.listen(socket.SOMAXCONN)
 
         # Set socket permissions
         os.chmod(self.socket_path, 0o666)
@@ -242,38 +1085,138 @@ class JSONRPCServer:
         try:
             while True:
                 conn, _ = sock.accept()
-                try:
-                    self._handle_connection(conn)
-                finally:
-                    conn.close()
+                # Persistent connections stay open, so each gets a thread
+                threading.Thread(
+                    target=self._serve_connection, args=(conn,), daemon=True
+                ).start()
         except KeyboardInterrupt:
             logger.info("Server shutting down")
         finally:
+            self.pool.close()
             sock.close()
             if os.path.exists(self.socket_path):
                 os.unlink(self.socket_path)
 
+    def _serve_connection(self, conn: socket.socket):
+        """Serve a client connection until it closes."""
+        try:
+            self._handle_connection(conn)
+        except Exception as e:
+            logger.error(f"Connection error: {e}")
+        finally:
+            conn.close()
+
     def _handle_connection(self, conn: socket.socket):
-        """Handle a single client connection."""
-        # Read request (max 1MB)
-        data = b""
+        """Handle a single client connection in the framing it starts with."""
+        first = conn.recv(1, socket.MSG_PEEK)
+        if not first:
+            return
+        if first in b"{[ \t\r\n":
+            self._handle_legacy(conn)
+        else:
+            self._handle_framed(conn)
+
+    def _handle_framed(self, conn: socket.socket):
+        """Answer length-prefixed requests until the client disconnects.
+
+        Responses are written as requests finish, which need not be the
+        order they arrived in; clients match them by id. Tool runs of the
+        connection are killed once the client disconnects.
+        """
+        send_lock = threading.Lock()
+        closed = threading.Event()
+
+        def reply(response: Optional[Any]):
+            if response is None:
+                return
+            try:
+                with send_lock:
+                    self._send_frame(conn, response)
+            except OSError as e:
+                logger.debug(f"Dropping response, client went away: {e}")
+
+        try:
+            self._read_framed(conn, reply, closed)
+        finally:
+            closed.set()
+
+    def _read_framed(
+        self,
+        conn: socket.socket,
+        reply: Callable[[Optional[Any]], None],
+        closed: threading.Event,
+    ):
+        """Dispatch length-prefixed requests until the client disconnects."""
         while True:
-            chunk = conn.recv(4096)
+            header = self._recv_exact(conn, FRAME_HEADER.size)
+            if header is None:
+                return
+            (size,) = FRAME_HEADER.unpack(header)
+            if size > MAX_FRAME_SIZE:
+                logger.warning("Frame too large, dropping connection")
+                return
+            payload = self._recv_exact(conn, size) if size else b""
+            if payload is None:
+                return
+
+            try:
+                message = json.loads(payload.decode("utf-8"))
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                logger.error(f"Invalid JSON: {e}")
+                reply(self._error_response(None, -32700, "Parse error"))
+                continue
+            self.dispatch(message, reply, notify=reply, cancelled=closed)
+
+    @staticmethod
+    def _recv_exact(conn: socket.socket, size: int) -> Optional[bytes]:
+        """Read exactly size bytes (None if the client disconnected)."""
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        received = 0
+        while received < size:
+            count = conn.recv_into(view[received:])
+            if not count:
+                return None
+            received += count
+        return bytes(buffer)
+
+    @staticmethod
+    def _send_frame(conn: socket.socket, message: Any):
+        """Send a JSON message as one length-prefixed frame."""
+        payload = json.dumps(message).encode("utf-8")
+        conn.sendall(FRAME_HEADER.pack(len(payload)) + payload)
+
+    def _handle_legacy(self, conn: socket.socket):
+        """Answer a single request read until the client half-closes."""
+        chunks = []
+        size = 0
+        while True:
+            chunk = conn.recv(65536)
             if not chunk:
                 break
-            data += chunk
-            if len(data) > 1024 * 1024:
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > MAX_LEGACY_REQUEST:
                 logger.warning("Request too large, dropping connection")
                 return
 
-        if not data:
+        if not chunks:
             return
+        data = b"".join(chunks)
 
         try:
-            request = json.loads(data.decode("utf-8"))
-            response = self.handle_request(request)
-            response_bytes = json.dumps(response).encode("utf-8")
-            conn.sendall(response_bytes)
+            message = json.loads(data.decode("utf-8"))
+            responses: List[Optional[Any]] = []
+            answered = threading.Event()
+
+            def reply(response: Optional[Any]):
+                responses.append(response)
+                answered.set()
+
+            self.dispatch(message, reply)
+            answered.wait()
+            if responses[0] is not None:
+                conn.sendall(json.dumps(responses[0]).encode("utf-8"))
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON: {e}")
             error = self._error_response(None, -32700, "Parse error")
@@ -294,8 +1237,37 @@ def main():
         default="/ipc/huskycat-gpl.sock",
         help="Unix socket path (default: /ipc/huskycat-gpl.sock)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Tool runs executing at once (default: {DEFAULT_WORKERS})",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=DEFAULT_QUEUE_SIZE,
+        help="Tool runs waiting for a worker before further ones are "
+        f"rejected as busy (default: {DEFAULT_QUEUE_SIZE})",
+    )
+    parser.add_argument(
+        "--tool-limit",
+        action="append",
+        default=[],
+        metavar="TOOL=N",
+        help="Run at most N instances of TOOL at once (repeatable)",
+    )
     args = parser.parse_args()
 
+    if args.workers < 1 or args.queue_size < 0:
+        parser.error("--workers must be at least 1 and --queue-size not negative")
+    tool_limits = {}
+    for limit in args.tool_limit:
+        tool, _, count = limit.partition("=")
+        if tool not in GPLToolExecutor.SUPPORTED_TOOLS or not count.isdigit():
+            parser.error(f"invalid --tool-limit {limit!r}")
+        tool_limits[tool] = max(1, int(count))
+
     # Create IPC directory if needed
     socket_dir = os.path.dirname(args.socket)
     if socket_dir:
@@ -304,8 +1276,11 @@ def main():
     logger.info(f"Starting HuskyCat GPL Sidecar Server")
     logger.info(f"License: GPL-3.0-only")
     logger.info(f"Socket: {args.socket}")
+    logger.info(f"Workers: {args.workers}, queue: {args.queue_size}")
 
-    server = JSONRPCServer(args.socket)
+    server = JSONRPCServer(
+        args.socket, WorkerPool(args.workers, args.queue_size, tool_limits)
+    )
     server.start()
 
 
@@ -77,6 +77,18 @@ def create_parser() -> argparse.ArgumentParser:
         dest="allow_warnings",
         help="Allow warnings to pass (treat warnings as success)",
     )
+    validate_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Number of concurrent validation workers (default: CPU count)",
+    )
+    validate_parser.add_argument(
+        "--since-last-pass",
+        action="store_true",
+        dest="since_last_pass",
+        help="Validate only files changed since the last fully successful run",
+    )
 
     # Auto-fix command
     autofix_parser = subparsers.add_parser(
@@ -194,6 +206,19 @@ def create_parser() -> argparse.ArgumentParser:
         dest="all_files",
         help="Remove all cache including schemas",
     )
+    clean_parser.add_argument(
+        "--cache",
+        action="store_true",
+        dest="cache_only",
+        help="Only remove cached validation results (.huskycat/cache)",
+    )
+    clean_parser.add_argument(
+        "--tools",
+        action="store_true",
+        dest="tools_only",
+        help="Only forget probed tool availability and versions "
+        "(~/.huskycat/toolcache.json)",
+    )
 
     # Status command
     subparsers.add_parser("status", help="Show HuskyCat status and configuration")
@@ -327,6 +352,8 @@ def _print_result(result, adapter):
         OutputFormat.JUNIT_XML,
     ):
         # For structured output, format the result data
+        if result.data and result.data.get("streamed"):
+            return  # Already written while validation ran
         if result.data:
             results = result.data.get("results", {})
             summary = {
@@ -165,6 +165,7 @@ class HuskyCat:
                 - interactive: Enable interactive prompts
                 - allow_warnings: Treat warnings as success
                 - container_mode: Force container execution
+                - max_workers: Concurrent validation workers (default: CPU count)
         """
         self.config = config or {}
         self.engine = ValidationEngine(
@@ -172,6 +173,7 @@ class HuskyCat:
             interactive=self.config.get("interactive", False),
             allow_warnings=self.config.get("allow_warnings", False),
             use_container=self.config.get("container_mode", False),
+            max_workers=self.config.get("max_workers"),
         )
         self.process_manager = ProcessManager()
         self.task_manager = get_task_manager()
@@ -207,13 +209,11 @@ class HuskyCat:
         if staged:
             validation_results = self.engine.validate_staged_files()
         else:
-            validation_results = {}
+            # Batch all explicit files so each tool runs once per chunk
+            files = [path for path in paths if path.is_file()]
+            validation_results = self.engine.validate_files(files, tools=tools)
             for path in paths:
-                if path.is_file():
-                    file_results = self.engine.validate_file(path, fix=fix, tools=tools)
-                    if file_results:
-                        validation_results[str(path)] = file_results
-                elif path.is_dir():
+                if path.is_dir():
                     dir_results = self.engine.validate_directory(path)
                     validation_results.update(dir_results)
 
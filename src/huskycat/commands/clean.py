@@ -6,6 +6,8 @@ import shutil
 from pathlib import Path
 
 from ..core.base import BaseCommand, CommandResult, CommandStatus
+from ..core.result_cache import ResultCache
+from ..core.tool_cache import ToolCache
 
 
 class CleanCommand(BaseCommand):
@@ -19,16 +21,29 @@ class CleanCommand(BaseCommand):
     def description(self) -> str:
         return "Clean cache and temporary files"
 
-    def execute(self, all_files: bool = False) -> CommandResult:
+    def execute(
+        self,
+        all_files: bool = False,
+        cache_only: bool = False,
+        tools_only: bool = False,
+    ) -> CommandResult:
         """
         Clean cache and temporary files.
 
         Args:
-            all_files: Remove all cache including schemas
+            all_files: Remove all cache including schemas, cached results and
+                remembered tool probes
+            cache_only: Only remove cached validation results
+            tools_only: Only forget remembered tool availability and versions
 
         Returns:
             CommandResult with cleanup status
         """
+        if cache_only:
+            return self._clean_result_cache()
+        if tools_only:
+            return self._clean_tool_cache()
+
         removed_items = []
 
         # Clean cache directory
@@ -49,6 +64,19 @@ class CleanCommand(BaseCommand):
                     removed_items.append(str(log_file))
                 self.log(f"Cleaned temporary files from {cache_dir}")
 
+        # Clean cached validation results
+        if all_files:
+            result_cache = ResultCache()
+            if result_cache.cache_dir.exists():
+                shutil.rmtree(result_cache.cache_dir)
+                removed_items.append(str(result_cache.cache_dir))
+                self.log(f"Removed result cache: {result_cache.cache_dir}")
+
+            tool_cache = ToolCache.shared()
+            if tool_cache.invalidate():
+                removed_items.append(str(tool_cache.path))
+                self.log(f"Removed tool cache: {tool_cache.path}")
+
         # Clean Python cache
         for cache_pattern in ["__pycache__", "*.pyc", ".pytest_cache", ".mypy_cache"]:
             for cache_item in Path(".").rglob(cache_pattern):
@@ -77,3 +105,25 @@ class CleanCommand(BaseCommand):
             return CommandResult(
                 status=CommandStatus.SUCCESS, message="Nothing to clean"
             )
+
+    def _clean_result_cache(self) -> CommandResult:
+        """Remove every cached validation result"""
+        result_cache = ResultCache()
+        removed = result_cache.clear()
+        self.log(f"Removed {removed} cached results from {result_cache.cache_dir}")
+        return CommandResult(
+            status=CommandStatus.SUCCESS,
+            message=f"Removed {removed} cached results",
+            data={"removed": removed, "cache_dir": str(result_cache.cache_dir)},
+        )
+
+    def _clean_tool_cache(self) -> CommandResult:
+        """Forget remembered tool availability and versions"""
+        tool_cache = ToolCache.shared()
+        removed = tool_cache.invalidate()
+        self.log(f"Cleared tool cache: {tool_cache.path}")
+        return CommandResult(
+            status=CommandStatus.SUCCESS,
+            message="Cleared tool cache" if removed else "Tool cache was empty",
+            data={"removed": removed, "cache_file": str(tool_cache.path)},
+        )
@@ -5,11 +5,14 @@ Uses the mode adapter to determine which tools to run based on the
 current product mode (git_hooks, ci, cli, pipeline, mcp).
 """
 
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import subprocess
+import sys
 
 from ..core.base import BaseCommand, CommandResult, CommandStatus
+from ..core.process_manager import LastPass, ProcessManager
 from ..unified_validation import ValidationEngine
 
 
@@ -32,6 +35,8 @@ class ValidateCommand(BaseCommand):
         fix: bool = False,
         interactive: bool = False,
         allow_warnings: bool = False,
+        jobs: Optional[int] = None,
+        since_last_pass: bool = False,
     ) -> CommandResult:
         """
         Execute validation on files.
@@ -42,18 +47,13 @@ class ValidateCommand(BaseCommand):
             all_files: Validate all files in repository
             fix: Auto-fix issues where possible
             interactive: Prompt user for auto-fix decisions
+            jobs: Number of concurrent validation workers (default: CPU count)
+            since_last_pass: Validate only files changed since the last fully
+                successful run (everything if tools or config changed)
 
         Returns:
             CommandResult with validation status
         """
-        # Determine which files to validate
-        files_to_validate = self._get_files_to_validate(files, staged, all_files)
-
-        if not files_to_validate:
-            return CommandResult(
-                status=CommandStatus.SUCCESS, message="No files to validate"
-            )
-
         # Get mode-specific settings from adapter if available
         adapter_config = self.adapter.config if self.adapter else None
         tool_selection = self.adapter.get_tool_selection() if self.adapter else ["all"]
@@ -68,30 +68,59 @@ class ValidateCommand(BaseCommand):
             auto_fix=fix,
             interactive=effective_interactive,
             allow_warnings=allow_warnings,
+            max_workers=jobs,
         )
 
         # Convert tool selection to filter list (None means all tools)
         tools_filter = None if "all" in tool_selection else tool_selection
 
+        # Determine which files to validate
+        pass_marker = None
+        if since_last_pass and not files and not staged:
+            files_to_validate, pass_marker = self._get_files_since_last_pass(
+                engine, tools_filter
+            )
+        else:
+            files_to_validate = self._get_files_to_validate(files, staged, all_files)
+
+        if not files_to_validate:
+            return CommandResult(
+                status=CommandStatus.SUCCESS, message="No files to validate"
+            )
+
         # Log tool selection in verbose mode
         if self.verbose:
             mode_name = self.adapter.name if self.adapter else "default"
             print(f"[TOOLS] Mode '{mode_name}' using: {tool_selection}")
 
         # Use the appropriate validation method
+        stream = None
         if staged:
             results = engine.validate_staged_files()
+            summary = engine.get_summary(results)
         else:
-            results = {}
-            for file_path in files_to_validate:
-                path = Path(file_path)
-                if path.exists():
-                    file_results = engine.validate_file(path, tools=tools_filter)
-                    if file_results:
-                        results[file_path] = file_results
-
-        # Generate summary
-        summary = engine.get_summary(results)
+            paths = [Path(f) for f in files_to_validate if Path(f).exists()]
+            stream = self.adapter.open_stream(sys.stdout) if self.adapter else None
+            if stream is None:
+                results = engine.validate_files(paths, tools=tools_filter)
+                summary = engine.get_summary(results)
+            else:
+                # Report each file as it finishes instead of holding the run
+                results = {}
+                summary = engine.empty_summary()
+                for filepath, file_results in engine.iter_file_results(
+                    paths, tools=tools_filter
+                ):
+                    stream.file(filepath, file_results)
+                    engine.add_to_summary(summary, filepath, file_results)
+                stream.close(
+                    {
+                        "total_errors": summary["total_errors"],
+                        "total_warnings": summary["total_warnings"],
+                        "files_checked": len(files_to_validate),
+                        "fixed_files": summary["fixed_files"],
+                    }
+                )
 
         # Prepare detailed messages
         all_errors = []
@@ -139,8 +168,13 @@ class ValidateCommand(BaseCommand):
                 filepath: [r.to_dict() for r in file_results]
                 for filepath, file_results in results.items()
             },
+            "streamed": stream is not None,
         }
 
+        # Remember the validated tree so the next run can skip it
+        if pass_marker is not None and status == CommandStatus.SUCCESS:
+            ProcessManager().save_last_pass(pass_marker)
+
         return CommandResult(
             status=status,
             message=message,
@@ -184,3 +218,80 @@ class ValidateCommand(BaseCommand):
                 return []
 
         return []
+
+    def _get_files_since_last_pass(
+        self, engine: ValidationEngine, tools: Optional[List[str]]
+    ) -> Tuple[List[str], Optional[LastPass]]:
+        """
+        Get files changed since the last fully successful run.
+
+        Falls back to every tracked and untracked file when no run has
+        passed yet, its tree is gone, or the tool versions or configuration
+        differ from that run.
+
+        Returns:
+            Tuple of (files, marker to record if this run passes). The
+            marker is None outside a git repository with commits.
+        """
+        fingerprint = engine.fingerprint(tools)
+        snapshot = self._snapshot_rev()
+        marker = (
+            LastPass(
+                rev=snapshot,
+                fingerprint=fingerprint,
+                recorded=datetime.now().isoformat(),
+            )
+            if snapshot
+            else None
+        )
+
+        last = ProcessManager().get_last_pass()
+        if last is None:
+            reason = "no previous passing run"
+        elif last.fingerprint != fingerprint:
+            reason = "tool versions or configuration changed"
+        elif not self._git_lines(
+            ["rev-parse", "--verify", "-q", f"{last.rev}^{{commit}}"]
+        ):
+            reason = f"tree {last.rev[:12]} no longer exists"
+        else:
+            changed = self._git_lines(["diff", "--name-only", "--relative", last.rev])
+            untracked = self._git_lines(["ls-files", "--others", "--exclude-standard"])
+            if self.verbose:
+                print(f"[SINCE] Changes since passing tree {last.rev[:12]}")
+            return list(dict.fromkeys(changed + untracked)), marker
+
+        if self.verbose:
+            print(f"[SINCE] Validating everything: {reason}")
+        files = self._git_lines(
+            ["ls-files", "--cached", "--others", "--exclude-standard"]
+        )
+        return files, marker
+
+    @staticmethod
+    def _snapshot_rev() -> Optional[str]:
+        """
+        Get a commit holding the current tree without touching any ref.
+
+        Uses a stash-style commit when tracked files have local changes and
+        HEAD otherwise; untracked files are always validated again.
+        """
+        stash = ValidateCommand._git_lines(["stash", "create"])
+        if stash:
+            return stash[0]
+        head = ValidateCommand._git_lines(["rev-parse", "--verify", "-q", "HEAD"])
+        return head[0] if head else None
+
+    @staticmethod
+    def _git_lines(args: List[str]) -> List[str]:
+        """Run git, returning its output lines (empty on any failure)"""
+        # Never report our own run data as changes
+        if args[0] in ("diff", "ls-files"):
+            args = [*args, "--", ".", ":(exclude).huskycat"]
+        try:
+            result = subprocess.run(
+                ["git", *args], capture_output=True, text=True, check=True
+            )
+        except (OSError, subprocess.CalledProcessError):
+            return []
+        return [line for line in result.stdout.splitlines() if line]
@@ -9,11 +9,12 @@ The ModeAdapter pattern encapsulates mode-specific behavior:
 - Error handling strategies
 """
 
+import json
 import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, TextIO
 
 
 def get_fix_threshold_from_env() -> Optional["FixConfidence"]:
@@ -98,6 +99,70 @@ class AdapterConfig:
     transport: Optional[str] = None  # "stdio" for MCP
 
 
+def result_to_dict(result: Any) -> Dict[str, Any]:
+    """Convert a ValidationResult (or an already converted dict) to a dict"""
+    if isinstance(result, dict):
+        return result
+    if hasattr(result, "to_dict"):
+        return result.to_dict()
+    return {
+        "tool": getattr(result, "tool", "unknown"),
+        "success": getattr(result, "success", True),
+        "errors": getattr(result, "errors", []),
+        "warnings": getattr(result, "warnings", []),
+    }
+
+
+class ResultStream:
+    """
+    Incremental output for results that arrive while validation runs.
+
+    Adapters that can show results before the run finishes return one from
+    ModeAdapter.open_stream(). The command then calls file() as each file
+    completes and close() with the summary at the end, and does not keep
+    the results itself.
+    """
+
+    def __init__(self, out: TextIO):
+        self.out = out
+
+    def file(self, filepath: str, file_results: List[Any]) -> None:
+        """Output the results of a file that has finished validating"""
+
+    def close(self, summary: Dict[str, Any]) -> None:
+        """Finish the output once every file has been reported"""
+
+
+class JsonResultStream(ResultStream):
+    """
+    Write the same document as ModeAdapter._format_json(), one file at a time.
+
+    The results object is written first and the summary last, so the output
+    stays a single JSON document consumers such as jq can read.
+    """
+
+    def __init__(self, out: TextIO):
+        super().__init__(out)
+        self._files = 0
+        self.out.write('{\n  "results": {')
+
+    def file(self, filepath: str, file_results: List[Any]) -> None:
+        entries = json.dumps([result_to_dict(r) for r in file_results], indent=2)
+        separator = "," if self._files else ""
+        self.out.write(
+            f"{separator}\n    {json.dumps(filepath)}: "
+            + entries.replace("\n", "\n    ")
+        )
+        self.out.flush()
+        self._files += 1
+
+    def close(self, summary: Dict[str, Any]) -> None:
+        closing = "\n  }" if self._files else "}"
+        summary_json = json.dumps(summary, indent=2).replace("\n", "\n  ")
+        self.out.write(f'{closing},\n  "summary": {summary_json}\n}}\n')
+        self.out.flush()
+
+
 class ModeAdapter(ABC):
     """
     Abstract base class for mode-specific adapters.
@@ -120,6 +185,19 @@ class ModeAdapter(ABC):
     def config(self) -> AdapterConfig:
         """Get the adapter configuration."""
 
+    def open_stream(self, out: TextIO) -> Optional[ResultStream]:
+        """
+        Start incremental output of validation results.
+
+        Args:
+            out: Stream to write results to as they arrive
+
+        Returns:
+            ResultStream, or None if this mode only reports complete runs
+            through format_output()
+        """
+        return None
+
     def format_output(self, results: Dict[str, Any], summary: Dict[str, Any]) -> str:
         """
         Format validation results for output.
@@ -196,31 +274,14 @@ class ModeAdapter(ABC):
 
     def _format_json(self, results: Dict[str, Any], summary: Dict[str, Any]) -> str:
         """JSON output for pipeline integration."""
-        import json
-
         output = {
             "summary": summary,
-            "results": {},
+            "results": {
+                filepath: [result_to_dict(result) for result in file_results]
+                for filepath, file_results in results.items()
+            },
         }
 
-        for filepath, file_results in results.items():
-            output["results"][filepath] = []
-            for result in file_results:
-                # Result could be either a ValidationResult object or already a dict
-                if isinstance(result, dict):
-                    output["results"][filepath].append(result)
-                elif hasattr(result, "to_dict"):
-                    output["results"][filepath].append(result.to_dict())
-                else:
-                    output["results"][filepath].append(
-                        {
-                            "tool": getattr(result, "tool", "unknown"),
-                            "success": getattr(result, "success", True),
-                            "errors": getattr(result, "errors", []),
-                            "warnings": getattr(result, "warnings", []),
-                        }
-                    )
-
         return json.dumps(output, indent=2)
 
     def _format_junit_xml(
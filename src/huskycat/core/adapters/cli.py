@@ -11,7 +11,35 @@ Optimized for interactive terminal use:
 
 import sys
 
-from .base import AdapterConfig, ModeAdapter, OutputFormat
+from .base import AdapterConfig, ModeAdapter, OutputFormat, ResultStream
+
+
+class HumanResultStream(ResultStream):
+    """Print each file's errors and warnings as soon as the file is done."""
+
+    def __init__(self, out, color: bool):
+        super().__init__(out)
+        self.color = color
+
+    def file(self, filepath, file_results):
+        lines = []
+        for result in file_results:
+            tool = getattr(result, "tool", "validator")
+            for error in getattr(result, "errors", []):
+                if self.color:
+                    lines.append(f"  \033[91m✗ [{tool}] {error}\033[0m")
+                else:
+                    lines.append(f"  ✗ [{tool}] {error}")
+            for warning in getattr(result, "warnings", []):
+                if self.color:
+                    lines.append(f"  \033[93m⚠ [{tool}] {warning}\033[0m")
+                else:
+                    lines.append(f"  ⚠ [{tool}] {warning}")
+
+        if lines:
+            header = f"\033[1m{filepath}\033[0m" if self.color else filepath
+            self.out.write("\n".join([header, *lines]) + "\n")
+            self.out.flush()
 
 
 class CLIAdapter(ModeAdapter):
@@ -42,6 +70,12 @@ class CLIAdapter(ModeAdapter):
             tools="configured",  # Per .huskycat.yaml
         )
 
+    def open_stream(self, out):
+        """
+        CLI mode: report problems file by file while validation runs.
+        """
+        return HumanResultStream(out, color=self.config.color)
+
     def format_output(self, results, summary):
         """
         CLI mode: Rich colored output with full details.
@@ -31,13 +31,16 @@ Integration:
     - ValidationEngine: Real validation execution (NOT placeholders)
 """
 
+import functools
 import sys
+import threading
 import time
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
-from ..parallel_executor import ParallelExecutor, ToolResult
+from ..parallel_executor import ParallelExecutor, ShardedTool, ToolResult
 from ..process_manager import ProcessManager, should_proceed_with_commit
+from ..resources import ResourceBudget
 from ..tui import ToolState, ValidationTUI
 from .base import AdapterConfig, ModeAdapter, OutputFormat
 
@@ -73,9 +76,17 @@ class NonBlockingGitHooksAdapter(ModeAdapter):
         """
         self.process_manager = ProcessManager(cache_dir)
         self.tui = ValidationTUI(refresh_rate=0.1)
-        self.executor = ParallelExecutor(max_workers=8, fail_fast=False)
+        # Tools start only while the CPU and memory they take are free
+        self.executor = ParallelExecutor(
+            max_workers=8, fail_fast=False, budget=ResourceBudget()
+        )
         self.auto_fix = auto_fix
         self._validation_engine: Optional[Any] = None
+        # Files each tool from get_all_validation_tools() will check
+        self._tool_file_counts: Dict[str, int] = {}
+        # [errors, warnings, files processed] per tool, summed over its shards
+        self._tool_progress: Dict[str, List[int]] = {}
+        self._progress_lock = threading.Lock()
 
     @property
     def name(self) -> str:
@@ -209,6 +220,12 @@ class NonBlockingGitHooksAdapter(ModeAdapter):
             elif tool_state == ToolState.FAILED:
                 print(f"  FAIL {tool_name} ({errors} errors, {warnings} warnings)")
 
+        # Schedule from earlier runs' durations and failures
+        self.executor.use_history(
+            self.process_manager.get_tool_history(), self._tool_file_counts
+        )
+        print(f"Predicted time: {self.executor.predict_wall_time(tool_names):.1f}s")
+
         # Execute all tools in parallel with dependency management
         try:
             results: List[ToolResult] = self.executor.execute_tools(
@@ -282,6 +299,12 @@ class NonBlockingGitHooksAdapter(ModeAdapter):
 
         if failed_tools:
             print(f"  Failed tools: {', '.join(failed_tools)}")
+        for result in results:
+            if result.metadata.get("near_timeout"):
+                print(
+                    f"  Slow: {result.tool_name} took {result.duration:.1f}s "
+                    f"of its {result.metadata['timeout']:.0f}s timeout"
+                )
 
         # Save validation run results with detailed error information
         from datetime import datetime
@@ -306,6 +329,7 @@ class NonBlockingGitHooksAdapter(ModeAdapter):
         )
 
         self.process_manager.save_run(run)
+        self.process_manager.record_tool_results(results)
 
         # Save detailed results separately for full ToolResult data
         self.process_manager.save_detailed_results(run_id, results)
@@ -433,7 +457,9 @@ class NonBlockingGitHooksAdapter(ModeAdapter):
         Load ALL available validation tools for given files.
 
         Uses the real ValidationEngine to create callables that execute
-        actual validation on the provided files.
+        actual validation on the provided files. Validators that check
+        each file on its own come as a ShardedTool, so the executor can
+        split their files across workers.
 
         Args:
             files: List of file paths to validate
@@ -466,6 +492,12 @@ class NonBlockingGitHooksAdapter(ModeAdapter):
 
             if applicable_files:
                 validator_files[validator.name] = applicable_files
+        self._tool_file_counts = {
+            name: len(applicable) for name, applicable in validator_files.items()
+        }
+        self._tool_progress = {}
+        # Configured tools.<name>.timeout wins over timeouts learned from history
+        self.executor.timeouts.overrides = engine.tool_timeouts()
 
         # Create callables for each validator that has applicable files
         for validator in engine.validators:
@@ -492,20 +524,51 @@ class NonBlockingGitHooksAdapter(ModeAdapter):
             files: List of file paths to validate
 
         Returns:
-            Callable that returns ToolResult when invoked
+            Callable that returns ToolResult when invoked; a ShardedTool
+            when the validator checks each file on its own
         """
+        if getattr(validator, "cacheable", False) and not getattr(
+            validator, "single_batch", False
+        ):
+            # Results depend only on each file, so shards can run apart
+            return ShardedTool(
+                files=files,
+                run=functools.partial(self._execute_real_validation, validator),
+            )
 
         def execute_validator() -> ToolResult:
             return self._execute_real_validation(validator, files)
 
         return execute_validator
 
+    def _report_progress(self, tool_name: str, errors: int, warnings: int) -> None:
+        """
+        Add one file's result to its tool's progress in the TUI.
+
+        Shards of a tool run concurrently, so the TUI shows the sums over
+        all of them rather than the counts of whichever shard reported last.
+        """
+        with self._progress_lock:
+            progress = self._tool_progress.setdefault(tool_name, [0, 0, 0])
+            progress[0] += errors
+            progress[1] += warnings
+            progress[2] += 1
+            self.tui.update_tool(
+                tool_name=tool_name,
+                state=ToolState.RUNNING,
+                errors=progress[0],
+                warnings=progress[1],
+                files_processed=progress[2],
+            )
+
     def _execute_real_validation(self, validator: Any, files: List[Path]) -> ToolResult:
         """
         Execute real validation using the unified validation engine.
 
-        Runs the validator on all provided files and aggregates results
-        into a single ToolResult for the ParallelExecutor.
+        Streams the validator's results from the engine's iter_validate()
+        so the TUI shows errors and files processed while the tool runs,
+        and aggregates them into a single ToolResult for the
+        ParallelExecutor.
 
         Args:
             validator: The validator instance to execute
@@ -522,11 +585,9 @@ class NonBlockingGitHooksAdapter(ModeAdapter):
         output_lines: List[str] = []
         error_messages: List[str] = []
 
-        for filepath in files:
-            try:
-                # Execute the real validator
-                result = validator.validate(filepath)
-
+        engine = self._get_validation_engine()
+        try:
+            for result in engine.iter_validate(files, tools=[validator.name]):
                 # Aggregate results
                 if not result.success:
                     all_success = False
@@ -537,17 +598,20 @@ class NonBlockingGitHooksAdapter(ModeAdapter):
                 # Collect error messages
                 if result.errors:
                     error_messages.extend(
-                        [f"{filepath}: {err}" for err in result.errors]
+                        [f"{result.filepath}: {err}" for err in result.errors]
                     )
 
                 # Collect output messages
                 if result.messages:
                     output_lines.extend(result.messages)
 
-            except Exception as e:
-                all_success = False
-                total_errors += 1
-                error_messages.append(f"{filepath}: Exception: {e!s}")
+                self._report_progress(
+                    validator.name, result.error_count, result.warning_count
+                )
+        except Exception as e:
+            all_success = False
+            total_errors += 1
+            error_messages.append(f"{validator.name}: Exception: {e!s}")
 
         duration = time.time() - start_time
 
@@ -564,4 +628,5 @@ class NonBlockingGitHooksAdapter(ModeAdapter):
             warnings=total_warnings,
             output=output,
             error_message=error_messages[0] if error_messages else None,
+            metadata={"files": len(files)},
         )
@@ -9,7 +9,7 @@ Optimized for toolchain integration:
 - Predictable behavior
 """
 
-from .base import AdapterConfig, ModeAdapter, OutputFormat
+from .base import AdapterConfig, JsonResultStream, ModeAdapter, OutputFormat
 
 
 class PipelineAdapter(ModeAdapter):
@@ -41,6 +41,15 @@ class PipelineAdapter(ModeAdapter):
             stdin_mode=True,  # Accept file list from stdin
         )
 
+    def open_stream(self, out):
+        """
+        Pipeline mode: write the JSON document file by file.
+
+        Output is identical to format_output(), but each file's results are
+        written as soon as the file is done.
+        """
+        return JsonResultStream(out)
+
     def format_output(self, results, summary):
         """
         Pipeline mode: Clean JSON output to stdout.
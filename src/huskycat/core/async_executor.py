@@ -0,0 +1,515 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+asyncio execution of tool processes.
+
+Threads blocking on subprocess.run() cost one OS thread per running
+tool process. This module runs tool processes on an event loop instead:
+- run_command() starts a tool with asyncio.create_subprocess_exec(),
+  streams its stdout line by line, enforces its deadline with
+  asyncio.wait_for() and limits concurrent processes per tool class
+- AsyncExecutor is the asyncio counterpart of ParallelExecutor: every
+  tool of a dependency graph is a task on one loop
+- run_command_sync() and AsyncExecutor.execute_tools() are sync facades
+  over a shared background loop, so threaded callers (ValidationEngine,
+  the MCP server) need no event loop of their own
+
+Validators start their processes on the shared loop when the
+async_processes feature flag is on (see enable_async_processes() and
+run_tool_process()). Processes obey the current CancelToken like those
+of core.cancellation.run_process().
+
+Usage:
+    async def ruff():
+        return await run_command(["ruff", "check", "."], on_line=print)
+
+    executor = AsyncExecutor(tool_dependencies={"ruff": []})
+    results = executor.execute_tools({"ruff": ruff})
+"""
+
+import asyncio
+import heapq
+import os
+import subprocess
+import threading
+import time
+import weakref
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from .cancellation import (
+    CancelToken,
+    ToolCancelled,
+    cancel_scope,
+    current_token,
+    kill_process_group,
+    run_process,
+)
+from .parallel_executor import ParallelExecutor, ToolResult, ToolStatus
+
+T = TypeVar("T")
+
+CONTAINER_RUNTIMES = frozenset({"podman", "docker"})
+
+# Concurrent processes per tool class; classes not listed get one per CPU.
+# Container runs share a class: each one is a whole container start.
+CLASS_LIMITS: Dict[str, int] = {"container": 2}
+
+# Longest stdout line run_command() can stream to on_line
+STREAM_LIMIT = 16 * 1024 * 1024
+
+# subprocess.run() keywords run_command_sync() understands; calls with
+# others go to run_process()
+SYNC_KWARGS = frozenset(
+    {
+        "capture_output",
+        "check",
+        "cwd",
+        "encoding",
+        "env",
+        "errors",
+        "input",
+        "text",
+        "timeout",
+        "universal_newlines",
+    }
+)
+
+# Per-loop semaphores of each tool class
+_semaphores: "weakref.WeakKeyDictionary[Any, Dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+_semaphores_lock = threading.Lock()
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+_enabled = False
+
+
+def tool_class(cmd: List[str]) -> str:
+    """Class limiting a command's concurrency: its executable, or "container" """
+    name = os.path.basename(cmd[0]) if cmd else ""
+    return "container" if name in CONTAINER_RUNTIMES else name
+
+
+def _semaphore(cls: str) -> asyncio.Semaphore:
+    """Semaphore of a tool class on the running loop"""
+    loop = asyncio.get_running_loop()
+    with _semaphores_lock:
+        per_loop = _semaphores.setdefault(loop, {})
+        if cls not in per_loop:
+            per_loop[cls] = asyncio.Semaphore(
+                CLASS_LIMITS.get(cls, os.cpu_count() or 1)
+            )
+        return per_loop[cls]
+
+
+async def _communicate(
+    process: asyncio.subprocess.Process,
+    stdin: Optional[bytes],
+    on_line: Optional[Callable[[str], None]],
+) -> Tuple[bytes, bytes]:
+    """Feed stdin and collect output, passing stdout lines to on_line"""
+
+    async def feed() -> None:
+        if process.stdin is None:
+            return
+        if stdin:
+            process.stdin.write(stdin)
+            try:
+                await process.stdin.drain()
+            except (BrokenPipeError, ConnectionResetError):
+                # The tool exited without reading everything
+                pass
+        process.stdin.close()
+
+    async def read_stdout() -> bytes:
+        assert process.stdout is not None
+        if on_line is None:
+            return await process.stdout.read()
+        lines = []
+        async for line in process.stdout:
+            lines.append(line)
+            on_line(line.decode("utf-8", errors="replace").rstrip("\r\n"))
+        return b"".join(lines)
+
+    assert process.stderr is not None
+    _, stdout, stderr = await asyncio.gather(
+        feed(), read_stdout(), process.stderr.read()
+    )
+    await process.wait()
+    return stdout, stderr
+
+
+async def run_command(
+    cmd: List[str],
+    *,
+    input: Optional[bytes] = None,
+    cwd: Optional[Any] = None,
+    env: Optional[Dict[str, str]] = None,
+    timeout: Optional[float] = None,
+    on_line: Optional[Callable[[str], None]] = None,
+    token: Optional[CancelToken] = None,
+) -> subprocess.CompletedProcess:
+    """
+    Run a tool process on the running event loop.
+
+    The process runs in its own process group, which is killed when the
+    deadline passes, the token is cancelled or the awaiting task is
+    cancelled. It starts once its tool class (see tool_class()) is below
+    its limit of concurrent processes.
+
+    Args:
+        cmd: Command to run
+        input: Bytes to write to the tool's stdin
+        cwd: Working directory
+        env: Environment (default: inherited)
+        timeout: Seconds the tool may run, capped by the token's deadline
+        on_line: Called with each stdout line (without line ending) as
+            the tool prints it
+        token: Cancel token (default: the current one)
+
+    Returns:
+        CompletedProcess with stdout and stderr as bytes
+
+    Raises:
+        ToolCancelled: If the token was cancelled or expired
+        subprocess.TimeoutExpired: If ``timeout`` passed first
+    """
+    if token is None:
+        token = current_token()
+    effective_timeout = timeout
+    if token is not None:
+        token.check()
+        effective_timeout = token.timeout(timeout)
+
+    async with _semaphore(tool_class(cmd)):
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=subprocess.PIPE if input is not None else None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=cwd,
+            env=env,
+            start_new_session=True,
+            limit=STREAM_LIMIT,
+        )
+        if token is not None:
+            token.register(process)
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                _communicate(process, input, on_line), effective_timeout
+            )
+        except asyncio.TimeoutError:
+            kill_process_group(process)
+            await process.wait()
+            if token is not None and token.cancelled:
+                raise ToolCancelled(token.describe())
+            assert timeout is not None  # an expired token raised above
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        except BaseException:
+            # Includes cancellation of the awaiting task
+            kill_process_group(process)
+            raise
+        finally:
+            if token is not None:
+                token.unregister(process)
+
+    if token is not None and token.reason is not None:
+        # Killed by cancel() while running
+        raise ToolCancelled(token.describe())
+    assert process.returncode is not None  # _communicate waited for it
+    return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+
+
+def _reset_loop() -> None:
+    """Forget the parent's loop in a forked child, where its thread is gone"""
+    global _loop
+    _loop = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_loop)
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """The shared event loop, running in a daemon thread from first use"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="huskycat-async", daemon=True
+            ).start()
+            _loop = loop
+        return _loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine on the shared loop and wait for its result.
+
+    Must not be called from the shared loop itself.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_loop()).result()
+
+
+def run_command_sync(cmd: List[str], **kwargs: Any) -> subprocess.CompletedProcess:
+    """
+    subprocess.run() that runs the process on the shared loop.
+
+    Output is always captured. Keywords other than SYNC_KWARGS make it
+    fall back to run_process(). The calling thread's cancel token applies.
+
+    Args:
+        cmd: Command to run
+        **kwargs: subprocess.run() keyword arguments
+
+    Returns:
+        CompletedProcess of the command
+
+    Raises:
+        ToolCancelled: If the token was cancelled or expired
+        subprocess.TimeoutExpired: If ``timeout`` passed first
+        subprocess.CalledProcessError: If ``check`` is set and the tool failed
+    """
+    if set(kwargs) - SYNC_KWARGS:
+        return run_process(cmd, **kwargs)
+
+    encoding = kwargs.get("encoding")
+    errors = kwargs.get("errors")
+    text = bool(
+        kwargs.get("text") or kwargs.get("universal_newlines") or encoding or errors
+    )
+    stdin = kwargs.get("input")
+    if text and isinstance(stdin, str):
+        stdin = stdin.encode(encoding or "utf-8")
+
+    result = run_sync(
+        run_command(
+            cmd,
+            input=stdin,
+            cwd=kwargs.get("cwd"),
+            env=kwargs.get("env"),
+            timeout=kwargs.get("timeout"),
+            token=current_token(),
+        )
+    )
+    if text:
+
+        def decode(data: bytes) -> str:
+            decoded = data.decode(encoding or "utf-8", errors or "strict")
+            return decoded.replace("\r\n", "\n").replace("\r", "\n")
+
+        result.stdout = decode(result.stdout)
+        result.stderr = decode(result.stderr)
+    if kwargs.get("check") and result.returncode:
+        raise subprocess.CalledProcessError(
+            result.returncode, cmd, result.stdout, result.stderr
+        )
+    return result
+
+
+def enable_async_processes(enabled: bool = True) -> None:
+    """Start validator processes on the shared loop (or stop doing so)"""
+    global _enabled
+    _enabled = enabled
+
+
+def async_processes_enabled() -> bool:
+    return _enabled
+
+
+def run_tool_process(cmd: List[str], **kwargs: Any) -> subprocess.CompletedProcess:
+    """Start a validator's tool process the configured way"""
+    if _enabled:
+        return run_command_sync(cmd, **kwargs)
+    return run_process(cmd, **kwargs)
+
+
+class AsyncExecutor(ParallelExecutor):
+    """
+    Execute async tools on one event loop respecting dependency constraints.
+
+    Tools are coroutine functions (typically awaiting run_command()).
+    Each starts as a task once its prerequisites completed, so a run
+    needs no thread per tool. Scheduling follows ParallelExecutor:
+    max_workers bounds the tools running at once, and ready tools start
+    in priority order (see _priorities()). Each tool's deadline is
+    enforced with asyncio.wait_for(), which cancels the tool and kills
+    its processes; in fail-fast mode the first failure cancels the
+    tools still running.
+    """
+
+    async def execute_tools_async(
+        self,
+        tools: Dict[str, Callable[[], Awaitable[Any]]],
+        progress_callback: Optional[Callable[[str, str], None]] = None,
+    ) -> List[ToolResult]:
+        """
+        Execute async tools concurrently respecting dependencies.
+
+        Args:
+            tools: Dict mapping tool names to coroutine functions
+            progress_callback: Optional callback(tool_name, status) for progress
+
+        Returns:
+            List of ToolResult for each tool executed, in completion order
+        """
+        loop = asyncio.get_running_loop()
+        dependencies, dependents = self._run_graph(tools)
+        priority = self._priorities(dependencies, dependents, set(tools))
+
+        all_results: List[ToolResult] = []
+        outcome: Dict[str, "asyncio.Future[bool]"] = {
+            tool: loop.create_future() for tool in dependencies
+        }
+        run_token = CancelToken()
+        inflight: Dict[str, "asyncio.Future[Any]"] = {}
+        stop_reason: Optional[str] = None
+
+        # Slots for running tools, handed to waiters in priority order
+        free = self.max_workers
+        waiting: List[Tuple[float, str, "asyncio.Future[None]"]] = []
+
+        async def acquire(tool: str) -> None:
+            nonlocal free
+            if free and not waiting:
+                free -= 1
+                return
+            turn: "asyncio.Future[None]" = loop.create_future()
+            heapq.heappush(waiting, (priority[tool], tool, turn))
+            await turn
+
+        def release() -> None:
+            nonlocal free
+            while waiting:
+                _, _, turn = heapq.heappop(waiting)
+                if not turn.done():
+                    turn.set_result(None)
+                    return
+            free += 1
+
+        def finish(tool: str, result: ToolResult) -> None:
+            nonlocal stop_reason
+            all_results.append(result)
+            if result.status != ToolStatus.SKIPPED:
+                self.durations[tool] = result.duration
+            if not result.success and self.fail_fast and stop_reason is None:
+                stop_reason = "Cancelled due to fail-fast mode"
+                run_token.cancel(stop_reason)
+                for running in inflight.values():
+                    running.cancel()
+            outcome[tool].set_result(result.success)
+
+        def skip(tool: str, reason: str) -> None:
+            finish(
+                tool,
+                ToolResult(
+                    tool_name=tool,
+                    success=False,
+                    duration=0.0,
+                    status=ToolStatus.SKIPPED,
+                    error_message=reason,
+                ),
+            )
+
+        async def call(tool: str, token: CancelToken) -> Any:
+            with cancel_scope(token):
+                return await tools[tool]()
+
+        async def run(tool: str) -> None:
+            deps_ok = all(
+                await asyncio.gather(*(outcome[dep] for dep in dependencies[tool]))
+            )
+            if tool not in tools:
+                outcome[tool].set_result(deps_ok and stop_reason is None)
+                return
+            if stop_reason is not None:
+                skip(tool, "Skipped due to fail-fast mode")
+                return
+            if not deps_ok:
+                skip(tool, "Skipped due to failed dependencies")
+                return
+
+            await acquire(tool)
+            try:
+                # Fail-fast may have struck while the tool waited for a slot
+                if run_token.cancelled:
+                    skip(tool, "Skipped due to fail-fast mode")
+                    return
+                finish(tool, await execute(tool))
+            finally:
+                release()
+
+        async def execute(tool: str) -> ToolResult:
+            if progress_callback:
+                progress_callback(tool, "running")
+            limit = self._tool_timeout(tool, self._file_counts.get(tool))
+            token = run_token.child(limit)
+            task = inflight[tool] = asyncio.ensure_future(call(tool, token))
+            start_time = time.time()
+            try:
+                value = await asyncio.wait_for(task, limit)
+            except (asyncio.TimeoutError, ToolCancelled):
+                return self._cancelled_result(
+                    tool, time.time() - start_time, token, progress_callback, limit
+                )
+            except asyncio.CancelledError:
+                if stop_reason is None or not task.cancelled():
+                    raise
+                return self._cancelled_result(
+                    tool, time.time() - start_time, token, progress_callback, limit
+                )
+            except Exception as e:
+                if progress_callback:
+                    progress_callback(tool, "failed")
+                return ToolResult(
+                    tool_name=tool,
+                    success=False,
+                    duration=time.time() - start_time,
+                    status=ToolStatus.FAILED,
+                    error_message=str(e),
+                )
+            finally:
+                del inflight[tool]
+
+            result = self._to_tool_result(tool, value, time.time() - start_time)
+            if token.cancelled and not result.success:
+                # Tools report killed processes as ordinary failures
+                return self._cancelled_result(
+                    tool, result.duration, token, progress_callback, limit
+                )
+            self._check_timeout(result, limit)
+            if progress_callback:
+                progress_callback(tool, "success" if result.success else "failed")
+            return result
+
+        await asyncio.gather(*(run(tool) for tool in dependencies))
+        return all_results
+
+    def execute_tools(  # type: ignore[override]
+        self,
+        tools: Dict[str, Callable[[], Awaitable[Any]]],
+        progress_callback: Optional[Callable[[str, str], None]] = None,
+    ) -> List[ToolResult]:
+        """
+        Sync facade of execute_tools_async(), run on the shared loop.
+
+        Args:
+            tools: Dict mapping tool names to coroutine functions
+            progress_callback: Optional callback(tool_name, status), called
+                from the loop's thread
+
+        Returns:
+            List of ToolResult for each tool executed, in completion order
+        """
+        return run_sync(self.execute_tools_async(tools, progress_callback))
@@ -0,0 +1,256 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Cancellation of running tools and their child processes.
+
+A CancelToken carries a tool run's deadline and can be cancelled from
+another thread (e.g. by the parallel executor in fail-fast mode). The
+token active in the current context is picked up by run_process(),
+which validators use to start tools:
+- each tool process runs in its own process group, so cancelling kills
+  the tool together with everything it spawned
+- subprocess timeouts are capped by the token's deadline
+- a cancelled or expired token makes run_process() raise ToolCancelled
+
+Tokens form a tree: cancelling a run's token cancels the token of every
+tool in it.
+
+Usage:
+    token = CancelToken(timeout=30)
+    with cancel_scope(token):
+        validator.validate_batch(files)   # tool processes obey the token
+    ...
+    token.cancel("Cancelled due to fail-fast mode")  # from another thread
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import os
+import signal
+import subprocess
+import threading
+import time
+from typing import Any, Iterator, List, Optional, Set, Union
+
+from .resources import MeteredPopen, current_meter
+
+# Child process handles: run_process() uses Popen, the asyncio engine
+# (core.async_executor) asyncio processes
+Process = Union[subprocess.Popen, asyncio.subprocess.Process]
+
+
+class ToolCancelled(Exception):
+    """A tool run was cancelled or ran past its deadline."""
+
+
+class CancelToken:
+    """
+    Cancellation signal and deadline for a tool run.
+
+    Thread-safe. Child processes registered with the token are killed
+    (whole process group) when it is cancelled.
+    """
+
+    def __init__(
+        self, timeout: Optional[float] = None, parent: Optional["CancelToken"] = None
+    ) -> None:
+        """
+        Initialize cancel token.
+
+        Args:
+            timeout: Seconds from now until the token expires (None: never)
+            parent: Token whose cancellation cancels this one too
+        """
+        self.deadline = time.monotonic() + timeout if timeout is not None else None
+        self.parent = parent
+        self.reason: Optional[str] = None
+        self._processes: Set[Process] = set()
+        self._children: List["CancelToken"] = []
+        self._lock = threading.Lock()
+        if parent is not None:
+            parent._adopt(self)
+
+    def child(self, timeout: Optional[float] = None) -> "CancelToken":
+        """Create a token cancelled along with this one"""
+        return CancelToken(timeout, parent=self)
+
+    def _adopt(self, child: "CancelToken") -> None:
+        with self._lock:
+            self._children.append(child)
+            reason = self.reason
+        if reason is not None:
+            child.cancel(reason)
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline of this token or a parent has passed"""
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the token was cancelled or expired"""
+        return self.reason is not None or self.expired
+
+    def remaining(self) -> Optional[float]:
+        """Seconds until the earliest deadline in the chain (None: no deadline)"""
+        remaining = None
+        token: Optional[CancelToken] = self
+        now = time.monotonic()
+        while token is not None:
+            if token.deadline is not None:
+                left = token.deadline - now
+                remaining = left if remaining is None else min(remaining, left)
+            token = token.parent
+        return remaining
+
+    def timeout(self, timeout: Optional[float]) -> Optional[float]:
+        """Cap a subprocess timeout by the token's deadline"""
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        remaining = max(0.0, remaining)
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def describe(self) -> str:
+        """Why the token is cancelled"""
+        if self.reason is not None:
+            return self.reason
+        return "Deadline exceeded"
+
+    def cancel(self, reason: str = "Cancelled") -> None:
+        """
+        Cancel the token, its children and their processes.
+
+        Args:
+            reason: Message reported by ToolCancelled; the first one wins
+        """
+        with self._lock:
+            if self.reason is None:
+                self.reason = reason
+            processes = list(self._processes)
+            children = list(self._children)
+        for process in processes:
+            kill_process_group(process)
+        for child in children:
+            child.cancel(reason)
+
+    def check(self) -> None:
+        """
+        Raise if the token is cancelled.
+
+        Raises:
+            ToolCancelled: If the token was cancelled or expired
+        """
+        if self.cancelled:
+            raise ToolCancelled(self.describe())
+
+    def register(self, process: Process) -> None:
+        """Kill a child process's group when the token is cancelled"""
+        with self._lock:
+            self._processes.add(process)
+        if self.reason is not None:
+            kill_process_group(process)
+
+    def unregister(self, process: Process) -> None:
+        with self._lock:
+            self._processes.discard(process)
+
+
+_current: "contextvars.ContextVar[Optional[CancelToken]]" = contextvars.ContextVar(
+    "huskycat_cancel_token", default=None
+)
+
+
+def current_token() -> Optional[CancelToken]:
+    """The token of the tool run in the current context, if any"""
+    return _current.get()
+
+
+@contextlib.contextmanager
+def cancel_scope(token: Optional[CancelToken]) -> Iterator[Optional[CancelToken]]:
+    """Make a token current for code run in this context"""
+    reset = _current.set(token)
+    try:
+        yield token
+    finally:
+        _current.reset(reset)
+
+
+def kill_process_group(process: Process) -> None:
+    """Kill a process started in its own session and everything it spawned"""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except OSError:
+        # Already gone
+        pass
+
+
+def run_process(cmd: List[str], **kwargs: Any) -> subprocess.CompletedProcess:
+    """
+    subprocess.run() that obeys the current cancel token.
+
+    Without a current token or resource meter this is plain
+    subprocess.run(). Otherwise the command runs in a new process group
+    that is killed when the token is cancelled, when the token's deadline
+    passes or when ``timeout`` does, and its resource usage is added to
+    the current meter (see core.resources).
+
+    Args:
+        cmd: Command to run
+        **kwargs: subprocess.run() keyword arguments
+
+    Returns:
+        CompletedProcess of the command
+
+    Raises:
+        ToolCancelled: If the token was cancelled or expired
+        subprocess.TimeoutExpired: If ``timeout`` passed first
+    """
+    token = current_token()
+    meter = current_meter()
+    if token is None and meter is None:
+        return subprocess.run(cmd, **kwargs)
+    if token is None:
+        token = CancelToken()
+    token.check()
+
+    timeout = kwargs.pop("timeout", None)
+    effective_timeout = token.timeout(timeout)
+    stdin = kwargs.pop("input", None)
+    check = kwargs.pop("check", False)
+    if kwargs.pop("capture_output", False):
+        kwargs["stdout"] = subprocess.PIPE
+        kwargs["stderr"] = subprocess.PIPE
+    if stdin is not None:
+        kwargs["stdin"] = subprocess.PIPE
+
+    process = MeteredPopen(cmd, start_new_session=True, **kwargs)
+    token.register(process)
+    try:
+        try:
+            stdout, stderr = process.communicate(stdin, timeout=effective_timeout)
+        except subprocess.TimeoutExpired:
+            kill_process_group(process)
+            stdout, stderr = process.communicate()
+            if token.cancelled:
+                raise ToolCancelled(token.describe())
+            raise subprocess.TimeoutExpired(cmd, timeout, stdout, stderr)
+        except BaseException:
+            kill_process_group(process)
+            process.wait()
+            raise
+    finally:
+        token.unregister(process)
+        if meter is not None and process.rusage is not None:
+            meter.record(process.rusage)
+
+    if token.reason is not None:
+        # Killed by cancel() while running
+        raise ToolCancelled(token.describe())
+    if check and process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, cmd, stdout, stderr)
+    return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
@@ -39,6 +39,9 @@ class HuskyCatConfig:
         parallel_execution: Enable parallel tool execution (default: True)
         tui_progress: Enable TUI progress display (default: True)
         cache_results: Cache validation results (default: True)
+        cache_tools: Remember tool availability and versions (default: True)
+        inprocess_tools: Run Python linters in a worker pool (default: False)
+        async_processes: Run tool processes on an asyncio loop (default: False)
     """
 
     def __init__(self, config_file: Optional[Path] = None):
@@ -239,6 +242,21 @@ class HuskyCatConfig:
         """Check if result caching is enabled."""
         return self.get_feature_flag("cache_results", default=True)
 
+    @property
+    def cache_tools_enabled(self) -> bool:
+        """Check if tool availability and version caching is enabled."""
+        return self.get_feature_flag("cache_tools", default=True)
+
+    @property
+    def inprocess_tools_enabled(self) -> bool:
+        """Check if Python linters run in the in-process worker pool."""
+        return self.get_feature_flag("inprocess_tools", default=False)
+
+    @property
+    def async_processes_enabled(self) -> bool:
+        """Check if tool processes run on the shared asyncio loop."""
+        return self.get_feature_flag("async_processes", default=False)
+
     def set_feature_flag(self, flag_name: str, value: bool):
         """
         Set feature flag value (runtime only, not persisted).
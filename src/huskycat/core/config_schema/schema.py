@@ -44,6 +44,15 @@ class FeatureFlags(BaseModel):
     )
     tui_progress: bool = Field(default=True, description="Enable TUI progress display")
     cache_results: bool = Field(default=True, description="Cache validation results")
+    cache_tools: bool = Field(
+        default=True, description="Remember tool availability and versions"
+    )
+    inprocess_tools: bool = Field(
+        default=False, description="Run Python linters in a pre-warmed worker pool"
+    )
+    async_processes: bool = Field(
+        default=False, description="Run tool processes on a shared asyncio loop"
+    )
 
 
 class ValidationConfig(BaseModel):
@@ -64,6 +73,12 @@ class ValidationConfig(BaseModel):
     max_errors: int = Field(
         default=100, ge=1, le=10000, description="Maximum number of errors to report"
     )
+    max_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=256,
+        description="Concurrent validation workers (default: CPU count)",
+    )
 
     @field_validator("max_errors")
     @classmethod
@@ -89,7 +104,10 @@ class ToolConfig(BaseModel):
         default=30,
         ge=1,
         le=600,
-        description="Timeout in seconds for tool execution",
+        description=(
+            "Timeout in seconds for tool execution; unset, it is learned "
+            "from recorded run times"
+        ),
     )
     tools: List[str] = Field(
         default_factory=list, description="List of tools to run in this category"
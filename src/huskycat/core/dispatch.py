@@ -0,0 +1,153 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Precompiled file to validator dispatch.
+
+Validators describe the files they handle with DispatchRule objects. The
+dispatcher compiles the rules of every validator once:
+- a suffix table (extensions and suffix-only rules)
+- an exact file name table (e.g. Dockerfile)
+- the remaining pattern rules, with a combined file name prefilter regex
+  and a per-directory memo of which directory patterns hold
+
+so finding the validators for a path is a few dictionary lookups instead of
+calling can_handle() on every validator.
+
+Usage:
+    dispatcher = ValidatorDispatcher(validators)
+    for validator in dispatcher.validators_for(Path("roles/web/tasks/main.yml")):
+        ...
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Pattern, Sequence, Set, Tuple
+
+from ..validators.base import DispatchRule, Validator, dispatch_dir
+
+# (validator index, compiled name pattern, compiled dir pattern, rule)
+_PatternRule = Tuple[int, Optional[Pattern[str]], Optional[Pattern[str]], DispatchRule]
+
+
+class ValidatorDispatcher:
+    """
+    Map file paths to the validators that handle them.
+
+    Validators that override can_handle() instead of dispatch_rules cannot
+    be compiled; they are asked directly for every path.
+    """
+
+    def __init__(self, validators: Sequence[Validator]) -> None:
+        self.validators = list(validators)
+        self._position = {id(v): i for i, v in enumerate(self.validators)}
+
+        self._by_extension: Dict[str, List[int]] = {}
+        self._by_suffix: Dict[str, List[int]] = {}
+        self._by_name: Dict[str, List[int]] = {}
+        self._patterns: List[_PatternRule] = []
+        self._custom: List[int] = []
+
+        for index, validator in enumerate(self.validators):
+            for ext in validator.extensions:
+                self._by_extension.setdefault(ext, []).append(index)
+
+            if type(validator).can_handle is not Validator.can_handle:
+                self._custom.append(index)
+                continue
+
+            for rule in validator.dispatch_rules:
+                if rule.name_pattern is None and rule.dir_pattern is None:
+                    if rule.suffixes and not rule.names:
+                        for suffix in rule.suffixes:
+                            self._by_suffix.setdefault(suffix, []).append(index)
+                        continue
+                    if rule.names and not rule.suffixes:
+                        for name in rule.names:
+                            self._by_name.setdefault(name, []).append(index)
+                        continue
+                self._patterns.append((index, rule.name_regex, rule.dir_regex, rule))
+
+        # One regex telling whether any name pattern can match a file name
+        name_patterns = [
+            (
+                f"(?i:{rule.name_pattern})"
+                if rule.ignore_case
+                else f"(?:{rule.name_pattern})"
+            )
+            for _, name_re, _, rule in self._patterns
+            if name_re is not None
+        ]
+        self._name_prefilter: Optional[Pattern[str]] = (
+            re.compile("|".join(name_patterns)) if name_patterns else None
+        )
+
+        # Directory string -> indices into self._patterns whose dir part holds
+        self._dir_memo: Dict[str, FrozenSet[int]] = {}
+
+    def _patterns_for_dir(self, directory: str) -> FrozenSet[int]:
+        matched = self._dir_memo.get(directory)
+        if matched is None:
+            matched = frozenset(
+                j
+                for j, (_, _, dir_re, _) in enumerate(self._patterns)
+                if dir_re is None or dir_re.search(directory)
+            )
+            self._dir_memo[directory] = matched
+        return matched
+
+    def handled(self, filepath: Path) -> Set[int]:
+        """Indices of the validators whose can_handle() accepts the path"""
+        name = filepath.name
+        suffix = filepath.suffix
+        handled = set(self._by_suffix.get(suffix, ()))
+        handled.update(self._by_name.get(name, ()))
+
+        if self._patterns:
+            name_hit = (
+                self._name_prefilter is not None
+                and self._name_prefilter.search(name) is not None
+            )
+            for j in self._patterns_for_dir(dispatch_dir(filepath)):
+                index, name_re, _, rule = self._patterns[j]
+                if index in handled:
+                    continue
+                if name_re is not None and (
+                    not name_hit or name_re.search(name) is None
+                ):
+                    continue
+                if rule.suffixes and suffix not in rule.suffixes:
+                    continue
+                if rule.names and name not in rule.names:
+                    continue
+                handled.add(index)
+
+        for index in self._custom:
+            if self.validators[index].can_handle(filepath):
+                handled.add(index)
+        return handled
+
+    def validators_for(self, filepath: Path) -> List[Validator]:
+        """
+        Get the validators to run on a file.
+
+        Returns validators registered for the file's extension first, then
+        any others whose rules accept the path, each group in validator order.
+        """
+        by_extension = self._by_extension.get(filepath.suffix, [])
+        extra = sorted(self.handled(filepath).difference(by_extension))
+        return [self.validators[i] for i in by_extension] + [
+            self.validators[i] for i in extra
+        ]
+
+    def extension_map(self) -> Dict[str, List[Validator]]:
+        """Validators registered for each file extension, in validator order"""
+        return {
+            ext: [self.validators[i] for i in indices]
+            for ext, indices in self._by_extension.items()
+        }
+
+    def handles(self, validator: Validator, filepath: Path) -> bool:
+        """Equivalent of validator.can_handle(filepath) using the tables"""
+        index = self._position.get(id(validator))
+        if index is None:
+            return validator.can_handle(filepath)
+        return index in self.handled(filepath)
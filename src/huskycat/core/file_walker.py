@@ -0,0 +1,398 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Ignore-aware directory walker.
+
+Walks a directory tree with os.scandir, pruning whole directories as soon
+as they are known to be ignored instead of listing everything and filtering
+afterwards. Ignored paths come from:
+- a fixed set of VCS, cache and virtualenv directories (.git, node_modules, ...)
+- .gitignore files (the repository's, nested ones, and .git/info/exclude)
+- the ignore_patterns list of .huskycat.yaml
+- caller supplied exclude patterns
+
+Patterns use gitignore syntax and are compiled to regular expressions once
+per ignore file. Files are yielded lazily, in sorted order per directory.
+
+Usage:
+    walker = FileWalker(Path("src"), ignore_patterns=["*.generated.py"])
+    for filepath in walker:
+        ...
+"""
+
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Iterator, List, Optional, Pattern, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Directories that never contain files worth validating
+DEFAULT_PRUNE_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        ".huskycat",
+        "node_modules",
+        "__pycache__",
+        ".venv",
+        "venv",
+        ".tox",
+        ".nox",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+    }
+)
+
+_GLOB_CHARS = re.compile(r"[*?\[]")
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a gitignore glob (without anchoring) to a regex fragment"""
+    out = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern[i : i + 3] == "**/":
+                out.append("(?:.*/)?")
+                i += 3
+                continue
+            if pattern[i : i + 2] == "**":
+                out.append(".*")
+                i += 2
+                continue
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1 : end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body.replace(chr(92), chr(92) * 2)}]")
+                i = end
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+class IgnoreRules:
+    """
+    Compiled gitignore-style rules relative to one base directory.
+
+    match() returns True if the path is ignored, False if a negated rule
+    re-includes it and None if no rule applies, so rule sets from nested
+    .gitignore files can be layered.
+    """
+
+    def __init__(self, patterns: Sequence[str], base: str = "") -> None:
+        """
+        Compile patterns.
+
+        Args:
+            patterns: gitignore lines (comments and blanks are skipped)
+            base: Base directory of the rules, relative to the walk root
+                ("" for the root itself), using "/" separators
+        """
+        self.base = base.strip("/")
+        self._rules: List[Tuple[Pattern[str], bool, bool]] = []
+        for line in patterns:
+            rule = self._compile(line)
+            if rule is not None:
+                self._rules.append(rule)
+
+        # Fast path: without negations one combined regex per kind suffices
+        self._has_negation = any(negate for _, negate, _ in self._rules)
+        self._any_regex = self._combine([r for r, _, d in self._rules if not d])
+        self._dir_regex = self._combine([r for r, _, d in self._rules if d])
+
+    @staticmethod
+    def _compile(line: str) -> Optional[Tuple[Pattern[str], bool, bool]]:
+        """Compile one gitignore line into (regex, negate, dir_only)"""
+        line = line.rstrip("\n")
+        if not line.endswith("\\ "):
+            line = line.rstrip()
+        if not line or line.startswith("#"):
+            return None
+
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        elif line.startswith("\\"):
+            line = line[1:]
+
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            return None
+
+        anchored = "/" in line
+        line = line.lstrip("/")
+        prefix = "^" if anchored else "^(?:.*/)?"
+        return re.compile(prefix + _glob_to_regex(line) + "$"), negate, dir_only
+
+    @staticmethod
+    def _combine(regexes: List[Pattern[str]]) -> Optional[Pattern[str]]:
+        if not regexes:
+            return None
+        return re.compile("|".join(f"(?:{r.pattern})" for r in regexes))
+
+    def __bool__(self) -> bool:
+        return bool(self._rules)
+
+    def _relative(self, rel_path: str) -> Optional[str]:
+        if not self.base:
+            return rel_path
+        if rel_path.startswith(self.base + "/"):
+            return rel_path[len(self.base) + 1 :]
+        return None
+
+    def match(self, rel_path: str, is_dir: bool) -> Optional[bool]:
+        """
+        Check a path against the rules.
+
+        Args:
+            rel_path: Path relative to the walk root, "/" separated
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if ignored, False if explicitly re-included, None otherwise
+        """
+        path = self._relative(rel_path)
+        if path is None:
+            return None
+
+        if not self._has_negation:
+            if self._any_regex is not None and self._any_regex.match(path):
+                return True
+            if is_dir and self._dir_regex is not None and self._dir_regex.match(path):
+                return True
+            return None
+
+        for regex, negate, dir_only in reversed(self._rules):
+            if dir_only and not is_dir:
+                continue
+            if regex.match(path):
+                return not negate
+        return None
+
+
+class ExcludeMatcher:
+    """
+    Match paths against exclude patterns.
+
+    Patterns containing glob characters use gitignore semantics; plain
+    strings keep the historical substring behaviour of validate_directory.
+    """
+
+    def __init__(self, patterns: Sequence[str]) -> None:
+        globs = [p for p in patterns if _GLOB_CHARS.search(p)]
+        self._substrings = [p for p in patterns if p and not _GLOB_CHARS.search(p)]
+        self._rules = IgnoreRules(globs)
+
+    def __bool__(self) -> bool:
+        return bool(self._substrings) or bool(self._rules)
+
+    def matches(self, rel_path: str, full_path: str, is_dir: bool = False) -> bool:
+        """Check whether a path is excluded"""
+        if any(s in full_path for s in self._substrings):
+            return True
+        return bool(self._rules.match(rel_path, is_dir))
+
+
+def _read_ignore_file(path: Path) -> List[str]:
+    try:
+        return path.read_text(errors="replace").splitlines()
+    except OSError:
+        return []
+
+
+def find_git_root(start: Path) -> Optional[Path]:
+    """Return the enclosing git work tree of a directory, if any"""
+    current = start.resolve()
+    for parent in [current] + list(current.parents):
+        if (parent / ".git").exists():
+            return parent
+    return None
+
+
+class FileWalker:
+    """
+    Lazily yield the files under a directory, skipping ignored paths.
+
+    Directories are pruned before they are listed, so ignored trees such
+    as node_modules cost a single check.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        recursive: bool = True,
+        exclude_patterns: Optional[Sequence[str]] = None,
+        ignore_patterns: Optional[Sequence[str]] = None,
+        use_gitignore: bool = True,
+        prune_dirs: Optional[Sequence[str]] = None,
+        ignore_base: Optional[Path] = None,
+    ) -> None:
+        """
+        Initialize walker.
+
+        Args:
+            root: Directory to walk
+            recursive: Descend into subdirectories
+            exclude_patterns: Caller supplied patterns (globs or substrings)
+            ignore_patterns: gitignore-style patterns relative to
+                ignore_base, e.g. the .huskycat.yaml ignore_patterns list
+            use_gitignore: Honour .gitignore files and .git/info/exclude
+            prune_dirs: Directory names to always skip
+                (default: DEFAULT_PRUNE_DIRS)
+            ignore_base: Directory ignore_patterns are relative to
+                (default: current working directory)
+        """
+        self.root = root
+        self.recursive = recursive
+        self.use_gitignore = use_gitignore
+        self.prune_dirs = frozenset(
+            DEFAULT_PRUNE_DIRS if prune_dirs is None else prune_dirs
+        )
+        self._exclude = ExcludeMatcher(list(exclude_patterns or []))
+        # Configured ignore patterns always win over .gitignore negations
+        self._ignore = self._rebased_rules(
+            list(ignore_patterns or []), ignore_base or Path.cwd()
+        )
+        self._base_rules: List[IgnoreRules] = []
+        if use_gitignore:
+            self._base_rules.extend(self._parent_gitignore_rules())
+
+    def _parent_gitignore_rules(self) -> List[IgnoreRules]:
+        """Load ignore rules that apply to the walk root from above it
+
+        Covers .git/info/exclude and the .gitignore files of every directory
+        between the git root and the walk root. The walk root's own
+        .gitignore is picked up while walking.
+        """
+        root = self.root.resolve()
+        git_root = find_git_root(root)
+        if git_root is None:
+            return []
+
+        ancestors = [
+            p for p in reversed(root.parents) if p == git_root or git_root in p.parents
+        ]
+        sources = [
+            (git_root, _read_ignore_file(git_root / ".git" / "info" / "exclude"))
+        ]
+        sources += [(d, _read_ignore_file(d / ".gitignore")) for d in ancestors]
+
+        rules = []
+        for directory, lines in sources:
+            rule_set = self._rebased_rules(lines, directory)
+            if rule_set:
+                rules.append(rule_set)
+        return rules
+
+    def _rebased_rules(self, lines: Sequence[str], base: Path) -> IgnoreRules:
+        """Compile rules written relative to base for paths relative to the root"""
+        try:
+            prefix = self.root.resolve().relative_to(base.resolve()).as_posix()
+        except ValueError:
+            # Root is outside base: only floating patterns can apply
+            prefix = ""
+        rebased = [self._rebase(line, prefix) for line in lines]
+        return IgnoreRules([line for line in rebased if line is not None])
+
+    @staticmethod
+    def _rebase(line: str, prefix: str) -> Optional[str]:
+        """Rewrite a gitignore line from an ancestor directory for the walk root"""
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#") or prefix == ".":
+            return line
+        if not prefix:
+            return line if "/" not in stripped.lstrip("!").rstrip("/") else None
+        negate = stripped.startswith("!")
+        body = stripped[1:] if negate else stripped
+        if "/" not in body.rstrip("/"):
+            return line  # floating patterns match at any depth
+        body = body.lstrip("/")
+        if body.startswith("**/"):
+            return line
+        if not body.startswith(prefix + "/"):
+            return None  # anchored elsewhere in the repository
+        rebased = "/" + body[len(prefix) + 1 :]
+        return ("!" if negate else "") + rebased
+
+    def _is_ignored(
+        self, rules: List[IgnoreRules], rel_path: str, full_path: str, is_dir: bool
+    ) -> bool:
+        if self._exclude and self._exclude.matches(rel_path, full_path, is_dir):
+            return True
+        if self._ignore and self._ignore.match(rel_path, is_dir):
+            return True
+        ignored = False
+        for rule_set in rules:
+            verdict = rule_set.match(rel_path, is_dir)
+            if verdict is not None:
+                ignored = verdict
+        return ignored
+
+    def __iter__(self) -> Iterator[Path]:
+        return self.walk()
+
+    def walk(self) -> Iterator[Path]:
+        """Yield files under the root that are not ignored"""
+        stack: List[Tuple[Path, str, List[IgnoreRules]]] = [
+            (self.root, "", list(self._base_rules))
+        ]
+        while stack:
+            directory, rel_dir, rules = stack.pop()
+            # Same form as str(directory / name), used for substring excludes
+            dir_prefix = "" if str(directory) == "." else f"{directory}{os.sep}"
+
+            if self.use_gitignore:
+                gitignore = _read_ignore_file(directory / ".gitignore")
+                if gitignore:
+                    rules = rules + [IgnoreRules(gitignore, base=rel_dir)]
+
+            try:
+                with os.scandir(directory) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError as e:
+                logger.debug(f"Cannot list {directory}: {e}")
+                continue
+
+            subdirs = []
+            for entry in entries:
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                full_path = dir_prefix + entry.name
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    is_file = not is_dir and entry.is_file()
+                except OSError:
+                    continue
+
+                if is_dir:
+                    if not self.recursive or entry.name in self.prune_dirs:
+                        continue
+                    if self._is_ignored(rules, rel_path, full_path, True):
+                        continue
+                    subdirs.append((directory / entry.name, rel_path, rules))
+                elif is_file:
+                    if entry.name.startswith("."):
+                        continue
+                    if self._is_ignored(rules, rel_path, full_path, False):
+                        continue
+                    yield directory / entry.name
+
+            # Reverse so subdirectories are visited in sorted order
+            stack.extend(reversed(subdirs))
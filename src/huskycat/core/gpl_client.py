@@ -6,28 +6,99 @@ sidecar via Unix socket using JSON-RPC 2.0 protocol.
 
 Architecture:
 - Connects to GPL sidecar via Unix socket
-- Sends JSON-RPC 2.0 requests (execute, list_tools, health)
+- Sends JSON-RPC 2.0 requests (execute, execute_many, list_tools, health),
+  alone or as batches
 - Handles connection errors gracefully
 - Auto-detects socket path from environment or default
 
+Framing:
+- legacy: one connection per request; the client half-closes the socket
+  after the request and the server closes it after the response
+- length-prefixed: one persistent connection carrying frames of a 4-byte
+  big-endian length and a JSON message. Requests from any thread are
+  pipelined on it and matched to responses by id; a broken connection
+  is replaced on the next request.
+
+On length-prefixed connections execute() and execute_many() have the
+sidecar stream the tool's output: it arrives in "output" notifications
+while the tool runs rather than in one response, so there is no size
+limit. Callers passing on_output get the pieces as they arrive and memory
+stays bounded; without it, a request collects at most MAX_COLLECTED_OUTPUT
+characters and fails beyond that.
+
+Content can travel with the request instead of as a path (execute's
+stdin): the sidecar pipes it to the tool, so it need not share the
+client's filesystem. supports("stdin") tells whether a sidecar can.
+
+Requests the sidecar rejects as busy (its worker queue is full) are
+retried with backoff within the request's timeout.
+
+The client asks the sidecar for length-prefixed framing with a legacy
+"negotiate" request and keeps using legacy framing with sidecars that do
+not know it.
+
+Batches (JSON-RPC 2.0 arrays of requests) go out as one message and come
+back as one; execute_many runs a tool once over several files and gets
+its findings back split per file.
+
 The sidecar executes GPL tools (shellcheck, hadolint, yamllint) in isolation
 to maintain Apache-2.0 licensing for the main HuskyCat codebase.
 """
 
+import base64
+import hashlib
 import json
 import logging
 import os
 import socket
+import struct
+import threading
 import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 logger = logging.getLogger(__name__)
 
 # Default socket path (host-side)
 DEFAULT_SOCKET_PATH = f"/tmp/huskycat-gpl-{os.getuid()}.sock"
 
+# Framing modes (see module docstring)
+FRAMING_LEGACY = "legacy"
+FRAMING_LENGTH_PREFIXED = "length-prefixed"
+
+# Length header of a frame
+FRAME_HEADER = struct.Struct(">I")
+
+# Largest frame accepted on a persistent connection
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+# Largest response accepted with legacy framing
+MAX_LEGACY_RESPONSE = 1024 * 1024
+
+# Most streamed output (characters) a request collects when the caller
+# passes no on_output; beyond it the request fails
+MAX_COLLECTED_OUTPUT = 64 * 1024 * 1024
+
+# JSON-RPC error code of a request the sidecar turned away because its
+# queue was full. Such requests are sent again after a delay (doubling up
+# to the maximum, in seconds) until their timeout runs out.
+SERVER_BUSY = -32001
+BUSY_RETRY_DELAY = 0.05
+MAX_BUSY_RETRY_DELAY = 1.0
+
 
 @dataclass
 class GPLToolResult:
@@ -59,9 +130,208 @@ class GPLSidecarTimeoutError(GPLSidecarError):
     pass
 
 
+class _OutputCollector:
+    """Joins streamed output per stream (or file), up to MAX_COLLECTED_OUTPUT"""
+
+    def __init__(self) -> None:
+        self.pieces: Dict[str, List[str]] = {}
+        self.size = 0
+        self.overflow = False
+
+    def __call__(self, name: str, data: str) -> None:
+        self.size += len(data)
+        if self.size > MAX_COLLECTED_OUTPUT:
+            self.overflow = True
+            self.pieces.clear()
+        if not self.overflow:
+            self.pieces.setdefault(name, []).append(data)
+
+    def text(self, name: str) -> str:
+        """All output of a stream, joined"""
+        return "".join(self.pieces.pop(name, []))
+
+    def check(self) -> None:
+        """
+        Fail if output had to be dropped.
+
+        Raises:
+            GPLSidecarError: More output arrived than MAX_COLLECTED_OUTPUT
+        """
+        if self.overflow:
+            raise GPLSidecarError(
+                f"Output exceeds {MAX_COLLECTED_OUTPUT} characters "
+                f"({self.size} received)"
+            )
+
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    """Read exactly size bytes (None if the peer closed before the first one)"""
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if not count:
+            if received == 0:
+                return None
+            raise ConnectionError("Connection closed mid-frame")
+        received += count
+    return bytes(buffer)
+
+
+def send_frame(sock: socket.socket, message: Any) -> None:
+    """Send a JSON message as one length-prefixed frame"""
+    payload = json.dumps(message).encode("utf-8")
+    sock.sendall(FRAME_HEADER.pack(len(payload)) + payload)
+
+
+def recv_frame(sock: socket.socket) -> Optional[Any]:
+    """
+    Read one length-prefixed frame.
+
+    Returns:
+        Decoded JSON message, or None if the peer closed the connection
+
+    Raises:
+        GPLSidecarError: Frame larger than MAX_FRAME_SIZE
+        ConnectionError: Connection closed mid-frame
+    """
+    header = _recv_exact(sock, FRAME_HEADER.size)
+    if header is None:
+        return None
+    (size,) = FRAME_HEADER.unpack(header)
+    if size > MAX_FRAME_SIZE:
+        raise GPLSidecarError(f"Frame too large ({size} bytes)")
+    payload = _recv_exact(sock, size) if size else b""
+    if payload is None:
+        raise ConnectionError("Connection closed mid-frame")
+    return json.loads(payload.decode("utf-8"))
+
+
+class _Connection:
+    """
+    Persistent length-prefixed connection to the sidecar.
+
+    Thread-safe. Requests are written as they come; a reader thread
+    resolves each request's future with the response carrying its id, so
+    any number of requests (and batches) can be in flight. Streamed output
+    of a request goes to the callback it was submitted with.
+    """
+
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self.pid = os.getpid()
+        self.closed = False
+        self._pending: Dict[Any, "Future[Dict[str, Any]]"] = {}
+        self._streams: Dict[Any, Callable[[str, str], None]] = {}
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._reader = threading.Thread(
+            target=self._read, name="huskycat-gpl-reader", daemon=True
+        )
+        self._reader.start()
+
+    def submit(
+        self, message: Any, on_output: Optional[Callable[[str, str], None]] = None
+    ) -> Any:
+        """
+        Send a request, or a batch (list) of requests in one frame.
+
+        Args:
+            message: Request dict or list of requests
+            on_output: Called with the stream name and each piece of
+                output the sidecar streams for a (single) request
+
+        Returns:
+            Future resolved with the response; for a batch, a list of
+            futures in request order
+
+        Raises:
+            GPLSidecarConnectionError: The connection is closed or broke
+        """
+        requests = message if isinstance(message, list) else [message]
+        futures: List["Future[Dict[str, Any]]"] = [Future() for _ in requests]
+        with self._lock:
+            if self.closed:
+                raise GPLSidecarConnectionError("Connection closed")
+            for request, future in zip(requests, futures):
+                self._pending[request["id"]] = future
+            if on_output is not None and not isinstance(message, list):
+                self._streams[message["id"]] = on_output
+        try:
+            with self._send_lock:
+                send_frame(self.sock, message)
+        except OSError as e:
+            self.close(f"Connection lost: {e}")
+        return futures if isinstance(message, list) else futures[0]
+
+    def forget(self, request_id: Any) -> None:
+        """Stop waiting for a request's response (e.g. after a timeout)"""
+        with self._lock:
+            self._pending.pop(request_id, None)
+            self._streams.pop(request_id, None)
+
+    def _stream(self, params: Dict[str, Any]) -> None:
+        """Pass a piece of streamed output to its request's callback"""
+        with self._lock:
+            on_output = self._streams.get(params.get("id"))
+        if on_output is None:
+            return
+        try:
+            on_output(params.get("stream", "stdout"), params.get("data", ""))
+        except Exception as e:
+            logger.warning(f"Output callback failed: {e}")
+
+    def _read(self) -> None:
+        reason = "Connection closed by sidecar"
+        try:
+            while True:
+                message = recv_frame(self.sock)
+                if message is None:
+                    break
+                if isinstance(message, dict) and message.get("method") == "output":
+                    self._stream(message.get("params") or {})
+                    continue
+                for response in message if isinstance(message, list) else [message]:
+                    with self._lock:
+                        future = self._pending.pop(response.get("id"), None)
+                        self._streams.pop(response.get("id"), None)
+                    if future is not None:
+                        future.set_result(response)
+                    else:
+                        logger.debug(f"Dropping unmatched sidecar response: {response}")
+        except Exception as e:
+            reason = f"Connection lost: {e}"
+        self.close(reason)
+
+    def close(self, reason: str = "Connection closed") -> None:
+        """Close the connection, failing the requests still in flight"""
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            pending = list(self._pending.values())
+            self._pending.clear()
+            self._streams.clear()
+        if self.pid == os.getpid():
+            # A forked child shares the socket; shutting it down there
+            # would cut off the parent
+            try:
+                self.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self.sock.close()
+        for future in pending:
+            if not future.done():
+                future.set_exception(GPLSidecarConnectionError(reason))
+
+
 class GPLSidecarClient:
     """Client for communicating with GPL sidecar via IPC.
 
+    Thread-safe: with length-prefixed framing, concurrent requests share
+    one persistent connection.
+
     Example:
         client = GPLSidecarClient()
         if client.is_available():
@@ -69,27 +339,182 @@ class GPLSidecarClient:
             print(result.stdout)
     """
 
-    def __init__(self, socket_path: Optional[str] = None):
+    def __init__(
+        self, socket_path: Optional[str] = None, framing: Optional[str] = None
+    ):
         """Initialize GPL sidecar client.
 
         Args:
             socket_path: Unix socket path (default: from env or /tmp/huskycat-gpl-{uid}.sock)
+            framing: FRAMING_LEGACY or FRAMING_LENGTH_PREFIXED (default:
+                negotiated with the sidecar on the first request)
         """
         self.socket_path = socket_path or os.environ.get(
             "HUSKYCAT_GPL_SOCKET", DEFAULT_SOCKET_PATH
         )
+        self.framing = framing
+        # Protocol features the sidecar announced (None: not asked yet)
+        self.features: Optional[FrozenSet[str]] = None
         self._request_id = 0
+        self._lock = threading.Lock()
+        self._negotiate_lock = threading.Lock()
+        self._connection: Optional[_Connection] = None
 
     def _next_request_id(self) -> int:
         """Get next JSON-RPC request ID."""
-        self._request_id += 1
-        return self._request_id
+        with self._lock:
+            self._request_id += 1
+            return self._request_id
+
+    def _connect(self, timeout: float) -> socket.socket:
+        """Open a socket to the sidecar.
+
+        Raises:
+            GPLSidecarConnectionError: Connection failed
+            GPLSidecarTimeoutError: Connection timed out
+        """
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        try:
+            sock.connect(self.socket_path)
+        except FileNotFoundError:
+            sock.close()
+            raise GPLSidecarConnectionError(
+                f"Socket not found: {self.socket_path}. Is the sidecar running?"
+            )
+        except ConnectionRefusedError:
+            sock.close()
+            raise GPLSidecarConnectionError(f"Connection refused: {self.socket_path}")
+        except socket.timeout:
+            sock.close()
+            raise GPLSidecarTimeoutError(f"Connection timeout: {self.socket_path}")
+        except OSError as e:
+            sock.close()
+            raise GPLSidecarConnectionError(f"Connection failed: {e}")
+        return sock
+
+    def _send_legacy(self, request: Any, timeout: float) -> Any:
+        """Send a request (or batch) on a connection of its own, read the response."""
+        sock = self._connect(timeout)
+        try:
+            sock.sendall(json.dumps(request).encode("utf-8"))
+
+            # Shutdown write side to signal end of request
+            sock.shutdown(socket.SHUT_WR)
+
+            chunks: List[bytes] = []
+            size = 0
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                size += len(chunk)
+                if size > MAX_LEGACY_RESPONSE:
+                    raise GPLSidecarError("Response too large (>1MB)")
+        finally:
+            sock.close()
+
+        if not chunks:
+            raise GPLSidecarError("Empty response from sidecar")
+        return json.loads(b"".join(chunks).decode("utf-8"))
+
+    def _get_connection(self, timeout: float) -> _Connection:
+        """The persistent connection, (re)connecting when there is none."""
+        with self._lock:
+            connection = self._connection
+            if connection is not None and connection.pid != os.getpid():
+                # Inherited through fork(): its reader thread is gone
+                connection.close("Connection inherited from parent process")
+                connection = None
+            if connection is None or connection.closed:
+                sock = self._connect(timeout)
+                sock.settimeout(None)
+                connection = self._connection = _Connection(sock)
+            return connection
+
+    def _send_framed(
+        self,
+        request: Any,
+        timeout: float,
+        on_output: Optional[Callable[[str, str], None]] = None,
+    ) -> Any:
+        """Send a request (or batch) on the persistent connection, await the response.
+
+        A request whose connection broke (e.g. the sidecar restarted) is
+        sent once more on a new connection, unless part of its output was
+        already streamed.
+        """
+        requests = request if isinstance(request, list) else [request]
+        streamed = threading.Event()
+
+        def stream(name: str, data: str) -> None:
+            streamed.set()
+            if on_output is not None:
+                on_output(name, data)
+
+        deadline = time.monotonic() + timeout
+        for attempt in range(2):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            connection = self._get_connection(remaining)
+            try:
+                submitted = connection.submit(
+                    request, stream if on_output is not None else None
+                )
+                futures = submitted if isinstance(request, list) else [submitted]
+                responses = [
+                    future.result(timeout=max(0.0, deadline - time.monotonic()))
+                    for future in futures
+                ]
+                return responses if isinstance(request, list) else responses[0]
+            except FutureTimeoutError:
+                for sent in requests:
+                    connection.forget(sent["id"])
+                break
+            except GPLSidecarConnectionError:
+                if attempt or streamed.is_set():
+                    raise
+                logger.debug("GPL sidecar connection lost, reconnecting")
+        raise GPLSidecarTimeoutError(f"Request timeout after {timeout}s")
+
+    def _negotiate(self, timeout: float) -> str:
+        """Agree on the framing with the sidecar (once per client).
+
+        Returns:
+            FRAMING_LENGTH_PREFIXED if the sidecar supports it, else
+            FRAMING_LEGACY
+        """
+        with self._negotiate_lock:
+            # Threads starting together wait for the first one to agree
+            if self.framing is not None:
+                return self.framing
+            response = self._send_legacy(
+                {
+                    "jsonrpc": "2.0",
+                    "id": self._next_request_id(),
+                    "method": "negotiate",
+                    "params": {"framing": [FRAMING_LENGTH_PREFIXED]},
+                },
+                timeout,
+            )
+            result = response.get("result") or {}
+            framing = result.get("framing")
+            if framing != FRAMING_LENGTH_PREFIXED:
+                # Sidecars predating negotiation answer "Method not found"
+                framing = FRAMING_LEGACY
+            self.features = frozenset(result.get("features") or ())
+            self.framing = framing
+            logger.debug(f"GPL sidecar framing: {framing}")
+            return framing
 
     def _send_request(
         self,
         method: str,
         params: Optional[Dict[str, Any]] = None,
         timeout: float = 30.0,
+        on_output: Optional[Callable[[str, str], None]] = None,
     ) -> Dict[str, Any]:
         """Send JSON-RPC 2.0 request to sidecar.
 
@@ -97,6 +522,7 @@ class GPLSidecarClient:
             method: JSON-RPC method name
             params: Method parameters (optional)
             timeout: Socket timeout in seconds
+            on_output: Receives output the sidecar streams for the request
 
         Returns:
             JSON-RPC result dict
@@ -106,6 +532,72 @@ class GPLSidecarClient:
             GPLSidecarTimeoutError: Request timed out
             GPLSidecarError: RPC error or invalid response
         """
+        deadline = time.monotonic() + timeout
+        delay = BUSY_RETRY_DELAY
+        while True:
+            response = self._exchange(self._request(method, params), timeout, on_output)
+            if not self._retry_busy(response, deadline, delay):
+                return self._result(response)
+            time.sleep(delay)
+            delay = min(2 * delay, MAX_BUSY_RETRY_DELAY)
+            timeout = deadline - time.monotonic()
+
+    def _send_batch(
+        self,
+        calls: Sequence[Tuple[str, Optional[Dict[str, Any]]]],
+        timeout: float = 30.0,
+    ) -> List[Dict[str, Any]]:
+        """Send JSON-RPC 2.0 requests as one batch.
+
+        Args:
+            calls: (method, params) of each request
+            timeout: Timeout in seconds for the whole batch
+
+        Returns:
+            JSON-RPC responses (result or error) in the order of calls
+
+        Raises:
+            GPLSidecarConnectionError: Connection failed
+            GPLSidecarTimeoutError: Request timed out
+            GPLSidecarError: Invalid response
+        """
+        responses: List[Dict[str, Any]] = [{} for _ in calls]
+        pending = list(range(len(calls)))
+        deadline = time.monotonic() + timeout
+        delay = BUSY_RETRY_DELAY
+        while True:
+            requests = [self._request(*calls[index]) for index in pending]
+            answers = self._exchange(requests, deadline - time.monotonic())
+            if isinstance(answers, dict):
+                # The whole batch was rejected
+                self._result(answers)
+            by_id = {answer.get("id"): answer for answer in answers}
+            missing = [r["id"] for r in requests if r["id"] not in by_id]
+            if missing:
+                raise GPLSidecarError(f"Batch response lacks ids {missing}")
+
+            busy = []
+            for index, request in zip(pending, requests):
+                responses[index] = by_id[request["id"]]
+                if self._retry_busy(responses[index], deadline, delay):
+                    busy.append(index)
+            if not busy:
+                return responses
+            pending = busy
+            time.sleep(delay)
+            delay = min(2 * delay, MAX_BUSY_RETRY_DELAY)
+
+    @staticmethod
+    def _retry_busy(response: Dict[str, Any], deadline: float, delay: float) -> bool:
+        """Whether a response turns the request away as busy and there is
+        time to send it again after delay seconds."""
+        error = response.get("error") or {}
+        return error.get("code") == SERVER_BUSY and deadline - time.monotonic() > delay
+
+    def _request(
+        self, method: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Build a JSON-RPC 2.0 request with a fresh id."""
         request = {
             "jsonrpc": "2.0",
             "id": self._next_request_id(),
@@ -113,61 +605,34 @@ class GPLSidecarClient:
         }
         if params is not None:
             request["params"] = params
+        return request
 
-        try:
-            # Connect to Unix socket
-            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
-
-            try:
-                sock.connect(self.socket_path)
-            except FileNotFoundError:
-                raise GPLSidecarConnectionError(
-                    f"Socket not found: {self.socket_path}. Is the sidecar running?"
-                )
-            except ConnectionRefusedError:
-                raise GPLSidecarConnectionError(
-                    f"Connection refused: {self.socket_path}"
-                )
-            except socket.timeout:
-                raise GPLSidecarTimeoutError(f"Connection timeout: {self.socket_path}")
-
-            # Send request
-            request_bytes = json.dumps(request).encode("utf-8")
-            sock.sendall(request_bytes)
-
-            # Shutdown write side to signal end of request
-            sock.shutdown(socket.SHUT_WR)
-
-            # Receive response (max 1MB)
-            response_data = b""
-            while True:
-                chunk = sock.recv(4096)
-                if not chunk:
-                    break
-                response_data += chunk
-                if len(response_data) > 1024 * 1024:
-                    raise GPLSidecarError("Response too large (>1MB)")
-
-            if not response_data:
-                raise GPLSidecarError("Empty response from sidecar")
-
-            # Parse JSON-RPC response
-            response = json.loads(response_data.decode("utf-8"))
-
-            # Check for JSON-RPC error
-            if "error" in response:
-                error = response["error"]
-                code = error.get("code", -32603)
-                message = error.get("message", "Unknown error")
-                raise GPLSidecarError(f"RPC error {code}: {message}")
-
-            # Return result
-            if "result" not in response:
-                raise GPLSidecarError("Invalid JSON-RPC response: missing 'result'")
+    def _exchange(
+        self,
+        request: Any,
+        timeout: float,
+        on_output: Optional[Callable[[str, str], None]] = None,
+    ) -> Any:
+        """Send a request or batch in the negotiated framing and read the response.
 
-            return response["result"]
+        Output streamed for the request goes to on_output (length-prefixed
+        framing only).
 
+        Raises:
+            GPLSidecarConnectionError: Connection failed
+            GPLSidecarTimeoutError: Request timed out
+            GPLSidecarError: Invalid response
+        """
+        # Negotiation (first request only) and the request share the timeout
+        deadline = time.monotonic() + timeout
+        try:
+            framing = self._negotiate(timeout)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise GPLSidecarTimeoutError(f"Request timeout after {timeout}s")
+            if framing == FRAMING_LENGTH_PREFIXED:
+                return self._send_framed(request, remaining, on_output)
+            return self._send_legacy(request, remaining)
         except socket.timeout:
             raise GPLSidecarTimeoutError(f"Request timeout after {timeout}s")
         except json.JSONDecodeError as e:
@@ -177,8 +642,54 @@ class GPLSidecarClient:
             raise
         except Exception as e:
             raise GPLSidecarError(f"Unexpected error: {e}")
-        finally:
-            sock.close()
+
+    @staticmethod
+    def _result(response: Dict[str, Any]) -> Dict[str, Any]:
+        """The result of a JSON-RPC response.
+
+        Raises:
+            GPLSidecarError: RPC error or invalid response
+        """
+        # Check for JSON-RPC error
+        if "error" in response:
+            error = response["error"]
+            code = error.get("code", -32603)
+            message = error.get("message", "Unknown error")
+            raise GPLSidecarError(f"RPC error {code}: {message}")
+
+        if "result" not in response:
+            raise GPLSidecarError("Invalid JSON-RPC response: missing 'result'")
+
+        return response["result"]
+
+    def supports(self, feature: str) -> bool:
+        """Whether the sidecar announced a protocol feature (e.g. "stdin").
+
+        Returns:
+            False also if the sidecar cannot be reached
+        """
+        if self.features is None:
+            try:
+                if self.framing is None:
+                    self._negotiate(2.0)
+                else:
+                    result = self._send_request(
+                        "negotiate", {"framing": [self.framing]}, timeout=2.0
+                    )
+                    self.features = frozenset(result.get("features") or ())
+            except (GPLSidecarConnectionError, GPLSidecarTimeoutError):
+                return False
+            except GPLSidecarError:
+                # Sidecars predating negotiation
+                self.features = frozenset()
+        return feature in (self.features or ())
+
+    def close(self) -> None:
+        """Close the persistent connection, if any."""
+        with self._lock:
+            connection, self._connection = self._connection, None
+        if connection is not None:
+            connection.close()
 
     def is_available(self) -> bool:
         """Check if sidecar is running and accessible.
@@ -198,8 +709,9 @@ class GPLSidecarClient:
         tool: str,
         args: List[str],
         cwd: Optional[str] = None,
-        stdin: Optional[str] = None,
+        stdin: Optional[Union[str, bytes]] = None,
         timeout_ms: int = 30000,
+        on_output: Optional[Callable[[str, str], None]] = None,
     ) -> GPLToolResult:
         """Execute a GPL tool via sidecar.
 
@@ -207,62 +719,258 @@ class GPLSidecarClient:
             tool: Tool name (shellcheck, hadolint, yamllint)
             args: Command-line arguments
             cwd: Working directory (default: /workspace in container)
-            stdin: Optional stdin input (not yet implemented in server)
+            stdin: Content piped to the tool, e.g. with args ending in "-"
+                (needs supports("stdin"))
             timeout_ms: Execution timeout in milliseconds
+            on_output: Called with the stream name ("stdout"/"stderr") and
+                each piece of output as it arrives, instead of collecting
+                the output in the result
 
         Returns:
-            GPLToolResult with execution results
+            GPLToolResult with execution results (empty stdout/stderr if
+            on_output was given)
 
         Raises:
             GPLSidecarError: Execution failed or sidecar unavailable
         """
         start_time = time.time()
 
-        params: Dict[str, Any] = {
-            "tool": tool,
-            "args": args,
-        }
-        if cwd is not None:
-            params["cwd"] = cwd
-        # Note: stdin not yet supported by server, but included for future
+        params = self._execute_params(tool, args, cwd, stdin, timeout_ms)
+        params["stream"] = True
 
         # Convert timeout to seconds for socket timeout
         socket_timeout = timeout_ms / 1000.0
 
+        # Streamed output is joined once at the end
+        collector = _OutputCollector()
+
         try:
-            result = self._send_request("execute", params, timeout=socket_timeout)
+            result = self._send_request(
+                "execute",
+                params,
+                timeout=socket_timeout,
+                on_output=on_output or collector,
+            )
+            collector.check()
         except GPLSidecarTimeoutError:
-            # Convert to result with timeout exit code
-            duration_ms = (time.time() - start_time) * 1000
-            return GPLToolResult(
-                tool=tool,
-                exit_code=124,
-                stdout="",
-                stderr=f"Tool execution timed out after {timeout_ms}ms",
-                success=False,
-                duration_ms=duration_ms,
+            return self._timeout_result(tool, timeout_ms, start_time)
+        except GPLSidecarError as e:
+            return self._error_result(tool, e, start_time)
+
+        if result.get("streamed"):
+            result = dict(
+                result,
+                stdout=collector.text("stdout"),
+                stderr=collector.text("stderr"),
             )
+        elif on_output is not None:
+            # Sidecars without streaming (or legacy framing) send it all at once
+            for stream in ("stdout", "stderr"):
+                if result.get(stream):
+                    on_output(stream, result[stream])
+            result = dict(result, stdout="", stderr="")
+        return self._tool_result(tool, result, start_time)
+
+    def execute_batch(
+        self,
+        calls: Sequence[Tuple[Any, ...]],
+        cwd: Optional[str] = None,
+        timeout_ms: int = 30000,
+    ) -> List[GPLToolResult]:
+        """Execute several GPL tool runs in one batch request.
+
+        Runs with the same tool, arguments and stdin content (compared by
+        hash) are sent once and share their result.
+
+        Args:
+            calls: (tool, args) or (tool, args, stdin) of each run
+            cwd: Working directory of all runs (default: /workspace in container)
+            timeout_ms: Timeout in milliseconds for the whole batch
+
+        Returns:
+            GPLToolResult of each run, in the order of calls
+        """
+        start_time = time.time()
+        unique: Dict[Tuple[str, Tuple[str, ...], Optional[str]], int] = {}
+        requests: List[Tuple[str, Dict[str, Any]]] = []
+        slots = []
+        for tool, args, *rest in calls:
+            stdin = rest[0] if rest else None
+            key = (tool, tuple(args), self._content_hash(stdin))
+            if key not in unique:
+                unique[key] = len(requests)
+                requests.append(
+                    (
+                        "execute",
+                        self._execute_params(tool, args, cwd, stdin, timeout_ms),
+                    )
+                )
+            slots.append(unique[key])
+        tools = [params["tool"] for _, params in requests]
+
+        try:
+            responses = self._send_batch(requests, timeout=timeout_ms / 1000.0)
+        except GPLSidecarTimeoutError:
+            results = [self._timeout_result(t, timeout_ms, start_time) for t in tools]
         except GPLSidecarError as e:
-            # Convert other errors to result
-            duration_ms = (time.time() - start_time) * 1000
-            return GPLToolResult(
+            results = [self._error_result(t, e, start_time) for t in tools]
+        else:
+            results = []
+            for tool, response in zip(tools, responses):
+                try:
+                    results.append(
+                        self._tool_result(tool, self._result(response), start_time)
+                    )
+                except GPLSidecarError as e:
+                    results.append(self._error_result(tool, e, start_time))
+        return [results[slot] for slot in slots]
+
+    @staticmethod
+    def _execute_params(
+        tool: str,
+        args: List[str],
+        cwd: Optional[str] = None,
+        stdin: Optional[Union[str, bytes]] = None,
+        timeout_ms: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Params of an execute request (bytes on stdin go base64-encoded)."""
+        params: Dict[str, Any] = {"tool": tool, "args": args}
+        if timeout_ms is not None:
+            # The sidecar kills the tool once the client stops waiting
+            params["timeout_ms"] = timeout_ms
+        if cwd is not None:
+            params["cwd"] = cwd
+        if isinstance(stdin, bytes):
+            params["stdin_base64"] = base64.b64encode(stdin).decode("ascii")
+        elif stdin is not None:
+            params["stdin"] = stdin
+        return params
+
+    @staticmethod
+    def _content_hash(content: Optional[Union[str, bytes]]) -> Optional[str]:
+        """SHA-256 of stdin content, text taken as UTF-8 (None without content)."""
+        if content is None:
+            return None
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        return hashlib.sha256(content).hexdigest()
+
+    def execute_many(
+        self,
+        tool: str,
+        files: Sequence[str],
+        args: Optional[List[str]] = None,
+        cwd: Optional[str] = None,
+        timeout_ms: int = 30000,
+        on_output: Optional[Callable[[str, str], None]] = None,
+    ) -> Dict[str, GPLToolResult]:
+        """Run a GPL tool once over several files, with results split per file.
+
+        Each file's result reads like a run over that file alone (see the
+        sidecar's execute_many). Only shellcheck, hadolint and yamllint
+        can be split.
+
+        Args:
+            tool: Tool name (shellcheck, hadolint, yamllint)
+            files: Files to check
+            args: Further command-line arguments (without an output format)
+            cwd: Working directory (default: /workspace in container)
+            timeout_ms: Execution timeout in milliseconds
+            on_output: Called with a file and each piece of its output as
+                it arrives, instead of collecting the output in the results
+
+        Returns:
+            Dict mapping each file to its GPLToolResult (with empty stdout
+            if on_output was given)
+
+        Raises:
+            GPLSidecarError: The run failed, or its output could not be split
+                or exceeded MAX_COLLECTED_OUTPUT (without on_output)
+        """
+        start_time = time.time()
+        params: Dict[str, Any] = {
+            "tool": tool,
+            "files": list(files),
+            "args": args or [],
+            "timeout_ms": timeout_ms,
+            "stream": True,
+        }
+        if cwd is not None:
+            params["cwd"] = cwd
+
+        # Streamed output is joined once at the end, file by file
+        collector = _OutputCollector()
+
+        result = self._send_request(
+            "execute_many",
+            params,
+            timeout=timeout_ms / 1000.0,
+            on_output=on_output or collector,
+        )
+        collector.check()
+
+        entries = result.get("files", [])
+        if result.get("streamed"):
+            entries = [
+                dict(entry, stdout=collector.text(entry["file"])) for entry in entries
+            ]
+        elif on_output is not None:
+            # Sidecars without streaming (or legacy framing) send it all at once
+            for entry in entries:
+                if entry.get("stdout"):
+                    on_output(entry["file"], entry["stdout"])
+            entries = [dict(entry, stdout="") for entry in entries]
+
+        duration_ms = (time.time() - start_time) * 1000
+        stderr = result.get("stderr", "")
+        return {
+            entry["file"]: GPLToolResult(
                 tool=tool,
-                exit_code=1,
-                stdout="",
-                stderr=f"Sidecar error: {e}",
-                success=False,
+                exit_code=entry.get("exit_code", 1),
+                stdout=entry.get("stdout", ""),
+                stderr=stderr,
+                success=entry.get("exit_code", 1) == 0,
                 duration_ms=duration_ms,
             )
+            for entry in entries
+        }
 
-        duration_ms = (time.time() - start_time) * 1000
-
+    @staticmethod
+    def _tool_result(
+        tool: str, result: Dict[str, Any], start_time: float
+    ) -> GPLToolResult:
+        """GPLToolResult of an execute result."""
         return GPLToolResult(
             tool=tool,
             exit_code=result.get("exit_code", 1),
             stdout=result.get("stdout", ""),
             stderr=result.get("stderr", ""),
             success=result.get("success", False),
-            duration_ms=duration_ms,
+            duration_ms=(time.time() - start_time) * 1000,
+        )
+
+    @staticmethod
+    def _timeout_result(tool: str, timeout_ms: int, start_time: float) -> GPLToolResult:
+        """GPLToolResult of a run that timed out (exit code 124, like timeout(1))."""
+        return GPLToolResult(
+            tool=tool,
+            exit_code=124,
+            stdout="",
+            stderr=f"Tool execution timed out after {timeout_ms}ms",
+            success=False,
+            duration_ms=(time.time() - start_time) * 1000,
+        )
+
+    @staticmethod
+    def _error_result(tool: str, error: Exception, start_time: float) -> GPLToolResult:
+        """GPLToolResult of a run the sidecar could not carry out."""
+        return GPLToolResult(
+            tool=tool,
+            exit_code=1,
+            stdout="",
+            stderr=f"Sidecar error: {error}",
+            success=False,
+            duration_ms=(time.time() - start_time) * 1000,
         )
 
     def list_tools(self) -> Dict[str, str]:
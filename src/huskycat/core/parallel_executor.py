@@ -3,17 +3,48 @@ Parallel tool executor with intelligent dependency graph management.
 
 Executes validation tools in parallel while respecting dependencies,
 maximizing throughput by running independent tools concurrently.
+Every tool runs under a CancelToken (see core.cancellation), so its
+processes are killed when it exceeds its timeout (see core.timeouts) or
+when fail-fast mode stops the run. Tools given as a ShardedTool have their files split
+into shards that run concurrently and are merged into one result. With
+a ResourceBudget (see core.resources), tools whose usage was measured
+start only while the CPU and memory they are expected to use are free.
 """
 
+import logging
 import os
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import heapq
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from functools import partial
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import networkx as nx
 
+from .cancellation import CancelToken, ToolCancelled, cancel_scope
+from .resources import ResourceBudget, ResourceMeter, ToolUsage, meter_scope
+from .timeouts import TimeoutPolicy
+
+if TYPE_CHECKING:
+    from .process_manager import ToolHistory
+
+logger = logging.getLogger(__name__)
+
 
 class ToolStatus(Enum):
     """Status of tool execution."""
@@ -24,6 +55,7 @@ class ToolStatus(Enum):
     FAILED = "failed"
     SKIPPED = "skipped"
     TIMEOUT = "timeout"
+    CANCELLED = "cancelled"
 
 
 @dataclass
@@ -73,12 +105,43 @@ TOOL_DEPENDENCIES: Dict[str, List[str]] = {
 }
 
 
+# Failure rate assumed for tools that never failed, so fail-fast ordering
+# still prefers cheap tools among them
+MIN_FAILURE_RATE = 0.01
+
+# Fewest cores a measured tool is assumed to keep busy
+MIN_TOOL_CORES = 0.1
+
+# Fewest files per shard for tools without history; smaller shards would
+# spend most of their time starting the tool
+MIN_SHARD_FILES = 25
+
+
+@dataclass
+class ShardedTool:
+    """
+    A tool whose files can be checked in independent shards.
+
+    ParallelExecutor.execute_tools() splits ``files`` into shards that
+    run concurrently, calls ``run`` once per shard and merges the shard
+    results into one ToolResult. Calling the tool itself checks all
+    files at once, like a plain tool callable.
+    """
+
+    files: List[Path]
+    run: Callable[[List[Path]], Any]
+
+    def __call__(self) -> Any:
+        return self.run(self.files)
+
+
 class ParallelExecutor:
     """
     Execute validation tools in parallel respecting dependency constraints.
 
     Uses a directed acyclic graph (DAG) to determine execution order
-    and runs independent tools concurrently using ThreadPoolExecutor.
+    and starts each tool on a shared ThreadPoolExecutor as soon as its
+    own dependencies have completed.
     """
 
     def __init__(
@@ -87,21 +150,45 @@ class ParallelExecutor:
         max_workers: Optional[int] = None,
         timeout_per_tool: float = 30.0,
         fail_fast: bool = False,
+        budget: Optional[ResourceBudget] = None,
+        timeouts: Optional[TimeoutPolicy] = None,
     ) -> None:
         """
         Initialize the parallel executor.
 
         Args:
             tool_dependencies: Dict mapping tool names to their dependencies
-            max_workers: Maximum parallel workers (default: CPU count - 1)
-            timeout_per_tool: Maximum seconds per tool execution
+            max_workers: Maximum parallel workers (default: CPU count - 1,
+                or twice the CPU count when a budget admits tools)
+            timeout_per_tool: Maximum seconds per tool execution, unless
+                the timeout policy sets one for the tool
             fail_fast: Stop on first critical failure if True
+            budget: CPU and memory budget tools with known usage are
+                admitted against
+            timeouts: Per-tool timeouts (default: learned by use_history())
         """
+        cpus = os.cpu_count() or 1
         self.dependencies = tool_dependencies or TOOL_DEPENDENCIES
-        self.max_workers = max_workers or max(1, os.cpu_count() - 1)
+        self.budget = budget
+        if max_workers is None:
+            max_workers = 2 * cpus if budget is not None else cpus - 1
+        self.max_workers = max(1, max_workers)
         self.timeout_per_tool = timeout_per_tool
+        self.timeouts = timeouts or TimeoutPolicy()
         self.fail_fast = fail_fast
         self.graph = self._build_graph()
+        # Expected seconds per tool: measured in the last run or seeded from
+        # history (use_history()), for scheduling and estimates
+        self.durations: Dict[str, float] = {}
+        # Fraction of earlier runs each tool failed, for fail-fast ordering
+        self.failure_rates: Dict[str, float] = {}
+        # (fixed seconds, seconds per file) of each tool, for sharding
+        self.file_costs: Dict[str, Tuple[float, float]] = {}
+        # Resources one instance of each tool takes, for admission control
+        self.usage: Dict[str, ToolUsage] = {}
+        # Files each tool checks in the coming run (use_history()), for
+        # timeouts of tools not given as a ShardedTool
+        self._file_counts: Dict[str, int] = {}
 
     def _build_graph(self) -> nx.DiGraph:
         """
@@ -178,6 +265,9 @@ class ParallelExecutor:
         tool_name: str,
         tool_callable: Callable[[], Any],
         progress_callback: Optional[Callable[[str, str], None]] = None,
+        token: Optional[CancelToken] = None,
+        meter: Optional[ResourceMeter] = None,
+        limit: Optional[float] = None,
     ) -> ToolResult:
         """
         Execute a single tool with timeout handling.
@@ -186,6 +276,9 @@ class ParallelExecutor:
             tool_name: Name of the tool
             tool_callable: Callable that executes the tool
             progress_callback: Optional callback(tool_name, status)
+            token: Cancel token the tool's processes obey
+            meter: Meter measuring the tool's processes
+            limit: The tool's timeout in seconds (default: timeout_per_tool)
 
         Returns:
             ToolResult with execution details
@@ -197,31 +290,16 @@ class ParallelExecutor:
 
         try:
             # Execute tool (tool_callable should handle its own validation)
-            result = tool_callable()
+            with cancel_scope(token), meter_scope(meter):
+                result = tool_callable()
             duration = time.time() - start_time
+            tool_result = self._to_tool_result(tool_name, result, duration)
 
-            # Convert result to ToolResult if not already
-            if isinstance(result, ToolResult):
-                tool_result = result
-                tool_result.duration = duration
-            else:
-                # Assume callable returns success boolean or dict
-                if isinstance(result, dict):
-                    tool_result = ToolResult(
-                        tool_name=tool_name,
-                        success=result.get("success", True),
-                        duration=duration,
-                        errors=result.get("errors", 0),
-                        warnings=result.get("warnings", 0),
-                        output=result.get("output", ""),
-                        metadata=result.get("metadata", {}),
-                    )
-                else:
-                    tool_result = ToolResult(
-                        tool_name=tool_name,
-                        success=bool(result),
-                        duration=duration,
-                    )
+            if token is not None and token.cancelled and not tool_result.success:
+                # Validators report killed processes as ordinary failures
+                return self._cancelled_result(
+                    tool_name, duration, token, progress_callback, limit
+                )
 
             if progress_callback:
                 status = "success" if tool_result.success else "failed"
@@ -229,6 +307,11 @@ class ParallelExecutor:
 
             return tool_result
 
+        except ToolCancelled:
+            return self._cancelled_result(
+                tool_name, time.time() - start_time, token, progress_callback, limit
+            )
+
         except TimeoutError:
             duration = time.time() - start_time
             if progress_callback:
@@ -239,7 +322,7 @@ class ParallelExecutor:
                 success=False,
                 duration=duration,
                 status=ToolStatus.TIMEOUT,
-                error_message=f"Tool exceeded timeout of {self.timeout_per_tool}s",
+                error_message=self._timeout_message(limit),
             )
 
         except Exception as e:
@@ -255,90 +338,361 @@ class ParallelExecutor:
                 error_message=str(e),
             )
 
-    def _execute_level(
+    @staticmethod
+    def _to_tool_result(tool_name: str, result: Any, duration: float) -> ToolResult:
+        """
+        Convert what a tool callable returned into a ToolResult.
+
+        Args:
+            tool_name: Name of the tool
+            result: ToolResult, dict of ToolResult fields or success flag
+            duration: Seconds the tool ran
+
+        Returns:
+            ToolResult with the measured duration
+        """
+        if isinstance(result, ToolResult):
+            result.duration = duration
+            return result
+        if isinstance(result, dict):
+            return ToolResult(
+                tool_name=tool_name,
+                success=result.get("success", True),
+                duration=duration,
+                errors=result.get("errors", 0),
+                warnings=result.get("warnings", 0),
+                output=result.get("output", ""),
+                metadata=result.get("metadata", {}),
+            )
+        return ToolResult(tool_name=tool_name, success=bool(result), duration=duration)
+
+    def _cancelled_result(
         self,
-        tool_names: List[str],
-        tools: Dict[str, Callable[[], Any]],
+        tool_name: str,
+        duration: float,
+        token: Optional[CancelToken],
         progress_callback: Optional[Callable[[str, str], None]] = None,
-    ) -> List[ToolResult]:
+        limit: Optional[float] = None,
+    ) -> ToolResult:
+        """
+        Build the result of a tool stopped by its cancel token.
+
+        Args:
+            tool_name: Name of the tool
+            duration: Seconds the tool ran
+            token: The tool's cancel token
+            progress_callback: Optional callback(tool_name, status)
+            limit: The tool's timeout in seconds (default: timeout_per_tool)
+
+        Returns:
+            TIMEOUT result if the tool ran out of time, CANCELLED otherwise
+        """
+        if token is not None and not token.expired:
+            status = ToolStatus.CANCELLED
+            message = token.describe()
+        else:
+            status = ToolStatus.TIMEOUT
+            message = self._timeout_message(limit)
+        if progress_callback:
+            progress_callback(tool_name, status.value)
+
+        return ToolResult(
+            tool_name=tool_name,
+            success=False,
+            duration=duration,
+            status=status,
+            error_message=message,
+        )
+
+    def _timeout_message(self, limit: Optional[float] = None) -> str:
+        seconds = self.timeout_per_tool if limit is None else limit
+        return f"Tool exceeded timeout of {seconds:g}s"
+
+    def _tool_timeout(self, tool: str, files: Optional[int] = None) -> float:
+        """Timeout of a run of a tool over the given number of files"""
+        return self.timeouts.limit(tool, files, default=self.timeout_per_tool)
+
+    def _check_timeout(self, result: ToolResult, limit: float) -> None:
+        """
+        Note a tool's timeout in its result and warn when it came close.
+
+        Sets ``metadata["timeout"]`` and, for runs taking more than
+        TIMEOUT_WARN_FRACTION of it, ``metadata["near_timeout"]``.
+        """
+        result.metadata["timeout"] = limit
+        if result.status == ToolStatus.SUCCESS and self.timeouts.near_limit(
+            result.duration, limit
+        ):
+            result.metadata["near_timeout"] = True
+            logger.warning(
+                "%s took %.1fs of its %.0fs timeout",
+                result.tool_name,
+                result.duration,
+                limit,
+            )
+
+    def _collect_result(
+        self, future: "Future[ToolResult]", tool_name: str
+    ) -> ToolResult:
+        """
+        Get a finished tool's result, turning executor errors into failures.
+
+        Args:
+            future: Completed future of _execute_tool_with_timeout
+            tool_name: Name of the tool
+
+        Returns:
+            ToolResult of the tool
         """
-        Execute a level of tools in parallel.
+        try:
+            return future.result(timeout=self.timeout_per_tool)
+        except TimeoutError:
+            return ToolResult(
+                tool_name=tool_name,
+                success=False,
+                duration=self.timeout_per_tool,
+                status=ToolStatus.TIMEOUT,
+                error_message=self._timeout_message(),
+            )
+        except Exception as e:
+            return ToolResult(
+                tool_name=tool_name,
+                success=False,
+                duration=0.0,
+                status=ToolStatus.FAILED,
+                error_message=f"Executor error: {e!s}",
+            )
+
+    def _shard(self, tool: str, files: List[Path]) -> List[List[Path]]:
+        """
+        Split a tool's files into shards of about equal work.
+
+        Every shard pays the tool's fixed start-up cost again, so a tool
+        gets only as many shards as leave each at least that much per-file
+        work (from use_history(); MIN_SHARD_FILES files per shard without
+        history), and at most max_workers. Files are dealt out largest
+        first to the shard with the fewest bytes so far.
 
         Args:
-            tool_names: List of tool names to execute
-            tools: Dict mapping tool names to callables
-            progress_callback: Optional callback for progress updates
+            tool: Name of the tool
+            files: Files the tool checks
 
         Returns:
-            List of ToolResult for each tool in this level
-        """
-        results: List[ToolResult] = []
-
-        # Filter to only tools that exist in the tools dict
-        available_tools = [t for t in tool_names if t in tools]
-
-        if not available_tools:
-            # No tools to run at this level
-            return results
-
-        # Execute tools in parallel using ThreadPoolExecutor
-        workers = min(len(available_tools), self.max_workers)
-
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            # Submit all tools in this level
-            future_to_tool = {
-                executor.submit(
-                    self._execute_tool_with_timeout,
-                    tool_name,
-                    tools[tool_name],
-                    progress_callback,
-                ): tool_name
-                for tool_name in available_tools
+            Non-empty shards, each keeping the files' original order
+        """
+        shards = min(self.max_workers, len(files))
+        costs = self.file_costs.get(tool)
+        if costs is None:
+            shards = min(shards, len(files) // MIN_SHARD_FILES)
+        elif costs[0] > 0:
+            fixed, per_file = costs
+            shards = min(shards, int(per_file * len(files) / fixed))
+        if shards <= 1:
+            return [list(files)]
+
+        def size(path: Path) -> int:
+            try:
+                return max(1, os.path.getsize(path))
+            except OSError:
+                return 1
+
+        sizes = [size(path) for path in files]
+        loads = [(0, shard) for shard in range(shards)]
+        assigned: List[List[int]] = [[] for _ in range(shards)]
+        for index in sorted(range(len(files)), key=lambda i: -sizes[i]):
+            load, shard = heapq.heappop(loads)
+            assigned[shard].append(index)
+            heapq.heappush(loads, (load + sizes[index], shard))
+        return [[files[i] for i in sorted(indices)] for indices in assigned]
+
+    def _merge_shards(
+        self, tool_name: str, results: List[ToolResult], wall_time: float
+    ) -> ToolResult:
+        """
+        Combine the results of a tool's shards into one.
+
+        The duration is the shards' total run time, so tool history keeps
+        measuring the cost of checking the files; the elapsed time goes
+        to ``metadata["wall_time"]``.
+
+        Args:
+            tool_name: Name of the tool
+            results: Result of each shard, in shard order
+            wall_time: Seconds from the first shard starting to the last
+                one finishing
+
+        Returns:
+            ToolResult of the whole tool
+        """
+        statuses = {result.status for result in results}
+        status = next(
+            (
+                candidate
+                for candidate in (
+                    ToolStatus.TIMEOUT,
+                    ToolStatus.FAILED,
+                    ToolStatus.CANCELLED,
+                )
+                if candidate in statuses
+            ),
+            ToolStatus.SUCCESS,
+        )
+        metadata: Dict[str, Any] = {}
+        for result in results:
+            for key, value in result.metadata.items():
+                if key in ("files", "cpu_seconds"):
+                    metadata[key] = metadata.get(key, 0) + value
+                elif key in ("peak_rss", "timeout"):
+                    metadata[key] = max(metadata.get(key, 0), value)
+                elif key == "near_timeout":
+                    metadata[key] = metadata.get(key, False) or value
+                else:
+                    metadata.setdefault(key, value)
+        metadata["shards"] = len(results)
+        metadata["wall_time"] = wall_time
+
+        return ToolResult(
+            tool_name=tool_name,
+            success=status == ToolStatus.SUCCESS,
+            duration=sum(result.duration for result in results),
+            errors=sum(result.errors for result in results),
+            warnings=sum(result.warnings for result in results),
+            output="\n".join(result.output for result in results if result.output),
+            status=status,
+            error_message=next(
+                (r.error_message for r in results if r.error_message), None
+            ),
+            metadata=metadata,
+        )
+
+    def _record_usage(self, result: ToolResult, meter: Optional[ResourceMeter]) -> None:
+        """
+        Add a tool's measured resource usage to its result and to usage.
+
+        Args:
+            result: Result of the tool (or shard)
+            meter: Meter of its processes (nothing is recorded without
+                measured processes)
+        """
+        if meter is None or not meter.processes:
+            return
+        result.metadata["peak_rss"] = meter.peak_rss
+        result.metadata["cpu_seconds"] = meter.cpu_seconds
+        cores = meter.cpu_seconds / result.duration if result.duration > 0 else 1.0
+        self.usage[result.tool_name] = ToolUsage(
+            cores=max(MIN_TOOL_CORES, cores), memory=meter.peak_rss
+        )
+
+    def _run_graph(
+        self, tools: Iterable[str]
+    ) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+        """
+        Get prerequisites and dependents of every tool in a run.
+
+        Args:
+            tools: Names of the tools to run; undeclared ones get no
+                dependencies
+
+        Returns:
+            (tool -> prerequisites, tool -> dependents)
+        """
+        dependencies = {tool: list(deps) for tool, deps in self.dependencies.items()}
+        for tool in tools:
+            dependencies.setdefault(tool, [])
+        dependents: Dict[str, List[str]] = {tool: [] for tool in dependencies}
+        for tool, deps in dependencies.items():
+            for dep in deps:
+                dependents[dep].append(tool)
+        return dependencies, dependents
+
+    def _priorities(
+        self,
+        dependencies: Dict[str, List[str]],
+        dependents: Dict[str, List[str]],
+        runnable: Set[str],
+    ) -> Dict[str, float]:
+        """
+        Order ready tools: lower keys start first.
+
+        Normally the tool heading the longest remaining chain of work
+        (its upward rank, as in HEFT) starts first, so the critical path
+        never waits behind short tools. In fail-fast mode the tools most
+        likely to fail per second of run time go first, so failures
+        surface as early as possible.
+
+        Args:
+            dependencies: Prerequisites of each tool in the run
+            dependents: Dependents of each tool in the run
+            runnable: Tools that actually execute (others take no time)
+
+        Returns:
+            Dict mapping tool names to sort keys
+        """
+
+        def cost(tool: str) -> float:
+            return self._estimate(tool) if tool in runnable else 0.0
+
+        if self.fail_fast:
+            return {
+                tool: cost(tool)
+                / max(self.failure_rates.get(tool, 0.0), MIN_FAILURE_RATE)
+                for tool in dependencies
             }
 
-            # Collect results as they complete
-            for future in as_completed(future_to_tool):
-                tool_name = future_to_tool[future]
-                try:
-                    result = future.result(timeout=self.timeout_per_tool)
-                    results.append(result)
-                except TimeoutError:
-                    results.append(
-                        ToolResult(
-                            tool_name=tool_name,
-                            success=False,
-                            duration=self.timeout_per_tool,
-                            status=ToolStatus.TIMEOUT,
-                            error_message=f"Tool exceeded timeout of {self.timeout_per_tool}s",
-                        )
-                    )
-                except Exception as e:
-                    results.append(
-                        ToolResult(
-                            tool_name=tool_name,
-                            success=False,
-                            duration=0.0,
-                            status=ToolStatus.FAILED,
-                            error_message=f"Executor error: {e!s}",
-                        )
-                    )
+        rank: Dict[str, float] = {}
 
-        return results
+        def upward_rank(tool: str) -> float:
+            if tool not in rank:
+                rank[tool] = cost(tool) + max(
+                    (upward_rank(dependent) for dependent in dependents[tool]),
+                    default=0.0,
+                )
+            return rank[tool]
+
+        return {tool: -upward_rank(tool) for tool in dependencies}
 
     def execute_tools(
         self,
-        tools: Dict[str, Callable[[], Any]],
+        tools: Dict[str, Union[Callable[[], Any], ShardedTool]],
         progress_callback: Optional[Callable[[str, str], None]] = None,
     ) -> List[ToolResult]:
         """
         Execute tools in parallel respecting dependencies.
 
+        Each tool starts as soon as its own prerequisites have completed,
+        on one thread pool shared by the whole run, so a tool never waits
+        for unrelated slower tools. When more tools are ready than there
+        are workers, they start in priority order (see _priorities()).
+        Tools without declared dependencies run unconstrained; declared
+        tools missing from ``tools`` count as completed for their
+        dependents.
+
+        A ShardedTool is split into shards (see _shard()) that are
+        queued together with the tool's priority and run concurrently;
+        its dependents start once every shard finished, and its shard
+        results are merged into a single ToolResult.
+
+        Each tool (or shard) gets the timeout its policy sets for the
+        files it checks (see timeouts; timeout_per_tool by default): past
+        that its processes are killed and it reports TIMEOUT, even if its
+        callable never returns. The timeout goes to the result's
+        ``metadata["timeout"]``, and runs that came close to it are
+        flagged with ``metadata["near_timeout"]``. In fail-fast mode the
+        first failure kills the tools still running, which report
+        CANCELLED.
+
+        With a budget, a ready tool (or shard) starts only once the budget
+        admits its expected usage (see usage); while it does not fit,
+        lower-priority tools that fit start first. The measured peak
+        memory and CPU time of each tool's processes go to its result's
+        metadata ("peak_rss", "cpu_seconds") and update usage.
+
         Args:
-            tools: Dict mapping tool names to callables
+            tools: Dict mapping tool names to callables or ShardedTools
             progress_callback: Optional callback(tool_name, status) for progress
 
         Returns:
-            List of ToolResult for each tool executed
+            List of ToolResult for each tool executed, in completion order
 
         Example:
             >>> tools = {
@@ -348,67 +702,340 @@ class ParallelExecutor:
             >>> executor = ParallelExecutor()
             >>> results = executor.execute_tools(tools)
         """
-        # Get execution levels from topological sort
-        levels = self._get_execution_order()
+        dependencies, dependents = self._run_graph(tools)
+        priority = self._priorities(dependencies, dependents, set(tools))
 
-        all_results: List[ToolResult] = []
-        failed_tools: Set[str] = set()
-
-        # Execute each level in sequence
-        for level_idx, level in enumerate(levels):
-            # Skip tools whose dependencies failed
-            tools_to_run = [
-                tool
-                for tool in level
-                if not any(dep in failed_tools for dep in self.dependencies[tool])
-            ]
+        # Ready queue of (priority, tool, shard): a tool is queued with
+        # shard -1 once all its prerequisites settled; when a sharded tool
+        # starts, its shards are queued with the same priority
+        pending = {tool: len(deps) for tool, deps in dependencies.items()}
+        ready: List[Tuple[float, str, int]] = []
 
-            # Mark skipped tools
-            skipped_tools = set(level) - set(tools_to_run)
-            for tool in skipped_tools:
-                all_results.append(
-                    ToolResult(
-                        tool_name=tool,
-                        success=False,
-                        duration=0.0,
-                        status=ToolStatus.SKIPPED,
-                        error_message="Skipped due to failed dependencies",
-                    )
+        all_results: List[ToolResult] = []
+        blocked: Set[str] = set()  # failed or skipped: dependents must not run
+        failed = False
+        # Running tasks: (tool, shard), shard -1 for a tool run whole
+        running: Dict["Future[ToolResult]", Tuple[str, int]] = {}
+        run_token = CancelToken()
+        tokens: Dict[Tuple[str, int], CancelToken] = {}
+        limits: Dict[Tuple[str, int], float] = {}
+        started: Dict[Tuple[str, int], float] = {}
+        shards: Dict[str, List[List[Path]]] = {}
+        shard_results: Dict[str, Dict[int, ToolResult]] = {}
+        meters: Dict[Tuple[str, int], ResourceMeter] = {}
+        admitted: Dict[Tuple[str, int], ToolUsage] = {}
+        if self.budget is not None:
+            self.budget.start_run()
+        # Timed-out callables still occupying a thread: they count against
+        # max_workers until they return, or new tasks would only queue in
+        # the pool while their timeouts run
+        stranded: Set["Future[ToolResult]"] = set()
+        abandoned = False  # some callable was stranded during the run
+
+        def queue(tool: str, shard: int = -1) -> None:
+            heapq.heappush(ready, (priority[tool], tool, shard))
+
+        def settle(tool: str, ok: bool) -> None:
+            if not ok:
+                blocked.add(tool)
+            for dependent in dependents[tool]:
+                pending[dependent] -= 1
+                if not pending[dependent]:
+                    queue(dependent)
+
+        def skip(tool: str, reason: str) -> None:
+            all_results.append(
+                ToolResult(
+                    tool_name=tool,
+                    success=False,
+                    duration=0.0,
+                    status=ToolStatus.SKIPPED,
+                    error_message=reason,
                 )
-
-            # Execute tools within level in parallel
-            level_results = self._execute_level(tools_to_run, tools, progress_callback)
-            all_results.extend(level_results)
-
-            # Track failures for dependency skipping
-            failed_tools.update(
-                result.tool_name for result in level_results if not result.success
             )
+            settle(tool, False)
+
+        for tool in dependencies:
+            if not pending[tool]:
+                queue(tool)
+
+        def finish(tool: str, result: ToolResult) -> None:
+            all_results.append(result)
+            self.durations[tool] = result.duration
+            settle(tool, result.success)
+
+        def complete(task: Tuple[str, int], result: ToolResult) -> None:
+            nonlocal failed
+            if not result.success and self.fail_fast and not failed:
+                run_token.cancel("Cancelled due to fail-fast mode")
+            failed = failed or not result.success
+            tool, shard = task
+            if task in admitted and self.budget is not None:
+                self.budget.release(tool, admitted.pop(task))
+            self._record_usage(result, meters.pop(task, None))
+            if task in limits:
+                self._check_timeout(result, limits.pop(task))
+            if shard < 0:
+                finish(tool, result)
+                return
+            shard_results[tool][shard] = result
+            if len(shard_results[tool]) < len(shards[tool]):
+                return
+            starts = [started[task] for task in started if task[0] == tool]
+            first_start = min(starts, default=time.time())
+            merged = self._merge_shards(
+                tool,
+                [shard_results[tool][i] for i in range(len(shards[tool]))],
+                time.time() - first_start,
+            )
+            if progress_callback:
+                progress_callback(tool, merged.status.value)
+            finish(tool, merged)
+
+        def start(
+            task: Tuple[str, int],
+            tool_callable: Callable[[], Any],
+            callback: Optional[Callable[[str, str], None]],
+        ) -> bool:
+            if len(running) + len(stranded) >= self.max_workers:
+                return False
+            # Tools never measured are only bounded by max_workers: charging
+            # them a guessed core each would serialize I/O-bound tools
+            usage = self.usage.get(task[0])
+            if self.budget is not None and usage is not None:
+                if not self.budget.admit(task[0], usage):
+                    return False
+                admitted[task] = usage
+            tool, shard = task
+            whole = tools[tool]
+            if shard >= 0:
+                files: Optional[int] = len(shards[tool][shard])
+            elif isinstance(whole, ShardedTool):
+                files = len(whole.files)
+            else:
+                files = self._file_counts.get(tool)
+            limits[task] = self._tool_timeout(tool, files)
+            tokens[task] = run_token.child(limits[task])
+            meters[task] = ResourceMeter()
+            started[task] = time.time()
+            future = executor.submit(
+                self._execute_tool_with_timeout,
+                tool,
+                tool_callable,
+                callback,
+                tokens[task],
+                meters[task],
+                limits[task],
+            )
+            running[future] = task
+            return True
 
-            # Fast-fail if requested and critical failure occurred
-            if self.fail_fast and failed_tools:
-                # Mark remaining tools as skipped
-                remaining_tools = [
-                    tool for level in levels[level_idx + 1 :] for tool in level
-                ]
-                for tool in remaining_tools:
-                    all_results.append(
-                        ToolResult(
-                            tool_name=tool,
-                            success=False,
-                            duration=0.0,
-                            status=ToolStatus.SKIPPED,
-                            error_message="Skipped due to fail-fast mode",
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while ready or running:
+                deferred: List[Tuple[float, str, int]] = []  # no free worker or over budget
+                while ready:
+                    entry = heapq.heappop(ready)
+                    _, tool, shard = entry
+                    if shard >= 0:
+                        if self.fail_fast and failed:
+                            # Fail-fast struck after the tool's first shards
+                            complete(
+                                (tool, shard),
+                                self._cancelled_result(tool, 0.0, run_token),
+                            )
+                        else:
+                            sharded = tools[tool]
+                            assert isinstance(sharded, ShardedTool)
+                            if not start(
+                                (tool, shard),
+                                partial(sharded.run, shards[tool][shard]),
+                                None,  # progress is reported for the whole tool
+                            ):
+                                deferred.append(entry)
+                        continue
+
+                    deps_ok = not any(dep in blocked for dep in dependencies[tool])
+                    if tool not in tools:
+                        settle(tool, deps_ok and not (self.fail_fast and failed))
+                    elif self.fail_fast and failed:
+                        skip(tool, "Skipped due to fail-fast mode")
+                    elif not deps_ok:
+                        skip(tool, "Skipped due to failed dependencies")
+                    else:
+                        tool_callable = tools[tool]
+                        plan = (
+                            self._shard(tool, tool_callable.files)
+                            if isinstance(tool_callable, ShardedTool)
+                            else []
+                        )
+                        if len(plan) > 1:
+                            shards[tool] = plan
+                            shard_results[tool] = {}
+                            if progress_callback:
+                                progress_callback(tool, "running")
+                            for index in range(len(plan)):
+                                queue(tool, index)
+                        elif not start((tool, -1), tool_callable, progress_callback):
+                            deferred.append(entry)
+                for entry in deferred:
+                    heapq.heappush(ready, entry)
+
+                if not running and not (ready and stranded):
+                    continue
+                # Wake up at the nearest deadline to enforce it
+                deadline = min(
+                    (tokens[task].remaining() or 0.0 for task in running.values()),
+                    default=None,
+                )
+                done, _ = wait(
+                    set(running) | stranded,
+                    timeout=None if deadline is None else max(0.0, deadline),
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    if future in stranded:
+                        stranded.discard(future)  # its result was reported
+                        continue
+                    task = running.pop(future)
+                    complete(task, self._collect_result(future, task[0]))
+
+                for future, task in list(running.items()):
+                    if tokens[task].expired:
+                        # Kill its processes and stop waiting for the callable
+                        tokens[task].cancel(self._timeout_message(limits[task]))
+                        del running[future]
+                        stranded.add(future)
+                        abandoned = True
+                        complete(
+                            task,
+                            self._cancelled_result(
+                                task[0],
+                                time.time() - started[task],
+                                tokens[task],
+                                progress_callback if task[1] < 0 else None,
+                                limits[task],
+                            ),
                         )
-                    )
-                break
+        finally:
+            executor.shutdown(wait=not abandoned, cancel_futures=True)
 
         return all_results
 
+    def use_history(
+        self,
+        history: Mapping[str, "ToolHistory"],
+        file_counts: Optional[Mapping[str, int]] = None,
+    ) -> None:
+        """
+        Seed duration estimates, failure rates, resource usage and learned
+        timeouts from earlier runs.
+
+        Args:
+            history: Dict mapping tool names to their ToolHistory
+            file_counts: Files each tool will check in the coming run
+        """
+        file_counts = file_counts or {}
+        self._file_counts = dict(file_counts)
+        self.timeouts.use_history(history)
+        for tool, tool_history in history.items():
+            estimate = tool_history.estimate(file_counts.get(tool))
+            if estimate is not None:
+                self.durations[tool] = estimate
+            costs = tool_history.costs()
+            if costs is not None:
+                self.file_costs[tool] = costs
+            resources = tool_history.resources()
+            if resources is not None:
+                peak_rss, cores = resources
+                self.usage[tool] = ToolUsage(
+                    cores=max(MIN_TOOL_CORES, cores), memory=peak_rss
+                )
+            self.failure_rates[tool] = tool_history.failure_rate
+
+    def predict_wall_time(self, tools: Optional[Iterable[str]] = None) -> float:
+        """
+        Predict a run's wall time by simulating its schedule.
+
+        Replays execute_tools() ordering on max_workers workers with
+        estimated durations, so both the critical path and worker
+        contention count.
+
+        Args:
+            tools: Tools that will run (default: every declared tool)
+
+        Returns:
+            Estimated seconds from start to the last tool finishing
+        """
+        runnable = set(self.dependencies) if tools is None else set(tools)
+        dependencies, dependents = self._run_graph(runnable)
+        priority = self._priorities(dependencies, dependents, runnable)
+        pending = {tool: len(deps) for tool, deps in dependencies.items()}
+        ready = [(priority[tool], tool) for tool in dependencies if not pending[tool]]
+        heapq.heapify(ready)
+        running: List[Tuple[float, str]] = []
+        clock = 0.0
+
+        def settle(tool: str) -> None:
+            for dependent in dependents[tool]:
+                pending[dependent] -= 1
+                if not pending[dependent]:
+                    heapq.heappush(ready, (priority[dependent], dependent))
+
+        while ready or running:
+            while ready and len(running) < self.max_workers:
+                _, tool = heapq.heappop(ready)
+                if tool in runnable:
+                    heapq.heappush(running, (clock + self._estimate(tool), tool))
+                else:
+                    settle(tool)
+            if running:
+                clock, tool = heapq.heappop(running)
+                settle(tool)
+        return clock
+
+    def get_critical_path(self) -> Tuple[List[str], float]:
+        """
+        Get the longest dependency chain, which bounds the run's wall time.
+
+        Tools are weighted by their expected duration (see durations), or
+        by timeout_per_tool when nothing is known about them.
+
+        Returns:
+            (tool names along the chain, estimated seconds to run it)
+        """
+        finish: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+        for tool in nx.topological_sort(self.graph):
+            prerequisite = max(
+                self.dependencies[tool], key=finish.__getitem__, default=None
+            )
+            start = finish[prerequisite] if prerequisite is not None else 0.0
+            finish[tool] = start + self._estimate(tool)
+            previous[tool] = prerequisite
+
+        last = max(finish, key=finish.__getitem__, default=None)
+        if last is None:
+            return [], 0.0
+        path: List[str] = []
+        step: Optional[str] = last
+        while step is not None:
+            path.append(step)
+            step = previous[step]
+        return path[::-1], finish[last]
+
+    def _estimate(self, tool: str) -> float:
+        """Expected duration of a tool (measured or historical, else the timeout)"""
+        return self.durations.get(tool, self.timeout_per_tool)
+
     def get_execution_plan(self) -> List[Tuple[int, List[str]]]:
         """
         Get the execution plan without running tools.
 
+        Tools are grouped by dependency depth, i.e. the earliest wave in
+        which they can start. Levels are not barriers: at run time each
+        tool starts as soon as its own dependencies complete.
+
         Returns:
             List of (level_number, tool_names) tuples showing
             parallel execution groups
@@ -449,10 +1076,17 @@ class ParallelExecutor:
         """
         Get statistics about the execution plan.
 
+        Time estimates use measured or historical durations where
+        available (timeout_per_tool otherwise). The parallel estimate is
+        the critical path, since tools are not held back by levels; the
+        predicted wall time also accounts for the number of workers.
+
         Returns:
             Dict with execution statistics
         """
         levels = self._get_execution_order()
+        critical_path, parallel_time = self.get_critical_path()
+        sequential_time = sum(self._estimate(tool) for tool in self.dependencies)
 
         return {
             "total_tools": len(self.dependencies),
@@ -461,7 +1095,11 @@ class ParallelExecutor:
             "avg_parallelism": (
                 sum(len(level) for level in levels) / len(levels) if levels else 0
             ),
-            "sequential_time_estimate": len(self.dependencies) * self.timeout_per_tool,
-            "parallel_time_estimate": len(levels) * self.timeout_per_tool,
-            "speedup_factor": (len(self.dependencies) / len(levels) if levels else 1.0),
+            "critical_path": critical_path,
+            "sequential_time_estimate": sequential_time,
+            "parallel_time_estimate": parallel_time,
+            "predicted_wall_time": self.predict_wall_time(),
+            "speedup_factor": (
+                sequential_time / parallel_time if parallel_time > 0 else 1.0
+            ),
         }
@@ -18,19 +18,23 @@ Key Design:
 """
 
 import logging
+import math
 import os
 import signal
 import sys
 import json
 import time
 import psutil
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Timing samples kept per tool in history/tools.json
+TOOL_HISTORY_SAMPLES = 20
+
 
 @dataclass
 class ErrorDetail:
@@ -101,6 +105,160 @@ class ValidationRun:
             self.warning_details = []
 
 
+@dataclass
+class LastPass:
+    """
+    Marker for the last fully successful validation run.
+
+    Attributes:
+        rev: Git commit holding the validated tree (HEAD, or a stash-style
+            commit of the working tree when it had local changes)
+        fingerprint: Hash of tool versions and configuration for the run
+        recorded: ISO timestamp when the run passed
+    """
+
+    rev: str
+    fingerprint: str
+    recorded: str
+
+
+@dataclass
+class ToolHistory:
+    """
+    Durations and outcomes of one tool across validation runs.
+
+    Attributes:
+        samples: [file count, seconds] of recent runs, oldest first
+        runs: Number of runs recorded
+        failures: Number of recorded runs that failed
+        usage: [peak RSS bytes, CPU seconds per second] of recent runs
+            whose processes were measured, oldest first
+    """
+
+    samples: List[List[float]] = field(default_factory=list)
+    runs: int = 0
+    failures: int = 0
+    usage: List[List[float]] = field(default_factory=list)
+
+    @property
+    def failure_rate(self) -> float:
+        """Fraction of recorded runs that failed"""
+        return self.failures / self.runs if self.runs else 0.0
+
+    def costs(self) -> Optional[Tuple[float, float]]:
+        """
+        Split recorded run times into a fixed and a per-file cost.
+
+        Fits a line through the samples when they cover different file
+        counts, otherwise puts their average into the fixed cost.
+
+        Returns:
+            (fixed seconds, seconds per file), or None without samples
+        """
+        if not self.samples:
+            return None
+        counts = [sample[0] for sample in self.samples]
+        seconds = [sample[1] for sample in self.samples]
+        mean_count = sum(counts) / len(counts)
+        mean_seconds = sum(seconds) / len(seconds)
+        spread = sum((c - mean_count) ** 2 for c in counts)
+        if spread == 0:
+            return mean_seconds, 0.0
+
+        per_file = (
+            sum((c - mean_count) * (t - mean_seconds) for c, t in zip(counts, seconds))
+            / spread
+        )
+        per_file = max(0.0, per_file)
+        fixed = max(0.0, mean_seconds - per_file * mean_count)
+        return fixed, per_file
+
+    def estimate(self, files: Optional[int] = None) -> Optional[float]:
+        """
+        Predict how long a run over the given number of files takes.
+
+        Uses the fixed plus per-file cost from costs() when the samples
+        cover different file counts, otherwise averages them.
+
+        Args:
+            files: Number of files (None: a typical run)
+
+        Returns:
+            Estimated seconds, or None without samples
+        """
+        costs = self.costs()
+        if costs is None:
+            return None
+        if files is None:
+            return sum(sample[1] for sample in self.samples) / len(self.samples)
+        fixed, per_file = costs
+        return fixed + per_file * files
+
+    def quantile(self, q: float, files: Optional[int] = None) -> Optional[float]:
+        """
+        Run time that a fraction q of runs over the given files stay under.
+
+        Each sample is compared with what costs() predicts for its file
+        count; the q-quantile of those ratios scales the estimate for
+        ``files``, so slow outliers on small inputs still count for large
+        ones.
+
+        Args:
+            q: Fraction of runs, e.g. 0.99
+            files: Number of files (None: a typical run)
+
+        Returns:
+            Seconds, or None without samples
+        """
+        estimate = self.estimate(files)
+        if estimate is None:
+            return None
+        fixed, per_file = self.costs()  # type: ignore[misc]
+        ratios = []
+        for count, seconds in self.samples:
+            predicted = fixed + per_file * count
+            if predicted > 0:
+                ratios.append(seconds / predicted)
+        ratios.sort()
+        if not ratios:
+            return estimate
+        rank = min(len(ratios) - 1, max(0, math.ceil(q * len(ratios)) - 1))
+        return estimate * ratios[rank]
+
+    def resources(self) -> Optional[Tuple[float, float]]:
+        """
+        Resources one instance of the tool takes.
+
+        Returns:
+            (highest recent peak RSS in bytes, average cores busy), or
+            None if no run was measured
+        """
+        if not self.usage:
+            return None
+        peak = max(sample[0] for sample in self.usage)
+        cores = sum(sample[1] for sample in self.usage) / len(self.usage)
+        return peak, cores
+
+    def record(self, files: int, seconds: float, success: bool, finished: bool = True):
+        """
+        Add one run, dropping the oldest samples beyond the limit.
+
+        A run that did not finish (it timed out) only counts as a run:
+        its duration is its limit, not how long the tool needed.
+        """
+        if finished:
+            self.samples.append([files, seconds])
+            del self.samples[:-TOOL_HISTORY_SAMPLES]
+        self.runs += 1
+        if not success:
+            self.failures += 1
+
+    def record_usage(self, peak_rss: float, cores: float):
+        """Add the measured resources of one run"""
+        self.usage.append([peak_rss, cores])
+        del self.usage[:-TOOL_HISTORY_SAMPLES]
+
+
 class ProcessManager:
     """
     Manages forked validation processes for git hooks.
@@ -140,9 +298,18 @@ class ProcessManager:
         # File to track last validation run
         self.last_run_file = self.cache_dir / "last_run.json"
 
+        # File to track the last fully successful run (validate --since-last-pass)
+        self.last_pass_file = self.cache_dir / "last_pass.json"
+
         # Symlink to latest results
         self.latest_results_link = self.results_dir / "latest.json"
 
+        # Per-tool durations and outcomes, for scheduling the next runs
+        # (outside the *.json files of the runs themselves)
+        self.history_dir = self.cache_dir / "history"
+        self.history_dir.mkdir(parents=True, exist_ok=True)
+        self.tool_history_file = self.history_dir / "tools.json"
+
     def check_previous_run(self) -> Optional[ValidationRun]:
         """
         Check if previous validation failed and return the run details.
@@ -372,6 +539,89 @@ class ProcessManager:
         except Exception as e:
             logger.error(f"Could not save validation run: {e}")
 
+    def save_last_pass(self, marker: LastPass):
+        """
+        Record the tree of a fully successful validation run.
+
+        Args:
+            marker: LastPass to save, replacing any previous one
+        """
+        try:
+            self.last_pass_file.write_text(json.dumps(asdict(marker), indent=2))
+            logger.debug(f"Recorded last passing tree: {marker.rev}")
+        except Exception as e:
+            logger.error(f"Could not save last pass: {e}")
+
+    def get_last_pass(self) -> Optional[LastPass]:
+        """
+        Get the marker of the last fully successful validation run.
+
+        Returns:
+            LastPass, or None if no run has passed or the file is unreadable
+        """
+        if not self.last_pass_file.exists():
+            return None
+
+        try:
+            return LastPass(**json.loads(self.last_pass_file.read_text()))
+        except (json.JSONDecodeError, TypeError, ValueError) as e:
+            logger.warning(f"Could not parse last pass: {e}")
+            return None
+
+    def get_tool_history(self) -> Dict[str, ToolHistory]:
+        """
+        Get the recorded durations and outcomes of each tool.
+
+        Returns:
+            Dict mapping tool names to ToolHistory (empty if none recorded)
+        """
+        if not self.tool_history_file.exists():
+            return {}
+
+        try:
+            data = json.loads(self.tool_history_file.read_text())
+            return {tool: ToolHistory(**entry) for tool, entry in data.items()}
+        except (json.JSONDecodeError, TypeError, ValueError, AttributeError) as e:
+            logger.warning(f"Could not parse tool history: {e}")
+            return {}
+
+    def record_tool_results(self, results: List[Any]):
+        """
+        Add the durations and outcomes of executed tools to their history.
+
+        Skipped and cancelled tools are ignored; timed out ones add no
+        duration, so they cannot raise learned timeouts (see
+        ToolHistory.record). The file count of a run is read from
+        ``metadata["files"]`` (0 if absent), its resource usage from
+        ``metadata["peak_rss"]`` and ``metadata["cpu_seconds"]`` when
+        the executor measured them.
+
+        Args:
+            results: ToolResult objects from the parallel executor
+        """
+        history = self.get_tool_history()
+        for result in results:
+            status = getattr(result.status, "value", result.status)
+            if status in ("skipped", "cancelled"):
+                continue
+            files = int(result.metadata.get("files", 0))
+            tool_history = history.setdefault(result.tool_name, ToolHistory())
+            tool_history.record(
+                files, result.duration, result.success, finished=status != "timeout"
+            )
+            if "peak_rss" in result.metadata and result.duration > 0:
+                tool_history.record_usage(
+                    result.metadata["peak_rss"],
+                    result.metadata.get("cpu_seconds", 0.0) / result.duration,
+                )
+
+        try:
+            self.tool_history_file.write_text(
+                json.dumps({tool: asdict(h) for tool, h in history.items()}, indent=2)
+            )
+        except Exception as e:
+            logger.error(f"Could not save tool history: {e}")
+
     def save_detailed_results(
         self, run_id: str, results: List[Any], tool_results: List[Dict[str, Any]] = None
     ):
@@ -670,16 +920,18 @@ class ProcessManager:
         """
         runs = []
 
-        # Get all run files
+        # Get all run files, skipping special files
         run_files = sorted(
-            self.cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True
+            (
+                p
+                for p in self.cache_dir.glob("*.json")
+                if p.name not in ("last_run.json", "last_pass.json")
+            ),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True,
         )
 
         for run_file in run_files[:limit]:
-            # Skip special files
-            if run_file.name == "last_run.json":
-                continue
-
             try:
                 data = json.loads(run_file.read_text())
                 runs.append(ValidationRun(**data))
@@ -700,7 +952,7 @@ class ProcessManager:
 
         for run_file in self.cache_dir.glob("*.json"):
             # Skip special files
-            if run_file.name == "last_run.json":
+            if run_file.name in ("last_run.json", "last_pass.json"):
                 continue
 
             try:
@@ -0,0 +1,214 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+CPU and memory accounting for concurrent tools.
+
+Tools differ wildly in cost: mypy or ansible-lint can take a gigabyte of
+memory while yamllint barely registers. Instead of a fixed number of
+workers, the parallel executor can admit tools against a ResourceBudget:
+- each tool weighs its expected cores and peak memory (ToolUsage),
+  learned from earlier runs (see ProcessManager tool history); tools
+  never measured are not charged, only limited by the worker count
+- a tool starts only while the running tools leave room for it, and a
+  heavy tool runs at most ``heavy_limit`` instances at once
+- the memory budget is the memory free when the run starts
+
+Measurements come from run_process(): processes are reaped with
+os.wait4(), whose rusage reports the peak RSS and CPU time of the tool
+and everything it spawned. They are added to the ResourceMeter current
+in the context (see meter_scope()).
+
+Usage:
+    budget = ResourceBudget()
+    executor = ParallelExecutor(budget=budget)
+"""
+
+import contextlib
+import contextvars
+import os
+import subprocess
+import sys
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional
+
+import psutil  # type: ignore
+
+# Memory of a ToolUsage not given one
+DEFAULT_TOOL_MEMORY = 256 * 1024 * 1024
+
+# Peak RSS from which a tool counts as heavy
+HEAVY_TOOL_MEMORY = 512 * 1024 * 1024
+
+# Concurrent instances (e.g. shards) of one heavy tool
+HEAVY_TOOL_LIMIT = 2
+
+# Share of the free memory tools may take, leaving room for the rest of
+# the system
+MEMORY_HEADROOM = 0.8
+
+# ru_maxrss is in kilobytes on Linux and in bytes on macOS
+_MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+@dataclass
+class ToolUsage:
+    """
+    Resources one running instance of a tool takes.
+
+    Attributes:
+        cores: CPU cores kept busy on average
+        memory: Peak resident memory in bytes
+    """
+
+    cores: float = 1.0
+    memory: float = DEFAULT_TOOL_MEMORY
+
+    @property
+    def heavy(self) -> bool:
+        return self.memory >= HEAVY_TOOL_MEMORY
+
+
+class ResourceMeter:
+    """
+    Peak memory and CPU time of the processes of one tool run.
+
+    Thread-safe: a tool may run several processes concurrently.
+    """
+
+    def __init__(self) -> None:
+        self.peak_rss = 0
+        self.cpu_seconds = 0.0
+        self.processes = 0
+        self._lock = threading.Lock()
+
+    def record(self, rusage: Any) -> None:
+        """Add the rusage of a reaped process"""
+        with self._lock:
+            self.peak_rss = max(self.peak_rss, rusage.ru_maxrss * _MAXRSS_UNIT)
+            self.cpu_seconds += rusage.ru_utime + rusage.ru_stime
+            self.processes += 1
+
+
+_current: "contextvars.ContextVar[Optional[ResourceMeter]]" = contextvars.ContextVar(
+    "huskycat_resource_meter", default=None
+)
+
+
+def current_meter() -> Optional[ResourceMeter]:
+    """The meter of the tool run in the current context, if any"""
+    return _current.get()
+
+
+@contextlib.contextmanager
+def meter_scope(meter: Optional[ResourceMeter]) -> Iterator[Optional[ResourceMeter]]:
+    """Make a meter current for code run in this context"""
+    reset = _current.set(meter)
+    try:
+        yield meter
+    finally:
+        _current.reset(reset)
+
+
+class MeteredPopen(subprocess.Popen):
+    """
+    Popen that keeps the rusage of the child it reaps.
+
+    Reaping goes through os.wait4() instead of os.waitpid(); ``rusage``
+    stays None where wait4() is unavailable.
+    """
+
+    rusage: Any = None
+
+    def _try_wait(self, wait_flags: int) -> Any:
+        if not hasattr(os, "wait4"):
+            return super()._try_wait(wait_flags)  # type: ignore[misc]
+        try:
+            pid, status, rusage = os.wait4(self.pid, wait_flags)
+        except ChildProcessError:
+            # Reaped elsewhere (e.g. SIGCHLD ignored)
+            return self.pid, 0
+        if pid == self.pid:
+            self.rusage = rusage
+        return pid, status
+
+
+def available_memory() -> int:
+    """Memory in bytes that can be used without swapping"""
+    return int(psutil.virtual_memory().available)
+
+
+class ResourceBudget:
+    """
+    CPU and memory shared by the tools of a run.
+
+    Thread-safe. A tool is admitted when the cores and memory of the
+    running tools plus its own fit the budget and, for heavy tools, while
+    fewer than ``heavy_limit`` instances of it run. With nothing running,
+    any tool is admitted, so oversized tools still run alone.
+    """
+
+    def __init__(
+        self,
+        cpus: Optional[float] = None,
+        memory: Optional[float] = None,
+        heavy_limit: int = HEAVY_TOOL_LIMIT,
+    ) -> None:
+        """
+        Initialize resource budget.
+
+        Args:
+            cpus: Cores tools may keep busy (default: CPU count)
+            memory: Bytes tools may use (default: MEMORY_HEADROOM of the
+                memory free when each run starts)
+            heavy_limit: Concurrent instances of one heavy tool
+        """
+        self.cpus = cpus or os.cpu_count() or 1
+        self._fixed_memory = memory
+        self.memory = memory if memory is not None else 0.0
+        self.heavy_limit = heavy_limit
+        self.cores_used = 0.0
+        self.memory_used = 0.0
+        self._instances: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def start_run(self) -> None:
+        """Reset usage and read the free memory for a new run"""
+        with self._lock:
+            if self._fixed_memory is None:
+                self.memory = available_memory() * MEMORY_HEADROOM
+            self.cores_used = 0.0
+            self.memory_used = 0.0
+            self._instances.clear()
+
+    def admit(self, tool: str, usage: ToolUsage) -> bool:
+        """
+        Reserve resources for an instance of a tool if they are free.
+
+        Args:
+            tool: Name of the tool
+            usage: Expected usage of the instance
+
+        Returns:
+            True if the instance may start (call release() when it ends)
+        """
+        with self._lock:
+            if self._instances:
+                if usage.heavy and self._instances.get(tool, 0) >= self.heavy_limit:
+                    return False
+                if self.cores_used + usage.cores > self.cpus:
+                    return False
+                if self.memory_used + usage.memory > self.memory:
+                    return False
+            self.cores_used += usage.cores
+            self.memory_used += usage.memory
+            self._instances[tool] = self._instances.get(tool, 0) + 1
+            return True
+
+    def release(self, tool: str, usage: ToolUsage) -> None:
+        """Return the resources of a finished instance"""
+        with self._lock:
+            self.cores_used -= usage.cores
+            self.memory_used -= usage.memory
+            self._instances[tool] -= 1
+            if not self._instances[tool]:
+                del self._instances[tool]
@@ -0,0 +1,288 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Content-addressed validation result cache.
+
+Stores serialized ValidationResult entries under .huskycat/cache so that
+re-validating unchanged files is a disk lookup instead of a tool run.
+
+Entries are keyed on:
+- tool name and tool version
+- hash of the effective tool configuration (HuskyCat tool section plus
+  project config files such as pyproject.toml or .flake8)
+- hash of the file content
+- the file's path relative to the working directory, as per-file
+  configuration (e.g. flake8's per-file-ignores) and reported messages
+  depend on it
+- the auto-fix flag
+
+The cache is size-capped; every hit refreshes the entry's mtime and the
+least recently used entries are evicted once the cap is exceeded.
+
+Usage:
+    cache = ResultCache()
+    key = cache.make_key(
+        "ruff", "ruff 0.4.1", config_hash, content_hash, False, "src/a.py"
+    )
+    result = cache.get(key, filepath)
+    if result is None:
+        result = validator.validate(filepath)
+        cache.put(key, result)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..validators.base import ValidationResult
+
+logger = logging.getLogger(__name__)
+
+# Default location, relative to the working directory
+DEFAULT_CACHE_DIR = Path(".huskycat") / "cache"
+
+# Default size cap for all cached entries
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Project files that change how tools behave; any edit invalidates entries
+PROJECT_CONFIG_FILES = (
+    ".huskycat.yaml",
+    ".huskycat.json",
+    "pyproject.toml",
+    "setup.cfg",
+    "tox.ini",
+    ".flake8",
+    "mypy.ini",
+    ".mypy.ini",
+    "ruff.toml",
+    ".ruff.toml",
+    ".isort.cfg",
+    ".bandit",
+    ".eslintrc",
+    ".eslintrc.json",
+    ".eslintrc.js",
+    ".eslintrc.yml",
+    ".eslintrc.yaml",
+    "eslint.config.js",
+    ".prettierrc",
+    ".prettierrc.json",
+    ".yamllint",
+    ".yamllint.yaml",
+    ".yamllint.yml",
+    ".hadolint.yaml",
+    ".shellcheckrc",
+    ".ansible-lint",
+    ".taplo.toml",
+    "taplo.toml",
+)
+
+
+def hash_file(filepath: Path) -> Optional[str]:
+    """Return the sha256 hex digest of a file's content, or None if unreadable"""
+    digest = hashlib.sha256()
+    try:
+        with open(filepath, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def hash_config(tool_config: Any = None, root: Optional[Path] = None) -> str:
+    """Hash a tool's configuration together with the project config files
+
+    Args:
+        tool_config: JSON-serializable tool settings (e.g. the .huskycat.yaml
+            tools section for this tool)
+        root: Directory holding the project config files (default: cwd)
+
+    Returns:
+        sha256 hex digest
+    """
+    root = root or Path.cwd()
+    digest = hashlib.sha256()
+    digest.update(json.dumps(tool_config, sort_keys=True, default=str).encode())
+    for name in PROJECT_CONFIG_FILES:
+        content_hash = hash_file(root / name)
+        if content_hash is not None:
+            digest.update(f"{name}:{content_hash}".encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Thread-safe, size-capped, on-disk cache of validation results.
+
+    Each entry is a small JSON file at <cache_dir>/<key[:2]>/<key>.json.
+    Corrupt or unreadable entries are treated as misses.
+    """
+
+    def __init__(
+        self, cache_dir: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        """
+        Initialize result cache.
+
+        Args:
+            cache_dir: Directory for cache entries.
+                       Defaults to .huskycat/cache in current working directory.
+            max_bytes: Total size above which LRU entries are evicted
+        """
+        self.cache_dir = cache_dir or Path.cwd() / DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        tool: str,
+        tool_version: str,
+        config_hash: str,
+        content_hash: str,
+        auto_fix: bool,
+        path: str,
+    ) -> str:
+        """Build the cache key for one (tool, file) validation"""
+        raw = "\0".join(
+            [
+                tool,
+                tool_version,
+                config_hash,
+                content_hash,
+                "fix" if auto_fix else "",
+                os.path.relpath(path),
+            ]
+        )
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str, filepath: str) -> Optional[ValidationResult]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Cache key from make_key()
+            filepath: Path to report in the returned result
+
+        Returns:
+            ValidationResult or None on a miss
+        """
+        entry = self._entry_path(key)
+        try:
+            data = json.loads(entry.read_text())
+            result = ValidationResult(
+                tool=data["tool"],
+                filepath=filepath,
+                success=data["success"],
+                messages=data.get("messages", []),
+                errors=data.get("errors", []),
+                warnings=data.get("warnings", []),
+                fixed=data.get("fixed", False),
+                duration_ms=data.get("duration_ms", 0),
+            )
+            # Refresh recency for LRU eviction
+            os.utime(entry)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable cache entry {entry}: {e}")
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return result
+
+    def put(self, key: str, result: ValidationResult) -> None:
+        """Store a result; write failures are logged and ignored"""
+        entry = self._entry_path(key)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            tmp = entry.with_name(f"{entry.name}.{os.getpid()}.{threading.get_ident()}")
+            tmp.write_text(json.dumps(result.to_dict()))
+            os.replace(tmp, entry)
+        except OSError as e:
+            logger.debug(f"Could not write cache entry {entry}: {e}")
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        """List (mtime, size, path) for every entry"""
+        entries: List[Tuple[float, int, Path]] = []
+        if not self.cache_dir.exists():
+            return entries
+        for bucket in os.scandir(self.cache_dir):
+            if not bucket.is_dir():
+                continue
+            for item in os.scandir(bucket.path):
+                if not item.name.endswith(".json"):
+                    continue
+                try:
+                    stat = item.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, Path(item.path)))
+        return entries
+
+    def prune(self) -> int:
+        """
+        Evict least recently used entries until the cache fits max_bytes.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            entries = self._entries()
+            total = sum(size for _, size, _ in entries)
+            if total <= self.max_bytes:
+                return 0
+
+            removed = 0
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+
+        logger.debug(f"Evicted {removed} cache entries from {self.cache_dir}")
+        return removed
+
+    def clear(self) -> int:
+        """
+        Remove every cache entry.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        with self._lock:
+            for _, _, path in self._entries():
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError:
+                    continue
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and on-disk size"""
+        entries = self._entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "cache_dir": str(self.cache_dir),
+        }
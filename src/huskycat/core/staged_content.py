@@ -0,0 +1,298 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Staged (index) content for pre-commit validation.
+
+A commit records what is in the index, not the working tree. For partially
+staged files the two differ, so pre-commit validation reads the staged
+blobs instead:
+- staged_files() lists the staged regular files with their blob SHAs
+- BlobReader streams any number of blobs through one
+  ``git cat-file --batch`` process
+- StagedContent runs validators on that content: on stdin for tools that
+  support it, otherwise on copies written to a scratch tree (on tmpfs
+  when available) and mapped back to the real paths
+
+Blob SHAs identify content exactly, so they double as result cache keys
+without hashing any file.
+
+Usage:
+    with StagedContent(staged_files()) as staged:
+        results = staged.validate(validator, [Path("src/app.py")])
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from ..validators.base import ValidationResult, Validator
+from .result_cache import PROJECT_CONFIG_FILES
+
+logger = logging.getLogger(__name__)
+
+# Index modes of regular files; symlinks and submodules are not validated
+REGULAR_FILE_MODES = ("100644", "100755")
+
+# Preferred location of scratch trees: a RAM-backed filesystem
+TMPFS_DIR = Path("/dev/shm")
+
+
+@dataclass(frozen=True)
+class StagedFile:
+    """A regular file as recorded in the index."""
+
+    path: Path  # relative to the current directory
+    repo_path: str  # relative to the repository root, as git reports it
+    blob: str  # object name of the staged content
+    mode: str
+
+
+def _git(args: List[str], cwd: Optional[Path] = None) -> Optional[bytes]:
+    """Run git, returning stdout, or None on failure"""
+    try:
+        result = subprocess.run(
+            ["git", *args], cwd=cwd, capture_output=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout
+
+
+def staged_files(cwd: Optional[Path] = None) -> List[StagedFile]:
+    """
+    List files added, copied or modified in the index.
+
+    Args:
+        cwd: Directory inside the repository (default: current directory)
+
+    Returns:
+        Staged regular files, empty outside a git repository
+    """
+    top = _git(["rev-parse", "--show-toplevel"], cwd)
+    raw = _git(
+        [
+            "diff",
+            "--cached",
+            "--raw",
+            "-z",
+            "--no-abbrev",
+            "--no-renames",
+            "--diff-filter=ACM",
+        ],
+        cwd,
+    )
+    if top is None or raw is None:
+        return []
+
+    root = Path(os.fsdecode(top.strip()))
+    base = Path(cwd or Path.cwd()).resolve()
+    fields = raw.split(b"\0")
+    staged = []
+    # Each entry is ":<old mode> <new mode> <old sha> <new sha> <status>"
+    # followed by the path, both NUL terminated
+    for info, path in zip(fields[0::2], fields[1::2]):
+        parts = os.fsdecode(info).lstrip(":").split()
+        if len(parts) != 5 or parts[1] not in REGULAR_FILE_MODES:
+            continue
+        repo_path = os.fsdecode(path)
+        staged.append(
+            StagedFile(
+                path=Path(os.path.relpath(root / repo_path, base)),
+                repo_path=repo_path,
+                blob=parts[3],
+                mode=parts[1],
+            )
+        )
+    return staged
+
+
+class BlobReader:
+    """
+    Read git objects through a single ``git cat-file --batch`` process.
+
+    Thread-safe; requests are serialized over the one pipe.
+    """
+
+    def __init__(self, cwd: Optional[Path] = None):
+        self.cwd = cwd
+        self._proc: Optional["subprocess.Popen[bytes]"] = None
+        self._lock = threading.Lock()
+
+    def read(self, blob: str) -> bytes:
+        """
+        Get the content of an object.
+
+        Raises:
+            KeyError: If the object does not exist
+        """
+        with self._lock:
+            if self._proc is None:
+                self._proc = subprocess.Popen(
+                    ["git", "cat-file", "--batch"],
+                    cwd=self.cwd,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                )
+            stdin, stdout = self._proc.stdin, self._proc.stdout
+            assert stdin is not None and stdout is not None
+            stdin.write(f"{blob}\n".encode())
+            stdin.flush()
+
+            # "<sha> <type> <size>\n<content>\n" or "<name> missing\n"
+            header = stdout.readline().split()
+            if len(header) != 3:
+                raise KeyError(blob)
+            content = stdout.read(int(header[2]))
+            stdout.read(1)
+            return content
+
+    def close(self) -> None:
+        with self._lock:
+            if self._proc is not None:
+                assert self._proc.stdin is not None
+                assert self._proc.stdout is not None
+                self._proc.stdin.close()
+                self._proc.wait()
+                self._proc.stdout.close()
+                self._proc = None
+
+    def __enter__(self) -> "BlobReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class StagedContent:
+    """
+    Validate the staged content of files instead of their working copies.
+
+    Files not in the index (e.g. passed explicitly) are validated from disk.
+    """
+
+    def __init__(
+        self,
+        files: Sequence[StagedFile],
+        reader: Optional[BlobReader] = None,
+        scratch_parent: Optional[Path] = None,
+    ):
+        self.files: Dict[str, StagedFile] = {str(f.path): f for f in files}
+        self.reader = reader or BlobReader()
+        self.scratch_parent = scratch_parent
+        self._scratch: Optional[Path] = None
+        self._materialized: Dict[str, Path] = {}
+        self._lock = threading.Lock()
+
+    def blob_for(self, filepath: Path) -> Optional[str]:
+        """Object name of a file's staged content, if it is staged"""
+        staged = self.files.get(str(filepath))
+        return staged.blob if staged else None
+
+    def content(self, filepath: Path) -> bytes:
+        """Staged content of a staged file"""
+        return self.reader.read(self.files[str(filepath)].blob)
+
+    def validate(
+        self, validator: Validator, files: List[Path]
+    ) -> List[ValidationResult]:
+        """
+        Validate the staged content of files, one result per file in order.
+
+        Content goes to the tool on stdin when it can read it there (a
+        chunk of files at a time, see Validator.validate_contents());
+        otherwise the files are written to the scratch tree and the results
+        reported against the real paths.
+        """
+        staged = [f for f in files if str(f) in self.files]
+        if not staged:
+            return validator.validate_batch(files)
+
+        results: Dict[str, ValidationResult] = {}
+        if validator.can_validate_content():
+            for start in range(0, len(staged), validator.batch_size):
+                chunk = staged[start : start + validator.batch_size]
+                contents = [self.content(f) for f in chunk]
+                for filepath, result in zip(
+                    chunk, validator.validate_contents(chunk, contents)
+                ):
+                    results[str(filepath)] = result
+        else:
+            copies = [self._materialize(f) for f in staged]
+            for filepath, copy, result in zip(
+                staged, copies, validator.validate_batch(copies)
+            ):
+                results[str(filepath)] = self._unmap(result, filepath, copy)
+
+        unstaged = [f for f in files if str(f) not in self.files]
+        if unstaged:
+            for filepath, result in zip(unstaged, validator.validate_batch(unstaged)):
+                results[str(filepath)] = result
+        return [results[str(f)] for f in files]
+
+    def _scratch_root(self) -> Path:
+        """Create the scratch tree on first use, seeded with project config"""
+        if self._scratch is None:
+            parent = self.scratch_parent
+            if parent is None and TMPFS_DIR.is_dir() and os.access(TMPFS_DIR, os.W_OK):
+                parent = TMPFS_DIR
+            self._scratch = Path(
+                tempfile.mkdtemp(prefix="huskycat-staged-", dir=parent)
+            )
+
+            # Tools look for their configuration next to the files
+            top = _git(["rev-parse", "--show-toplevel"])
+            root = Path(os.fsdecode(top.strip())) if top else Path.cwd()
+            for name in PROJECT_CONFIG_FILES:
+                if (root / name).is_file():
+                    shutil.copy2(root / name, self._scratch / name)
+        return self._scratch
+
+    def _materialize(self, filepath: Path) -> Path:
+        """Write a file's staged content into the scratch tree (once)"""
+        with self._lock:
+            key = str(filepath)
+            if key not in self._materialized:
+                staged = self.files[key]
+                copy = self._scratch_root() / staged.repo_path
+                copy.parent.mkdir(parents=True, exist_ok=True)
+                copy.write_bytes(self.reader.read(staged.blob))
+                if staged.mode == "100755":
+                    copy.chmod(0o755)
+                self._materialized[key] = copy
+            return self._materialized[key]
+
+    def _unmap(
+        self, result: ValidationResult, filepath: Path, copy: Path
+    ) -> ValidationResult:
+        """Report a scratch tree result against the real path"""
+        prefix = f"{self._scratch}{os.sep}"
+
+        def fix(text: str) -> str:
+            return text.replace(str(copy), str(filepath)).replace(prefix, "")
+
+        return replace(
+            result,
+            filepath=str(filepath),
+            messages=[fix(m) for m in result.messages],
+            errors=[fix(e) for e in result.errors],
+            warnings=[fix(w) for w in result.warnings],
+        )
+
+    def close(self) -> None:
+        """Stop the blob reader and remove the scratch tree"""
+        self.reader.close()
+        if self._scratch is not None:
+            shutil.rmtree(self._scratch, ignore_errors=True)
+            self._scratch = None
+            self._materialized.clear()
+
+    def __enter__(self) -> "StagedContent":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Per-tool timeouts learned from earlier runs.
+
+A fixed timeout is wrong both ways: big inputs hit it although the tool
+is making progress, and a hung tool is only noticed after the full
+limit. A TimeoutPolicy gives each tool run its own limit instead:
+- ``tools.<name>.timeout`` from the config, when set, is used as is
+- otherwise, once a tool has MIN_TIMEOUT_SAMPLES recorded runs (see
+  ProcessManager tool history), TIMEOUT_MARGIN times the p99 run time
+  for the run's number of files
+- otherwise the caller's default
+
+Runs that finish but take TIMEOUT_WARN_FRACTION of their limit or more
+are reported (see near_limit()), before they start timing out.
+
+Usage:
+    policy = TimeoutPolicy(overrides={"mypy": 120})
+    policy.use_history(process_manager.get_tool_history())
+    limit = policy.limit("ruff", files=200)
+"""
+
+from typing import TYPE_CHECKING, Dict, Mapping, Optional
+
+if TYPE_CHECKING:
+    from .process_manager import ToolHistory
+
+# Timeout of a tool with neither configuration nor history
+DEFAULT_TOOL_TIMEOUT = 30.0
+
+# Recorded runs needed before a tool's history sets its timeout
+MIN_TIMEOUT_SAMPLES = 5
+
+# Quantile of recorded run times the timeout is based on
+TIMEOUT_QUANTILE = 0.99
+
+# Factor between that run time and the timeout
+TIMEOUT_MARGIN = 2.0
+
+# Bounds of learned timeouts (seconds)
+MIN_LEARNED_TIMEOUT = 10.0
+MAX_LEARNED_TIMEOUT = 600.0
+
+# Share of its timeout from which a run is reported as close to it
+TIMEOUT_WARN_FRACTION = 0.75
+
+
+class TimeoutPolicy:
+    """
+    Decides how long each tool run may take.
+
+    Attributes:
+        overrides: Configured timeout in seconds per tool
+        history: Recorded runs per tool
+    """
+
+    def __init__(
+        self,
+        overrides: Optional[Mapping[str, float]] = None,
+        history: Optional[Mapping[str, "ToolHistory"]] = None,
+    ) -> None:
+        """
+        Initialize timeout policy.
+
+        Args:
+            overrides: Configured timeout in seconds per tool
+            history: Recorded runs per tool
+        """
+        self.overrides: Dict[str, float] = dict(overrides or {})
+        self.history: Dict[str, "ToolHistory"] = dict(history or {})
+
+    def use_history(self, history: Mapping[str, "ToolHistory"]) -> None:
+        """Base learned timeouts on these recorded runs"""
+        self.history = dict(history)
+
+    def learned(self, tool: str, files: Optional[int] = None) -> Optional[float]:
+        """
+        Timeout learned from a tool's recorded runs.
+
+        Args:
+            tool: Name of the tool
+            files: Number of files the run checks (None: a typical run)
+
+        Returns:
+            Seconds, or None with too few recorded runs
+        """
+        history = self.history.get(tool)
+        if history is None or len(history.samples) < MIN_TIMEOUT_SAMPLES:
+            return None
+        seconds = history.quantile(TIMEOUT_QUANTILE, files)
+        if seconds is None:
+            return None
+        return min(
+            MAX_LEARNED_TIMEOUT, max(MIN_LEARNED_TIMEOUT, seconds * TIMEOUT_MARGIN)
+        )
+
+    def limit(
+        self,
+        tool: str,
+        files: Optional[int] = None,
+        default: float = DEFAULT_TOOL_TIMEOUT,
+    ) -> float:
+        """
+        Timeout of one run of a tool.
+
+        Args:
+            tool: Name of the tool
+            files: Number of files the run checks (None: a typical run)
+            default: Timeout without configuration or enough history
+
+        Returns:
+            Seconds the run may take
+        """
+        if tool in self.overrides:
+            return self.overrides[tool]
+        learned = self.learned(tool, files)
+        return learned if learned is not None else default
+
+    @staticmethod
+    def near_limit(seconds: float, limit: float) -> bool:
+        """Whether a run that took ``seconds`` came close to its timeout"""
+        return seconds >= limit * TIMEOUT_WARN_FRACTION
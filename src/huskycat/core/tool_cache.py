@@ -0,0 +1,243 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Process-wide and on-disk cache of tool availability and versions.
+
+Finding out which validators can run means a PATH lookup per tool, and in
+containers a ``which`` subprocess per tool or a ``podman --version`` probe;
+every result cache key needs each tool's ``--version`` output on top.
+Engines are created per command, per MCP request and per fix pass, so
+these probes are remembered in ~/.huskycat/toolcache.json and in memory.
+
+The whole cache is discarded when the environment changes (PATH, HuskyCat
+version, interpreter, container or bundle state). Each entry is also
+stamped with the resolved tool binary's path, mtime and size, so upgrading
+or removing a tool invalidates just that tool. Entries expire after a TTL.
+
+Usage:
+    cache = ToolCache.shared()
+    available = [v for v in validators if cache.is_available(v)]
+    ...
+    cache.remember_versions(available)
+    cache.save()
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from ..validators.base import Validator
+
+logger = logging.getLogger(__name__)
+
+# Entries older than this are probed again
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+# Bump when the file layout changes
+CACHE_FORMAT = 1
+
+
+def default_cache_path() -> Path:
+    """Location of the on-disk tool cache"""
+    return Path.home() / ".huskycat" / "toolcache.json"
+
+
+def _file_stamp(path: Optional[Path]) -> str:
+    """Identify a file by path, mtime and size ("-" if it does not exist)"""
+    if path is None:
+        return "-"
+    try:
+        stat = path.stat()
+    except OSError:
+        return "-"
+    return f"{path}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def environment_key() -> str:
+    """Hash of everything outside a single tool that decides tool probes"""
+    from .. import __version__
+
+    bundled = Path.home() / ".huskycat" / "tools"
+    parts = [
+        str(CACHE_FORMAT),
+        __version__,
+        sys.executable,
+        str(bool(getattr(sys, "frozen", False))),
+        os.environ.get("PATH", ""),
+        str(
+            os.path.exists("/.dockerenv")
+            or bool(os.environ.get("container"))
+            or os.path.exists("/run/.containerenv")
+        ),
+        _file_stamp(bundled),
+    ]
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+class ToolCache:
+    """
+    Remembered is_available() and get_version() results per validator.
+
+    Thread-safe. Lookups never touch the disk after the first one; call
+    save() to persist new probes.
+    """
+
+    _shared: Optional["ToolCache"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self, path: Optional[Path] = None, ttl: float = DEFAULT_TTL_SECONDS
+    ) -> None:
+        """
+        Initialize tool cache.
+
+        Args:
+            path: Cache file (default: ~/.huskycat/toolcache.json)
+            ttl: Seconds after which an entry is probed again
+        """
+        self.path = path or default_cache_path()
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._environment: Optional[str] = None
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._stamps: Dict[str, str] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "ToolCache":
+        """The process-wide cache at the default location"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def _load(self) -> None:
+        """(Re)load entries if the environment changed since the last load"""
+        environment = environment_key()
+        if environment == self._environment:
+            return
+        self._environment = environment
+        self._entries = {}
+        self._stamps = {}
+        try:
+            data = json.loads(self.path.read_text())
+            if data.get("environment") == environment:
+                self._entries = dict(data.get("entries", {}))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logger.debug(f"Ignoring unreadable tool cache {self.path}: {e}")
+
+    @staticmethod
+    def _key(validator: Validator) -> str:
+        cls = type(validator)
+        return f"{cls.__module__}.{cls.__qualname__}:{validator.name}"
+
+    def _stamp(self, key: str, validator: Validator) -> str:
+        """Identify the tool binary and route a validator would use"""
+        if key not in self._stamps:
+            from ..validators._utils import get_gpl_sidecar, is_gpl_tool
+
+            bundled = Path.home() / ".huskycat" / "tools" / validator.command
+            if bundled.exists():
+                binary: Optional[Path] = bundled
+            else:
+                found = shutil.which(validator.command)
+                binary = Path(found) if found else None
+            route = "local"
+            if is_gpl_tool(validator.name) and get_gpl_sidecar() is not None:
+                route = "sidecar"
+            self._stamps[key] = f"{route}|{_file_stamp(binary)}"
+        return self._stamps[key]
+
+    def is_available(self, validator: Validator) -> bool:
+        """
+        Cached validator.is_available(); also seeds its known version.
+
+        Args:
+            validator: Validator to check
+
+        Returns:
+            True if the validator's tool can run
+        """
+        key = self._key(validator)
+        with self._lock:
+            self._load()
+            stamp = self._stamp(key, validator)
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and entry.get("stamp") == stamp
+                and time.time() - entry.get("checked", 0) < self.ttl
+            ):
+                self.hits += 1
+                if entry.get("version") is not None:
+                    validator.seed_version(entry["version"])
+                return bool(entry.get("available"))
+            self.misses += 1
+
+        available = validator.is_available()
+        with self._lock:
+            self._entries[key] = {
+                "stamp": stamp,
+                "checked": time.time(),
+                "available": available,
+                "version": None,
+            }
+            self._dirty = True
+        return available
+
+    def remember_versions(self, validators: Iterable[Validator]) -> None:
+        """Record versions the validators probed since they were checked"""
+        with self._lock:
+            for validator in validators:
+                version = validator.probed_version
+                entry = self._entries.get(self._key(validator))
+                if version is not None and entry is not None:
+                    if entry.get("version") != version:
+                        entry["version"] = version
+                        self._dirty = True
+
+    def save(self) -> None:
+        """Write new probes to disk; failures are logged and ignored"""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {"environment": self._environment, "entries": self._entries}
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}")
+                tmp.write_text(json.dumps(data, sort_keys=True))
+                os.replace(tmp, self.path)
+                self._dirty = False
+            except OSError as e:
+                logger.debug(f"Could not write tool cache {self.path}: {e}")
+
+    def invalidate(self) -> bool:
+        """
+        Forget every probe, in memory and on disk.
+
+        Returns:
+            True if a cache file was removed
+        """
+        with self._lock:
+            self._environment = None
+            self._entries = {}
+            self._stamps = {}
+            self._dirty = False
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                return False
+            except OSError as e:
+                logger.debug(f"Could not remove tool cache {self.path}: {e}")
+                return False
+            return True
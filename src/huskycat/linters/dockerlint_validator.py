@@ -9,9 +9,10 @@ Docker parser wrapped by the dockerfile Python library.
 import logging
 import time
 from pathlib import Path
-from typing import List, Set
+from typing import List, Set, Tuple
 
 from huskycat.validators import ValidationResult, Validator
+from huskycat.validators.base import DispatchRule
 
 logger = logging.getLogger(__name__)
 
@@ -38,12 +39,13 @@ class DockerLintValidator(Validator):
         # Return empty set - use can_handle() method instead
         return set()
 
-    def can_handle(self, filepath: Path) -> bool:
-        """Check if file is a Dockerfile or ContainerFile"""
-        return filepath.name in [
-            "Dockerfile",
-            "ContainerFile",
-        ] or filepath.name.endswith(".dockerfile")
+    @property
+    def dispatch_rules(self) -> Tuple[DispatchRule, ...]:
+        """Dockerfile or ContainerFile by name, or a .dockerfile extension"""
+        return (
+            DispatchRule(names=frozenset({"Dockerfile", "ContainerFile"})),
+            DispatchRule(name_pattern=r"\.dockerfile$"),
+        )
 
     def is_available(self) -> bool:
         """Check if dockerfile library is available"""
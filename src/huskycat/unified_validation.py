@@ -10,14 +10,26 @@ This module serves as the facade for the validators package.
 Validators are now split into individual modules under huskycat.validators.
 """
 
+import copy
+import contextvars
+import hashlib
 import json
 import logging
 import os
-import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from huskycat.core.async_executor import enable_async_processes
+from huskycat.core.config import HuskyCatConfig
+from huskycat.core.dispatch import ValidatorDispatcher
+from huskycat.core.file_walker import ExcludeMatcher, FileWalker
+from huskycat.core.parallel_executor import TOOL_DEPENDENCIES
+from huskycat.core.result_cache import ResultCache, hash_config, hash_file
+from huskycat.core.staged_content import StagedContent, staged_files
+from huskycat.core.tool_cache import ToolCache
 from huskycat.core.tool_selector import (
     LintingMode,
     get_mode_from_env,
@@ -60,6 +72,8 @@ from huskycat.validators import (
     # GitLab CI validator
     GitLabCIValidator,
 )
+from huskycat.validators.base import DEFAULT_BATCH_SIZE
+from huskycat.validators.inprocess import enable_inprocess
 
 # Configure logging
 logging.basicConfig(
@@ -68,6 +82,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Validators that can fix the problems they report
+FIXABLE_TOOLS = frozenset(
+    {
+        "python-black",
+        "autoflake",
+        "ruff",
+        "isort",
+        "taplo",
+        "terraform",
+        "yamllint",
+        "js-eslint",
+        "js-prettier",
+        "chapel",
+    }
+)
 
 # Re-export for backwards compatibility
 __all__ = [
@@ -120,6 +149,10 @@ class ValidationEngine:
         use_container: bool = False,
         adapter: Optional[Any] = None,
         linting_mode: Optional[LintingMode] = None,
+        use_cache: Optional[bool] = None,
+        result_cache: Optional[ResultCache] = None,
+        max_workers: Optional[int] = None,
+        tool_cache: Optional[ToolCache] = None,
     ):
         self.auto_fix = auto_fix
         self.interactive = interactive
@@ -130,8 +163,54 @@ class ValidationEngine:
         logger.info(
             f"ValidationEngine initialized with linting_mode={self.linting_mode.value}"
         )
+        self.config = HuskyCatConfig()
+
+        # Tool probes are remembered across engines and processes unless the
+        # cache_tools feature flag is off
+        if tool_cache is None and self.config.cache_tools_enabled:
+            tool_cache = ToolCache.shared()
+        self.tool_cache = tool_cache
+
+        # Python-native linters run in a pre-warmed worker pool when the
+        # inprocess_tools feature flag is on
+        if self.config.inprocess_tools_enabled:
+            enable_inprocess()
+        # Tool processes run on the shared asyncio loop, rather than each
+        # blocking a thread in subprocess.run(), when async_processes is on
+        if self.config.async_processes_enabled:
+            enable_async_processes()
         self.validators = self._initialize_validators()
-        self._extension_map = self._build_extension_map()
+        # A configured tools.<name>.timeout replaces the validator's default
+        timeouts = self.tool_timeouts()
+        for validator in self.validators:
+            if validator.name in timeouts:
+                validator.timeout = timeouts[validator.name]
+
+        # Result cache, gated by the cache_results feature flag unless the
+        # caller decides explicitly
+        if use_cache is None:
+            use_cache = self.config.cache_results_enabled
+        self.result_cache = (result_cache or ResultCache()) if use_cache else None
+        self._config_hashes: Dict[str, str] = {}
+        self._tool_excludes: Dict[str, ExcludeMatcher] = {}
+        self.max_workers = self._resolve_max_workers(max_workers)
+
+    @property
+    def _config_base(self) -> Path:
+        """Directory that config-relative patterns are anchored at"""
+        if self.config.config_file is not None:
+            return self.config.config_file.parent
+        return Path.cwd()
+
+    def _resolve_max_workers(self, max_workers: Optional[int]) -> int:
+        """Pick the worker count: argument, then config, then CPU count"""
+        if max_workers is None:
+            max_workers = self.config.get("validation.max_workers")
+        if max_workers is None:
+            if not self.config.parallel_execution_enabled:
+                return 1
+            max_workers = os.cpu_count() or 1
+        return max(1, int(max_workers))
 
     def _load_dockerlint_validator(self):
         """Dynamically load DockerLintValidator if available"""
@@ -226,7 +305,7 @@ class ValidationEngine:
                 )
                 continue
 
-            if v.is_available():
+            if self._is_available(v):
                 available.append(v)
                 logger.info(
                     f"Validator {v.name} is available (auto_fix={v.auto_fix}, mode={self.linting_mode.value})"
@@ -234,46 +313,59 @@ class ValidationEngine:
             else:
                 logger.warning(f"Validator {v.name} is not available")
 
+        if self.tool_cache is not None:
+            self.tool_cache.save()
         return available
 
-    def _build_extension_map(self) -> Dict[str, List[Validator]]:
-        """Build a map of file extensions to validators"""
-        ext_map: Dict[str, List[Validator]] = {}
-        for validator in self.validators:
-            for ext in validator.extensions:
-                if ext not in ext_map:
-                    ext_map[ext] = []
-                ext_map[ext].append(validator)
-        return ext_map
+    def _is_available(self, validator: Validator) -> bool:
+        """Check a validator's tool, through the tool cache if enabled"""
+        if self.tool_cache is not None:
+            return self.tool_cache.is_available(validator)
+        return validator.is_available()
+
+    def _remember_versions(self) -> None:
+        """Persist tool versions probed for result cache keys"""
+        if self.tool_cache is not None:
+            self.tool_cache.remember_versions(self.validators)
+            self.tool_cache.save()
+
+    @property
+    def _extension_map(self) -> Dict[str, List[Validator]]:
+        """Map of file extensions to validators, from the dispatch tables"""
+        return self._dispatcher.extension_map()
+
+    @property
+    def _dispatcher(self) -> ValidatorDispatcher:
+        """Compiled dispatch tables, rebuilt if the validator list is replaced"""
+        key = (id(self.validators), len(self.validators))
+        if getattr(self, "_dispatcher_key", None) != key:
+            self._dispatcher_cache = ValidatorDispatcher(self.validators)
+            self._dispatcher_key = key
+        return self._dispatcher_cache
 
     def get_validators_for_file(self, filepath: Path) -> List[Validator]:
         """Get applicable validators for a file (for testing compatibility)"""
-        validators = self._extension_map.get(filepath.suffix, [])
+        return self._select_validators(filepath)[0]
 
-        # Also check validators with custom can_handle logic
-        for v in self.validators:
-            if v.can_handle(filepath) and v not in validators:
-                validators.append(v)
+    def _select_validators(
+        self, filepath: Path, tools: Optional[List[str]] = None
+    ) -> Tuple[List[Validator], List[ValidationResult]]:
+        """Pick the validators to run on a file
 
-        return validators
-
-    def validate_file(
-        self,
-        filepath: Path,
-        fix: Optional[bool] = None,
-        tools: Optional[List[str]] = None,
-    ) -> List[ValidationResult]:
-        """Validate a single file with all applicable validators"""
-        results: List[ValidationResult] = []
+        Returns:
+            Tuple of (validators, error results for unknown requested tools)
+        """
+        unknown: List[ValidationResult] = []
 
-        # Find applicable validators
+        dispatcher = self._dispatcher
         if tools:
             # Filter validators by specified tool names
+            handled = dispatcher.handled(filepath)
             validators = []
             for tool_name in tools:
                 found_validator = None
-                for v in self.validators:
-                    if v.name == tool_name and v.can_handle(filepath):
+                for index, v in enumerate(dispatcher.validators):
+                    if v.name == tool_name and index in handled:
                         found_validator = v
                         break
 
@@ -288,78 +380,508 @@ class ValidationEngine:
                         messages=[f"Unknown tool: {tool_name}"],
                         errors=[f"Unknown tool: {tool_name}"],
                     )
-                    results.append(result)
+                    unknown.append(result)
         else:
-            # Use all applicable validators
-            validators = self._extension_map.get(filepath.suffix, [])
+            # Use all applicable validators: extension matches first, then
+            # validators that handle the file by name or location
+            validators = dispatcher.validators_for(filepath)
 
-            # Also check validators with custom can_handle logic
-            for v in self.validators:
-                if v.can_handle(filepath) and v not in validators:
-                    validators.append(v)
+        validators = [v for v in validators if not self._is_tool_excluded(v, filepath)]
+        return validators, unknown
 
-        if not validators and not tools:
-            logger.warning(f"No validators found for {filepath}")
-            return results
+    def _tool_exclude_matcher(self, validator: Validator) -> ExcludeMatcher:
+        """Compile the configured exclude patterns that apply to a validator
 
-        # Run each validator
-        for validator in validators:
-            logger.info(f"Running {validator.name} on {filepath}")
-            result = validator.validate(filepath)
-            results.append(result)
+        A tools entry applies when its key or its ``tools`` list names the
+        validator, e.g. ``tools.python.exclude`` with ``tools: [ruff]``.
+        """
+        if validator.name not in self._tool_excludes:
+            names = {validator.name, self._dependency_name(validator.name)}
+            patterns: List[str] = []
+            tool_sections = self.config.get("tools") or {}
+            for key, section in tool_sections.items():
+                if not isinstance(section, dict):
+                    continue
+                if key in names or names & set(section.get("tools") or []):
+                    patterns.extend(section.get("exclude") or [])
+            self._tool_excludes[validator.name] = ExcludeMatcher(patterns)
+        return self._tool_excludes[validator.name]
+
+    def tool_timeouts(self) -> Dict[str, float]:
+        """Timeouts in seconds configured for the validators
+
+        Like excludes, a tools entry applies when its key or its ``tools``
+        list names the validator; an entry keyed by the validator itself
+        wins over a category listing it.
+        """
+        tool_sections = self.config.get("tools") or {}
+        timeouts: Dict[str, float] = {}
+        for validator in self.validators:
+            names = {validator.name, self._dependency_name(validator.name)}
+            for key, section in tool_sections.items():
+                if not isinstance(section, dict) or section.get("timeout") is None:
+                    continue
+                if key in names:
+                    timeouts[validator.name] = float(section["timeout"])
+                    break
+                if names & set(section.get("tools") or []):
+                    timeouts.setdefault(validator.name, float(section["timeout"]))
+        return timeouts
+
+    def _is_tool_excluded(self, validator: Validator, filepath: Path) -> bool:
+        """Check the validator's configured exclude patterns for a file"""
+        matcher = self._tool_exclude_matcher(validator)
+        if not matcher:
+            return False
+        rel_path = os.path.relpath(os.path.abspath(filepath), self._config_base)
+        return matcher.matches(Path(rel_path).as_posix(), str(filepath))
+
+    def validate_file(
+        self,
+        filepath: Path,
+        fix: Optional[bool] = None,
+        tools: Optional[List[str]] = None,
+    ) -> List[ValidationResult]:
+        """Validate a single file with all applicable validators"""
+        return self.validate_files([filepath], tools=tools).get(str(filepath), [])
 
+    def validate_files(
+        self,
+        filepaths: List[Path],
+        tools: Optional[List[str]] = None,
+        staged: Optional[StagedContent] = None,
+    ) -> Dict[str, List[ValidationResult]]:
+        """Validate many files, running each validator once per batch of files
+
+        Files are grouped by applicable validator and handed to
+        ``Validator.validate_batch``, so tools that accept several paths are
+        spawned once per chunk instead of once per file. Per-file results
+        keep the same order as ``validate_file`` would produce.
+
+        With ``staged``, files in the index are validated with their staged
+        content instead of the working tree copy.
+        """
+        completed: Dict[str, List[ValidationResult]] = {}
+        for key, _, file_results in self._stream_files(filepaths, tools, staged):
+            if file_results:
+                completed[key] = file_results
+
+        # Files finish in completion order; report them in input order
+        results: Dict[str, List[ValidationResult]] = {}
+        for filepath in filepaths:
+            key = str(filepath)
+            if key in completed:
+                results[key] = completed.pop(key)
         return results
 
+    def iter_validate(
+        self,
+        paths: Iterable[Path],
+        tools: Optional[List[str]] = None,
+        recursive: bool = True,
+        exclude_patterns: Optional[List[str]] = None,
+    ) -> Iterator[ValidationResult]:
+        """Validate files and directories, yielding results as they complete
+
+        Each (file, tool) result is yielded as soon as its unit of work
+        finishes, so callers can report the first problems while the rest
+        of the run is still going. Directories are walked like
+        ``validate_directory``. Files are planned one window at a time, so
+        memory stays flat however many files there are. With several
+        workers the completion order is not deterministic.
+        """
+        files = self._expand_paths(paths, recursive, exclude_patterns)
+        for window in self._windows(files):
+            for _, result, _ in self._stream_files(window, tools):
+                yield result
+
+    def iter_file_results(
+        self,
+        paths: Iterable[Path],
+        tools: Optional[List[str]] = None,
+        recursive: bool = True,
+        exclude_patterns: Optional[List[str]] = None,
+    ) -> Iterator[Tuple[str, List[ValidationResult]]]:
+        """Like ``iter_validate``, but yield each file once all its tools ran
+
+        Yields:
+            Tuples of (filepath, results) with results in the order
+            ``validate_file`` would return them
+        """
+        files = self._expand_paths(paths, recursive, exclude_patterns)
+        for window in self._windows(files):
+            for key, _, file_results in self._stream_files(window, tools):
+                if file_results:
+                    yield key, file_results
+
+    def _windows(self, files: Iterable[Path]) -> Iterator[List[Path]]:
+        """Group a lazy stream of files into work windows
+
+        A window is large enough to keep every worker busy with full
+        batches, and bounds how many files are planned at once.
+        """
+        window_size = self.max_workers * DEFAULT_BATCH_SIZE
+        files = iter(files)
+        while True:
+            window = list(islice(files, window_size))
+            if not window:
+                return
+            yield window
+
+    def _expand_paths(
+        self,
+        paths: Iterable[Path],
+        recursive: bool = True,
+        exclude_patterns: Optional[List[str]] = None,
+    ) -> Iterator[Path]:
+        """Yield files as given, walking any directories among them"""
+        for path in paths:
+            path = Path(path)
+            if path.is_dir():
+                yield from self._walker(path, recursive, exclude_patterns)
+            else:
+                yield path
+
+    def _walker(
+        self,
+        directory: Path,
+        recursive: bool = True,
+        exclude_patterns: Optional[List[str]] = None,
+    ) -> FileWalker:
+        """Walker applying the configured ignore patterns to a directory"""
+        return FileWalker(
+            directory,
+            recursive=recursive,
+            exclude_patterns=exclude_patterns,
+            ignore_patterns=self.config.get("ignore_patterns") or [],
+            ignore_base=self._config_base,
+        )
+
+    def _stream_files(
+        self,
+        filepaths: List[Path],
+        tools: Optional[List[str]] = None,
+        staged: Optional[StagedContent] = None,
+    ) -> Iterator[Tuple[str, ValidationResult, Optional[List[ValidationResult]]]]:
+        """Run the validators for a set of files, yielding each result
+
+        Yields:
+            Tuples of (filepath, result, file_results). file_results is None
+            until the result completes its file; it then holds all of that
+            file's results in validator order.
+        """
+        plan: Dict[str, List[Validator]] = {}
+        slots: Dict[str, List[Optional[ValidationResult]]] = {}
+        remaining: Dict[str, int] = {}
+        batches: Dict[int, Tuple[Validator, List[Path]]] = {}
+        finished: List[Tuple[str, ValidationResult]] = []
+
+        for filepath in filepaths:
+            key = str(filepath)
+            if key in plan:
+                continue
+
+            validators, unknown = self._select_validators(filepath, tools)
+            if not validators and not tools:
+                logger.warning(f"No validators found for {filepath}")
+                continue
+
+            plan[key] = validators
+            slots[key] = [*unknown, *([None] * len(validators))]
+            remaining[key] = len(slots[key])
+            finished.extend((key, result) for result in unknown)
+            for validator in validators:
+                batches.setdefault(id(validator), (validator, []))[1].append(filepath)
+
+        def complete(
+            key: str, validator: Optional[Validator], result: ValidationResult
+        ) -> Optional[List[ValidationResult]]:
+            """Record a result, returning the file's results once all are in"""
+            file_slots = slots[key]
+            if validator is not None:
+                offset = len(file_slots) - len(plan[key])
+                file_slots[offset + plan[key].index(validator)] = result
+            remaining[key] -= 1
+            if remaining[key]:
+                return None
+            del slots[key], remaining[key]
+            return [slot for slot in file_slots if slot is not None]  # all filled
+
+        for key, result in finished:
+            yield key, result, complete(key, None, result)
+        for key in [k for k, count in remaining.items() if count == 0]:
+            # Files whose requested tools were all excluded
+            del slots[key], remaining[key]
+
+        # Run each validator over all of its files not already cached. Stages
+        # run one after another; the (validator, chunk) units of a stage run
+        # concurrently on the work pool and are yielded as they finish.
+        content_hashes: Dict[str, Optional[str]] = {}
+        run = None
+        if staged is not None:
+            # Blob names identify staged content without reading it
+            content_hashes.update(
+                (key, f"blob:{staged_file.blob}")
+                for key, staged_file in staged.files.items()
+            )
+            run = staged.validate
+        stages = self._execution_stages([v for v, _ in batches.values()])
+        pool = None
+        if self.max_workers > 1:
+            pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            for stage in stages:
+                units: List[Tuple[Validator, List[Path], Dict[str, str]]] = []
+                for validator in stage:
+                    files = batches[id(validator)][1]
+                    keys = self._cache_keys(validator, files, content_hashes)
+                    pending = []
+                    for filepath in files:
+                        cache_key = keys.get(str(filepath))
+                        cached = (
+                            self.result_cache.get(cache_key, str(filepath))
+                            if self.result_cache is not None and cache_key is not None
+                            else None
+                        )
+                        if cached is not None:
+                            yield str(filepath), cached, complete(
+                                str(filepath), validator, cached
+                            )
+                        else:
+                            pending.append(filepath)
+
+                    if not pending:
+                        logger.debug(
+                            f"All {len(files)} file(s) cached for {validator.name}"
+                        )
+                        continue
+
+                    logger.info(f"Running {validator.name} on {len(pending)} file(s)")
+                    for chunk in self._split_work(validator, pending):
+                        units.append((validator, chunk, keys))
+
+                for (validator, chunk, keys), chunk_results in self._run_units(
+                    pool, units, run
+                ):
+                    for filepath, result in zip(chunk, chunk_results):
+                        self._store_result(
+                            validator, filepath, result, keys, content_hashes
+                        )
+                        yield str(filepath), result, complete(
+                            str(filepath), validator, result
+                        )
+        finally:
+            if pool is not None:
+                # Stop queued units if the consumer abandoned the stream
+                pool.shutdown(wait=True, cancel_futures=True)
+
+        if self.result_cache is not None:
+            self.result_cache.prune()
+        self._remember_versions()
+
+    @staticmethod
+    def _dependency_name(tool_name: str) -> str:
+        """Map a validator name onto its TOOL_DEPENDENCIES key"""
+        for prefix in ("python-", "js-"):
+            if tool_name.startswith(prefix):
+                return tool_name[len(prefix) :]
+        return tool_name
+
+    def _execution_stages(self, validators: List[Validator]) -> List[List[Validator]]:
+        """Group validators into stages that may run concurrently
+
+        Read-only validators never conflict, so without fixers everything is
+        one stage. Fixers rewrite files in place: each gets a stage of its
+        own, ordered by TOOL_DEPENDENCIES, and read-only validators run last
+        on the fixed content.
+        """
+        fixers = [v for v in validators if v.auto_fix]
+        checkers = [v for v in validators if not v.auto_fix]
+        if not fixers:
+            return [checkers] if checkers else []
+
+        depth: Dict[str, int] = {}
+
+        def level(name: str) -> int:
+            if name not in depth:
+                depth[name] = 0  # guards against cycles
+                deps = TOOL_DEPENDENCIES.get(name, [])
+                depth[name] = max((level(d) + 1 for d in deps), default=0)
+            return depth[name]
+
+        # sorted() is stable, so equal levels keep validator order
+        ordered = sorted(fixers, key=lambda v: level(self._dependency_name(v.name)))
+        stages = [[v] for v in ordered]
+        if checkers:
+            stages.append(checkers)
+        return stages
+
+    def _split_work(self, validator: Validator, files: List[Path]) -> List[List[Path]]:
+        """Split a validator's files into chunks so the pool stays busy
+
+        Chunks never exceed the validator's batch_size, and are made smaller
+        when there are fewer chunks than workers. Validators asking for a
+        single batch get all their files at once.
+        """
+        if getattr(validator, "single_batch", False):
+            return [files]
+        per_worker = -(-len(files) // self.max_workers)  # ceil division
+        size = max(1, min(validator.batch_size, per_worker))
+        return [files[i : i + size] for i in range(0, len(files), size)]
+
+    @staticmethod
+    def _run_units(
+        pool: Optional[ThreadPoolExecutor],
+        units: List[Tuple[Validator, List[Path], Dict[str, str]]],
+        run: Optional[Callable[[Validator, List[Path]], List[ValidationResult]]] = None,
+    ) -> Iterator[
+        Tuple[Tuple[Validator, List[Path], Dict[str, str]], List[ValidationResult]]
+    ]:
+        """Run (validator, chunk) units, yielding each with its results
+
+        ``run`` validates a chunk (default: ``Validator.validate_batch``).
+        Units are yielded in completion order when they run on the pool,
+        and in unit order otherwise.
+        """
+        if run is None:
+
+            def run(validator: Validator, chunk: List[Path]) -> List[ValidationResult]:
+                return validator.validate_batch(chunk)
+
+        if pool is None or len(units) <= 1:
+            for unit in units:
+                yield unit, run(unit[0], unit[1])
+            return
+        # Each unit gets a copy of the caller's context, so the current cancel
+        # token (huskycat.core.cancellation) reaches the pool threads
+        futures = {
+            pool.submit(contextvars.copy_context().run, run, v, chunk): i
+            for i, (v, chunk, _) in enumerate(units)
+        }
+        for future in as_completed(futures):
+            yield units[futures[future]], future.result()
+
+    def _config_hash(self, validator: Validator) -> str:
+        """Hash of the effective configuration for a validator"""
+        if validator.name not in self._config_hashes:
+            tool_config = self.config.get(f"tools.{validator.name}")
+            self._config_hashes[validator.name] = hash_config(tool_config)
+        return self._config_hashes[validator.name]
+
+    def fingerprint(self, tools: Optional[List[str]] = None) -> str:
+        """Hash of everything apart from file content that decides results
+
+        Covers the linting mode, the version of each available validator
+        (restricted to ``tools`` if given) and the project configuration.
+        Runs with different fingerprints cannot vouch for each other.
+        """
+        versions = {
+            v.name: v.get_version()
+            for v in self.validators
+            if not tools or v.name in tools
+        }
+        payload = {
+            "mode": self.linting_mode.value,
+            "versions": versions,
+            "config": hash_config(self.config.get("tools"), self._config_base),
+        }
+        self._remember_versions()
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def _cache_keys(
+        self,
+        validator: Validator,
+        files: List[Path],
+        content_hashes: Dict[str, Optional[str]],
+    ) -> Dict[str, str]:
+        """Compute result cache keys for the files a validator will check
+
+        Files that cannot be hashed, and validators that are not cacheable or
+        whose version is unknown, get no key and are always run.
+        """
+        if self.result_cache is None or not validator.cacheable:
+            return {}
+
+        version = validator.get_version()
+        if version is None:
+            return {}
+
+        config_hash = self._config_hash(validator)
+        keys = {}
+        for filepath in files:
+            path_key = str(filepath)
+            if path_key not in content_hashes:
+                content_hashes[path_key] = hash_file(filepath)
+            content_hash = content_hashes[path_key]
+            if content_hash is not None:
+                keys[path_key] = ResultCache.make_key(
+                    validator.name,
+                    version,
+                    config_hash,
+                    content_hash,
+                    validator.auto_fix,
+                    path_key,
+                )
+        return keys
+
+    def _store_result(
+        self,
+        validator: Validator,
+        filepath: Path,
+        result: ValidationResult,
+        keys: Dict[str, str],
+        content_hashes: Dict[str, Optional[str]],
+    ) -> None:
+        """Cache a fresh result unless the validator changed the file"""
+        key = keys.get(str(filepath))
+        if self.result_cache is None or key is None:
+            return
+        if validator.auto_fix:
+            # A fixer may have rewritten the file; the result then describes
+            # content that no longer exists under this key, and later
+            # validators must hash the new content
+            current = hash_file(filepath)
+            if current != content_hashes.get(str(filepath)):
+                content_hashes[str(filepath)] = current
+                return
+        if not result.fixed:
+            self.result_cache.put(key, result)
+
     def validate_directory(
         self,
         directory: Path,
         recursive: bool = True,
         exclude_patterns: Optional[List[str]] = None,
     ) -> Dict[str, List[ValidationResult]]:
-        """Validate all files in a directory"""
-        results = {}
-
-        pattern = "**/*" if recursive else "*"
-        exclude_patterns = exclude_patterns or []
-
-        for filepath in directory.glob(pattern):
-            if filepath.is_file() and not filepath.name.startswith("."):
-                # Check if file should be excluded
-                should_exclude = False
-                for exclude_pattern in exclude_patterns:
-                    if exclude_pattern in str(filepath):
-                        should_exclude = True
-                        break
-
-                if not should_exclude:
-                    file_results = self.validate_file(filepath)
-                    if file_results:
-                        results[str(filepath)] = file_results
+        """Validate all files in a directory
 
+        The tree is walked lazily, pruning ignored directories (.gitignore,
+        the configured ignore_patterns and exclude_patterns), and files are
+        validated in windows as the walk produces them.
+        """
+        results: Dict[str, List[ValidationResult]] = {}
+        walker = self._walker(directory, recursive, exclude_patterns)
+        for window in self._windows(walker):
+            results.update(self.validate_files(window))
         return results
 
     def validate_staged_files(self) -> Dict[str, List[ValidationResult]]:
-        """Validate files staged for git commit with interactive auto-fix prompt"""
-        try:
-            # Get staged files
-            result = subprocess.run(
-                ["git", "diff", "--cached", "--name-only"],
-                capture_output=True,
-                text=True,
-            )
+        """Validate files staged for git commit with interactive auto-fix prompt
 
-            if result.returncode != 0:
-                logger.error("Failed to get staged files")
-                return {}
+        Checks the staged content of each file, which is what the commit
+        will contain, rather than its working tree copy. Auto-fixing
+        rewrites files in place, so it works on the working tree.
+        """
+        try:
+            index = staged_files()
+            staged = [f.path for f in index]
 
             # First pass - validate without auto-fix
-            results = {}
-            for filename in result.stdout.splitlines():
-                filepath = Path(filename)
-                if filepath.exists():
-                    file_results = self.validate_file(filepath)
-                    if file_results:
-                        results[filename] = file_results
+            if self.auto_fix:
+                results = self.validate_files(staged)
+            else:
+                with StagedContent(index) as content:
+                    results = self.validate_files(staged, staged=content)
 
             # Check if we have fixable issues and prompt for auto-fix
             if self.interactive and not self.auto_fix:
@@ -369,17 +891,7 @@ class ValidationEngine:
                     response = input("Attempt auto-fix? [y/N]: ").strip().lower()
                     if response in ["y", "yes"]:
                         print("Applying auto-fixes...")
-                        # Re-run with auto-fix enabled, preserving linting mode
-                        auto_fix_engine = ValidationEngine(
-                            auto_fix=True, linting_mode=self.linting_mode
-                        )
-                        results = {}
-                        for filename in result.stdout.splitlines():
-                            filepath = Path(filename)
-                            if filepath.exists():
-                                file_results = auto_fix_engine.validate_file(filepath)
-                                if file_results:
-                                    results[filename] = file_results
+                        results = self._apply_fixes(results)
 
             return results
 
@@ -389,63 +901,139 @@ class ValidationEngine:
 
     def _count_fixable_issues(self, results: Dict[str, List[ValidationResult]]) -> int:
         """Count how many issues could potentially be auto-fixed"""
-        fixable_tools = {
-            "black",
-            "autoflake",
-            "ruff",
-            "isort",
-            "taplo",
-            "terraform",
-            "yamllint",
-            "eslint",
-            "js-prettier",
-            "chapel",
-        }
         count = 0
 
         for filepath, file_results in results.items():
             for result in file_results:
-                if not result.success and result.tool in fixable_tools:
+                if not result.success and result.tool in FIXABLE_TOOLS:
                     count += result.error_count
 
         return count
 
+    def _apply_fixes(
+        self, results: Dict[str, List[ValidationResult]]
+    ) -> Dict[str, List[ValidationResult]]:
+        """Fix the fixable failures in results and bring the rest up to date
+
+        Only the fixers that failed on a file run on it, in fix mode. The
+        other validators re-run, in check mode, only on files the fixers
+        actually changed; results for untouched files stand.
+        """
+        fixes: Dict[str, List[str]] = {}
+        for filepath, file_results in results.items():
+            tools = [
+                r.tool
+                for r in file_results
+                if not r.success and r.tool in FIXABLE_TOOLS
+            ]
+            if tools:
+                fixes[filepath] = tools
+        if not fixes:
+            return results
+
+        before = {filepath: hash_file(Path(filepath)) for filepath in fixes}
+        fix_engine = self._fix_engine()
+        updated: Dict[str, Dict[str, ValidationResult]] = {}
+        for group, files in self._group_by_tools(fixes).items():
+            for key, file_results in fix_engine.validate_files(
+                files, list(group)
+            ).items():
+                updated.setdefault(key, {}).update((r.tool, r) for r in file_results)
+
+        # Fixes can surface or clear problems other validators report
+        rechecks: Dict[str, List[str]] = {}
+        for filepath, tools in fixes.items():
+            if hash_file(Path(filepath)) != before[filepath]:
+                others = [r.tool for r in results[filepath] if r.tool not in tools]
+                if others:
+                    rechecks[filepath] = others
+        for group, files in self._group_by_tools(rechecks).items():
+            for key, file_results in self.validate_files(files, list(group)).items():
+                updated.setdefault(key, {}).update((r.tool, r) for r in file_results)
+
+        merged = dict(results)
+        for filepath, by_tool in updated.items():
+            merged[filepath] = [by_tool.get(r.tool, r) for r in results[filepath]]
+        return merged
+
+    def _fix_engine(self) -> "ValidationEngine":
+        """This engine with fixing copies of its fixer validators
+
+        Shares the probed validators, configuration and result cache, so
+        switching to fix mode does not rediscover any tools.
+        """
+        fix_engine = copy.copy(self)
+        fix_engine.auto_fix = True
+        fix_engine.validators = []
+        for validator in self.validators:
+            if validator.name in FIXABLE_TOOLS and not validator.auto_fix:
+                validator = copy.copy(validator)
+                validator.auto_fix = True
+            fix_engine.validators.append(validator)
+        return fix_engine
+
+    @staticmethod
+    def _group_by_tools(
+        tools_by_file: Dict[str, List[str]],
+    ) -> Dict[Tuple[str, ...], List[Path]]:
+        """Group files that need the same tools run on them"""
+        groups: Dict[Tuple[str, ...], List[Path]] = {}
+        for filepath, tools in tools_by_file.items():
+            groups.setdefault(tuple(tools), []).append(Path(filepath))
+        return groups
+
     def get_summary(self, results: Dict[str, List[ValidationResult]]) -> Dict[str, Any]:
         """Generate a summary of validation results"""
-        total_files = len(results)
-        total_errors = 0
-        total_warnings = 0
-        failed_files = []
-        fixed_files = []
-
+        summary = self.empty_summary()
         for filepath, file_results in results.items():
-            has_error = False
-            has_fixes = False
-            for result in file_results:
-                total_errors += result.error_count
-                total_warnings += result.warning_count
-                if not result.success:
-                    has_error = True
-                if result.fixed:
-                    has_fixes = True
-
-            if has_error:
-                failed_files.append(filepath)
-            if has_fixes:
-                fixed_files.append(filepath)
+            self.add_to_summary(summary, filepath, file_results)
+        return summary
 
+    @staticmethod
+    def empty_summary() -> Dict[str, Any]:
+        """Summary of a run with no results, to fill with add_to_summary()"""
         return {
-            "total_files": total_files,
-            "passed_files": total_files - len(failed_files),
-            "failed_files": len(failed_files),
-            "fixed_files": len(fixed_files),
-            "total_errors": total_errors,
-            "total_warnings": total_warnings,
-            "failed_file_list": failed_files,
-            "fixed_file_list": fixed_files,
-            "success": len(failed_files) == 0,
+            "total_files": 0,
+            "passed_files": 0,
+            "failed_files": 0,
+            "fixed_files": 0,
+            "total_errors": 0,
+            "total_warnings": 0,
+            "failed_file_list": [],
+            "fixed_file_list": [],
+            "success": True,
         }
 
+    @staticmethod
+    def add_to_summary(
+        summary: Dict[str, Any],
+        filepath: str,
+        file_results: List[ValidationResult],
+    ) -> None:
+        """Fold one file's results into a summary
+
+        Lets streaming callers summarize a run without keeping its results.
+        """
+        has_error = False
+        has_fixes = False
+        for result in file_results:
+            summary["total_errors"] += result.error_count
+            summary["total_warnings"] += result.warning_count
+            if not result.success:
+                has_error = True
+            if result.fixed:
+                has_fixes = True
+
+        summary["total_files"] += 1
+        if has_error:
+            summary["failed_file_list"].append(filepath)
+        if has_fixes:
+            summary["fixed_file_list"].append(filepath)
+        summary["failed_files"] = len(summary["failed_file_list"])
+        summary["fixed_files"] = len(summary["fixed_file_list"])
+        summary["passed_files"] = summary["total_files"] - summary["failed_files"]
+        summary["success"] = summary["failed_files"] == 0
+
 
 # CLI Interface
 def main() -> None:
@@ -39,7 +39,7 @@ class AutoflakeValidator(Validator):
 
         try:
             result = self._execute_command(
-                check_cmd, capture_output=True, text=True, timeout=30
+                check_cmd, capture_output=True, text=True, timeout=self._timeout()
             )
             duration_ms = int((time.time() - start_time) * 1000)
 
@@ -64,7 +64,7 @@ class AutoflakeValidator(Validator):
                         str(filepath),
                     ]
                     fix_result = self._execute_command(
-                        fix_cmd, capture_output=True, text=True, timeout=30
+                        fix_cmd, capture_output=True, text=True, timeout=self._timeout()
                     )
 
                     if fix_result.returncode == 0:
@@ -10,9 +10,14 @@ License: Apache-2.0
 import json
 import time
 from pathlib import Path
-from typing import Set
+from typing import Any, Dict, List, Set
 
-from huskycat.validators.base import ValidationResult, Validator
+from huskycat.validators.base import (
+    BatchOutputError,
+    FileIndex,
+    ValidationResult,
+    Validator,
+)
 
 
 class BanditValidator(Validator):
@@ -32,7 +37,7 @@ class BanditValidator(Validator):
 
         try:
             result = self._execute_command(
-                cmd, capture_output=True, text=True, timeout=30
+                cmd, capture_output=True, text=True, timeout=self._timeout()
             )
 
             duration_ms = int((time.time() - start_time) * 1000)
@@ -55,11 +60,10 @@ class BanditValidator(Validator):
                     data = json.loads(result.stdout)
                     results = data.get("results", [])
                     for issue in results:
-                        msg = f"Line {issue.get('line_number', '?')}: {issue.get('test_name', 'Unknown')} - {issue.get('issue_text', 'Security issue')}"
+                        msg = self._format_issue(issue)
                         messages.append(msg)
 
-                        severity = issue.get("issue_severity", "MEDIUM")
-                        if severity in ["HIGH", "CRITICAL"]:
+                        if self._is_error(issue):
                             errors.append(msg)
                         else:
                             warnings.append(msg)
@@ -86,3 +90,76 @@ class BanditValidator(Validator):
                 errors=[str(e)],
                 duration_ms=int((time.time() - start_time) * 1000),
             )
+
+    def _format_issue(self, issue: Dict[str, Any]) -> str:
+        """Format one bandit JSON finding as a result message"""
+        return (
+            f"Line {issue.get('line_number', '?')}: "
+            f"{issue.get('test_name', 'Unknown')} - "
+            f"{issue.get('issue_text', 'Security issue')}"
+        )
+
+    def _is_error(self, issue: Dict[str, Any]) -> bool:
+        """HIGH and CRITICAL findings are errors, the rest are warnings"""
+        return issue.get("issue_severity", "MEDIUM") in ["HIGH", "CRITICAL"]
+
+    def _validate_chunk(self, files: List[Path]) -> List[ValidationResult]:
+        """Scan the chunk with one bandit process and split findings by filename"""
+        start_time = time.time()
+        cmd = [self.command, "-f", "json"] + [str(f) for f in files]
+
+        try:
+            result = self._execute_command(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=self._batch_timeout(files),
+            )
+        except Exception as e:
+            return self._batch_error_results(
+                files, str(e), int((time.time() - start_time) * 1000)
+            )
+        duration_ms = int((time.time() - start_time) * 1000) // len(files)
+
+        findings: Dict[Path, List[Dict[str, Any]]] = {f: [] for f in files}
+        if result.returncode != 0:
+            try:
+                data = json.loads(result.stdout) if result.stdout else None
+            except json.JSONDecodeError as e:
+                raise BatchOutputError(f"invalid JSON: {e}")
+            if not isinstance(data, dict) or not data.get("results"):
+                raise BatchOutputError(
+                    f"exit code {result.returncode} without findings"
+                )
+
+            index = FileIndex(files)
+            for issue in data["results"]:
+                filepath = index.lookup(issue.get("filename", ""))
+                if filepath is None:
+                    raise BatchOutputError(f"unknown file {issue.get('filename')}")
+                findings[filepath].append(issue)
+
+        results = []
+        for filepath in files:
+            file_findings = findings[filepath]
+            messages = [self._format_issue(issue) for issue in file_findings]
+            results.append(
+                ValidationResult(
+                    tool=self.name,
+                    filepath=str(filepath),
+                    success=not file_findings,
+                    messages=messages,
+                    errors=[
+                        msg
+                        for msg, issue in zip(messages, file_findings)
+                        if self._is_error(issue)
+                    ],
+                    warnings=[
+                        msg
+                        for msg, issue in zip(messages, file_findings)
+                        if not self._is_error(issue)
+                    ],
+                    duration_ms=duration_ms,
+                )
+            )
+        return results
@@ -6,20 +6,27 @@ HuskyCat Validators Base Module
 Contains the base classes for all validators:
 - ValidationResult: Dataclass for validation results
 - Validator: Abstract base class for all validators
+- BatchOutputError: Raised when batched tool output cannot be split per file
+- DispatchRule: Declarative description of which files a validator handles
 """
 
 import logging
 import os
+import re
 import shutil
 import subprocess
 import sys
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Pattern, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Default number of files handed to one tool process by validate_batch()
+DEFAULT_BATCH_SIZE = 100
+
 
 @dataclass
 class ValidationResult:
@@ -56,11 +63,144 @@ class ValidationResult:
         return len(self.warnings)
 
 
+class BatchOutputError(Exception):
+    """Batched tool output could not be attributed to individual files.
+
+    Raised by ``Validator._validate_chunk`` implementations; the caller then
+    falls back to validating each file of the chunk on its own.
+    """
+
+
+class FileIndex:
+    """Map paths reported by a tool back to the files passed on its command line.
+
+    Tools normalise paths differently (ruff and eslint report absolute paths,
+    bandit prefixes ``./``, isort resolves symlinks), so lookups compare
+    absolute and fully resolved forms.
+    """
+
+    def __init__(self, files: Iterable[Path]):
+        self._index: Dict[str, Path] = {}
+        for filepath in files:
+            self._index.setdefault(os.path.abspath(filepath), filepath)
+            self._index.setdefault(os.path.realpath(filepath), filepath)
+
+    def lookup(self, reported: str) -> Optional[Path]:
+        """Return the batch file a reported path refers to, if any"""
+        reported = reported.strip()
+        if not reported:
+            return None
+        match = self._index.get(os.path.abspath(reported))
+        if match is None:
+            match = self._index.get(os.path.realpath(reported))
+        return match
+
+
+@dataclass(frozen=True)
+class DispatchRule:
+    """Which files a validator handles, in a form that can be precompiled.
+
+    Every condition that is set must hold for the rule to match:
+    - suffixes: the file suffix is one of these
+    - names: the file name is one of these
+    - name_pattern: regex searched in the file name
+    - dir_pattern: regex searched in the parent directory plus a trailing
+      separator (e.g. "ansible/roles/")
+
+    A validator handles a file if any of its rules matches.
+    """
+
+    suffixes: FrozenSet[str] = frozenset()
+    names: FrozenSet[str] = frozenset()
+    name_pattern: Optional[str] = None
+    dir_pattern: Optional[str] = None
+    ignore_case: bool = False
+
+    @property
+    def name_regex(self) -> Optional[Pattern[str]]:
+        return self._compile(self.name_pattern)
+
+    @property
+    def dir_regex(self) -> Optional[Pattern[str]]:
+        return self._compile(self.dir_pattern)
+
+    def _compile(self, pattern: Optional[str]) -> Optional[Pattern[str]]:
+        if pattern is None:
+            return None
+        return re.compile(pattern, re.IGNORECASE if self.ignore_case else 0)
+
+    @property
+    def is_simple(self) -> bool:
+        """True if the rule is a plain suffix or file name lookup"""
+        return (
+            self.name_pattern is None
+            and self.dir_pattern is None
+            and not (self.suffixes and self.names)
+        )
+
+    def matches_name(self, name: str, suffix: str) -> bool:
+        """Check the conditions that only depend on the file name"""
+        if self.suffixes and suffix not in self.suffixes:
+            return False
+        if self.names and name not in self.names:
+            return False
+        regex = self.name_regex
+        return regex is None or regex.search(name) is not None
+
+    def matches_dir(self, directory: str) -> bool:
+        """Check the directory condition against a dispatch_dir() string"""
+        regex = self.dir_regex
+        return regex is None or regex.search(directory) is not None
+
+    def matches(self, filepath: Path) -> bool:
+        """Check whether the rule matches a path"""
+        return self.matches_name(filepath.name, filepath.suffix) and (
+            self.dir_pattern is None or self.matches_dir(dispatch_dir(filepath))
+        )
+
+
+def dispatch_dir(filepath: Path) -> str:
+    """Directory string that DispatchRule.dir_pattern is matched against"""
+    return f"{filepath.parent}{os.sep}"
+
+
 class Validator(ABC):
     """Abstract base class for all validators"""
 
+    # Maximum number of files passed to a single tool invocation
+    batch_size: int = DEFAULT_BATCH_SIZE
+
+    # Whether a result depends only on the file content and tool config, so it
+    # can be reused from the result cache. Tools that read other files (e.g.
+    # mypy following imports) must set this to False.
+    cacheable: bool = True
+
+    # Whether the tool can check content piped to it on stdin. Validators
+    # setting this implement _stdin_command() and _read_result(), which
+    # validate_content() uses to check staged blobs without a file on disk
+    # (for GPL tools the content travels to the sidecar with the request).
+    reads_stdin: bool = False
+
+    # Whether the GPL sidecar can check a chunk with one tool run and split
+    # the output per file (its execute_many method). Validators setting this
+    # implement _read_result(), which turns each file's share into its result.
+    sidecar_batches: bool = False
+
+    # Validators that send all their files to one warm server (see
+    # validators.daemons) want a single validate_batch() call; concurrent
+    # chunks would only queue up on the server.
+    single_batch: bool = False
+
+    # Argument making the tool print its version (see get_version())
+    version_flag: str = "--version"
+
+    # Seconds one tool invocation may take; tools.<name>.timeout in the
+    # config overrides it (see ValidationEngine.tool_timeouts())
+    timeout: float = 30
+
     def __init__(self, auto_fix: bool = False):
         self.auto_fix = auto_fix
+        self._version: Optional[str] = None
 
     @property
     @abstractmethod
@@ -125,6 +265,38 @@ class Validator(ABC):
         # Fallback: check for container runtime (legacy behavior)
         return self._container_runtime_exists()
 
+    def get_version(self) -> Optional[str]:
+        """Get the tool's version string, or None if it cannot be determined
+
+        Runs ``<command> <version_flag>`` once per validator instance.
+        """
+        if self._version is None:
+            self._version = ""
+            try:
+                result = self._execute_command(
+                    [self.command, self.version_flag],
+                    capture_output=True,
+                    text=True,
+                    timeout=10,
+                )
+                output = result.stdout or result.stderr
+                if result.returncode == 0 and isinstance(output, str):
+                    lines = output.strip().splitlines()
+                    self._version = lines[0] if lines else ""
+            except Exception as e:
+                logger.debug(f"Could not determine {self.name} version: {e}")
+        return self._version or None
+
+    @property
+    def probed_version(self) -> Optional[str]:
+        """Outcome of the version probe: None if not run yet, "" if unknown"""
+        return self._version
+
+    def seed_version(self, version: str) -> None:
+        """Use a version probed earlier (e.g. by another process) as our own"""
+        if self._version is None:
+            self._version = version
+
     def _get_execution_mode(self) -> str:
         """Detect execution mode
 
@@ -205,6 +377,7 @@ class Validator(ABC):
         5. Container runtime (fallback delegation)
         """
         # Import here to avoid circular imports
+        from huskycat.core.async_executor import run_tool_process
         from huskycat.validators._utils import is_gpl_tool, get_gpl_sidecar
 
         # Check if this is a GPL tool and sidecar is available
@@ -228,12 +401,12 @@ class Validator(ABC):
         if mode == "container":
             # Already in container - direct execution
             self._log_execution_mode(mode)
-            return subprocess.run(cmd, **kwargs)
+            return self._execute_local(cmd, **kwargs)
 
         # Fallback: delegate to container (legacy behavior)
         logger.warning(f"Falling back to container execution for {self.command}")
         container_cmd = self._build_container_command(cmd)
-        return subprocess.run(container_cmd, **kwargs)
+        return run_tool_process(container_cmd, **kwargs)
 
     def _execute_via_sidecar(
         self, sidecar: Any, cmd: List[str], **kwargs: Any
@@ -248,6 +421,7 @@ class Validator(ABC):
         Returns:
             subprocess.CompletedProcess-like object with stdout, stderr, returncode
         """
+        from huskycat.core.cancellation import current_token
         from huskycat.core.gpl_client import GPLSidecarError
 
         self._log_execution_mode("gpl_sidecar")
@@ -255,9 +429,20 @@ class Validator(ABC):
         # Extract tool name and args from command
         tool = cmd[0]
         args = cmd[1:] if len(cmd) > 1 else []
+        stdin = kwargs.get("input")
+        # Like subprocess: bytes output unless text mode was asked for
+        text = bool(
+            kwargs.get("text")
+            or kwargs.get("universal_newlines")
+            or kwargs.get("encoding")
+        )
 
-        # Get timeout from kwargs (convert to ms)
+        # Get timeout from kwargs, capped by the run's deadline (convert to ms)
         timeout_s = kwargs.get("timeout", 30)
+        token = current_token()
+        if token is not None:
+            token.check()
+            timeout_s = token.timeout(timeout_s)
         timeout_ms = int(timeout_s * 1000)
 
         # Get working directory
@@ -266,25 +451,28 @@ class Validator(ABC):
         logger.debug(f"Executing {tool} via GPL sidecar: {args}")
 
         try:
-            result = sidecar.execute(tool, args, cwd=str(cwd), timeout_ms=timeout_ms)
-
-            # Convert GPLToolResult to subprocess.CompletedProcess
-            return subprocess.CompletedProcess(
-                args=cmd,
-                returncode=result.exit_code,
-                stdout=result.stdout,
-                stderr=result.stderr,
+            result = sidecar.execute(
+                tool, args, cwd=str(cwd), stdin=stdin, timeout_ms=timeout_ms
             )
+            stdout, stderr = result.stdout, result.stderr
         except GPLSidecarError as e:
             logger.error(f"GPL sidecar execution failed: {e}")
             # Return error result
             return subprocess.CompletedProcess(
                 args=cmd,
                 returncode=1,
-                stdout="",
-                stderr=str(e),
+                stdout="" if text else b"",
+                stderr=str(e) if text else str(e).encode("utf-8"),
             )
 
+        # Convert GPLToolResult to subprocess.CompletedProcess
+        return subprocess.CompletedProcess(
+            args=cmd,
+            returncode=result.exit_code,
+            stdout=stdout if text else stdout.encode("utf-8"),
+            stderr=stderr if text else stderr.encode("utf-8"),
+        )
+
     def _execute_bundled(
         self, cmd: List[str], **kwargs: Any
     ) -> subprocess.CompletedProcess:
@@ -297,6 +485,8 @@ class Validator(ABC):
         Returns:
             CompletedProcess result
         """
+        from huskycat.core.async_executor import run_tool_process
+
         tool_path = self._get_bundled_tool_path()
 
         if not tool_path:
@@ -305,7 +495,7 @@ class Validator(ABC):
         # Replace tool name with full path
         bundled_cmd = [str(tool_path)] + cmd[1:]
 
-        return subprocess.run(bundled_cmd, **kwargs)
+        return run_tool_process(bundled_cmd, **kwargs)
 
     def _execute_local(
         self, cmd: List[str], **kwargs: Any
@@ -319,8 +509,16 @@ class Validator(ABC):
         Returns:
             CompletedProcess result
         """
+        # Python-native tools may run in the pre-warmed worker pool
+        from huskycat.core.async_executor import run_tool_process
+        from huskycat.validators.inprocess import run_inprocess
+
+        result = run_inprocess(self, cmd, **kwargs)
+        if result is not None:
+            return result
+
         # Direct execution using PATH lookup
-        return subprocess.run(cmd, **kwargs)
+        return run_tool_process(cmd, **kwargs)
 
     def _log_execution_mode(self, mode: str) -> None:
         """Log which execution mode is being used
@@ -388,6 +586,278 @@ class Validator(ABC):
     def validate(self, filepath: Path) -> ValidationResult:
         """Validate a single file"""
 
+    def validate_batch(self, files: List[Path]) -> List[ValidationResult]:
+        """Validate many files, returning one result per file in input order.
+
+        Files are processed in chunks of ``batch_size``. Validators whose tool
+        accepts several paths override ``_validate_chunk`` so that each chunk
+        costs a single tool process; everything else falls back to one
+        ``validate()`` call per file. GPL tools with ``sidecar_batches`` run
+        each chunk as one process in the sidecar instead.
+        """
+        sidecar = self._batch_sidecar() if len(files) > 1 else None
+        results: List[ValidationResult] = []
+        for start in range(0, len(files), self.batch_size):
+            chunk = files[start : start + self.batch_size]
+            if len(chunk) == 1:
+                results.append(self.validate(chunk[0]))
+                continue
+
+            try:
+                if sidecar is not None:
+                    results.extend(self._validate_chunk_via_sidecar(sidecar, chunk))
+                else:
+                    results.extend(self._validate_chunk(chunk))
+            except BatchOutputError as e:
+                logger.debug(
+                    f"{self.name}: cannot split batch output ({e}), "
+                    "validating files individually"
+                )
+                results.extend(self.validate(filepath) for filepath in chunk)
+        return results
+
+    def _validate_chunk(self, files: List[Path]) -> List[ValidationResult]:
+        """Validate one chunk of files (default: one validate() per file)
+
+        Overrides must return exactly one result per file, in input order,
+        or raise BatchOutputError when the tool output cannot be split.
+        """
+        return [self.validate(filepath) for filepath in files]
+
+    def _batch_sidecar(self) -> Optional[Any]:
+        """GPL sidecar client to check chunks with (sidecar_batches), if any
+
+        Fixers still go file by file: the sidecar only reports.
+        """
+        if not self.sidecar_batches or self.auto_fix:
+            return None
+        return self._gpl_sidecar()
+
+    def _validate_chunk_via_sidecar(
+        self, sidecar: Any, files: List[Path]
+    ) -> List[ValidationResult]:
+        """Validate one chunk with a single tool run in the GPL sidecar
+
+        The sidecar splits the output into what a run over each file alone
+        would print, so _read_result() builds the per-file results. Raises
+        BatchOutputError when the sidecar cannot split the output.
+        """
+        from huskycat.core.cancellation import current_token
+        from huskycat.core.gpl_client import GPLSidecarError, GPLSidecarTimeoutError
+
+        self._log_execution_mode("gpl_sidecar")
+        start_time = time.time()
+
+        timeout_s = self._batch_timeout(files)
+        token = current_token()
+        if token is not None:
+            token.check()
+            capped = token.timeout(timeout_s)
+            assert capped is not None  # only None when given None
+            timeout_s = capped
+
+        try:
+            split = sidecar.execute_many(
+                self.command,
+                [str(filepath) for filepath in files],
+                cwd=os.getcwd(),
+                timeout_ms=int(timeout_s * 1000),
+            )
+        except GPLSidecarTimeoutError as e:
+            return self._batch_error_results(
+                files, str(e), int((time.time() - start_time) * 1000)
+            )
+        except GPLSidecarError as e:
+            raise BatchOutputError(str(e))
+        duration_ms = int((time.time() - start_time) * 1000) // len(files)
+
+        results = []
+        for filepath in files:
+            output = split.get(str(filepath))
+            if output is None:
+                raise BatchOutputError(f"no output for {filepath}")
+            result = subprocess.CompletedProcess(
+                args=[self.command, str(filepath)],
+                returncode=output.exit_code,
+                stdout=output.stdout,
+                stderr=output.stderr,
+            )
+            results.append(self._read_result(filepath, result, duration_ms))
+        return results
+
+    def can_validate_content(self) -> bool:
+        """Check whether validate_content() can pipe content to the tool
+
+        Fixers must rewrite real files, and so do GPL tools run by a
+        sidecar too old to take content with the request.
+        """
+        if not self.reads_stdin or self.auto_fix:
+            return False
+
+        sidecar = self._gpl_sidecar()
+        return sidecar is None or sidecar.supports("stdin")
+
+    def _gpl_sidecar(self) -> Optional[Any]:
+        """GPL sidecar client this validator's tool runs through, if any"""
+        from huskycat.validators._utils import get_gpl_sidecar, is_gpl_tool
+
+        if not is_gpl_tool(self.name):
+            return None
+        return get_gpl_sidecar()
+
+    def validate_content(self, filepath: Path, content: bytes) -> ValidationResult:
+        """Validate content read from stdin as if it were the file at filepath
+
+        The path is still passed to the tool so that per-path configuration
+        and file type detection apply. Only valid when
+        can_validate_content() is True.
+        """
+        start_time = time.time()
+        try:
+            raw = self._execute_command(
+                self._stdin_command(filepath, content),
+                input=content,
+                capture_output=True,
+                timeout=self._timeout(),
+            )
+            result = subprocess.CompletedProcess(
+                args=raw.args,
+                returncode=raw.returncode,
+                stdout=(raw.stdout or b"").decode("utf-8", errors="replace"),
+                stderr=(raw.stderr or b"").decode("utf-8", errors="replace"),
+            )
+            return self._read_result(
+                filepath, result, int((time.time() - start_time) * 1000)
+            )
+        except Exception as e:
+            return ValidationResult(
+                tool=self.name,
+                filepath=str(filepath),
+                success=False,
+                errors=[str(e)],
+                duration_ms=int((time.time() - start_time) * 1000),
+            )
+
+    def validate_contents(
+        self, files: List[Path], contents: List[bytes]
+    ) -> List[ValidationResult]:
+        """Validate several contents as validate_content() does, in order
+
+        GPL tools send them all to the sidecar in one batch request, which
+        runs identical contents only once.
+        """
+        sidecar = self._gpl_sidecar() if len(files) > 1 else None
+        if sidecar is None:
+            return [self.validate_content(f, c) for f, c in zip(files, contents)]
+
+        from huskycat.core.cancellation import current_token
+
+        self._log_execution_mode("gpl_sidecar")
+        start_time = time.time()
+        timeout_s = self._batch_timeout(files)
+        token = current_token()
+        if token is not None:
+            token.check()
+            capped = token.timeout(timeout_s)
+            assert capped is not None  # only None when given None
+            timeout_s = capped
+
+        try:
+            commands = [self._stdin_command(f, c) for f, c in zip(files, contents)]
+            outputs = sidecar.execute_batch(
+                [(cmd[0], cmd[1:], c) for cmd, c in zip(commands, contents)],
+                cwd=os.getcwd(),
+                timeout_ms=int(timeout_s * 1000),
+            )
+            duration_ms = int((time.time() - start_time) * 1000) // len(files)
+
+            results = []
+            for filepath, cmd, output in zip(files, commands, outputs):
+                result = subprocess.CompletedProcess(
+                    args=cmd,
+                    returncode=output.exit_code,
+                    stdout=output.stdout,
+                    stderr=output.stderr,
+                )
+                results.append(self._read_result(filepath, result, duration_ms))
+            return results
+        except Exception as e:
+            return self._batch_error_results(
+                files, str(e), int((time.time() - start_time) * 1000)
+            )
+
+    def _stdin_command(self, filepath: Path, content: bytes) -> List[str]:
+        """Command checking stdin as the content of filepath (reads_stdin)"""
+        raise NotImplementedError(f"{self.name} cannot read stdin")
+
+    def _read_result(
+        self,
+        filepath: Path,
+        result: subprocess.CompletedProcess,
+        duration_ms: int,
+    ) -> ValidationResult:
+        """Build the result of a one-file check from the tool's output"""
+        raise NotImplementedError(f"{self.name} cannot read a single-file result")
+
+    def _timeout(self, base: Optional[float] = None) -> float:
+        """Timeout for one tool invocation
+
+        ``base`` (default: the validator's timeout) is stretched to the
+        deadline of the current cancel token, so a tool run that the
+        parallel executor granted more time (core.timeouts) is not cut
+        short by the fixed limit.
+        """
+        from huskycat.core.cancellation import current_token
+
+        limit = self.timeout if base is None else base
+        token = current_token()
+        remaining = token.remaining() if token is not None else None
+        return limit if remaining is None else max(limit, remaining)
+
+    def _batch_timeout(self, files: List[Path], base: Optional[float] = None) -> float:
+        """Timeout for a batched invocation: base plus one second per extra file"""
+        base = self.timeout if base is None else base
+        return self._timeout(base + max(0, len(files) - 1))
+
+    def _batch_error_results(
+        self, files: List[Path], error: str, duration_ms: int
+    ) -> List[ValidationResult]:
+        """Build identical failure results for every file of a chunk"""
+        per_file_ms = duration_ms // max(1, len(files))
+        return [
+            ValidationResult(
+                tool=self.name,
+                filepath=str(filepath),
+                success=False,
+                errors=[error],
+                duration_ms=per_file_ms,
+            )
+            for filepath in files
+        ]
+
+    @staticmethod
+    def _content_hashes(files: Iterable[Path]) -> Dict[Path, Optional[str]]:
+        """Hash each file's content (None if unreadable)
+
+        Fixers run once in write mode; comparing hashes taken before and
+        after the run tells which files they changed.
+        """
+        from huskycat.core.result_cache import hash_file
+
+        return {filepath: hash_file(filepath) for filepath in files}
+
+    @property
+    def dispatch_rules(self) -> Tuple[DispatchRule, ...]:
+        """Rules describing the files this validator handles
+
+        Defaults to one rule matching ``extensions``. Validators that handle
+        files by name or location override this rather than can_handle(), so
+        the engine can compile all rules into one lookup table.
+        """
+        if not self.extensions:
+            return ()
+        return (DispatchRule(suffixes=frozenset(self.extensions)),)
+
     def can_handle(self, filepath: Path) -> bool:
         """Check if this validator can handle the given file"""
-        return filepath.suffix in self.extensions
+        return any(rule.matches(filepath) for rule in self.dispatch_rules)
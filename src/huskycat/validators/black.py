@@ -7,20 +7,32 @@ Uses Black (https://github.com/psf/black) to check and format Python code.
 License: MIT
 """
 
+import subprocess
 import time
 from pathlib import Path
-from typing import Set
+from typing import Dict, List, Set
 
-from huskycat.validators.base import ValidationResult, Validator
+from huskycat.validators.base import (
+    BatchOutputError,
+    FileIndex,
+    ValidationResult,
+    Validator,
+)
 
 
 class BlackValidator(Validator):
     """Python code formatter"""
 
+    reads_stdin = True
+
     @property
     def name(self) -> str:
         return "python-black"
 
+    @property
+    def command(self) -> str:
+        return "black"
+
     @property
     def extensions(self) -> Set[str]:
         return {".py", ".pyi"}
@@ -33,29 +45,16 @@ class BlackValidator(Validator):
             cmd.remove("--check")
 
         try:
+            before = self._content_hashes([filepath]) if self.auto_fix else None
             result = self._execute_command(
-                cmd, capture_output=True, text=True, timeout=30
+                cmd, capture_output=True, text=True, timeout=self._timeout()
             )
-            duration_ms = int((time.time() - start_time) * 1000)
-
-            if result.returncode == 0:
-                return ValidationResult(
-                    tool=self.name,
-                    filepath=str(filepath),
-                    success=True,
-                    messages=["File is properly formatted"],
-                    fixed=self.auto_fix,
-                    duration_ms=duration_ms,
-                )
-            else:
-                return ValidationResult(
-                    tool=self.name,
-                    filepath=str(filepath),
-                    success=False,
-                    errors=["File needs formatting"],
-                    messages=result.stdout.splitlines() if result.stdout else [],
-                    duration_ms=duration_ms,
-                )
+            validation = self._read_result(
+                filepath, result, int((time.time() - start_time) * 1000)
+            )
+            if before is not None and validation.success:
+                validation.fixed = self._content_hashes([filepath]) != before
+            return validation
         except Exception as e:
             return ValidationResult(
                 tool=self.name,
@@ -64,3 +63,99 @@ class BlackValidator(Validator):
                 errors=[str(e)],
                 duration_ms=int((time.time() - start_time) * 1000),
             )
+
+    def _stdin_command(self, filepath: Path, content: bytes) -> List[str]:
+        return [self.command, "--check", "--stdin-filename", str(filepath), "-"]
+
+    def _read_result(
+        self,
+        filepath: Path,
+        result: subprocess.CompletedProcess,
+        duration_ms: int,
+    ) -> ValidationResult:
+        if result.returncode == 0:
+            return ValidationResult(
+                tool=self.name,
+                filepath=str(filepath),
+                success=True,
+                messages=["File is properly formatted"],
+                duration_ms=duration_ms,
+            )
+        else:
+            return ValidationResult(
+                tool=self.name,
+                filepath=str(filepath),
+                success=False,
+                errors=["File needs formatting"],
+                messages=result.stdout.splitlines() if result.stdout else [],
+                duration_ms=duration_ms,
+            )
+
+    def _validate_chunk(self, files: List[Path]) -> List[ValidationResult]:
+        """Check (or format) the chunk in one black run
+
+        Black reports per-file outcomes on stderr as ``would reformat <path>``
+        and ``error: cannot format <path>: <reason>``; every file not named
+        there is already formatted, or was reformatted with auto-fix if its
+        content hash changed.
+        """
+        start_time = time.time()
+        before = self._content_hashes(files) if self.auto_fix else {}
+        cmd = [self.command] + ([] if self.auto_fix else ["--check"])
+        cmd.extend(str(f) for f in files)
+
+        try:
+            result = self._execute_command(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=self._batch_timeout(files),
+            )
+        except Exception as e:
+            return self._batch_error_results(
+                files, str(e), int((time.time() - start_time) * 1000)
+            )
+        duration_ms = int((time.time() - start_time) * 1000) // len(files)
+
+        failures: Dict[Path, str] = {}
+        if result.returncode != 0:
+            index = FileIndex(files)
+            for line in (result.stderr or "").splitlines():
+                if line.startswith("would reformat "):
+                    reported = line[len("would reformat ") :]
+                elif line.startswith("error: cannot format "):
+                    reported = line[len("error: cannot format ") :].split(": ", 1)[0]
+                else:
+                    continue
+                filepath = index.lookup(reported)
+                if filepath is not None:
+                    failures[filepath] = line
+            if not failures:
+                raise BatchOutputError(f"exit code {result.returncode} without files")
+
+        after = self._content_hashes(before) if before else {}
+        results = []
+        for filepath in files:
+            if filepath in failures:
+                results.append(
+                    ValidationResult(
+                        tool=self.name,
+                        filepath=str(filepath),
+                        success=False,
+                        errors=["File needs formatting"],
+                        messages=[failures[filepath]],
+                        duration_ms=duration_ms,
+                    )
+                )
+            else:
+                results.append(
+                    ValidationResult(
+                        tool=self.name,
+                        filepath=str(filepath),
+                        success=True,
+                        messages=["File is properly formatted"],
+                        fixed=after.get(filepath) != before.get(filepath),
+                        duration_ms=duration_ms,
+                    )
+                )
+        return results
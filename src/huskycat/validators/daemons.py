@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+"""
+Warm tool daemons
+
+Some tools can keep their analysis in a long-lived server process, so a
+check only redoes the work for files that changed. A cold ``mypy`` run
+re-analyzes the whole import graph every time; ``dmypy`` answers a single
+changed file in a fraction of a second once warm.
+
+Daemons are per repository and outlive the HuskyCat process, so successive
+git hooks share them:
+- state lives in <repo>/.huskycat/daemons/
+- the daemon restarts when the project config or the tool binary changes
+- it shuts itself down after an idle period
+- a request that fails while the daemon is unhealthy is retried once
+  against a fresh daemon
+
+Usage:
+    daemon = get_daemon("mypy")
+    if daemon is not None:
+        result = daemon.run(["--no-error-summary", "src/app.py"])
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import subprocess
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Type
+
+logger = logging.getLogger(__name__)
+
+# Seconds without requests after which a daemon exits on its own
+DEFAULT_IDLE_TIMEOUT = 15 * 60
+
+# Environment variable that disables daemons ("0", "false", "no", "off")
+DAEMONS_ENV = "HUSKYCAT_DAEMONS"
+
+
+_roots: Dict[Path, Path] = {}
+
+
+def repository_root(cwd: Optional[Path] = None) -> Path:
+    """Root of the git repository containing cwd, else cwd itself"""
+    cwd = Path(cwd or Path.cwd())
+    if cwd not in _roots:
+        _roots[cwd] = _find_root(cwd)
+    return _roots[cwd]
+
+
+def _find_root(cwd: Path) -> Path:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return Path(result.stdout.strip())
+    except (OSError, subprocess.SubprocessError):
+        pass
+    return cwd.resolve()
+
+
+class ToolDaemon(ABC):
+    """A tool server kept warm for one repository"""
+
+    # Client exit codes of completed checks, whatever they found
+    ok_codes: Tuple[int, ...] = (0,)
+
+    def __init__(self, root: Path, idle_timeout: int = DEFAULT_IDLE_TIMEOUT):
+        self.root = root
+        self.idle_timeout = idle_timeout
+        self.state_dir = root / ".huskycat" / "daemons"
+        self._lock = threading.Lock()
+        self._checked_stamp = False
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Tool the daemon serves (validator name)"""
+
+    @property
+    @abstractmethod
+    def command(self) -> str:
+        """Client executable"""
+
+    @abstractmethod
+    def _run_command(self, args: List[str]) -> List[str]:
+        """Client command running one check, starting the server if needed"""
+
+    @abstractmethod
+    def _status_command(self) -> List[str]:
+        """Client command exiting 0 while the server is up"""
+
+    @abstractmethod
+    def _stop_command(self) -> List[str]:
+        """Client command stopping the server"""
+
+    @property
+    def stamp_file(self) -> Path:
+        return self.state_dir / f"{self.name}.stamp"
+
+    def _stamp(self) -> str:
+        """Hash of the project config and the tool binary the server uses"""
+        from huskycat.core.result_cache import hash_config
+
+        binary = shutil.which(self.command) or ""
+        try:
+            stat = os.stat(binary)
+            binary = f"{binary}:{stat.st_mtime_ns}:{stat.st_size}"
+        except OSError:
+            pass
+        raw = f"{hash_config(None, self.root)}\0{binary}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _client(self, cmd: List[str], timeout: float) -> subprocess.CompletedProcess:
+        from huskycat.core.cancellation import run_process
+
+        return run_process(
+            cmd, cwd=self.root, capture_output=True, text=True, timeout=timeout
+        )
+
+    def _ensure_current(self) -> None:
+        """Restart the server if the config or binary changed since it started
+
+        Checked once per process; later runs reuse the result.
+        """
+        if self._checked_stamp:
+            return
+        self._checked_stamp = True
+        stamp = self._stamp()
+        try:
+            previous = self.stamp_file.read_text()
+        except OSError:
+            previous = None
+        if previous != stamp:
+            if previous is not None:
+                logger.info(f"{self.name} daemon: configuration changed, restarting")
+                self.stop()
+            self.state_dir.mkdir(parents=True, exist_ok=True)
+            self.stamp_file.write_text(stamp)
+
+    def is_healthy(self) -> bool:
+        """Check that the server is up and answering"""
+        try:
+            return self._client(self._status_command(), timeout=10).returncode == 0
+        except (OSError, subprocess.SubprocessError):
+            return False
+
+    def run(self, args: List[str], timeout: float = 60) -> subprocess.CompletedProcess:
+        """
+        Run one check through the server, starting it if needed.
+
+        Args:
+            args: Tool arguments, with paths relative to the repository root
+            timeout: Seconds to wait, including a cold start
+
+        Returns:
+            CompletedProcess of the client; server failures are retried once
+            against a fresh server
+        """
+        with self._lock:
+            self.state_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_current()
+            cmd = self._run_command(args)
+            result = self._client(cmd, timeout)
+            if result.returncode not in self.ok_codes and not self.is_healthy():
+                logger.warning(
+                    f"{self.name} daemon failed ({result.returncode}), restarting"
+                )
+                self.stop()
+                result = self._client(cmd, timeout)
+            return result
+
+    def stop(self) -> None:
+        """Stop the server if it is running"""
+        try:
+            self._client(self._stop_command(), timeout=10)
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.debug(f"Could not stop {self.name} daemon: {e}")
+
+
+class DmypyDaemon(ToolDaemon):
+    """mypy daemon (dmypy) in fine-grained incremental mode"""
+
+    # No errors, and type errors found; 2 is a crash or a fatal error
+    ok_codes = (0, 1)
+
+    @property
+    def name(self) -> str:
+        return "mypy"
+
+    @property
+    def command(self) -> str:
+        return "dmypy"
+
+    @property
+    def status_file(self) -> Path:
+        return self.state_dir / "dmypy.json"
+
+    def _base(self) -> List[str]:
+        return [self.command, "--status-file", str(self.status_file)]
+
+    def _run_command(self, args: List[str]) -> List[str]:
+        return self._base() + ["run", "--timeout", str(self.idle_timeout), "--"] + args
+
+    def _status_command(self) -> List[str]:
+        return self._base() + ["status"]
+
+    def _stop_command(self) -> List[str]:
+        return self._base() + ["kill"]
+
+
+# Tools with a persistent server mode, by validator name
+DAEMONS: Dict[str, Type[ToolDaemon]] = {
+    "mypy": DmypyDaemon,
+}
+
+_daemons: Dict[Tuple[str, Path], ToolDaemon] = {}
+_daemons_lock = threading.Lock()
+
+
+def daemons_enabled() -> bool:
+    """Daemons are used unless HUSKYCAT_DAEMONS turns them off"""
+    return os.environ.get(DAEMONS_ENV, "1").lower() not in ("0", "false", "no", "off")
+
+
+def get_daemon(name: str, cwd: Optional[Path] = None) -> Optional[ToolDaemon]:
+    """
+    Get the warm daemon for a tool in the repository containing cwd.
+
+    Args:
+        name: Validator name (e.g. "mypy")
+        cwd: Directory inside the repository (default: current directory)
+
+    Returns:
+        The shared daemon, or None if the tool has no server mode, its
+        client is not installed, or daemons are disabled
+    """
+    daemon_class = DAEMONS.get(name)
+    if daemon_class is None or not daemons_enabled():
+        return None
+
+    root = repository_root(cwd)
+    with _daemons_lock:
+        daemon = _daemons.get((name, root))
+        if daemon is None:
+            daemon = daemon_class(root)
+            if shutil.which(daemon.command) is None:
+                return None
+            _daemons[(name, root)] = daemon
+        return daemon
+
+
+def stop_daemons() -> None:
+    """Stop every daemon this process has used"""
+    with _daemons_lock:
+        daemons = list(_daemons.values())
+        _daemons.clear()
+    for daemon in daemons:
+        daemon.stop()
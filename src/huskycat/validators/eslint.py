@@ -8,16 +8,24 @@ License: MIT
 """
 
 import json
+import subprocess
 import time
 from pathlib import Path
-from typing import Set
+from typing import Any, Dict, List, Set
 
-from huskycat.validators.base import ValidationResult, Validator
+from huskycat.validators.base import (
+    BatchOutputError,
+    FileIndex,
+    ValidationResult,
+    Validator,
+)
 
 
 class ESLintValidator(Validator):
     """JavaScript/TypeScript linter"""
 
+    reads_stdin = True
+
     @property
     def name(self) -> str:
         return "js-eslint"
@@ -35,56 +43,130 @@ class ESLintValidator(Validator):
 
         try:
             result = self._execute_command(
-                cmd, capture_output=True, text=True, timeout=30
+                cmd, capture_output=True, text=True, timeout=self._timeout()
+            )
+            return self._read_result(
+                filepath, result, int((time.time() - start_time) * 1000)
             )
-            duration_ms = int((time.time() - start_time) * 1000)
-
-            try:
-                data = json.loads(result.stdout) if result.stdout else []
-                file_result = data[0] if data else {}
-
-                errors = [
-                    msg
-                    for msg in file_result.get("messages", [])
-                    if msg.get("severity") == 2
-                ]
-                warnings = [
-                    msg
-                    for msg in file_result.get("messages", [])
-                    if msg.get("severity") == 1
-                ]
-
-                if not errors:
-                    return ValidationResult(
-                        tool=self.name,
-                        filepath=str(filepath),
-                        success=True,
-                        warnings=[w.get("message", "") for w in warnings],
-                        fixed=self.auto_fix,
-                        duration_ms=duration_ms,
-                    )
-                else:
-                    return ValidationResult(
-                        tool=self.name,
-                        filepath=str(filepath),
-                        success=False,
-                        errors=[e.get("message", "") for e in errors],
-                        warnings=[w.get("message", "") for w in warnings],
-                        duration_ms=duration_ms,
-                    )
-            except json.JSONDecodeError:
+        except Exception as e:
+            return ValidationResult(
+                tool=self.name,
+                filepath=str(filepath),
+                success=False,
+                errors=[str(e)],
+                duration_ms=int((time.time() - start_time) * 1000),
+            )
+
+    def _stdin_command(self, filepath: Path, content: bytes) -> List[str]:
+        return [
+            self.command,
+            "--format=json",
+            "--stdin",
+            "--stdin-filename",
+            str(filepath),
+        ]
+
+    def _read_result(
+        self,
+        filepath: Path,
+        result: subprocess.CompletedProcess,
+        duration_ms: int,
+    ) -> ValidationResult:
+        try:
+            data = json.loads(result.stdout) if result.stdout else []
+            file_result = data[0] if data else {}
+
+            errors = [
+                msg
+                for msg in file_result.get("messages", [])
+                if msg.get("severity") == 2
+            ]
+            warnings = [
+                msg
+                for msg in file_result.get("messages", [])
+                if msg.get("severity") == 1
+            ]
+
+            if not errors:
                 return ValidationResult(
                     tool=self.name,
                     filepath=str(filepath),
-                    success=result.returncode == 0,
-                    messages=result.stdout.splitlines() if result.stdout else [],
+                    success=True,
+                    warnings=[w.get("message", "") for w in warnings],
+                    fixed=self.auto_fix,
                     duration_ms=duration_ms,
                 )
-        except Exception as e:
+            else:
+                return ValidationResult(
+                    tool=self.name,
+                    filepath=str(filepath),
+                    success=False,
+                    errors=[e.get("message", "") for e in errors],
+                    warnings=[w.get("message", "") for w in warnings],
+                    duration_ms=duration_ms,
+                )
+        except json.JSONDecodeError:
             return ValidationResult(
                 tool=self.name,
                 filepath=str(filepath),
-                success=False,
-                errors=[str(e)],
-                duration_ms=int((time.time() - start_time) * 1000),
+                success=result.returncode == 0,
+                messages=result.stdout.splitlines() if result.stdout else [],
+                duration_ms=duration_ms,
+            )
+
+    def _validate_chunk(self, files: List[Path]) -> List[ValidationResult]:
+        """Lint the chunk with one eslint process, one JSON entry per filePath"""
+        start_time = time.time()
+        cmd = [self.command, "--format=json"]
+        if self.auto_fix:
+            cmd.append("--fix")
+        cmd.extend(str(f) for f in files)
+
+        try:
+            result = self._execute_command(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=self._batch_timeout(files),
+            )
+        except Exception as e:
+            return self._batch_error_results(
+                files, str(e), int((time.time() - start_time) * 1000)
+            )
+        duration_ms = int((time.time() - start_time) * 1000) // len(files)
+
+        try:
+            data = json.loads(result.stdout) if result.stdout else None
+        except json.JSONDecodeError as e:
+            raise BatchOutputError(f"invalid JSON: {e}")
+        if not isinstance(data, list):
+            raise BatchOutputError("missing JSON report")
+
+        index = FileIndex(files)
+        reports: Dict[Path, Dict[str, Any]] = {}
+        for file_result in data:
+            filepath = index.lookup(file_result.get("filePath", ""))
+            if filepath is not None:
+                reports[filepath] = file_result
+
+        results = []
+        for filepath in files:
+            file_messages = reports.get(filepath, {}).get("messages", [])
+            errors = [
+                m.get("message", "") for m in file_messages if m.get("severity") == 2
+            ]
+            warnings = [
+                m.get("message", "") for m in file_messages if m.get("severity") == 1
+            ]
+            results.append(
+                ValidationResult(
+                    tool=self.name,
+                    filepath=str(filepath),
+                    success=not errors,
+                    errors=errors,
+                    warnings=warnings,
+                    fixed=self.auto_fix and not errors,
+                    duration_ms=duration_ms,
+                )
             )
+        return results
@@ -9,9 +9,14 @@ License: MIT
 
 import time
 from pathlib import Path
-from typing import Set
+from typing import Dict, List, Set, Tuple
 
-from huskycat.validators.base import ValidationResult, Validator
+from huskycat.validators.base import (
+    BatchOutputError,
+    FileIndex,
+    ValidationResult,
+    Validator,
+)
 
 
 class Flake8Validator(Validator):
@@ -31,7 +36,7 @@ class Flake8Validator(Validator):
 
         try:
             result = self._execute_command(
-                cmd, capture_output=True, text=True, timeout=30
+                cmd, capture_output=True, text=True, timeout=self._timeout()
             )
             duration_ms = int((time.time() - start_time) * 1000)
 
@@ -53,7 +58,7 @@ class Flake8Validator(Validator):
                         parts = line.split(":", 3)
                         if len(parts) >= 4:
                             msg = parts[3].strip()
-                            if any(code in msg for code in ["E", "F"]):
+                            if self._is_error(msg):
                                 errors.append(msg)
                             else:
                                 warnings.append(msg)
@@ -74,3 +79,78 @@ class Flake8Validator(Validator):
                 errors=[str(e)],
                 duration_ms=int((time.time() - start_time) * 1000),
             )
+
+    def _is_error(self, msg: str) -> bool:
+        """Classify a flake8 message (pycodestyle E / pyflakes F codes are errors)"""
+        return any(code in msg for code in ["E", "F"])
+
+    def _validate_chunk(self, files: List[Path]) -> List[ValidationResult]:
+        """Lint the chunk with one flake8 process and split lines by path
+
+        The batch path always uses flake8's default ``path:row:col: message``
+        format, since it needs the path to attribute each line. Any line it
+        cannot attribute raises BatchOutputError.
+        """
+        start_time = time.time()
+        cmd = [self.command, "--format=default"] + [str(f) for f in files]
+
+        try:
+            result = self._execute_command(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=self._batch_timeout(files),
+            )
+        except Exception as e:
+            return self._batch_error_results(
+                files, str(e), int((time.time() - start_time) * 1000)
+            )
+        duration_ms = int((time.time() - start_time) * 1000) // len(files)
+
+        issues: Dict[Path, Tuple[List[str], List[str]]] = {f: ([], []) for f in files}
+        if result.returncode != 0:
+            index = FileIndex(files)
+            attributed = False
+            for line in result.stdout.splitlines():
+                if not line.strip():
+                    continue
+                parts = line.split(":", 3)
+                filepath = index.lookup(parts[0]) if len(parts) == 4 else None
+                if filepath is None:
+                    # Dropping it could pass a failing file
+                    raise BatchOutputError(f"cannot attribute {line!r}")
+                attributed = True
+                msg = parts[3].strip()
+                errors, warnings = issues[filepath]
+                if self._is_error(msg):
+                    errors.append(msg)
+                else:
+                    warnings.append(msg)
+            if not attributed:
+                raise BatchOutputError(f"exit code {result.returncode} without issues")
+
+        results = []
+        for filepath in files:
+            errors, warnings = issues[filepath]
+            if not errors and not warnings:
+                results.append(
+                    ValidationResult(
+                        tool=self.name,
+                        filepath=str(filepath),
+                        success=True,
+                        messages=["No issues found"],
+                        duration_ms=duration_ms,
+                    )
+                )
+            else:
+                results.append(
+                    ValidationResult(
+                        tool=self.name,
+                        filepath=str(filepath),
+                        success=False,
+                        errors=errors,
+                        warnings=warnings,
+                        duration_ms=duration_ms,
+                    )
+                )
+        return results
@@ -10,9 +10,9 @@ import os
 import sys
 import time
 from pathlib import Path
-from typing import Set
+from typing import Set, Tuple
 
-from huskycat.validators.base import ValidationResult, Validator
+from huskycat.validators.base import DispatchRule, ValidationResult, Validator
 
 
 class GitLabCIValidator(Validator):
@@ -35,22 +35,15 @@ class GitLabCIValidator(Validator):
         except ImportError:
             return False
 
-    def can_handle(self, filepath: Path) -> bool:
-        """Check if this file is a GitLab CI file"""
-        name = filepath.name
-        parent_path = str(filepath.parent)
-
-        # Specific GitLab CI files
-        if name == ".gitlab-ci.yml" or name.startswith(".gitlab-ci"):
-            return True
-
-        # Files in .gitlab/ci/ directory that are YAML files
-        if (".gitlab/ci" in parent_path or parent_path.endswith(".gitlab/ci")) and (
-            name.endswith(".yml") or name.endswith(".yaml")
-        ):
-            return True
-
-        return False
+    @property
+    def dispatch_rules(self) -> Tuple[DispatchRule, ...]:
+        """GitLab CI files: .gitlab-ci* and YAML files under .gitlab/ci"""
+        return (
+            # Specific GitLab CI files
+            DispatchRule(name_pattern=r"^\.gitlab-ci"),
+            # Files in .gitlab/ci/ directory that are YAML files
+            DispatchRule(dir_pattern=r"\.gitlab/ci", name_pattern=r"\.(?:yml|yaml)$"),
+        )
 
     def validate(self, filepath: Path) -> ValidationResult:
         """Validate GitLab CI YAML file against official schema"""
@@ -7,16 +7,20 @@ Uses Hadolint for comprehensive Dockerfile linting.
 License: GPL-3.0 (requires container/sidecar in FAST mode)
 """
 
+import subprocess
 import time
 from pathlib import Path
-from typing import Set
+from typing import List, Set, Tuple
 
-from huskycat.validators.base import ValidationResult, Validator
+from huskycat.validators.base import DispatchRule, ValidationResult, Validator
 
 
 class HadolintValidator(Validator):
     """Dockerfile/ContainerFile linter"""
 
+    reads_stdin = True
+    sidecar_batches = True
+
     @property
     def name(self) -> str:
         return "hadolint"
@@ -31,12 +35,13 @@ class HadolintValidator(Validator):
         # Handle both extensions and specific filenames
         return {".dockerfile"}
 
-    def can_handle(self, filepath: Path) -> bool:
-        """Check if this validator can handle the given file"""
-        return filepath.suffix in self.extensions or filepath.name in [
-            "Dockerfile",
-            "ContainerFile",
-        ]
+    @property
+    def dispatch_rules(self) -> Tuple[DispatchRule, ...]:
+        """*.dockerfile plus Dockerfile and ContainerFile by name"""
+        return (
+            DispatchRule(suffixes=frozenset(self.extensions)),
+            DispatchRule(names=frozenset({"Dockerfile", "ContainerFile"})),
+        )
 
     def validate(self, filepath: Path) -> ValidationResult:
         start_time = time.time()
@@ -44,37 +49,11 @@ class HadolintValidator(Validator):
 
         try:
             result = self._execute_command(
-                cmd, capture_output=True, text=True, timeout=30
+                cmd, capture_output=True, text=True, timeout=self._timeout()
+            )
+            return self._read_result(
+                filepath, result, int((time.time() - start_time) * 1000)
             )
-            duration_ms = int((time.time() - start_time) * 1000)
-
-            if result.returncode == 0:
-                return ValidationResult(
-                    tool=self.name,
-                    filepath=str(filepath),
-                    success=True,
-                    messages=["Container file is valid"],
-                    duration_ms=duration_ms,
-                )
-            else:
-                errors = []
-                warnings = []
-
-                for line in result.stdout.splitlines():
-                    if "DL" in line:  # Hadolint error codes
-                        if "error" in line.lower():
-                            errors.append(line)
-                        else:
-                            warnings.append(line)
-
-                return ValidationResult(
-                    tool=self.name,
-                    filepath=str(filepath),
-                    success=False,
-                    errors=errors,
-                    warnings=warnings,
-                    duration_ms=duration_ms,
-                )
         except Exception as e:
             return ValidationResult(
                 tool=self.name,
@@ -83,3 +62,40 @@ class HadolintValidator(Validator):
                 errors=[str(e)],
                 duration_ms=int((time.time() - start_time) * 1000),
             )
+
+    def _stdin_command(self, filepath: Path, content: bytes) -> List[str]:
+        return [self.command, "-"]
+
+    def _read_result(
+        self,
+        filepath: Path,
+        result: subprocess.CompletedProcess,
+        duration_ms: int,
+    ) -> ValidationResult:
+        if result.returncode == 0:
+            return ValidationResult(
+                tool=self.name,
+                filepath=str(filepath),
+                success=True,
+                messages=["Container file is valid"],
+                duration_ms=duration_ms,
+            )
+        else:
+            errors = []
+            warnings = []
+
+            for line in result.stdout.splitlines():
+                if "DL" in line:  # Hadolint error codes
+                    if "error" in line.lower():
+                        errors.append(line)
+                    else:
+                        warnings.append(line)
+
+            return ValidationResult(
+                tool=self.name,
+                filepath=str(filepath),
+                success=False,
+                errors=errors,
+                warnings=warnings,
+                duration_ms=duration_ms,
+            )
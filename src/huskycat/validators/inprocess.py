@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+"""
+In-process execution of Python-native linters
+
+black, isort, autoflake, flake8 and mypy are importable Python packages,
+so a subprocess per invocation mostly pays for interpreter startup and
+imports. With the backend enabled, their command lines run inside a
+long-lived pool of worker processes that import the tools once:
+- the tool's CLI entry point runs with the same arguments, so output
+  and exit codes match the command and existing parsers keep working
+- results come back as subprocess.CompletedProcess
+- tools run only when the importable version matches the command on
+  PATH; otherwise, and whenever an in-process run fails, callers fall
+  back to a subprocess
+
+Usage:
+    enable_inprocess()
+    result = run_inprocess(validator, ["black", "--check", "a.py"],
+                           capture_output=True, text=True, timeout=30)
+    if result is None:
+        result = subprocess.run(...)
+"""
+
+import concurrent.futures
+import importlib
+import importlib.util
+import io
+import logging
+import multiprocessing
+import os
+import subprocess
+import sys
+import threading
+import time
+from importlib import metadata
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Keyword arguments of subprocess.run() an in-process run can honour
+SUPPORTED_KWARGS = frozenset({"capture_output", "text", "timeout", "input", "cwd"})
+
+# Arguments added so tools do not start process pools of their own
+SERIAL_ARGS: Dict[str, List[str]] = {
+    "flake8": ["--jobs=1"],
+}
+
+# Worker processes in the pool
+WORKERS = os.cpu_count() or 1
+
+# Seconds between checks of the cancel token while a run waits
+CANCEL_POLL_INTERVAL = 0.2
+
+
+def _run_black(argv: List[str]) -> int:
+    import black
+
+    # Always exits with black's status
+    black.main.main(args=argv, prog_name="black", standalone_mode=True)
+
+
+def _run_isort(argv: List[str]) -> int:
+    import isort.main  # type: ignore
+
+    isort.main.main(argv, stdin=sys.stdin)
+    return 0
+
+
+def _run_autoflake(argv: List[str]) -> int:
+    import autoflake  # type: ignore
+
+    return autoflake._main(["autoflake"] + argv, sys.stdout, sys.stderr, sys.stdin)
+
+
+def _run_flake8(argv: List[str]) -> int:
+    import flake8.main.cli  # type: ignore
+
+    return flake8.main.cli.main(argv)
+
+
+def _run_mypy(argv: List[str]) -> int:
+    import mypy.api
+
+    stdout, stderr, status = mypy.api.run(argv)
+    sys.stdout.write(stdout)
+    sys.stderr.write(stderr)
+    return status
+
+
+# Command -> (distribution, module to pre-import, entry point)
+RUNNERS: Dict[str, Tuple[str, str, Callable[[List[str]], int]]] = {
+    "black": ("black", "black", _run_black),
+    "isort": ("isort", "isort.main", _run_isort),
+    "autoflake": ("autoflake", "autoflake", _run_autoflake),
+    "flake8": ("flake8", "flake8.main.cli", _run_flake8),
+    "mypy": ("mypy", "mypy.api", _run_mypy),
+}
+
+
+def _init_worker() -> None:
+    """Import every available tool once per worker"""
+    # black would otherwise fork a process pool per multi-file run
+    os.environ["BLACK_NUM_WORKERS"] = "1"
+    for _, module, _ in RUNNERS.values():
+        try:
+            importlib.import_module(module)
+        except Exception:
+            pass
+
+
+def _exit_code(code: Any) -> int:
+    """Map a SystemExit code to a process exit status"""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _call(
+    command: str, argv: List[str], stdin: Optional[bytes], cwd: Optional[str]
+) -> Tuple[int, bytes, bytes]:
+    """Run a tool's entry point in this worker, capturing its output"""
+    runner = RUNNERS[command][2]
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8", write_through=True)
+    stderr = io.TextIOWrapper(io.BytesIO(), encoding="utf-8", write_through=True)
+    fake_stdin = io.TextIOWrapper(io.BytesIO(stdin or b""), encoding="utf-8")
+
+    saved = (sys.stdin, sys.stdout, sys.stderr, sys.argv, os.getcwd())
+    try:
+        if cwd is not None:
+            os.chdir(cwd)
+        sys.stdin, sys.stdout, sys.stderr = fake_stdin, stdout, stderr
+        sys.argv = [command] + argv
+        try:
+            returncode = runner(argv)
+        except SystemExit as e:
+            returncode = _exit_code(e.code)
+        stdout.flush()
+        stderr.flush()
+        return returncode, stdout.buffer.getvalue(), stderr.buffer.getvalue()
+    finally:
+        sys.stdin, sys.stdout, sys.stderr, sys.argv = saved[:4]
+        os.chdir(saved[4])
+
+
+_enabled = False
+_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+_matches: Dict[str, bool] = {}
+
+# One per worker: runs wait here rather than in the pool's queue, so a
+# run's timeout only counts while a worker runs it
+_slots = threading.BoundedSemaphore(WORKERS)
+
+
+def enable_inprocess(enabled: bool = True) -> None:
+    """Turn the in-process backend on or off for this process"""
+    global _enabled
+    _enabled = enabled
+    if not enabled:
+        shutdown_inprocess()
+
+
+def inprocess_enabled() -> bool:
+    return _enabled
+
+
+def _get_pool() -> concurrent.futures.ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn: the engine forks from threads, which fork() does not survive
+            _pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+        return _pool
+
+
+def _recycle_pool(pool: concurrent.futures.ProcessPoolExecutor) -> None:
+    """Kill a pool whose worker is stuck in a tool run; the next run starts anew
+
+    Killing a single worker breaks the whole ProcessPoolExecutor, so all
+    of its workers go. Runs still in flight there fail and fall back to a
+    subprocess.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    for process in list((pool._processes or {}).values()):
+        process.kill()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_inprocess() -> None:
+    """Stop the worker pool (it restarts on the next in-process run)"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _matches_installed(validator: Any) -> bool:
+    """Check that the importable tool is the one the command would run
+
+    Compares the installed distribution version with the command's
+    reported version, once per command.
+    """
+    command = validator.command
+    if command not in _matches:
+        distribution = RUNNERS[command][0]
+        try:
+            version = metadata.version(distribution)
+            found = importlib.util.find_spec(RUNNERS[command][1]) is not None
+        except (metadata.PackageNotFoundError, ImportError, ValueError):
+            found = False
+        if not found:
+            _matches[command] = False
+        else:
+            reported = validator.get_version() or ""
+            _matches[command] = version in reported
+            if not _matches[command]:
+                logger.debug(
+                    f"{command}: importable {version} differs from {reported!r}, "
+                    "using subprocess"
+                )
+    return _matches[command]
+
+
+def _result(
+    future: "concurrent.futures.Future[Tuple[int, bytes, bytes]]",
+    timeout: Optional[float],
+    token: Any,
+) -> Tuple[int, bytes, bytes]:
+    """
+    Wait for a run's result, checking its cancel token meanwhile.
+
+    Raises:
+        concurrent.futures.TimeoutError: The run took longer than timeout
+            or the token was cancelled
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        wait = None if token is None else CANCEL_POLL_INTERVAL
+        if deadline is not None:
+            left = max(0.0, deadline - time.monotonic())
+            wait = left if wait is None else min(wait, left)
+        try:
+            return future.result(timeout=wait)
+        except concurrent.futures.TimeoutError:
+            if token is not None and token.cancelled:
+                raise
+            if deadline is not None and time.monotonic() >= deadline:
+                raise
+
+
+def run_inprocess(
+    validator: Any, cmd: List[str], **kwargs: Any
+) -> Optional[subprocess.CompletedProcess]:
+    """
+    Run a validator's command in the worker pool.
+
+    The run waits for a free worker first, so its timeout counts from
+    when a worker takes it. The cancel token is checked while it waits
+    and while it runs.
+
+    Args:
+        validator: Validator whose tool the command runs
+        cmd: Command line, starting with validator.command
+        **kwargs: subprocess.run() keyword arguments
+
+    Returns:
+        CompletedProcess like subprocess.run() would return, or None when
+        the command cannot or should not run in-process
+
+    Raises:
+        subprocess.TimeoutExpired: If the tool does not finish in time
+        ToolCancelled: If the current cancel token expired first
+    """
+    if not _enabled or not cmd or cmd[0] not in RUNNERS:
+        return None
+    if cmd[0] != validator.command or cmd[1:] == [validator.version_flag]:
+        return None
+    if not kwargs.get("capture_output") or set(kwargs) - SUPPORTED_KWARGS:
+        return None
+    if not _matches_installed(validator):
+        return None
+
+    stdin = kwargs.get("input")
+    if isinstance(stdin, str):
+        stdin = stdin.encode("utf-8")
+    cwd = kwargs.get("cwd")
+    argv = SERIAL_ARGS.get(cmd[0], []) + list(cmd[1:])
+
+    # Workers import this module; keep huskycat.core out of them
+    from huskycat.core.cancellation import ToolCancelled, current_token
+
+    timeout = kwargs.get("timeout")
+    token = current_token()
+    while not _slots.acquire(timeout=CANCEL_POLL_INTERVAL):
+        if token is not None:
+            token.check()
+    try:
+        if token is not None:
+            token.check()
+            timeout = token.timeout(timeout)
+        try:
+            pool = _get_pool()
+            future = pool.submit(
+                _call, cmd[0], argv, stdin, None if cwd is None else str(cwd)
+            )
+            returncode, stdout, stderr = _result(future, timeout, token)
+        except concurrent.futures.TimeoutError:
+            # A busy worker cannot be interrupted: kill it rather than let
+            # it hold its slot until the tool gives up
+            _recycle_pool(pool)
+            if token is not None and token.cancelled:
+                raise ToolCancelled(token.describe())
+            assert timeout is not None  # only a deadline or a cancel stops a run
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        except Exception as e:
+            logger.debug(f"In-process {cmd[0]} failed ({e}), using subprocess")
+            return None
+    finally:
+        _slots.release()
+
+    if kwargs.get("text"):
+        return subprocess.CompletedProcess(
+            cmd,
+            returncode,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace"),
+        )
+    return subprocess.CompletedProcess(cmd, returncode, stdout, stderr)
@@ -7,16 +7,27 @@ Uses isort to check and sort Python imports.
 License: MIT
 """
 
+import subprocess
 import time
 from pathlib import Path
-from typing import Set
+from typing import Dict, List, Set
 
-from huskycat.validators.base import ValidationResult, Validator
+from huskycat.validators.base import (
+    BatchOutputError,
+    FileIndex,
+    ValidationResult,
+    Validator,
+)
 
 
 class IsortValidator(Validator):
     """Python import sorting and organization"""
 
+    reads_stdin = True
+
+    # Plain --version prints a banner before the version
+    version_flag = "--version-number"
+
     @property
     def name(self) -> str:
         return "isort"
@@ -26,9 +37,10 @@ class IsortValidator(Validator):
         return {".py", ".pyi"}
 
     def validate(self, filepath: Path) -> ValidationResult:
-        start_time = time.time()
+        if self.auto_fix:
+            return self._fix(filepath)
 
-        # First check what isort would fix (dry run)
+        start_time = time.time()
         check_cmd = [
             self.command,
             "--check-only",
@@ -38,57 +50,184 @@ class IsortValidator(Validator):
 
         try:
             result = self._execute_command(
-                check_cmd, capture_output=True, text=True, timeout=30
+                check_cmd, capture_output=True, text=True, timeout=self._timeout()
+            )
+            return self._read_result(
+                filepath, result, int((time.time() - start_time) * 1000)
+            )
+        except Exception as e:
+            return ValidationResult(
+                tool=self.name,
+                filepath=str(filepath),
+                success=False,
+                errors=[str(e)],
+                duration_ms=int((time.time() - start_time) * 1000),
+            )
+
+    def _fix(self, filepath: Path) -> ValidationResult:
+        """Sort imports in place in one isort run, detecting edits by hash"""
+        start_time = time.time()
+        before = self._content_hashes([filepath])
+
+        try:
+            # isort modifies in-place by default
+            result = self._execute_command(
+                [self.command, str(filepath)],
+                capture_output=True,
+                text=True,
+                timeout=self._timeout(),
+            )
+        except Exception as e:
+            return ValidationResult(
+                tool=self.name,
+                filepath=str(filepath),
+                success=False,
+                errors=[str(e)],
+                duration_ms=int((time.time() - start_time) * 1000),
+            )
+        duration_ms = int((time.time() - start_time) * 1000)
+
+        if result.returncode != 0:
+            return ValidationResult(
+                tool=self.name,
+                filepath=str(filepath),
+                success=False,
+                errors=["Failed to sort imports"],
+                messages=result.stderr.splitlines() if result.stderr else [],
+                duration_ms=duration_ms,
             )
-            duration_ms = int((time.time() - start_time) * 1000)
-
-            if result.returncode == 0:
-                # Imports are already sorted
-                return ValidationResult(
-                    tool=self.name,
-                    filepath=str(filepath),
-                    success=True,
-                    messages=["Imports are properly sorted"],
-                    duration_ms=duration_ms,
+        return self._fixed_result(
+            filepath, self._content_hashes([filepath]) != before, duration_ms
+        )
+
+    def _fixed_result(
+        self, filepath: Path, changed: bool, duration_ms: int
+    ) -> ValidationResult:
+        return ValidationResult(
+            tool=self.name,
+            filepath=str(filepath),
+            success=True,
+            messages=[
+                (
+                    "Sorted and organized imports"
+                    if changed
+                    else "Imports are properly sorted"
                 )
-            else:
-                # Imports need sorting
-                if self.auto_fix:
-                    # Apply fixes (isort modifies in-place by default)
-                    fix_cmd = [
-                        self.command,
-                        str(filepath),
-                    ]
-                    fix_result = self._execute_command(
-                        fix_cmd, capture_output=True, text=True, timeout=30
-                    )
+            ],
+            fixed=changed,
+            duration_ms=duration_ms,
+        )
 
-                    if fix_result.returncode == 0:
-                        return ValidationResult(
-                            tool=self.name,
-                            filepath=str(filepath),
-                            success=True,
-                            messages=["Sorted and organized imports"],
-                            fixed=True,
-                            duration_ms=duration_ms,
-                        )
-                    else:
-                        return ValidationResult(
-                            tool=self.name,
-                            filepath=str(filepath),
-                            success=False,
-                            errors=["Failed to sort imports"],
-                            messages=(
-                                fix_result.stderr.splitlines()
-                                if fix_result.stderr
-                                else []
-                            ),
-                            duration_ms=duration_ms,
-                        )
-                else:
-                    # Just report issues without fixing
-                    diff_lines = result.stdout.splitlines() if result.stdout else []
-                    return ValidationResult(
+    def _stdin_command(self, filepath: Path, content: bytes) -> List[str]:
+        return [
+            self.command,
+            "--check-only",
+            "--diff",
+            "--filename",
+            str(filepath),
+            "-",
+        ]
+
+    def _read_result(
+        self,
+        filepath: Path,
+        result: subprocess.CompletedProcess,
+        duration_ms: int,
+    ) -> ValidationResult:
+        if result.returncode == 0:
+            # Imports are already sorted
+            return ValidationResult(
+                tool=self.name,
+                filepath=str(filepath),
+                success=True,
+                messages=["Imports are properly sorted"],
+                duration_ms=duration_ms,
+            )
+
+        if not result.stdout and "was skipped" in (result.stderr or ""):
+            # Paths excluded by skip settings (only reported for stdin input)
+            return ValidationResult(
+                tool=self.name,
+                filepath=str(filepath),
+                success=True,
+                messages=["Skipped by isort configuration"],
+                duration_ms=duration_ms,
+            )
+
+        # Just report issues without fixing
+        diff_lines = result.stdout.splitlines() if result.stdout else []
+        return ValidationResult(
+            tool=self.name,
+            filepath=str(filepath),
+            success=False,
+            errors=["Imports are not properly sorted"],
+            messages=(
+                diff_lines[:10] if diff_lines else ["Run with --fix to sort imports"]
+            ),
+            duration_ms=duration_ms,
+        )
+
+    def _validate_chunk(self, files: List[Path]) -> List[ValidationResult]:
+        """Check the chunk in one isort run (or fix it in one run with auto-fix)
+
+        Unsorted files are named on stderr (``ERROR: <path> Imports are
+        incorrectly sorted``) and their diffs on stdout start with
+        ``--- <path>:before``.
+        """
+        if self.auto_fix:
+            return self._fix_chunk(files)
+
+        start_time = time.time()
+        check_cmd = [self.command, "--check-only", "--diff"] + [str(f) for f in files]
+
+        try:
+            result = self._execute_command(
+                check_cmd,
+                capture_output=True,
+                text=True,
+                timeout=self._batch_timeout(files),
+            )
+        except Exception as e:
+            return self._batch_error_results(
+                files, str(e), int((time.time() - start_time) * 1000)
+            )
+
+        unsorted: Dict[Path, List[str]] = {}
+        if result.returncode != 0:
+            index = FileIndex(files)
+            for line in (result.stderr or "").splitlines():
+                if line.startswith("ERROR: ") and " Imports are " in line:
+                    reported = line[len("ERROR: ") :].split(" Imports are ", 1)[0]
+                    filepath = index.lookup(reported)
+                    if filepath is not None:
+                        unsorted.setdefault(filepath, [])
+            if not unsorted:
+                raise BatchOutputError(f"exit code {result.returncode} without files")
+
+            current = None
+            for line in (result.stdout or "").splitlines():
+                if line.startswith("--- ") and ":before" in line:
+                    current = index.lookup(line[4:].rsplit(":before", 1)[0])
+                if current is not None and current in unsorted:
+                    unsorted[current].append(line)
+        duration_ms = int((time.time() - start_time) * 1000) // len(files)
+
+        results = []
+        for filepath in files:
+            if filepath not in unsorted:
+                results.append(
+                    ValidationResult(
+                        tool=self.name,
+                        filepath=str(filepath),
+                        success=True,
+                        messages=["Imports are properly sorted"],
+                        duration_ms=duration_ms,
+                    )
+                )
+            else:
+                diff_lines = unsorted[filepath]
+                results.append(
+                    ValidationResult(
                         tool=self.name,
                         filepath=str(filepath),
                         success=False,
@@ -100,11 +239,37 @@ class IsortValidator(Validator):
                         ),
                         duration_ms=duration_ms,
                     )
+                )
+        return results
+
+    def _fix_chunk(self, files: List[Path]) -> List[ValidationResult]:
+        """Sort imports of the whole chunk in place in one isort run
+
+        Files whose content hash changed were fixed. If isort fails, files it
+        left untouched are retried one by one to attribute the error.
+        """
+        start_time = time.time()
+        before = self._content_hashes(files)
+
+        try:
+            result = self._execute_command(
+                [self.command] + [str(f) for f in files],
+                capture_output=True,
+                text=True,
+                timeout=self._batch_timeout(files),
+            )
         except Exception as e:
-            return ValidationResult(
-                tool=self.name,
-                filepath=str(filepath),
-                success=False,
-                errors=[str(e)],
-                duration_ms=int((time.time() - start_time) * 1000),
+            return self._batch_error_results(
+                files, str(e), int((time.time() - start_time) * 1000)
             )
+        duration_ms = int((time.time() - start_time) * 1000) // len(files)
+
+        after = self._content_hashes(files)
+        results = []
+        for filepath in files:
+            changed = after[filepath] != before[filepath]
+            if result.returncode != 0 and not changed:
+                results.append(self._fix(filepath))
+            else:
+                results.append(self._fixed_result(filepath, changed, duration_ms))
+        return results
@@ -7,16 +7,29 @@ Uses MyPy to check Python code for type errors.
 License: MIT
 """
 
+import logging
+import os
 import time
 from pathlib import Path
-from typing import Set
+from typing import Dict, List, Optional, Set, Tuple
 
-from huskycat.validators.base import ValidationResult, Validator
+from huskycat.validators.base import (
+    BatchOutputError,
+    FileIndex,
+    ValidationResult,
+    Validator,
+)
+from huskycat.validators.daemons import ToolDaemon, get_daemon
+
+logger = logging.getLogger(__name__)
 
 
 class MypyValidator(Validator):
     """Python type checker"""
 
+    # Results depend on imported modules, not just the checked file
+    cacheable = False
+
     @property
     def name(self) -> str:
         return "mypy"
@@ -25,13 +38,87 @@ class MypyValidator(Validator):
     def extensions(self) -> Set[str]:
         return {".py", ".pyi"}
 
+    @property
+    def single_batch(self) -> bool:  # type: ignore[override]
+        return self._daemon() is not None
+
+    def _daemon(self) -> Optional[ToolDaemon]:
+        """The warm dmypy server, when tools run directly from PATH"""
+        if self._get_execution_mode() not in ("local", "container"):
+            return None
+        return get_daemon(self.name)
+
+    def validate_batch(self, files: List[Path]) -> List[ValidationResult]:
+        """Check all files in one request to the daemon when one is available"""
+        daemon = self._daemon()
+        if daemon is None or not files:
+            return super().validate_batch(files)
+        return self._validate_with_daemon(daemon, files)
+
+    def _validate_with_daemon(
+        self, daemon: ToolDaemon, files: List[Path]
+    ) -> List[ValidationResult]:
+        """Type-check files through dmypy, falling back to cold runs on errors"""
+        start_time = time.time()
+        paths = [os.path.relpath(os.path.abspath(f), daemon.root) for f in files]
+        if any(p.startswith(os.pardir) for p in paths):
+            # Files outside the repository (e.g. scratch copies of staged
+            # content) would only churn the daemon's file set
+            return self._validate_cold(files)
+        try:
+            result = daemon.run(
+                ["--no-error-summary"] + paths,
+                timeout=self._batch_timeout(files, base=2 * self.timeout),
+            )
+        except Exception as e:
+            return self._batch_error_results(
+                files, str(e), int((time.time() - start_time) * 1000)
+            )
+        if result.returncode not in (0, 1):
+            # Fatal errors such as duplicate module names
+            return self._validate_cold(files)
+        return self._results_from_output(
+            files,
+            result.stdout if result.returncode else "",
+            int((time.time() - start_time) * 1000) // len(files),
+            root=daemon.root,
+        )
+
     def validate(self, filepath: Path) -> ValidationResult:
+        daemon = self._daemon()
+        if daemon is not None:
+            return self._validate_with_daemon(daemon, [filepath])[0]
+        return self._validate_file(filepath)
+
+    def _validate_cold(self, files: List[Path]) -> List[ValidationResult]:
+        """Type-check files with plain mypy runs, never through the daemon
+
+        The daemon's fallbacks land here rather than in validate() or
+        validate_batch(), which would send the files to the daemon again.
+        """
+        results: List[ValidationResult] = []
+        for start in range(0, len(files), self.batch_size):
+            chunk = files[start : start + self.batch_size]
+            if len(chunk) > 1:
+                try:
+                    results.extend(self._validate_chunk(chunk))
+                    continue
+                except BatchOutputError as e:
+                    logger.debug(
+                        f"{self.name}: cannot split batch output ({e}), "
+                        "validating files individually"
+                    )
+            results.extend(self._validate_file(filepath) for filepath in chunk)
+        return results
+
+    def _validate_file(self, filepath: Path) -> ValidationResult:
+        """Type-check one file with a plain mypy run"""
         start_time = time.time()
         cmd = [self.command, str(filepath), "--no-error-summary"]
 
         try:
             result = self._execute_command(
-                cmd, capture_output=True, text=True, timeout=30
+                cmd, capture_output=True, text=True, timeout=self._timeout()
             )
             duration_ms = int((time.time() - start_time) * 1000)
 
@@ -69,3 +156,87 @@ class MypyValidator(Validator):
                 errors=[str(e)],
                 duration_ms=int((time.time() - start_time) * 1000),
             )
+
+    def _validate_chunk(self, files: List[Path]) -> List[ValidationResult]:
+        """Type-check the chunk in one mypy run and attribute lines per file
+
+        Diagnostics for modules outside the chunk (imports) are dropped, as
+        they belong to files that were not asked for. Exit code 2 signals a
+        fatal error such as duplicate module names, which only per-file runs
+        can avoid.
+        """
+        start_time = time.time()
+        cmd = [self.command, "--no-error-summary"] + [str(f) for f in files]
+
+        try:
+            result = self._execute_command(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=self._batch_timeout(files),
+            )
+        except Exception as e:
+            return self._batch_error_results(
+                files, str(e), int((time.time() - start_time) * 1000)
+            )
+        duration_ms = int((time.time() - start_time) * 1000) // len(files)
+
+        if result.returncode not in (0, 1):
+            raise BatchOutputError(f"mypy exited with {result.returncode}")
+        return self._results_from_output(
+            files, result.stdout if result.returncode else "", duration_ms
+        )
+
+    def _results_from_output(
+        self,
+        files: List[Path],
+        output: str,
+        duration_ms: int,
+        root: Optional[Path] = None,
+    ) -> List[ValidationResult]:
+        """Attribute mypy output lines to files, one result per file
+
+        Args:
+            root: Directory reported paths are relative to (default: cwd)
+        """
+        issues: Dict[Path, Tuple[List[str], List[str]]] = {f: ([], []) for f in files}
+        index = FileIndex(files)
+        for line in output.splitlines():
+            reported = line.split(":", 1)[0]
+            if root is not None:
+                reported = os.path.join(root, reported)
+            filepath = index.lookup(reported)
+            if filepath is None:
+                continue
+            errors, warnings = issues[filepath]
+            if "error:" in line:
+                errors.append(line)
+            elif "warning:" in line or "note:" in line:
+                warnings.append(line)
+
+        results = []
+        for filepath in files:
+            errors, warnings = issues[filepath]
+            if not errors:
+                results.append(
+                    ValidationResult(
+                        tool=self.name,
+                        filepath=str(filepath),
+                        success=True,
+                        messages=["Type checking passed"],
+                        warnings=warnings,
+                        duration_ms=duration_ms,
+                    )
+                )
+            else:
+                results.append(
+                    ValidationResult(
+                        tool=self.name,
+                        filepath=str(filepath),
+                        success=False,
+                        errors=errors,
+                        warnings=warnings,
+                        duration_ms=duration_ms,
+                    )
+                )
+        return results
@@ -17,6 +17,8 @@ from huskycat.validators.base import ValidationResult, Validator
 class PrettierValidator(Validator):
     """JavaScript/TypeScript code formatter"""
 
+    reads_stdin = True
+
     @property
     def name(self) -> str:
         return "js-prettier"
@@ -36,7 +38,7 @@ class PrettierValidator(Validator):
 
         try:
             result = self._execute_command(
-                cmd, capture_output=True, text=True, timeout=30
+                cmd, capture_output=True, text=True, timeout=self._timeout()
             )
 
             duration_ms = int((time.time() - start_time) * 1000)
@@ -78,3 +80,56 @@ class PrettierValidator(Validator):
                 errors=[str(e)],
                 duration_ms=int((time.time() - start_time) * 1000),
             )
+
+    def validate_content(self, filepath: Path, content: bytes) -> ValidationResult:
+        """Format the content read from stdin and compare it with the input
+
+        Prettier has no check mode for stdin; it prints the formatted
+        content, which differs from the input when formatting is needed.
+        """
+        start_time = time.time()
+        cmd = [self.command, "--stdin-filepath", str(filepath)]
+
+        try:
+            result = self._execute_command(
+                cmd, input=content, capture_output=True, timeout=self._timeout()
+            )
+            duration_ms = int((time.time() - start_time) * 1000)
+
+            if result.returncode != 0:
+                stderr = (result.stderr or b"").decode("utf-8", errors="replace")
+                errors = [line for line in stderr.splitlines() if line.strip()]
+                return ValidationResult(
+                    tool=self.name,
+                    filepath=str(filepath),
+                    success=False,
+                    errors=errors or [f"prettier exited with {result.returncode}"],
+                    duration_ms=duration_ms,
+                )
+
+            if result.stdout != content:
+                msg = f"Code formatting: {filepath}"
+                return ValidationResult(
+                    tool=self.name,
+                    filepath=str(filepath),
+                    success=False,
+                    messages=[msg],
+                    errors=[msg],
+                    duration_ms=duration_ms,
+                )
+
+            return ValidationResult(
+                tool=self.name,
+                filepath=str(filepath),
+                success=True,
+                duration_ms=duration_ms,
+            )
+
+        except Exception as e:
+            return ValidationResult(
+                tool=self.name,
+                filepath=str(filepath),
+                success=False,
+                errors=[str(e)],
+                duration_ms=int((time.time() - start_time) * 1000),
+            )
@@ -8,16 +8,24 @@ License: MIT
 """
 
 import json
+import subprocess
 import time
 from pathlib import Path
-from typing import Set
+from typing import Any, Dict, List, Set
 
-from huskycat.validators.base import ValidationResult, Validator
+from huskycat.validators.base import (
+    BatchOutputError,
+    FileIndex,
+    ValidationResult,
+    Validator,
+)
 
 
 class RuffValidator(Validator):
     """Python fast linter"""
 
+    reads_stdin = True
+
     @property
     def name(self) -> str:
         return "ruff"
@@ -36,49 +44,122 @@ class RuffValidator(Validator):
 
         try:
             result = self._execute_command(
-                cmd, capture_output=True, text=True, timeout=30
+                cmd, capture_output=True, text=True, timeout=self._timeout()
             )
-
-            duration_ms = int((time.time() - start_time) * 1000)
-
-            if result.returncode == 0:
-                return ValidationResult(
-                    tool=self.name,
-                    filepath=str(filepath),
-                    success=True,
-                    fixed=self.auto_fix,
-                    duration_ms=duration_ms,
-                )
-
-            # Parse JSON output
-            messages = []
-            errors = []
-            if result.stdout:
-                try:
-                    data = json.loads(result.stdout)
-                    for issue in data:
-                        msg = f"Line {issue.get('location', {}).get('row', '?')}: {issue.get('message', 'Unknown error')}"
-                        messages.append(msg)
-                        errors.append(msg)
-                except json.JSONDecodeError:
-                    errors = [result.stdout.strip()]
-                    messages = [result.stdout.strip()]
-
+            return self._read_result(
+                filepath, result, int((time.time() - start_time) * 1000)
+            )
+        except Exception as e:
             return ValidationResult(
                 tool=self.name,
                 filepath=str(filepath),
                 success=False,
-                messages=messages,
-                errors=errors,
-                fixed=self.auto_fix and result.returncode == 0,
-                duration_ms=duration_ms,
+                errors=[str(e)],
+                duration_ms=int((time.time() - start_time) * 1000),
             )
 
-        except Exception as e:
+    def _stdin_command(self, filepath: Path, content: bytes) -> List[str]:
+        return [
+            self.command,
+            "check",
+            "--output-format=json",
+            "--stdin-filename",
+            str(filepath),
+            "-",
+        ]
+
+    def _read_result(
+        self,
+        filepath: Path,
+        result: subprocess.CompletedProcess,
+        duration_ms: int,
+    ) -> ValidationResult:
+        if result.returncode == 0:
             return ValidationResult(
                 tool=self.name,
                 filepath=str(filepath),
-                success=False,
-                errors=[str(e)],
-                duration_ms=int((time.time() - start_time) * 1000),
+                success=True,
+                fixed=self.auto_fix,
+                duration_ms=duration_ms,
+            )
+
+        # Parse JSON output
+        messages = []
+        errors = []
+        if result.stdout:
+            try:
+                data = json.loads(result.stdout)
+                for issue in data:
+                    msg = self._format_issue(issue)
+                    messages.append(msg)
+                    errors.append(msg)
+            except json.JSONDecodeError:
+                errors = [result.stdout.strip()]
+                messages = [result.stdout.strip()]
+
+        return ValidationResult(
+            tool=self.name,
+            filepath=str(filepath),
+            success=False,
+            messages=messages,
+            errors=errors,
+            fixed=self.auto_fix and result.returncode == 0,
+            duration_ms=duration_ms,
+        )
+
+    def _format_issue(self, issue: Dict[str, Any]) -> str:
+        """Format one ruff JSON diagnostic as a result message"""
+        return f"Line {issue.get('location', {}).get('row', '?')}: {issue.get('message', 'Unknown error')}"
+
+    def _validate_chunk(self, files: List[Path]) -> List[ValidationResult]:
+        """Run one ruff process over the chunk and split its JSON report per file"""
+        start_time = time.time()
+        cmd = [self.command, "check", "--output-format=json"]
+        if self.auto_fix:
+            cmd.append("--fix")
+        cmd.extend(str(f) for f in files)
+
+        try:
+            result = self._execute_command(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=self._batch_timeout(files),
+            )
+        except Exception as e:
+            return self._batch_error_results(
+                files, str(e), int((time.time() - start_time) * 1000)
+            )
+        duration_ms = int((time.time() - start_time) * 1000) // len(files)
+
+        issues: Dict[Path, List[str]] = {f: [] for f in files}
+        if result.returncode != 0:
+            try:
+                data = json.loads(result.stdout) if result.stdout else None
+            except json.JSONDecodeError as e:
+                raise BatchOutputError(f"invalid JSON: {e}")
+            if not isinstance(data, list) or not data:
+                raise BatchOutputError(f"exit code {result.returncode} without issues")
+
+            index = FileIndex(files)
+            for issue in data:
+                filepath = index.lookup(issue.get("filename", ""))
+                if filepath is None:
+                    raise BatchOutputError(f"unknown file {issue.get('filename')}")
+                issues[filepath].append(self._format_issue(issue))
+
+        results = []
+        for filepath in files:
+            file_issues = issues[filepath]
+            results.append(
+                ValidationResult(
+                    tool=self.name,
+                    filepath=str(filepath),
+                    success=not file_issues,
+                    messages=list(file_issues),
+                    errors=list(file_issues),
+                    fixed=self.auto_fix and not file_issues,
+                    duration_ms=duration_ms,
+                )
             )
+        return results
@@ -8,16 +8,28 @@ License: GPL-3.0 (requires container/sidecar in FAST mode)
 """
 
 import json
+import subprocess
 import time
 from pathlib import Path
-from typing import Set
+from typing import Dict, List, Set, Tuple
 
-from huskycat.validators.base import ValidationResult, Validator
+from huskycat.validators.base import (
+    BatchOutputError,
+    FileIndex,
+    ValidationResult,
+    Validator,
+)
+
+# Shell dialect implied by an extension, for scripts checked on stdin
+STDIN_SHELLS = {".sh": "sh", ".bash": "bash", ".ksh": "ksh"}
 
 
 class ShellcheckValidator(Validator):
     """Shell script linter"""
 
+    reads_stdin = True
+    sidecar_batches = True
+
     @property
     def name(self) -> str:
         return "shellcheck"
@@ -32,41 +44,11 @@ class ShellcheckValidator(Validator):
 
         try:
             result = self._execute_command(
-                cmd, capture_output=True, text=True, timeout=30
+                cmd, capture_output=True, text=True, timeout=self._timeout()
+            )
+            return self._read_result(
+                filepath, result, int((time.time() - start_time) * 1000)
             )
-            duration_ms = int((time.time() - start_time) * 1000)
-
-            if result.returncode == 0:
-                return ValidationResult(
-                    tool=self.name,
-                    filepath=str(filepath),
-                    success=True,
-                    messages=["Shell script is valid"],
-                    duration_ms=duration_ms,
-                )
-            else:
-                errors = []
-                warnings = []
-
-                try:
-                    issues = json.loads(result.stdout) if result.stdout else []
-                    for issue in issues:
-                        msg = f"Line {issue.get('line')}: {issue.get('message')}"
-                        if issue.get("level") == "error":
-                            errors.append(msg)
-                        else:
-                            warnings.append(msg)
-                except json.JSONDecodeError:
-                    errors = result.stdout.splitlines() if result.stdout else []
-
-                return ValidationResult(
-                    tool=self.name,
-                    filepath=str(filepath),
-                    success=False,
-                    errors=errors,
-                    warnings=warnings,
-                    duration_ms=duration_ms,
-                )
         except Exception as e:
             return ValidationResult(
                 tool=self.name,
@@ -75,3 +57,121 @@ class ShellcheckValidator(Validator):
                 errors=[str(e)],
                 duration_ms=int((time.time() - start_time) * 1000),
             )
+
+    def _stdin_command(self, filepath: Path, content: bytes) -> List[str]:
+        # Without a file name shellcheck cannot fall back from a missing
+        # shebang to the extension, so name the shell explicitly
+        cmd = [self.command, "-f", "json"]
+        shell = STDIN_SHELLS.get(filepath.suffix)
+        if shell and not content.startswith(b"#!"):
+            cmd.append(f"--shell={shell}")
+        return cmd + ["-"]
+
+    def _read_result(
+        self,
+        filepath: Path,
+        result: subprocess.CompletedProcess,
+        duration_ms: int,
+    ) -> ValidationResult:
+        if result.returncode == 0:
+            return ValidationResult(
+                tool=self.name,
+                filepath=str(filepath),
+                success=True,
+                messages=["Shell script is valid"],
+                duration_ms=duration_ms,
+            )
+        else:
+            errors = []
+            warnings = []
+
+            try:
+                issues = json.loads(result.stdout) if result.stdout else []
+                for issue in issues:
+                    msg = f"Line {issue.get('line')}: {issue.get('message')}"
+                    if issue.get("level") == "error":
+                        errors.append(msg)
+                    else:
+                        warnings.append(msg)
+            except json.JSONDecodeError:
+                errors = result.stdout.splitlines() if result.stdout else []
+
+            return ValidationResult(
+                tool=self.name,
+                filepath=str(filepath),
+                success=False,
+                errors=errors,
+                warnings=warnings,
+                duration_ms=duration_ms,
+            )
+
+    def _validate_chunk(self, files: List[Path]) -> List[ValidationResult]:
+        """Check the chunk with one shellcheck process using the json1 format
+
+        json1 wraps diagnostics in ``{"comments": [...]}`` and tags each
+        with its ``file``, which is how they are split back per script.
+        """
+        start_time = time.time()
+        cmd = [self.command, "-f", "json1"] + [str(f) for f in files]
+
+        try:
+            result = self._execute_command(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=self._batch_timeout(files),
+            )
+        except Exception as e:
+            return self._batch_error_results(
+                files, str(e), int((time.time() - start_time) * 1000)
+            )
+        duration_ms = int((time.time() - start_time) * 1000) // len(files)
+
+        issues: Dict[Path, Tuple[List[str], List[str]]] = {f: ([], []) for f in files}
+        if result.returncode != 0:
+            try:
+                data = json.loads(result.stdout) if result.stdout else None
+            except json.JSONDecodeError as e:
+                raise BatchOutputError(f"invalid JSON: {e}")
+            if not isinstance(data, dict) or not data.get("comments"):
+                raise BatchOutputError(
+                    f"exit code {result.returncode} without comments"
+                )
+
+            index = FileIndex(files)
+            for issue in data["comments"]:
+                filepath = index.lookup(issue.get("file", ""))
+                if filepath is None:
+                    raise BatchOutputError(f"unknown file {issue.get('file')}")
+                errors, warnings = issues[filepath]
+                msg = f"Line {issue.get('line')}: {issue.get('message')}"
+                if issue.get("level") == "error":
+                    errors.append(msg)
+                else:
+                    warnings.append(msg)
+
+        results = []
+        for filepath in files:
+            errors, warnings = issues[filepath]
+            if not errors and not warnings:
+                results.append(
+                    ValidationResult(
+                        tool=self.name,
+                        filepath=str(filepath),
+                        success=True,
+                        messages=["Shell script is valid"],
+                        duration_ms=duration_ms,
+                    )
+                )
+            else:
+                results.append(
+                    ValidationResult(
+                        tool=self.name,
+                        filepath=str(filepath),
+                        success=False,
+                        errors=errors,
+                        warnings=warnings,
+                        duration_ms=duration_ms,
+                    )
+                )
+        return results
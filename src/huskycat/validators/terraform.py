@@ -38,7 +38,7 @@ class TerraformValidator(Validator):
 
         try:
             result = self._execute_command(
-                check_cmd, capture_output=True, text=True, timeout=30
+                check_cmd, capture_output=True, text=True, timeout=self._timeout()
             )
             duration_ms = int((time.time() - start_time) * 1000)
 
@@ -61,7 +61,7 @@ class TerraformValidator(Validator):
                         str(filepath),
                     ]
                     fix_result = self._execute_command(
-                        fix_cmd, capture_output=True, text=True, timeout=30
+                        fix_cmd, capture_output=True, text=True, timeout=self._timeout()
                     )
 
                     if fix_result.returncode == 0:
@@ -8,9 +8,10 @@ License: GPL-3.0 (requires container/sidecar in FAST mode)
 """
 
 import logging
+import subprocess
 import time
 from pathlib import Path
-from typing import Set
+from typing import List, Set
 
 from huskycat.validators.base import ValidationResult, Validator
 
@@ -20,6 +21,9 @@ logger = logging.getLogger(__name__)
 class YamlLintValidator(Validator):
     """YAML linter with auto-fix for trailing spaces and newlines"""
 
+    reads_stdin = True
+    sidecar_batches = True
+
     @property
     def name(self) -> str:
         return "yamllint"
@@ -68,37 +72,13 @@ class YamlLintValidator(Validator):
 
         try:
             result = self._execute_command(
-                cmd, capture_output=True, text=True, timeout=30
+                cmd, capture_output=True, text=True, timeout=self._timeout()
+            )
+            validation = self._read_result(
+                filepath, result, int((time.time() - start_time) * 1000)
             )
-            duration_ms = int((time.time() - start_time) * 1000)
-
-            if result.returncode == 0:
-                return ValidationResult(
-                    tool=self.name,
-                    filepath=str(filepath),
-                    success=True,
-                    messages=["YAML is valid"],
-                    fixed=fixed,
-                    duration_ms=duration_ms,
-                )
-            else:
-                errors = []
-                warnings = []
-
-                for line in result.stdout.splitlines():
-                    if "[error]" in line:
-                        errors.append(line)
-                    elif "[warning]" in line:
-                        warnings.append(line)
-
-                return ValidationResult(
-                    tool=self.name,
-                    filepath=str(filepath),
-                    success=False,
-                    errors=errors,
-                    warnings=warnings,
-                    duration_ms=duration_ms,
-                )
+            validation.fixed = fixed
+            return validation
         except Exception as e:
             return ValidationResult(
                 tool=self.name,
@@ -107,3 +87,39 @@ class YamlLintValidator(Validator):
                 errors=[str(e)],
                 duration_ms=int((time.time() - start_time) * 1000),
             )
+
+    def _stdin_command(self, filepath: Path, content: bytes) -> List[str]:
+        return [self.command, "-f", "parsable", "-"]
+
+    def _read_result(
+        self,
+        filepath: Path,
+        result: subprocess.CompletedProcess,
+        duration_ms: int,
+    ) -> ValidationResult:
+        if result.returncode == 0:
+            return ValidationResult(
+                tool=self.name,
+                filepath=str(filepath),
+                success=True,
+                messages=["YAML is valid"],
+                duration_ms=duration_ms,
+            )
+        else:
+            errors = []
+            warnings = []
+
+            for line in result.stdout.splitlines():
+                if "[error]" in line:
+                    errors.append(line)
+                elif "[warning]" in line:
+                    warnings.append(line)
+
+            return ValidationResult(
+                tool=self.name,
+                filepath=str(filepath),
+                success=False,
+                errors=errors,
+                warnings=warnings,
+                duration_ms=duration_ms,
+            )
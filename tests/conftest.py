@@ -285,6 +285,8 @@ def test_environment_setup():
             "LOG_LEVEL": "DEBUG",
             "MCP_SERVER_URL": "http://localhost:8080",
             "MCP_SERVER_TOKEN": "test-token-123",
+            # Warm tool daemons would outlive the tests; opt in per test
+            "HUSKYCAT_DAEMONS": "0",
         }
     )
 
@@ -296,6 +298,16 @@ def test_environment_setup():
         os.environ.update(original_env)
 
 
+@pytest.fixture(autouse=True)
+def result_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep default result caches out of the working tree (one per test)."""
+    from huskycat.core import result_cache
+
+    cache_dir = tmp_path_factory.mktemp("result-cache")
+    monkeypatch.setattr(result_cache, "DEFAULT_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
 # E2E fixtures removed - see docs/future-roadmap.md for future plans
 
 
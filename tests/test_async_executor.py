@@ -0,0 +1,199 @@
+"""Tests for the asyncio tool process engine and executor."""
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from huskycat.core import async_executor
+from huskycat.core.async_executor import (
+    AsyncExecutor,
+    run_command,
+    run_command_sync,
+    run_tool_process,
+    tool_class,
+)
+from huskycat.core.cancellation import CancelToken, ToolCancelled, cancel_scope
+from huskycat.core.parallel_executor import ToolStatus
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "killpg"), reason="process groups are POSIX only"
+)
+
+
+def test_tool_class():
+    assert tool_class(["/usr/bin/ruff", "check"]) == "ruff"
+    assert tool_class(["podman", "run", "img"]) == "container"
+    assert tool_class(["docker", "run", "img"]) == "container"
+
+
+class TestRunCommand:
+    def test_streams_stdout_lines(self):
+        lines = []
+        result = asyncio.run(run_command(["printf", "a\\nb\\n"], on_line=lines.append))
+        assert lines == ["a", "b"]
+        assert (result.returncode, result.stdout) == (0, b"a\nb\n")
+
+    def test_stdin_and_stderr(self):
+        result = asyncio.run(
+            run_command(["sh", "-c", "cat; echo err >&2; exit 3"], input=b"data")
+        )
+        assert (result.returncode, result.stdout, result.stderr) == (
+            3,
+            b"data",
+            b"err\n",
+        )
+
+    def test_timeout(self):
+        start = time.monotonic()
+        with pytest.raises(subprocess.TimeoutExpired):
+            asyncio.run(run_command(["sleep", "30"], timeout=0.3))
+        assert time.monotonic() - start < 5
+
+    def test_token_deadline(self):
+        with pytest.raises(ToolCancelled, match="Deadline exceeded"):
+            asyncio.run(
+                run_command(["sleep", "30"], timeout=30, token=CancelToken(0.3))
+            )
+
+    def test_tool_class_limit(self, monkeypatch):
+        """At most CLASS_LIMITS processes of one class run at once."""
+        monkeypatch.setitem(async_executor.CLASS_LIMITS, "sleep", 1)
+
+        async def both():
+            start = time.monotonic()
+            await asyncio.gather(
+                run_command(["sleep", "0.3"]), run_command(["sleep", "0.3"])
+            )
+            return time.monotonic() - start
+
+        assert asyncio.run(both()) >= 0.6
+
+
+class TestSyncFacade:
+    def test_text_and_check(self):
+        result = run_command_sync(
+            ["cat"], input="héllo\r\n", capture_output=True, text=True, timeout=30
+        )
+        assert result.stdout == "héllo\n"
+        with pytest.raises(subprocess.CalledProcessError):
+            run_command_sync(["false"], check=True)
+
+    def test_missing_command(self):
+        with pytest.raises(FileNotFoundError):
+            run_command_sync(["huskycat-no-such-tool"])
+
+    def test_cancel_token_of_calling_thread(self):
+        with cancel_scope(CancelToken(timeout=0.3)):
+            with pytest.raises(ToolCancelled):
+                run_command_sync(["sleep", "30"], capture_output=True)
+
+    def test_run_tool_process_follows_flag(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            async_executor, "run_command_sync", lambda cmd, **kw: calls.append(cmd)
+        )
+        run_tool_process([sys.executable, "-c", "pass"])
+        assert calls == []
+
+        async_executor.enable_async_processes()
+        try:
+            run_tool_process(["true"])
+        finally:
+            async_executor.enable_async_processes(False)
+        assert calls == [["true"]]
+
+
+class TestAsyncExecutor:
+    def test_dependencies_and_results(self):
+        order = []
+
+        def tool(name, code):
+            async def run():
+                order.append(name)
+                result = await run_command(["sh", "-c", f"exit {code}"])
+                return result.returncode == 0
+
+            return run
+
+        executor = AsyncExecutor(
+            tool_dependencies={"black": [], "flake8": ["black"], "bandit": []}
+        )
+        results = executor.execute_tools(
+            {"black": tool("black", 0), "flake8": tool("flake8", 0)}
+        )
+
+        assert order == ["black", "flake8"]
+        assert [r.status for r in results] == [ToolStatus.SUCCESS] * 2
+
+    def test_failed_dependency_skips(self):
+        async def failing():
+            return False
+
+        async def after():
+            return True
+
+        executor = AsyncExecutor(tool_dependencies={"a": [], "b": ["a"]})
+        results = {
+            r.tool_name: r for r in executor.execute_tools({"a": failing, "b": after})
+        }
+
+        assert results["a"].status == ToolStatus.FAILED
+        assert results["b"].status == ToolStatus.SKIPPED
+
+    def test_timeout_kills_tool(self):
+        async def hung():
+            await run_command(["sleep", "30"])
+            return True
+
+        executor = AsyncExecutor(tool_dependencies={"hung": []}, timeout_per_tool=0.3)
+        start = time.time()
+        results = executor.execute_tools({"hung": hung})
+
+        assert time.time() - start < 5
+        assert results[0].status == ToolStatus.TIMEOUT
+
+    def test_fail_fast_cancels_running_tools(self):
+        async def failing():
+            await asyncio.sleep(0.2)
+            return False
+
+        async def slow():
+            await asyncio.sleep(30)
+            return True
+
+        executor = AsyncExecutor(
+            tool_dependencies={"failing": [], "slow": []},
+            fail_fast=True,
+            max_workers=2,
+            timeout_per_tool=30,
+        )
+        start = time.time()
+        results = {
+            r.tool_name: r
+            for r in executor.execute_tools({"failing": failing, "slow": slow})
+        }
+
+        assert time.time() - start < 5
+        assert results["failing"].status == ToolStatus.FAILED
+        assert results["slow"].status == ToolStatus.CANCELLED
+
+    def test_max_workers_bounds_running_tools(self):
+        running = []
+        peak = []
+
+        async def tool():
+            running.append(1)
+            peak.append(len(running))
+            await asyncio.sleep(0.05)
+            running.pop()
+            return True
+
+        executor = AsyncExecutor(tool_dependencies={}, max_workers=2)
+        results = executor.execute_tools({f"t{i}": tool for i in range(6)})
+
+        assert len(results) == 6
+        assert max(peak) == 2
@@ -0,0 +1,125 @@
+"""Tests for cancel tokens and cancellable tool processes."""
+
+import os
+import subprocess
+import threading
+import time
+
+import pytest
+
+from huskycat.core.cancellation import (
+    CancelToken,
+    ToolCancelled,
+    cancel_scope,
+    current_token,
+    run_process,
+)
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "killpg"), reason="process groups are POSIX only"
+)
+
+# Prints the PID of a background grandchild, then waits on it
+SPAWNS_GRANDCHILD = ["sh", "-c", "sleep 30 & echo $!; wait"]
+
+
+def _alive(pid: int) -> bool:
+    """Whether a process exists and is not a zombie"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except OSError:
+        return False
+
+
+def _wait_dead(pid: int, seconds: float = 5.0) -> bool:
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        if not _alive(pid):
+            return True
+        time.sleep(0.05)
+    return False
+
+
+class TestCancelToken:
+    def test_cancel_reaches_children(self):
+        parent = CancelToken()
+        child = parent.child(timeout=60)
+        parent.cancel("stop")
+        assert child.cancelled
+        with pytest.raises(ToolCancelled, match="stop"):
+            child.check()
+
+    def test_child_of_cancelled_parent_starts_cancelled(self):
+        parent = CancelToken()
+        parent.cancel("stop")
+        assert parent.child().cancelled
+
+    def test_deadline_caps_timeouts(self):
+        token = CancelToken(timeout=60).child(timeout=1)
+        assert token.timeout(30) <= 1
+        assert token.timeout(None) <= 1
+        assert CancelToken().timeout(30) == 30
+
+    def test_expiry(self):
+        token = CancelToken(timeout=0)
+        assert token.expired
+        assert token.cancelled
+        assert token.describe() == "Deadline exceeded"
+
+    def test_scope(self):
+        token = CancelToken()
+        assert current_token() is None
+        with cancel_scope(token):
+            assert current_token() is token
+        assert current_token() is None
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc"), reason="needs /proc")
+class TestRunProcess:
+    def test_without_token_is_subprocess_run(self):
+        result = run_process(["echo", "hi"], capture_output=True, text=True)
+        assert (result.returncode, result.stdout) == (0, "hi\n")
+
+    def test_with_token_returns_output(self):
+        with cancel_scope(CancelToken(timeout=30)):
+            result = run_process(["cat"], input="data", capture_output=True, text=True)
+        assert (result.returncode, result.stdout) == (0, "data")
+
+    def test_check(self):
+        with cancel_scope(CancelToken()):
+            with pytest.raises(subprocess.CalledProcessError):
+                run_process(["false"], check=True)
+
+    def test_timeout_kills_process_group(self):
+        start = time.monotonic()
+        with cancel_scope(CancelToken()):
+            with pytest.raises(subprocess.TimeoutExpired) as info:
+                run_process(SPAWNS_GRANDCHILD, capture_output=True, timeout=0.5)
+        assert time.monotonic() - start < 5
+        assert _wait_dead(int(info.value.stdout))
+
+    def test_deadline_kills_process_group(self):
+        with cancel_scope(CancelToken(timeout=0.5)):
+            with pytest.raises(ToolCancelled) as info:
+                run_process(SPAWNS_GRANDCHILD, capture_output=True, timeout=30)
+        assert "Deadline exceeded" in str(info.value)
+
+    def test_cancel_from_other_thread(self):
+        token = CancelToken()
+        timer = threading.Timer(0.3, token.cancel, ["Cancelled due to fail-fast mode"])
+        start = time.monotonic()
+        timer.start()
+        with cancel_scope(token):
+            with pytest.raises(ToolCancelled, match="fail-fast"):
+                run_process(["sleep", "30"], capture_output=True)
+        assert time.monotonic() - start < 5
+
+    def test_cancelled_token_starts_nothing(self, tmp_path):
+        token = CancelToken()
+        token.cancel()
+        marker = tmp_path / "ran"
+        with cancel_scope(token):
+            with pytest.raises(ToolCancelled):
+                run_process(["touch", str(marker)])
+        assert not marker.exists()
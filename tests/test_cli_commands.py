@@ -135,6 +135,72 @@ class TestValidateCommand:
         assert "ruff" in tools
 
 
+class TestValidateSinceLastPass:
+    """Test validate --since-last-pass."""
+
+    @pytest.fixture
+    def repo(self, tmp_path, monkeypatch):
+        import subprocess
+
+        monkeypatch.chdir(tmp_path)
+        for args in (
+            ["init", "-q"],
+            ["config", "user.email", "dev@example.com"],
+            ["config", "user.name", "dev"],
+        ):
+            subprocess.run(["git", *args], check=True)
+        (tmp_path / "a.py").write_text("x = 1\n")
+        (tmp_path / "b.py").write_text("y = 2\n")
+        subprocess.run(["git", "add", "."], check=True)
+        subprocess.run(["git", "commit", "-qm", "init"], check=True)
+        return tmp_path
+
+    def run(self, fingerprint="fp", results=None):
+        """Run the command, returning the files it was asked to validate"""
+        from huskycat.commands.validate import ValidateCommand
+        from huskycat.unified_validation import ValidationEngine
+
+        with patch.object(
+            ValidationEngine, "fingerprint", return_value=fingerprint
+        ), patch.object(
+            ValidationEngine, "validate_files", return_value=results or {}
+        ) as validate_files:
+            result = ValidateCommand().execute(since_last_pass=True)
+        if not validate_files.called:
+            return result, []
+        return result, sorted(p.name for p in validate_files.call_args[0][0])
+
+    def test_first_run_validates_everything(self, repo):
+        _, files = self.run()
+        assert files == ["a.py", "b.py"]
+
+    def test_only_changes_since_pass_are_validated(self, repo):
+        self.run()
+        (repo / "a.py").write_text("x = 10\n")
+        (repo / "c.py").write_text("z = 3\n")
+        _, files = self.run()
+        assert files == ["a.py", "c.py"]
+
+    def test_nothing_changed(self, repo):
+        self.run()
+        result, files = self.run()
+        assert result.message == "No files to validate"
+
+    def test_failed_run_is_not_recorded(self, repo):
+        from huskycat.validators.base import ValidationResult
+
+        failing = {"a.py": [ValidationResult("ruff", "a.py", False, errors=["E1"])]}
+        result, _ = self.run(results=failing)
+        assert result.status == CommandStatus.FAILED
+        _, files = self.run()
+        assert files == ["a.py", "b.py"]
+
+    def test_fingerprint_change_validates_everything(self, repo):
+        self.run()
+        _, files = self.run(fingerprint="other")
+        assert files == ["a.py", "b.py"]
+
+
 class TestCleanCommand:
     """Test CleanCommand."""
 
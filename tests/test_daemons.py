@@ -0,0 +1,185 @@
+"""Tests for warm tool daemons and the mypy daemon route."""
+
+import shutil
+import subprocess
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+from huskycat.unified_validation import ValidationEngine
+from huskycat.validators import daemons
+from huskycat.validators.daemons import DmypyDaemon, get_daemon
+from huskycat.validators.mypy import MypyValidator
+
+
+class FakeDmypy(DmypyDaemon):
+    """dmypy daemon recording client commands instead of running them"""
+
+    def __init__(self, root: Path, returncodes: List[int], healthy: bool = True):
+        super().__init__(root)
+        self.returncodes = returncodes
+        self.healthy = healthy
+        self.commands: List[List[str]] = []
+
+    def _client(self, cmd, timeout):
+        self.commands.append(cmd)
+        action = cmd[3]
+        if action == "status":
+            returncode = 0 if self.healthy else 2
+        elif action == "run":
+            returncode = self.returncodes.pop(0)
+        else:
+            returncode = 0
+        return subprocess.CompletedProcess(cmd, returncode, "", "")
+
+    def actions(self) -> List[str]:
+        return [cmd[3] for cmd in self.commands]
+
+
+@pytest.fixture
+def enabled(monkeypatch):
+    monkeypatch.setenv("HUSKYCAT_DAEMONS", "1")
+    monkeypatch.setattr(daemons, "_daemons", {})
+
+
+class TestToolDaemon:
+    def test_run_command(self, tmp_path):
+        daemon = FakeDmypy(tmp_path, [0])
+        daemon.run(["--no-error-summary", "a.py"])
+        assert daemon.commands[-1] == [
+            "dmypy",
+            "--status-file",
+            str(tmp_path / ".huskycat" / "daemons" / "dmypy.json"),
+            "run",
+            "--timeout",
+            str(daemons.DEFAULT_IDLE_TIMEOUT),
+            "--",
+            "--no-error-summary",
+            "a.py",
+        ]
+
+    def test_type_errors_are_not_failures(self, tmp_path):
+        daemon = FakeDmypy(tmp_path, [1])
+        assert daemon.run(["a.py"]).returncode == 1
+        assert daemon.actions() == ["run"]
+
+    def test_unhealthy_daemon_is_restarted_once(self, tmp_path):
+        daemon = FakeDmypy(tmp_path, [2, 0], healthy=False)
+        assert daemon.run(["a.py"]).returncode == 0
+        assert daemon.actions() == ["run", "status", "kill", "run"]
+
+    def test_fatal_errors_keep_a_healthy_daemon(self, tmp_path):
+        daemon = FakeDmypy(tmp_path, [2])
+        assert daemon.run(["a.py"]).returncode == 2
+        assert daemon.actions() == ["run", "status"]
+
+    def test_config_change_restarts(self, tmp_path):
+        FakeDmypy(tmp_path, [0]).run(["a.py"])
+
+        # Same config in a later process: the daemon is reused
+        daemon = FakeDmypy(tmp_path, [0])
+        daemon.run(["a.py"])
+        assert daemon.actions() == ["run"]
+
+        (tmp_path / "mypy.ini").write_text("[mypy]\nstrict = True\n")
+        daemon = FakeDmypy(tmp_path, [0, 0])
+        daemon.run(["a.py"])
+        daemon.run(["a.py"])
+        assert daemon.actions() == ["kill", "run", "run"]
+
+
+class TestGetDaemon:
+    def test_disabled(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("HUSKYCAT_DAEMONS", "0")
+        assert get_daemon("mypy", tmp_path) is None
+
+    def test_tool_without_server_mode(self, enabled, tmp_path):
+        assert get_daemon("flake8", tmp_path) is None
+
+    def test_missing_client(self, enabled, tmp_path):
+        with patch("huskycat.validators.daemons.shutil.which", return_value=None):
+            assert get_daemon("mypy", tmp_path) is None
+
+    def test_shared_per_repository(self, enabled, tmp_path):
+        with patch("huskycat.validators.daemons.shutil.which", return_value="dmypy"):
+            daemon = get_daemon("mypy", tmp_path)
+            assert get_daemon("mypy", tmp_path) is daemon
+        assert daemon.root == tmp_path.resolve()
+
+
+class TestMypyDaemonRoute:
+    def test_files_go_to_the_daemon_in_one_request(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        daemon = FakeDmypy(tmp_path, [1])
+        daemon.run = lambda args, timeout=60: subprocess.CompletedProcess(
+            args,
+            1,
+            "dep.py:1: error: Bad import\nb.py:2: error: Incompatible types\n",
+            "",
+        )
+        validator = MypyValidator()
+        with patch.object(MypyValidator, "_daemon", return_value=daemon):
+            assert validator.single_batch
+            results = validator.validate_batch([Path("a.py"), Path("b.py")])
+
+        assert [r.success for r in results] == [True, False]
+        assert results[1].errors == ["b.py:2: error: Incompatible types"]
+
+    def cold_run(self, validator, daemon, files):
+        """Validate files with the daemon, answering cold mypy runs itself"""
+        cold = subprocess.CompletedProcess(
+            [], 1, f"{files[0]}:1: error: Syntax error\n", ""
+        )
+        with patch.object(MypyValidator, "_daemon", return_value=daemon), patch.object(
+            MypyValidator, "_execute_command", return_value=cold
+        ) as execute:
+            results = validator.validate_batch(files)
+        return results, execute
+
+    def test_fatal_daemon_error_falls_back_to_one_cold_run(self, tmp_path):
+        daemon = FakeDmypy(tmp_path, [2])
+        files = [tmp_path / "a.py"]
+        results, execute = self.cold_run(MypyValidator(), daemon, files)
+
+        assert daemon.actions().count("run") == 1
+        assert execute.call_count == 1
+        assert execute.call_args[0][0][0] == "mypy"
+        assert [r.success for r in results] == [False]
+
+    def test_file_outside_root_skips_the_daemon(self, tmp_path):
+        daemon = FakeDmypy(tmp_path / "repo", [])
+        files = [tmp_path / "scratch" / "a.py"]
+        results, execute = self.cold_run(MypyValidator(), daemon, files)
+
+        assert daemon.commands == []
+        assert execute.call_count == 1
+        assert [r.success for r in results] == [False]
+
+    def test_engine_does_not_split_daemon_work(self):
+        engine = ValidationEngine(max_workers=4, use_cache=False)
+        files = [Path(f"f{i}.py") for i in range(10)]
+        validator = MypyValidator()
+        with patch.object(MypyValidator, "_daemon", return_value=object()):
+            assert engine._split_work(validator, files) == [files]
+
+    @pytest.mark.skipif(shutil.which("dmypy") is None, reason="dmypy not installed")
+    def test_real_daemon(self, enabled, tmp_path, monkeypatch):
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        (tmp_path / "a.py").write_text('x: int = "a"\n')
+        (tmp_path / "b.py").write_text("import a\ny: str = a.x\n")
+        monkeypatch.chdir(tmp_path)
+
+        validator = MypyValidator()
+        try:
+            first = validator.validate(Path("b.py"))
+            second = validator.validate(Path("b.py"))
+            assert get_daemon("mypy").is_healthy()
+        finally:
+            daemons.stop_daemons()
+
+        for result in (first, second):
+            assert not result.success
+            assert len(result.errors) == 1
+            assert result.errors[0].startswith("b.py:2:")
@@ -0,0 +1,119 @@
+"""Tests for the precompiled file to validator dispatcher."""
+
+from pathlib import Path
+from typing import Set
+
+import pytest
+
+from huskycat.core.dispatch import ValidatorDispatcher
+from huskycat.linters.dockerlint_validator import DockerLintValidator
+from huskycat.validators import (
+    AnsibleLintValidator,
+    GitLabCIValidator,
+    HadolintValidator,
+    RuffValidator,
+    YamlLintValidator,
+)
+from huskycat.validators.base import DispatchRule, ValidationResult, Validator
+
+
+class CustomValidator(Validator):
+    """Validator that overrides can_handle() directly"""
+
+    @property
+    def name(self) -> str:
+        return "custom"
+
+    @property
+    def extensions(self) -> Set[str]:
+        return set()
+
+    def can_handle(self, filepath: Path) -> bool:
+        return filepath.name == "Makefile"
+
+    def validate(self, filepath: Path) -> ValidationResult:
+        return ValidationResult(self.name, str(filepath), True)
+
+
+@pytest.fixture
+def validators():
+    return [
+        RuffValidator(),
+        YamlLintValidator(),
+        AnsibleLintValidator(),
+        GitLabCIValidator(),
+        HadolintValidator(),
+        DockerLintValidator(),
+        CustomValidator(),
+    ]
+
+
+PATHS = [
+    "src/app.py",
+    "config.yml",
+    "ansible/roles/web/tasks/main.yml",
+    "deploy/Site.YAML",
+    "my_playbook_dir/vars.yml",
+    ".gitlab-ci.yml",
+    "x/.gitlab/ci/build.yaml",
+    "x/.gitlab/ci/notes.txt",
+    "Dockerfile",
+    "images/api.dockerfile",
+    "ContainerFile",
+    "Makefile",
+    "README",
+]
+
+
+class TestDispatchRule:
+    def test_all_conditions_must_hold(self):
+        rule = DispatchRule(dir_pattern=r"\.gitlab/ci", name_pattern=r"\.ya?ml$")
+        assert rule.matches(Path("a/.gitlab/ci/b.yml"))
+        assert not rule.matches(Path("a/.gitlab/ci/b.txt"))
+        assert not rule.matches(Path("a/b.yml"))
+
+    def test_default_rules_follow_extensions(self):
+        ruff = RuffValidator()
+        assert ruff.dispatch_rules == (
+            DispatchRule(suffixes=frozenset(ruff.extensions)),
+        )
+        assert GitLabCIValidator().extensions == set()
+
+
+class TestValidatorDispatcher:
+    @pytest.mark.parametrize("path", PATHS)
+    def test_matches_can_handle(self, validators, path):
+        dispatcher = ValidatorDispatcher(validators)
+        filepath = Path(path)
+        expected = {i for i, v in enumerate(validators) if v.can_handle(filepath)}
+        assert dispatcher.handled(filepath) == expected
+
+    def test_extension_matches_come_first(self, validators):
+        dispatcher = ValidatorDispatcher(validators)
+        filepath = Path("ansible/roles/x/main.yml")
+        names = [v.name for v in dispatcher.validators_for(filepath)]
+        assert names == ["yamllint", "ansible-lint"]
+
+    def test_custom_can_handle_is_consulted(self, validators):
+        dispatcher = ValidatorDispatcher(validators)
+        assert [v.name for v in dispatcher.validators_for(Path("Makefile"))] == [
+            "custom"
+        ]
+
+    def test_directory_patterns_are_memoized(self, validators):
+        dispatcher = ValidatorDispatcher(validators)
+        dispatcher.handled(Path("roles/web/a.yml"))
+        dispatcher.handled(Path("roles/web/b.yml"))
+        assert list(dispatcher._dir_memo) == ["roles/web/"]
+
+    def test_handles_unknown_validator(self, validators):
+        dispatcher = ValidatorDispatcher(validators[:1])
+        assert dispatcher.handles(validators[3], Path(".gitlab-ci.yml"))
+        assert not dispatcher.handles(validators[0], Path("x.yml"))
+
+    def test_extension_map(self, validators):
+        dispatcher = ValidatorDispatcher(validators)
+        extension_map = dispatcher.extension_map()
+        assert [v.name for v in extension_map[".py"]] == ["ruff"]
+        for ext, mapped in extension_map.items():
+            assert mapped == dispatcher.validators_for(Path(f"x{ext}"))[: len(mapped)]
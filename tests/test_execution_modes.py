@@ -141,13 +141,12 @@ class TestBundledToolPathResolution:
         validator = BlackValidator()
 
         bundled_dir = Path.home() / ".huskycat" / "tools"
-        tool_path = bundled_dir / "python-black"
+        tool_path = bundled_dir / "black"
 
         with mock.patch.object(Path, "exists", side_effect=lambda: True):
             result = validator._get_bundled_tool_path()
             # Should return path to bundled tool
-            assert result is not None
-            assert "python-black" in str(result)
+            assert result == tool_path
 
     def test_get_bundled_tool_path_not_exists(self):
         """Test resolving bundled tool path when directory doesn't exist."""
@@ -267,7 +266,7 @@ class TestExecutionModeLogging:
             validator._log_execution_mode("bundled")
 
             assert "bundled" in caplog.text
-            assert "python-black" in caplog.text
+            assert "black" in caplog.text
 
     def test_log_local_mode(self, caplog):
         """Test logging for local mode."""
@@ -34,7 +34,7 @@ class TestBundledToolExecution:
             result = validator._get_bundled_tool_path()
 
             assert result is not None
-            assert "python-black" in str(result)
+            assert result.name == "black"
             assert ".huskycat" in str(result)
 
     def test_bundled_tool_path_directory_not_exists(self):
@@ -0,0 +1,148 @@
+"""Tests for the ignore-aware directory walker."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from huskycat.core.file_walker import ExcludeMatcher, FileWalker, IgnoreRules
+from huskycat.unified_validation import ValidationEngine
+
+
+def make_tree(root: Path, files):
+    for name in files:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x = 1\n")
+
+
+def walked(walker):
+    return sorted(p.relative_to(walker.root).as_posix() for p in walker)
+
+
+class TestIgnoreRules:
+    @pytest.mark.parametrize(
+        "pattern,path,is_dir,expected",
+        [
+            ("*.pyc", "a/b/c.pyc", False, True),
+            ("/build", "build", True, True),
+            ("/build", "src/build", True, None),
+            ("docs/", "docs", True, True),
+            ("docs/", "docs", False, None),
+            ("src/**/gen_*.py", "src/a/b/gen_x.py", False, True),
+            ("**/fixtures", "tests/unit/fixtures", True, True),
+            ("file[0-9].txt", "file7.txt", False, True),
+            ("# comment", "# comment", False, None),
+        ],
+    )
+    def test_match(self, pattern, path, is_dir, expected):
+        assert IgnoreRules([pattern]).match(path, is_dir) is expected
+
+    def test_negation_last_rule_wins(self):
+        rules = IgnoreRules(["*.log", "!keep.log"])
+        assert rules.match("debug.log", False) is True
+        assert rules.match("keep.log", False) is False
+
+    def test_base_scopes_rules(self):
+        rules = IgnoreRules(["*.tmp"], base="sub")
+        assert rules.match("sub/x.tmp", False) is True
+        assert rules.match("x.tmp", False) is None
+
+
+class TestExcludeMatcher:
+    def test_plain_strings_are_substrings(self):
+        matcher = ExcludeMatcher(["vendor"])
+        assert matcher.matches("lib/vendor/x.py", "lib/vendor/x.py")
+        assert not matcher.matches("lib/x.py", "lib/x.py")
+
+    def test_globs(self):
+        matcher = ExcludeMatcher(["*_pb2.py"])
+        assert matcher.matches("proto/a_pb2.py", "proto/a_pb2.py")
+        assert not ExcludeMatcher([])
+
+
+class TestFileWalker:
+    def test_prunes_default_dirs_and_hidden_files(self, tmp_path):
+        make_tree(
+            tmp_path,
+            ["a.py", ".hidden.py", "node_modules/m.js", ".git/x", ".venv/v.py"],
+        )
+        assert walked(FileWalker(tmp_path)) == ["a.py"]
+
+    def test_gitignore_nested_and_negated(self, tmp_path):
+        make_tree(
+            tmp_path,
+            ["a.py", "build/out.py", "pkg/b.py", "pkg/gen.py", "pkg/keep.log", "x.log"],
+        )
+        (tmp_path / ".gitignore").write_text("build/\n*.log\n")
+        (tmp_path / "pkg" / ".gitignore").write_text("gen.py\n!keep.log\n")
+
+        assert walked(FileWalker(tmp_path)) == ["a.py", "pkg/b.py", "pkg/keep.log"]
+        assert len(walked(FileWalker(tmp_path, use_gitignore=False))) == 6
+
+    def test_ignored_dirs_are_never_listed(self, tmp_path):
+        make_tree(tmp_path, ["a.py", "build/out.py"])
+        (tmp_path / ".gitignore").write_text("build/\n")
+
+        with patch("huskycat.core.file_walker.os.scandir", wraps=os.scandir) as scan:
+            list(FileWalker(tmp_path))
+        assert all("build" not in str(call.args[0]) for call in scan.call_args_list)
+
+    def test_parent_gitignore_applies_to_subdirectory(self, tmp_path):
+        (tmp_path / ".git").mkdir()
+        make_tree(tmp_path, ["src/a.py", "src/gen/b.py", "src/c.tmp"])
+        (tmp_path / ".gitignore").write_text("/src/gen/\n*.tmp\n")
+
+        assert walked(FileWalker(tmp_path / "src")) == ["a.py"]
+
+    def test_ignore_and_exclude_patterns(self, tmp_path):
+        make_tree(tmp_path, ["a.py", "migrations/m.py", "proto/p_pb2.py"])
+        walker = FileWalker(
+            tmp_path,
+            ignore_patterns=["/migrations/"],
+            exclude_patterns=["*_pb2.py"],
+            ignore_base=tmp_path,
+        )
+        assert walked(walker) == ["a.py"]
+
+    def test_configured_ignores_beat_gitignore_negation(self, tmp_path):
+        make_tree(tmp_path, ["a.py", "b.py"])
+        (tmp_path / ".gitignore").write_text("!b.py\n")
+        walker = FileWalker(tmp_path, ignore_patterns=["b.py"], ignore_base=tmp_path)
+        assert walked(walker) == ["a.py"]
+
+    def test_non_recursive(self, tmp_path):
+        make_tree(tmp_path, ["a.py", "sub/b.py"])
+        assert walked(FileWalker(tmp_path, recursive=False)) == ["a.py"]
+
+    def test_yields_lazily(self, tmp_path):
+        make_tree(tmp_path, ["a.py", "sub/b.py"])
+        walker = iter(FileWalker(tmp_path))
+        assert next(walker) == tmp_path / "a.py"
+
+
+class TestEngineIntegration:
+    def test_validate_directory_skips_gitignored(self, tmp_path):
+        make_tree(tmp_path, ["a.py", "build/out.py"])
+        (tmp_path / ".gitignore").write_text("build/\n")
+        engine = ValidationEngine(use_cache=False, max_workers=1)
+
+        with patch.object(engine, "validate_files", return_value={}) as mock_files:
+            engine.validate_directory(tmp_path)
+
+        assert mock_files.call_args[0][0] == [tmp_path / "a.py"]
+
+    def test_tool_exclude_drops_validator(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".huskycat.yaml").write_text(
+            "tools:\n  python:\n    tools: [ruff]\n    exclude: ['legacy/']\n"
+        )
+        make_tree(tmp_path, ["legacy/old.py", "new.py"])
+        engine = ValidationEngine(use_cache=False)
+        ruff = next((v for v in engine.validators if v.name == "ruff"), None)
+        if ruff is None:
+            pytest.skip("ruff not available")
+
+        assert ruff not in engine.get_validators_for_file(Path("legacy/old.py"))
+        assert ruff in engine.get_validators_for_file(Path("new.py"))
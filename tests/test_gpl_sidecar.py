@@ -32,11 +32,14 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 try:
     from huskycat.core.gpl_client import (
         DEFAULT_SOCKET_PATH,
+        FRAMING_LEGACY,
+        FRAMING_LENGTH_PREFIXED,
         GPLSidecarClient,
         GPLSidecarConnectionError,
         GPLSidecarError,
         GPLSidecarTimeoutError,
         GPLToolResult,
+        _Connection,
         execute_gpl_tool,
         get_default_client,
         is_sidecar_available,
@@ -372,6 +375,742 @@ class TestGPLToolResult:
         assert "Error" in result.stderr
 
 
+SIDECAR_SCRIPT = Path(__file__).parent.parent / "gpl-sidecar" / "server.py"
+
+
+def start_sidecar(socket_path: str) -> subprocess.Popen:
+    """Run gpl-sidecar/server.py and wait until it listens."""
+    proc = subprocess.Popen(
+        [sys.executable, str(SIDECAR_SCRIPT), "--socket", socket_path],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    for _ in range(100):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(socket_path)
+            break
+        except OSError:
+            time.sleep(0.05)
+        finally:
+            probe.close()
+    return proc
+
+
+def stop_sidecar(proc: subprocess.Popen):
+    proc.terminate()
+    proc.wait(timeout=5)
+
+
+@pytest.mark.skipif(not HAS_GPL_CLIENT, reason="GPL client not available")
+class TestPersistentConnection:
+    """Test the negotiated length-prefixed framing against the real server."""
+
+    @pytest.fixture
+    def sidecar(self, temp_socket_path):
+        proc = start_sidecar(temp_socket_path)
+        yield temp_socket_path
+        stop_sidecar(proc)
+
+    def test_negotiates_and_reuses_connection(self, sidecar):
+        client = GPLSidecarClient(socket_path=sidecar)
+        assert client.health_check() is True
+        assert client.framing == FRAMING_LENGTH_PREFIXED
+
+        connection = client._connection
+        assert isinstance(client.list_tools(), dict)
+        result = client.execute("shellcheck", ["--version"], cwd="/")
+        assert isinstance(result, GPLToolResult)
+        assert client._connection is connection
+        client.close()
+
+    def test_pipelined_requests_from_threads(self, sidecar):
+        client = GPLSidecarClient(socket_path=sidecar)
+        results = []
+
+        def check():
+            results.append(client.health_check())
+
+        threads = [threading.Thread(target=check) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [True] * 16
+        client.close()
+
+    def test_negotiation_counts_against_the_timeout(self):
+        client = GPLSidecarClient(socket_path="unused.sock")
+
+        def slow_negotiate(timeout):
+            time.sleep(0.3)
+            client.framing = FRAMING_LENGTH_PREFIXED
+            return client.framing
+
+        with patch.object(
+            client, "_negotiate", side_effect=slow_negotiate
+        ), patch.object(client, "_send_framed", return_value={"result": {}}) as send:
+            client._exchange({"id": 1}, timeout=1.0)
+        assert send.call_args[0][1] <= 0.7
+
+        with patch.object(
+            client, "_negotiate", side_effect=lambda timeout: time.sleep(0.2)
+        ), pytest.raises(GPLSidecarTimeoutError):
+            client._exchange({"id": 2}, timeout=0.1)
+
+    def test_reconnects_after_sidecar_restart(self, temp_socket_path):
+        proc = start_sidecar(temp_socket_path)
+        client = GPLSidecarClient(socket_path=temp_socket_path)
+        try:
+            assert client.health_check() is True
+            stop_sidecar(proc)
+            proc = start_sidecar(temp_socket_path)
+            assert client.health_check() is True
+        finally:
+            client.close()
+            stop_sidecar(proc)
+
+    def test_legacy_server_fallback(self, mock_server, temp_socket_path):
+        """Sidecars without negotiation keep getting one request per connection."""
+        client = GPLSidecarClient(socket_path=temp_socket_path)
+        assert client.execute("shellcheck", ["a.sh"]).success is True
+        assert client.framing == FRAMING_LEGACY
+        assert mock_server.received_requests[0]["method"] == "negotiate"
+        assert client.execute("shellcheck", ["b.sh"]).success is True
+
+    def test_legacy_framing_against_new_server(self, sidecar):
+        client = GPLSidecarClient(socket_path=sidecar, framing=FRAMING_LEGACY)
+        assert client.health_check() is True
+        assert client._connection is None
+
+
+def load_sidecar_module():
+    """Import gpl-sidecar/server.py (not a package) as a module."""
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location("gpl_sidecar_server", SIDECAR_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.skipif(not HAS_GPL_CLIENT, reason="GPL client not available")
+class TestBatchRequests:
+    """Test JSON-RPC 2.0 batches and execute_many against the real server."""
+
+    @pytest.fixture
+    def sidecar(self, temp_socket_path):
+        proc = start_sidecar(temp_socket_path)
+        yield temp_socket_path
+        stop_sidecar(proc)
+
+    @pytest.mark.parametrize("framing", [FRAMING_LENGTH_PREFIXED, FRAMING_LEGACY])
+    def test_batch_responses_in_request_order(self, sidecar, framing):
+        client = GPLSidecarClient(socket_path=sidecar, framing=framing)
+        responses = client._send_batch(
+            [("health", None), ("no_such_method", None), ("list_tools", None)]
+        )
+        client.close()
+
+        assert responses[0]["result"]["status"] == "healthy"
+        assert responses[1]["error"]["code"] == -32601
+        assert "tools" in responses[2]["result"]
+
+    def test_execute_batch(self, sidecar):
+        client = GPLSidecarClient(socket_path=sidecar)
+        results = client.execute_batch(
+            [("shellcheck", ["--version"]), ("not-a-tool", [])], cwd="/"
+        )
+        client.close()
+
+        assert [r.tool for r in results] == ["shellcheck", "not-a-tool"]
+        assert results[1].success is False
+        assert "Unsupported tool" in results[1].stderr
+
+    def test_invalid_batches(self, sidecar):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(sidecar)
+        sock.sendall(b"[]")
+        sock.shutdown(socket.SHUT_WR)
+        response = json.loads(sock.recv(65536).decode("utf-8"))
+        sock.close()
+        assert response["error"]["code"] == -32600
+
+    def test_execute_many_rejects_unsplittable_tools(self, sidecar):
+        client = GPLSidecarClient(socket_path=sidecar)
+        with pytest.raises(GPLSidecarError, match="Cannot split"):
+            client.execute_many("not-a-tool", ["a.sh"], cwd="/")
+        with pytest.raises(GPLSidecarError, match="non-empty"):
+            client.execute_many("shellcheck", [], cwd="/")
+        client.close()
+
+
+class TestExecuteManySplit:
+    """Test how the server splits one tool run's output per file."""
+
+    @pytest.fixture
+    def executor(self):
+        module = load_sidecar_module()
+        with patch.object(module.os.path, "exists", return_value=True):
+            yield module
+
+    def run(self, module, tool, files, returncode, stdout, on_output=None):
+        def run_streamed(cmd, cwd, on_output, timeout, stdin=None, cancelled=None):
+            # Pieces small enough to cut findings apart
+            for start in range(0, len(stdout), 7):
+                on_output("stdout", stdout[start : start + 7])
+            return returncode
+
+        with patch.object(
+            module.GPLToolExecutor, "_run_streamed", side_effect=run_streamed
+        ) as run:
+            result = module.GPLToolExecutor.execute_many(
+                tool, files, [], cwd="/repo", on_output=on_output
+            )
+        return run.call_args[0][0], {f["file"]: f for f in result["files"]}
+
+    def test_shellcheck(self, executor):
+        comments = [{"file": "/repo/b.sh", "line": 2, "level": "error", "message": "x"}]
+        cmd, files = self.run(
+            executor,
+            "shellcheck",
+            ["a.sh", "b.sh"],
+            1,
+            json.dumps({"comments": comments}),
+        )
+
+        assert cmd[1:3] == ["-f", "json1"]
+        assert files["a.sh"] == {"file": "a.sh", "exit_code": 0, "stdout": ""}
+        assert files["b.sh"]["exit_code"] == 1
+        assert json.loads(files["b.sh"]["stdout"]) == comments
+
+    def test_hadolint(self, executor):
+        findings = [
+            {
+                "file": "Dockerfile",
+                "line": 3,
+                "code": "DL3008",
+                "level": "warning",
+                "message": "Pin versions",
+            },
+        ]
+        _, files = self.run(
+            executor,
+            "hadolint",
+            ["Dockerfile", "api/Dockerfile"],
+            1,
+            json.dumps(findings),
+        )
+
+        assert (
+            files["Dockerfile"]["stdout"]
+            == "Dockerfile:3 DL3008 warning: Pin versions\n"
+        )
+        assert files["api/Dockerfile"]["exit_code"] == 0
+
+    def test_yamllint_warnings_do_not_fail(self, executor):
+        stdout = (
+            "a.yaml:1:1: [error] syntax error (syntax)\n"
+            "./b.yaml:2:81: [warning] line too long (line-length)\n"
+        )
+        _, files = self.run(executor, "yamllint", ["a.yaml", "b.yaml"], 1, stdout)
+
+        assert files["a.yaml"]["exit_code"] == 1
+        assert files["b.yaml"]["exit_code"] == 0
+        assert "line too long" in files["b.yaml"]["stdout"]
+
+    @pytest.mark.parametrize(
+        "returncode,stdout",
+        [
+            (2, ""),  # tool failure
+            (1, ""),  # failure without findings
+            (1, "not json"),
+            (1, json.dumps({"comments": [{"file": "c.sh", "line": 1}]})),
+        ],
+    )
+    def test_unsplittable_output(self, executor, returncode, stdout):
+        with pytest.raises(executor.SplitError):
+            self.run(executor, "shellcheck", ["a.sh", "b.sh"], returncode, stdout)
+
+    @pytest.mark.parametrize(
+        "tool,stdout",
+        [
+            (
+                "shellcheck",
+                json.dumps(
+                    {
+                        "comments": [
+                            {"file": "a", "line": 1, "message": "x"},
+                            {"file": "b", "line": 2, "message": "y"},
+                            {"file": "a", "line": 3, "message": "z"},
+                        ]
+                    }
+                ),
+            ),
+            (
+                "hadolint",
+                json.dumps(
+                    [
+                        {"file": "b", "line": 1, "code": "DL1", "level": "error"},
+                        {"file": "a", "line": 2, "code": "DL2", "level": "info"},
+                    ]
+                ),
+            ),
+            ("yamllint", "a:1:1: [error] x (e)\nb:2:2: [warning] y (w)\na:3:3"),
+        ],
+    )
+    def test_streamed_pieces_join_to_stdout(self, executor, tool, stdout):
+        _, files = self.run(executor, tool, ["a", "b"], 1, stdout)
+        pieces = {"a": [], "b": []}
+        _, streamed = self.run(
+            executor,
+            tool,
+            ["a", "b"],
+            1,
+            stdout,
+            on_output=lambda path, data: pieces[path].append(data),
+        )
+
+        for path in ("a", "b"):
+            assert streamed[path]["stdout"] == ""
+            assert streamed[path]["exit_code"] == files[path]["exit_code"]
+            assert "".join(pieces[path]) == files[path]["stdout"]
+
+    def test_truncated_json(self, executor):
+        stdout = json.dumps({"comments": [{"file": "a.sh", "line": 1}]})[:-5]
+        with pytest.raises(executor.SplitError, match="truncated"):
+            self.run(executor, "shellcheck", ["a.sh"], 1, stdout)
+
+
+class TestWorkerPool:
+    """Test the server's bounded pool of tool workers."""
+
+    @pytest.fixture
+    def server_module(self):
+        return load_sidecar_module()
+
+    def test_runs_tools_concurrently(self, server_module):
+        pool = server_module.WorkerPool(workers=3)
+        barrier = threading.Barrier(3, timeout=5)
+        done = []
+
+        def job():
+            barrier.wait()  # breaks unless all three run at once
+            done.append(True)
+
+        for tool in ("shellcheck", "hadolint", "yamllint"):
+            assert pool.submit(tool, job)
+        deadline = time.time() + 5
+        while len(done) < 3 and time.time() < deadline:
+            time.sleep(0.01)
+        pool.close()
+        assert done == [True] * 3
+
+    def test_tool_limit_does_not_block_other_tools(self, server_module):
+        pool = server_module.WorkerPool(workers=2, tool_limits={"shellcheck": 1})
+        release = threading.Event()
+        started = []
+
+        def job(name, wait):
+            started.append(name)
+            if wait:
+                release.wait(5)
+
+        pool.submit("shellcheck", lambda: job("first", True))
+        pool.submit("shellcheck", lambda: job("second", False))
+        yamllint_ran = threading.Event()
+        pool.submit("yamllint", yamllint_ran.set)
+
+        assert yamllint_ran.wait(5)
+        assert started == ["first"]
+        release.set()
+        deadline = time.time() + 5
+        while len(started) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        pool.close()
+        assert started == ["first", "second"]
+
+    def test_rejects_beyond_queue_size(self, server_module):
+        pool = server_module.WorkerPool(workers=1, queue_size=1)
+        release = threading.Event()
+        assert pool.submit("shellcheck", lambda: release.wait(5))
+        assert pool.submit("shellcheck", lambda: None)
+        assert not pool.submit("hadolint", lambda: None)
+        assert pool.stats()["running"] + pool.stats()["queued"] == 2
+        release.set()
+        pool.close()
+
+
+class BusySidecarServer(MockSidecarServer):
+    """Mock sidecar turning the first execute requests away as busy."""
+
+    def __init__(self, socket_path: str, busy: int):
+        super().__init__(socket_path)
+        self.busy = busy
+
+    def _handle_request(self, request: dict) -> dict:
+        if request.get("method") == "execute" and self.busy:
+            self.busy -= 1
+            return {
+                "jsonrpc": "2.0",
+                "id": request.get("id"),
+                "error": {"code": -32001, "message": "Server busy: queue full"},
+            }
+        return super()._handle_request(request)
+
+
+class TestBackpressure:
+    """Test busy responses when the worker queue is full."""
+
+    def test_busy_response_when_queue_full(self, temp_socket_path):
+        module = load_sidecar_module()
+        server = module.JSONRPCServer(temp_socket_path, module.WorkerPool(1, 0))
+        release = threading.Event()
+        replies = []
+
+        def slow_execute(tool, args, cwd=None, **kwargs):
+            release.wait(5)
+            return {"success": True, "stdout": "", "stderr": "", "exit_code": 0}
+
+        request = {
+            "jsonrpc": "2.0",
+            "method": "execute",
+            "params": {"tool": "hadolint"},
+        }
+        with patch.object(server.executor, "execute", side_effect=slow_execute):
+            server.dispatch(dict(request, id=1), replies.append)
+            server.dispatch(dict(request, id=2), replies.append)
+            # Other methods are still answered while the workers are busy
+            server.dispatch(
+                {"jsonrpc": "2.0", "id": 3, "method": "health"}, replies.append
+            )
+
+            assert replies[0]["id"] == 2
+            assert replies[0]["error"]["code"] == module.SERVER_BUSY
+            pool = replies[1]["result"]["pool"]
+            assert pool["workers"] == 1
+            assert pool["running"] + pool["queued"] == 1
+            release.set()
+            deadline = time.time() + 5
+            while len(replies) < 3 and time.time() < deadline:
+                time.sleep(0.01)
+        server.pool.close()
+        assert replies[2]["id"] == 1
+        assert replies[2]["result"]["success"] is True
+
+    @pytest.mark.skipif(not HAS_GPL_CLIENT, reason="GPL client not available")
+    def test_client_retries_busy_requests(self, temp_socket_path):
+        server = BusySidecarServer(temp_socket_path, busy=2)
+        server.start()
+        try:
+            client = GPLSidecarClient(socket_path=temp_socket_path)
+            result = client.execute("shellcheck", ["a.sh"])
+        finally:
+            server.stop()
+
+        assert result.success is True
+        executes = [r for r in server.received_requests if r["method"] == "execute"]
+        assert len(executes) == 3
+
+    @pytest.mark.skipif(not HAS_GPL_CLIENT, reason="GPL client not available")
+    def test_client_gives_up_at_timeout(self, temp_socket_path):
+        server = BusySidecarServer(temp_socket_path, busy=1000)
+        server.start()
+        try:
+            client = GPLSidecarClient(socket_path=temp_socket_path)
+            result = client.execute("shellcheck", ["a.sh"], timeout_ms=300)
+        finally:
+            server.stop()
+
+        assert result.success is False
+        assert "Server busy" in result.stderr
+
+
+@pytest.fixture
+def client():
+    """Client wired to an in-process server whose shellcheck is Python."""
+    module = load_sidecar_module()
+    server = module.JSONRPCServer("unused.sock", module.WorkerPool(2))
+    server_sock, client_sock = socket.socketpair()
+    threading.Thread(
+        target=server._serve_connection, args=(server_sock,), daemon=True
+    ).start()
+
+    client = GPLSidecarClient(
+        socket_path="unused.sock", framing=FRAMING_LENGTH_PREFIXED
+    )
+    client._connection = _Connection(client_sock)
+    with patch.dict(
+        module.GPLToolExecutor.SUPPORTED_TOOLS, {"shellcheck": sys.executable}
+    ):
+        yield client, module
+    client.close()
+    server.pool.close()
+
+
+@pytest.mark.skipif(not HAS_GPL_CLIENT, reason="GPL client not available")
+class TestStreamedOutput:
+    """Test tool output streamed in pieces instead of one response."""
+
+    # Writes 3 MB to stdout (well past the old 1 MB response cap)
+    LOUD_TOOL = ["-c", "import sys; sys.stdout.write('é' * 1500000); print('done')"]
+
+    def test_output_beyond_one_megabyte(self, client):
+        client, _ = client
+        result = client.execute("shellcheck", self.LOUD_TOOL, cwd="/")
+
+        assert result.success is True
+        assert len(result.stdout) == 1500000 + len("done\n")
+        assert result.stdout.endswith("édone\n")
+
+    def test_on_output_receives_bounded_pieces(self, client):
+        client, module = client
+        pieces = []
+        result = client.execute(
+            "shellcheck",
+            self.LOUD_TOOL,
+            cwd="/",
+            on_output=lambda stream, data: pieces.append((stream, len(data))),
+        )
+
+        assert result.success is True
+        assert result.stdout == ""
+        assert len(pieces) > 1
+        assert max(size for _, size in pieces) <= module.OUTPUT_CHUNK_SIZE
+        assert sum(size for _, size in pieces) == 1500000 + len("done\n")
+
+    def test_execute_many_streams_per_file(self, client):
+        client, module = client
+        # A yamllint printing 2 x 30000 findings, about 2 MB
+        loud_yamllint = [
+            "-c",
+            "import sys\n"
+            "for path in sys.argv[1:]:\n"
+            "    for n in range(30000):\n"
+            "        print(f'{path}:{n + 1}:1: [warning] too long (line-length)')",
+        ]
+        pieces = []
+        with patch.dict(
+            module.GPLToolExecutor.SUPPORTED_TOOLS, {"yamllint": sys.executable}
+        ), patch.dict(
+            module.GPLToolExecutor.SPLIT_FORMATS, {"yamllint": loud_yamllint}
+        ):
+            results = client.execute_many("yamllint", ["a.yaml", "b.yaml"], cwd="/")
+            streamed = client.execute_many(
+                "yamllint",
+                ["a.yaml", "b.yaml"],
+                cwd="/",
+                on_output=lambda path, data: pieces.append((path, data)),
+            )
+
+        assert [r.exit_code for r in results.values()] == [0, 0]
+        assert results["b.yaml"].stdout.count("\n") == 30000
+        assert results["b.yaml"].stdout.startswith("b.yaml:1:1: [warning]")
+        assert all(r.stdout == "" for r in streamed.values())
+        assert len(pieces) > 2
+        for path in ("a.yaml", "b.yaml"):
+            joined = "".join(data for name, data in pieces if name == path)
+            assert joined == results[path].stdout
+
+    @patch("huskycat.core.gpl_client.MAX_COLLECTED_OUTPUT", 1000000)
+    def test_collected_output_is_bounded(self, client):
+        client, _ = client
+
+        result = client.execute("shellcheck", self.LOUD_TOOL, cwd="/")
+        assert result.success is False
+        assert "Output exceeds 1000000 characters" in result.stderr
+
+        pieces = []
+        result = client.execute(
+            "shellcheck",
+            self.LOUD_TOOL,
+            cwd="/",
+            on_output=lambda stream, data: pieces.append(len(data)),
+        )
+        assert result.success is True
+        assert sum(pieces) > 1000000
+
+    def test_on_output_with_legacy_sidecar(self, mock_server, temp_socket_path):
+        client = GPLSidecarClient(socket_path=temp_socket_path)
+        pieces = []
+        result = client.execute(
+            "shellcheck", ["a.sh"], on_output=lambda *piece: pieces.append(piece)
+        )
+
+        assert result.stdout == ""
+        assert pieces == [("stdout", "Mock output from shellcheck")]
+
+
+@pytest.mark.skipif(not HAS_GPL_CLIENT, reason="GPL client not available")
+class TestRunLimits:
+    """Test tool runs stopped by the request's timeout or a lost client."""
+
+    SLEEPER = ["-c", "import time; time.sleep(30)"]
+
+    @pytest.fixture
+    def module(self):
+        module = load_sidecar_module()
+        with patch.dict(
+            module.GPLToolExecutor.SUPPORTED_TOOLS, {"shellcheck": sys.executable}
+        ):
+            yield module
+
+    def test_execute_honours_timeout_ms(self, module):
+        server = module.JSONRPCServer("unused.sock", module.WorkerPool(1))
+        start = time.monotonic()
+        response = server.handle_request(
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "execute",
+                "params": {
+                    "tool": "shellcheck",
+                    "args": self.SLEEPER,
+                    "cwd": "/",
+                    "timeout_ms": 300,
+                },
+            }
+        )
+        server.pool.close()
+
+        assert response["result"]["exit_code"] == 124
+        assert time.monotonic() - start < 5
+
+    def test_invalid_timeout_ms(self, module):
+        server = module.JSONRPCServer("unused.sock", module.WorkerPool(1))
+        response = server.handle_request(
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "execute",
+                "params": {"tool": "shellcheck", "args": [], "timeout_ms": "soon"},
+            }
+        )
+        server.pool.close()
+        assert response["error"]["code"] == -32602
+
+    def test_run_killed_when_client_disconnects(self, module, tmp_path):
+        pid_file = tmp_path / "pid"
+        writer = (
+            "import os, time; "
+            f"open({str(pid_file)!r}, 'w').write(str(os.getpid())); "
+            "time.sleep(30)"
+        )
+        server = module.JSONRPCServer("unused.sock", module.WorkerPool(1))
+        server_sock, client_sock = socket.socketpair()
+        serving = threading.Thread(
+            target=server._serve_connection, args=(server_sock,), daemon=True
+        )
+        serving.start()
+
+        connection = _Connection(client_sock)
+        connection.submit(
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "execute",
+                "params": {
+                    "tool": "shellcheck",
+                    "args": ["-c", writer],
+                    "cwd": "/",
+                    "stream": True,
+                },
+            }
+        )
+        for _ in range(100):
+            if pid_file.exists() and pid_file.read_text():
+                break
+            time.sleep(0.05)
+        pid = int(pid_file.read_text())
+
+        connection.close("test done")
+        serving.join(timeout=5)
+        for _ in range(100):
+            if server.pool.stats()["running"] == 0:
+                break
+            time.sleep(0.05)
+        assert server.pool.stats()["running"] == 0
+        server.pool.close()
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)
+
+    def test_client_sends_timeout(self):
+        client = GPLSidecarClient(socket_path="unused.sock")
+        with patch.object(client, "_send_request", return_value={}) as send:
+            client.execute("shellcheck", ["a.sh"], timeout_ms=1234)
+        assert send.call_args[0][1]["timeout_ms"] == 1234
+
+
+@pytest.mark.skipif(not HAS_GPL_CLIENT, reason="GPL client not available")
+class TestStdinContent:
+    """Test file content sent in the request and piped to the tool."""
+
+    ECHO_TOOL = ["-c", "import sys; sys.stdout.write(sys.stdin.read()[::-1])"]
+
+    def test_bytes_and_text_reach_stdin(self, client):
+        client, _ = client
+
+        def run(**kwargs):
+            return client.execute("shellcheck", self.ECHO_TOOL, cwd="/", **kwargs)
+
+        assert run(stdin=b"abc\xc3\xa9").stdout == "écba"
+        assert run(stdin="xyz").stdout == "zyx"
+        assert run().stdout == ""
+
+    def test_streamed_run_reads_stdin(self, client):
+        client, _ = client
+        pieces = []
+        client.execute(
+            "shellcheck",
+            self.ECHO_TOOL,
+            cwd="/",
+            stdin=b"123",
+            on_output=lambda stream, data: pieces.append(data),
+        )
+        assert "".join(pieces) == "321"
+
+    def test_invalid_base64(self, client):
+        client, module = client
+        server = module.JSONRPCServer("unused.sock", module.WorkerPool(1))
+        response = server.handle_request(
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "execute",
+                "params": {"tool": "shellcheck", "args": [], "stdin_base64": "*"},
+            }
+        )
+        server.pool.close()
+        assert response["error"]["code"] == -32602
+
+    def test_features_are_negotiated(self, client):
+        client, module = client
+        assert client.supports("stdin") is True
+        assert client.features == frozenset(module.FEATURES)
+        assert not client.supports("teleport")
+
+    def test_legacy_sidecar_lacks_stdin(self, mock_server, temp_socket_path):
+        client = GPLSidecarClient(socket_path=temp_socket_path)
+        assert client.supports("stdin") is False
+
+    def test_batch_runs_identical_content_once(self, client):
+        client, _ = client
+        with patch.object(client, "_send_batch", wraps=client._send_batch) as send:
+            results = client.execute_batch(
+                [
+                    ("shellcheck", self.ECHO_TOOL, b"one"),
+                    ("shellcheck", self.ECHO_TOOL, b"two"),
+                    ("shellcheck", self.ECHO_TOOL, b"one"),
+                ],
+                cwd="/",
+            )
+
+        (requests,), _ = send.call_args
+        assert len(requests) == 2
+        assert [r.stdout for r in results] == ["eno", "owt", "eno"]
+
+
 @pytest.mark.integration
 @pytest.mark.skipif(not HAS_GPL_CLIENT, reason="GPL client not available")
 class TestGPLSidecarIntegration:
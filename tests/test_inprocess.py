@@ -0,0 +1,241 @@
+"""Tests for running Python-native linters in the in-process worker pool."""
+
+import subprocess
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from huskycat.core.cancellation import CancelToken, ToolCancelled, cancel_scope
+from huskycat.unified_validation import ValidationEngine
+from huskycat.validators import inprocess
+from huskycat.validators.black import BlackValidator
+from huskycat.validators.flake8 import Flake8Validator
+from huskycat.validators.isort import IsortValidator
+from huskycat.validators.mypy import MypyValidator
+
+SAMPLE = "import sys\nimport os\ndef f( x ):\n    return x+undefined_name\n"
+
+
+@pytest.fixture
+def backend():
+    """In-process backend enabled for one test"""
+    inprocess.enable_inprocess()
+    inprocess._matches.clear()
+    yield
+    inprocess.enable_inprocess(False)
+    inprocess._matches.clear()
+
+
+@pytest.fixture
+def sample(tmp_path):
+    path = tmp_path / "sample.py"
+    path.write_text(SAMPLE)
+    return path
+
+
+def _subprocess(cmd, **kwargs):
+    return subprocess.run(cmd, capture_output=True, text=True, timeout=60, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "validator_class,args",
+    [
+        (BlackValidator, ["--check"]),
+        (IsortValidator, ["--check-only"]),
+        (Flake8Validator, ["--format=default"]),
+        (MypyValidator, ["--no-error-summary", "--ignore-missing-imports"]),
+    ],
+)
+def test_matches_subprocess(backend, sample, validator_class, args):
+    validator = validator_class()
+    if not validator.is_available():
+        pytest.skip(f"{validator.command} not installed")
+    cmd = [validator.command] + args + [str(sample)]
+
+    expected = _subprocess(cmd, cwd=sample.parent)
+    result = inprocess.run_inprocess(
+        validator, cmd, capture_output=True, text=True, timeout=60, cwd=sample.parent
+    )
+
+    assert result is not None
+    assert result.returncode == expected.returncode
+    assert result.stdout == expected.stdout
+    assert result.stderr == expected.stderr
+    assert isinstance(result.stdout, str)
+
+
+def test_stdin_content(backend, sample):
+    validator = BlackValidator()
+    if not validator.is_available():
+        pytest.skip("black not installed")
+    result = inprocess.run_inprocess(
+        validator,
+        ["black", "-q", "-"],
+        capture_output=True,
+        input=SAMPLE.encode(),
+    )
+    assert result is not None
+    assert result.returncode == 0
+    assert b"def f(x):" in result.stdout
+
+
+def test_disabled_by_default(sample):
+    assert not inprocess.inprocess_enabled()
+    assert (
+        inprocess.run_inprocess(
+            BlackValidator(), ["black", "--check", str(sample)], capture_output=True
+        )
+        is None
+    )
+
+
+def test_engine_feature_flag(monkeypatch):
+    monkeypatch.setenv("HUSKYCAT_FEATURE_INPROCESS_TOOLS", "true")
+    try:
+        ValidationEngine(use_cache=False)
+        assert inprocess.inprocess_enabled()
+    finally:
+        inprocess.enable_inprocess(False)
+
+
+@pytest.mark.parametrize(
+    "cmd,kwargs",
+    [
+        (["shellcheck", "a.sh"], {"capture_output": True}),
+        (["black", "--version"], {"capture_output": True}),
+        (["black", "a.py"], {}),
+        (["black", "a.py"], {"capture_output": True, "env": {}}),
+    ],
+)
+def test_unsupported_calls_use_subprocess(backend, cmd, kwargs):
+    with patch.object(inprocess, "_get_pool") as get_pool:
+        assert inprocess.run_inprocess(BlackValidator(), cmd, **kwargs) is None
+    get_pool.assert_not_called()
+
+
+def test_version_mismatch_uses_subprocess(backend, sample):
+    validator = BlackValidator()
+    validator.seed_version("black, 0.0.1 (compiled: no)")
+    with patch.object(inprocess, "_get_pool") as get_pool:
+        result = inprocess.run_inprocess(
+            validator, ["black", "--check", str(sample)], capture_output=True
+        )
+    assert result is None
+    get_pool.assert_not_called()
+
+
+def test_worker_failure_uses_subprocess(backend, sample):
+    validator = BlackValidator()
+    if not validator.is_available():
+        pytest.skip("black not installed")
+    with patch.object(inprocess, "_get_pool", side_effect=RuntimeError("broken")):
+        assert (
+            inprocess.run_inprocess(
+                validator, ["black", "--check", str(sample)], capture_output=True
+            )
+            is None
+        )
+
+    with patch.object(inprocess, "_get_pool", side_effect=RuntimeError("broken")):
+        result = validator.validate(sample)
+    assert not result.success
+
+
+def test_timeout(backend, sample):
+    validator = BlackValidator()
+    if not validator.is_available():
+        pytest.skip("black not installed")
+    with patch.object(inprocess, "_get_pool") as get_pool:
+        future = get_pool.return_value.submit.return_value
+        future.result.side_effect = inprocess.concurrent.futures.TimeoutError
+        with pytest.raises(subprocess.TimeoutExpired):
+            inprocess.run_inprocess(
+                validator,
+                ["black", "--check", str(sample)],
+                capture_output=True,
+                timeout=0.5,
+            )
+
+
+def test_waiting_for_a_worker_does_not_count(backend, monkeypatch):
+    validator = BlackValidator()
+    monkeypatch.setattr(inprocess, "_matches_installed", lambda validator: True)
+    monkeypatch.setattr(inprocess, "_slots", threading.BoundedSemaphore(1))
+    inprocess._slots.acquire()  # the only worker is busy for a while
+    threading.Timer(1.0, inprocess._slots.release).start()
+
+    with patch.object(inprocess, "_get_pool") as get_pool:
+        future = get_pool.return_value.submit.return_value
+        future.result.return_value = (0, b"", b"")
+        result = inprocess.run_inprocess(
+            validator, ["black", "--check", "a.py"], capture_output=True, timeout=0.5
+        )
+    assert result.returncode == 0
+
+
+def test_cancel_stops_a_running_tool(backend, monkeypatch):
+    validator = BlackValidator()
+    monkeypatch.setattr(inprocess, "_matches_installed", lambda validator: True)
+    token = CancelToken()
+    threading.Timer(0.3, token.cancel, args=("fail fast",)).start()
+
+    with patch.object(inprocess, "_get_pool") as get_pool, patch.object(
+        inprocess, "_recycle_pool"
+    ) as recycle:
+        future = get_pool.return_value.submit.return_value
+        future.result.side_effect = _never_done
+        started = time.monotonic()
+        with cancel_scope(token), pytest.raises(ToolCancelled, match="fail fast"):
+            inprocess.run_inprocess(
+                validator, ["black", "--check", "a.py"], capture_output=True, timeout=60
+            )
+    assert time.monotonic() - started < 5
+    recycle.assert_called_once()
+
+
+def _never_done(timeout):
+    time.sleep(timeout or 0)
+    raise inprocess.concurrent.futures.TimeoutError
+
+
+def test_timeout_kills_stuck_worker(backend):
+    pool = inprocess._get_pool()
+    pool.submit(time.sleep, 60)
+    workers = list(pool._processes.values())
+    assert workers
+
+    inprocess._recycle_pool(pool)
+
+    for worker in workers:
+        worker.join(timeout=10)
+    assert not any(worker.is_alive() for worker in workers)
+    assert inprocess._get_pool() is not pool
+
+
+def test_validator_runs_in_pool(backend, sample):
+    validator = BlackValidator()
+    if not validator.is_available():
+        pytest.skip("black not installed")
+    real_run = subprocess.run
+    with patch("huskycat.validators.base.subprocess.run") as run:
+        run.side_effect = real_run
+        result = validator.validate(sample)
+    assert not result.success
+    # Only the version probe left the pool
+    assert [call.args[0][1:] for call in run.call_args_list] == [["--version"]]
+
+
+def test_call_restores_process_state(tmp_path):
+    pytest.importorskip("black")
+    pytest.importorskip("isort")
+    before = Path.cwd()
+    returncode, stdout, _ = inprocess._call("black", ["-q", "-"], b"x  =  1\n", None)
+    assert (returncode, stdout) == (0, b"x = 1\n")
+    returncode, _, _ = inprocess._call(
+        "isort", ["--check-only", "-"], b"", str(tmp_path)
+    )
+    assert returncode == 0
+    assert Path.cwd() == before
@@ -211,6 +211,27 @@ class TestNonBlockingIntegration:
         assert "black" in adapter.tui.tools
         assert adapter.tui.tools["black"].state == ToolState.SUCCESS
 
+    def test_shard_progress_is_summed(self):
+        """Test shards of one tool report the tool's totals to the TUI."""
+        from huskycat.validators.base import ValidationResult
+
+        adapter = NonBlockingGitHooksAdapter()
+        engine = MagicMock()
+        engine.iter_validate.side_effect = lambda files, tools: (
+            ValidationResult("ruff", str(f), False, errors=["E1"]) for f in files
+        )
+        validator = MagicMock()
+        validator.name = "ruff"
+
+        with patch.object(
+            adapter, "_get_validation_engine", return_value=engine
+        ), patch.object(adapter.tui, "update_tool") as update:
+            adapter._execute_real_validation(validator, [Path("a.py"), Path("b.py")])
+            adapter._execute_real_validation(validator, [Path("c.py")])
+
+        last = update.call_args.kwargs
+        assert (last["errors"], last["files_processed"]) == (3, 3)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -2,17 +2,24 @@
 Tests for parallel tool executor with dependency graph.
 """
 
+import os
+import threading
 import time
 from typing import Any, Dict
 
 import pytest
 
+from src.huskycat.core.cancellation import run_process
 from src.huskycat.core.parallel_executor import (
     TOOL_DEPENDENCIES,
     ParallelExecutor,
+    ShardedTool,
     ToolResult,
     ToolStatus,
 )
+from src.huskycat.core.process_manager import ToolHistory
+from src.huskycat.core.resources import ResourceBudget, ToolUsage
+from src.huskycat.core.timeouts import MIN_TIMEOUT_SAMPLES, TimeoutPolicy
 
 
 class TestDependencyGraph:
@@ -209,6 +216,61 @@ class TestParallelExecution:
         statuses = [update[1] for update in progress_updates]
         assert "running" in statuses
 
+    def test_dependent_starts_without_waiting_for_level(self):
+        """A tool starts once its own dependencies finish, not its whole level."""
+        started: Dict[str, float] = {}
+        finished: Dict[str, float] = {}
+
+        def timed(name: str, seconds: float):
+            def tool():
+                started[name] = time.time()
+                time.sleep(seconds)
+                finished[name] = time.time()
+                return True
+
+            return tool
+
+        deps = {"fast": [], "slow": [], "after_fast": ["fast"]}
+        executor = ParallelExecutor(tool_dependencies=deps, max_workers=3)
+        results = executor.execute_tools(
+            {
+                "fast": timed("fast", 0.01),
+                "slow": timed("slow", 0.3),
+                "after_fast": timed("after_fast", 0.01),
+            }
+        )
+
+        assert all(r.success for r in results)
+        assert started["after_fast"] >= finished["fast"]
+        assert finished["after_fast"] < finished["slow"]
+        assert results[-1].tool_name == "slow"
+
+    def test_longest_chain_starts_first(self):
+        """With one worker, the head of the longest chain runs first."""
+        started = []
+
+        def tool(name: str):
+            def run():
+                started.append(name)
+                return True
+
+            return run
+
+        deps = {"short": [], "head": [], "tail": ["head"]}
+        executor = ParallelExecutor(tool_dependencies=deps, max_workers=1)
+        executor.durations.update({"short": 2.0, "head": 1.0, "tail": 3.0})
+
+        executor.execute_tools({name: tool(name) for name in deps})
+
+        assert started[0] == "head"
+
+    def test_undeclared_tools_run(self):
+        """Tools without declared dependencies run unconstrained."""
+        executor = ParallelExecutor(tool_dependencies={"a": []})
+        results = executor.execute_tools({"a": lambda: True, "extra": lambda: True})
+
+        assert sorted(r.tool_name for r in results) == ["a", "extra"]
+
 
 class TestFailureHandling:
     """Test failure scenarios and error handling."""
@@ -269,6 +331,21 @@ class TestFailureHandling:
         assert not base_result.success
         assert dependent_result.status == ToolStatus.SKIPPED
 
+    def test_skip_propagates_to_indirect_dependents(self):
+        """Tools downstream of a skipped tool are skipped as well."""
+        deps = {"base": [], "middle": ["base"], "top": ["middle"]}
+        executor = ParallelExecutor(tool_dependencies=deps)
+        results = executor.execute_tools(
+            {"base": lambda: False, "middle": lambda: True, "top": lambda: True}
+        )
+
+        statuses = {r.tool_name: r.status for r in results}
+        assert statuses == {
+            "base": ToolStatus.FAILED,
+            "middle": ToolStatus.SKIPPED,
+            "top": ToolStatus.SKIPPED,
+        }
+
     def test_fail_fast_mode(self):
         """Test fail-fast mode stops on first failure."""
         execution_count = {"count": 0}
@@ -289,7 +366,10 @@ class TestFailureHandling:
             "level1_b": ["level0_success"],
         }
 
-        executor = ParallelExecutor(tool_dependencies=deps, fail_fast=True)
+        # Enough workers for both level 0 tools to start before the failure
+        executor = ParallelExecutor(
+            tool_dependencies=deps, fail_fast=True, max_workers=2
+        )
         tools = {
             "level0_fail": counting_tool("level0_fail", should_fail=True),
             "level0_success": counting_tool("level0_success"),
@@ -303,6 +383,37 @@ class TestFailureHandling:
         assert execution_count["count"] == 2  # Only level 0 tools
         assert any(r.status == ToolStatus.SKIPPED for r in results)
 
+    def test_fail_fast_runs_likely_failures_first(self):
+        """Fail-fast starts cheap, historically failing tools first."""
+        started = []
+
+        def tool(name: str, fails: bool):
+            def run():
+                started.append(name)
+                return not fails
+
+            return run
+
+        deps = {"slow_clean": [], "cheap_flaky": [], "cheap_clean": []}
+        executor = ParallelExecutor(
+            tool_dependencies=deps, fail_fast=True, max_workers=1
+        )
+        executor.durations.update(
+            {"slow_clean": 5.0, "cheap_flaky": 0.1, "cheap_clean": 0.1}
+        )
+        executor.failure_rates.update({"cheap_flaky": 0.5})
+
+        results = executor.execute_tools(
+            {
+                "slow_clean": tool("slow_clean", False),
+                "cheap_flaky": tool("cheap_flaky", True),
+                "cheap_clean": tool("cheap_clean", False),
+            }
+        )
+
+        assert started == ["cheap_flaky"]
+        assert sum(r.status == ToolStatus.SKIPPED for r in results) == 2
+
     def test_exception_handling(self):
         """Test handling of exceptions during tool execution."""
 
@@ -320,6 +431,361 @@ class TestFailureHandling:
         assert results[0].status == ToolStatus.FAILED
         assert "Tool crashed" in results[0].error_message
 
+    def test_hung_tool_times_out(self):
+        """A tool past timeout_per_tool is abandoned, not waited for."""
+        executor = ParallelExecutor(
+            tool_dependencies={"hung": [], "after": ["hung"]}, timeout_per_tool=0.3
+        )
+
+        start = time.time()
+        results = executor.execute_tools(
+            {"hung": lambda: time.sleep(3), "after": lambda: True}
+        )
+
+        assert time.time() - start < 2
+        by_name = {r.tool_name: r for r in results}
+        assert by_name["hung"].status == ToolStatus.TIMEOUT
+        assert "timeout of 0.3s" in by_name["hung"].error_message
+        assert by_name["after"].status == ToolStatus.SKIPPED
+
+    def test_hung_tool_keeps_its_worker(self):
+        """The next tool waits for a hung tool's thread, not for its timeout."""
+        executor = ParallelExecutor(
+            tool_dependencies={"hung": [], "next": []},
+            max_workers=1,
+            timeouts=TimeoutPolicy(overrides={"hung": 0.3, "next": 0.5}),
+        )
+
+        results = {
+            r.tool_name: r
+            for r in executor.execute_tools(
+                {"hung": lambda: time.sleep(1), "next": lambda: True}
+            )
+        }
+
+        assert results["hung"].status == ToolStatus.TIMEOUT
+        assert results["next"].success
+
+    @pytest.mark.skipif(not hasattr(os, "killpg"), reason="POSIX only")
+    def test_timeout_kills_tool_process(self):
+        """Processes started by a tool are killed at its deadline."""
+        executor = ParallelExecutor(
+            tool_dependencies={"slow": []}, timeout_per_tool=0.3
+        )
+
+        def slow_tool():
+            run_process(["sleep", "30"], capture_output=True)
+            return True
+
+        start = time.time()
+        results = executor.execute_tools({"slow": slow_tool})
+
+        assert time.time() - start < 5
+        assert results[0].status == ToolStatus.TIMEOUT
+
+    @pytest.mark.skipif(not hasattr(os, "killpg"), reason="POSIX only")
+    def test_fail_fast_cancels_running_tools(self):
+        """In fail-fast mode the first failure kills tools still running."""
+        executor = ParallelExecutor(
+            tool_dependencies={"failing": [], "slow": []},
+            fail_fast=True,
+            max_workers=2,
+            timeout_per_tool=30,
+        )
+
+        def failing_tool():
+            time.sleep(0.2)
+            return False
+
+        def slow_tool():
+            # Validators report a killed tool as an ordinary failure
+            try:
+                run_process(["sleep", "30"], capture_output=True)
+            except Exception:
+                return False
+            return True
+
+        start = time.time()
+        results = executor.execute_tools({"failing": failing_tool, "slow": slow_tool})
+
+        assert time.time() - start < 5
+        by_name = {r.tool_name: r for r in results}
+        assert by_name["failing"].status == ToolStatus.FAILED
+        assert by_name["slow"].status == ToolStatus.CANCELLED
+        assert by_name["slow"].error_message == "Cancelled due to fail-fast mode"
+
+
+class TestSharding:
+    """Test splitting a tool's files into concurrent shards."""
+
+    def test_shards_run_concurrently_and_merge(self, tmp_path):
+        """Shards of one tool overlap and come back as one result."""
+        files = [tmp_path / f"f{i}.py" for i in range(100)]
+        for path in files:
+            path.write_text("x = 1\n")
+        calls = []
+
+        def check(shard):
+            calls.append(list(shard))
+            time.sleep(0.2)
+            return {"success": True, "errors": 1, "metadata": {"files": len(shard)}}
+
+        executor = ParallelExecutor(tool_dependencies={"ruff": []}, max_workers=4)
+        start = time.time()
+        results = executor.execute_tools({"ruff": ShardedTool(files, check)})
+
+        assert time.time() - start < 0.6
+        assert len(calls) == 4
+        assert sorted(f for shard in calls for f in shard) == sorted(files)
+        assert len(results) == 1
+        assert results[0].tool_name == "ruff"
+        assert results[0].errors == 4
+        assert results[0].metadata["files"] == 100
+        assert results[0].metadata["shards"] == 4
+
+    def test_dependents_wait_for_all_shards(self, tmp_path):
+        """A dependent starts only after every shard of its prerequisite."""
+        files = [tmp_path / f"f{i}.py" for i in range(50)]
+        finished = []
+
+        def check(shard):
+            time.sleep(0.05)
+            finished.append("black")
+            return True
+
+        def after():
+            finished.append("flake8")
+            return True
+
+        executor = ParallelExecutor(
+            tool_dependencies={"black": [], "flake8": ["black"]}, max_workers=2
+        )
+        executor.execute_tools({"black": ShardedTool(files, check), "flake8": after})
+
+        assert finished == ["black", "black", "flake8"]
+
+    def test_failed_shard_fails_tool(self, tmp_path):
+        """One failing shard fails the merged result and blocks dependents."""
+        files = [tmp_path / f"f{i}.py" for i in range(50)]
+
+        def check(shard):
+            return files[0] not in shard
+
+        executor = ParallelExecutor(
+            tool_dependencies={"black": [], "flake8": ["black"]}, max_workers=2
+        )
+        results = executor.execute_tools(
+            {"black": ShardedTool(files, check), "flake8": lambda: True}
+        )
+
+        by_name = {r.tool_name: r for r in results}
+        assert by_name["black"].status == ToolStatus.FAILED
+        assert by_name["flake8"].status == ToolStatus.SKIPPED
+
+    def test_small_tools_are_not_sharded(self, tmp_path):
+        """Few files without history run as a single call."""
+        files = [tmp_path / "a.py", tmp_path / "b.py"]
+        calls = []
+
+        executor = ParallelExecutor(tool_dependencies={"ruff": []}, max_workers=4)
+        executor.execute_tools({"ruff": ShardedTool(files, calls.append)})
+
+        assert calls == [files]
+
+    def test_shard_count_follows_history(self, tmp_path):
+        """Shards are only made while their file work outweighs start-up."""
+        files = [tmp_path / f"f{i}.py" for i in range(10)]
+        executor = ParallelExecutor(tool_dependencies={"ruff": []}, max_workers=8)
+
+        executor.file_costs["ruff"] = (1.0, 0.3)  # 3s of file work
+        assert len(executor._shard("ruff", files)) == 3
+        executor.file_costs["ruff"] = (0.0, 0.3)
+        assert len(executor._shard("ruff", files)) == 8
+        executor.file_costs["ruff"] = (1.0, 0.0)
+        assert len(executor._shard("ruff", files)) == 1
+
+    def test_shards_balance_bytes(self, tmp_path):
+        """Large files are spread so shards hold similar byte counts."""
+        sizes = [900, 800, 100, 100, 100, 100, 100, 100, 100, 100]
+        files = []
+        for i, size in enumerate(sizes):
+            path = tmp_path / f"f{i}.py"
+            path.write_text("x" * size)
+            files.append(path)
+        executor = ParallelExecutor(tool_dependencies={"ruff": []}, max_workers=2)
+        executor.file_costs["ruff"] = (0.0, 1.0)
+
+        shards = executor._shard("ruff", files)
+
+        loads = sorted(sum(p.stat().st_size for p in shard) for shard in shards)
+        assert loads == [1200, 1300]
+        assert shards[0] == sorted(shards[0], key=files.index)
+
+
+class TestAdmissionControl:
+    """Test admitting tools against a CPU and memory budget."""
+
+    GIB = 1024**3
+
+    def test_tools_over_budget_wait(self):
+        """Tools whose memory does not fit wait while small ones run."""
+        budget = ResourceBudget(cpus=8, memory=2 * self.GIB)
+        executor = ParallelExecutor(
+            tool_dependencies={"mypy": [], "eslint": [], "yamllint": []},
+            max_workers=3,
+            budget=budget,
+        )
+        executor.usage["mypy"] = ToolUsage(cores=1, memory=1.5 * self.GIB)
+        executor.usage["eslint"] = ToolUsage(cores=1, memory=1.5 * self.GIB)
+        executor.usage["yamllint"] = ToolUsage(cores=1, memory=0.1 * self.GIB)
+        spans: Dict[str, Any] = {}
+
+        def tool(name):
+            def run():
+                start = time.time()
+                time.sleep(0.2)
+                spans[name] = (start, time.time())
+                return True
+
+            return run
+
+        results = executor.execute_tools(
+            {name: tool(name) for name in ("mypy", "eslint", "yamllint")}
+        )
+
+        assert all(r.success for r in results)
+        first, second = sorted([spans["mypy"], spans["eslint"]])
+        assert second[0] >= first[1]  # never together
+        assert spans["yamllint"][0] < first[1]  # backfilled alongside
+        assert budget.memory_used == 0
+
+    def test_unmeasured_tools_are_not_charged(self):
+        """Tools without measured usage run up to max_workers at once."""
+        budget = ResourceBudget(cpus=1, memory=self.GIB)
+        executor = ParallelExecutor(
+            tool_dependencies={f"tool{i}": [] for i in range(4)},
+            max_workers=4,
+            budget=budget,
+        )
+        barrier = threading.Barrier(4, timeout=5)
+
+        def tool():
+            barrier.wait()  # breaks unless all four run together
+            return True
+
+        results = executor.execute_tools({f"tool{i}": tool for i in range(4)})
+
+        assert all(r.success for r in results)
+        assert budget.cores_used == 0
+
+    def test_heavy_shards_are_capped(self, tmp_path):
+        """A heavy tool runs at most heavy_limit shards at once."""
+        files = [tmp_path / f"f{i}.py" for i in range(100)]
+        active = []
+        peak = []
+
+        def check(shard):
+            active.append(1)
+            peak.append(len(active))
+            time.sleep(0.1)
+            active.pop()
+            return True
+
+        executor = ParallelExecutor(
+            tool_dependencies={"mypy": []},
+            max_workers=4,
+            budget=ResourceBudget(cpus=64, memory=64 * self.GIB, heavy_limit=2),
+        )
+        executor.usage["mypy"] = ToolUsage(cores=1, memory=self.GIB)
+        results = executor.execute_tools({"mypy": ShardedTool(files, check)})
+
+        assert results[0].metadata["shards"] == 4
+        assert max(peak) == 2
+
+    @pytest.mark.skipif(not hasattr(os, "wait4"), reason="needs os.wait4")
+    def test_usage_is_measured(self):
+        """Measured peak memory lands in metadata and future admissions."""
+        executor = ParallelExecutor(
+            tool_dependencies={"tool": []}, budget=ResourceBudget()
+        )
+
+        def tool():
+            return run_process(["true"]).returncode == 0
+
+        results = executor.execute_tools({"tool": tool})
+
+        assert results[0].metadata["peak_rss"] > 0
+        assert "cpu_seconds" in results[0].metadata
+        assert executor.usage["tool"].memory == results[0].metadata["peak_rss"]
+
+    def test_usage_from_history(self):
+        """History seeds each tool's expected resource usage."""
+        history = ToolHistory()
+        history.record_usage(300.0, 0.5)
+        history.record_usage(500.0, 1.5)
+
+        executor = ParallelExecutor(tool_dependencies={"mypy": []})
+        executor.use_history({"mypy": history})
+
+        assert executor.usage["mypy"] == ToolUsage(cores=1.0, memory=500.0)
+
+
+class TestTimeoutPolicy:
+    """Test per-tool timeouts from the timeout policy."""
+
+    def test_configured_timeout_wins(self):
+        """A tool's own timeout replaces timeout_per_tool."""
+        executor = ParallelExecutor(
+            tool_dependencies={"hung": [], "quick": []},
+            max_workers=2,
+            timeout_per_tool=30,
+            timeouts=TimeoutPolicy(overrides={"hung": 0.3}),
+        )
+
+        start = time.time()
+        results = {
+            r.tool_name: r
+            for r in executor.execute_tools(
+                {"hung": lambda: time.sleep(3), "quick": lambda: True}
+            )
+        }
+
+        assert time.time() - start < 2
+        assert results["hung"].status == ToolStatus.TIMEOUT
+        assert "timeout of 0.3s" in results["hung"].error_message
+        assert results["quick"].metadata["timeout"] == 30
+
+    def test_near_timeout_is_flagged(self):
+        executor = ParallelExecutor(
+            tool_dependencies={"slow": [], "quick": []},
+            timeouts=TimeoutPolicy(overrides={"slow": 1.0, "quick": 1.0}),
+        )
+
+        results = {
+            r.tool_name: r
+            for r in executor.execute_tools(
+                {"slow": lambda: time.sleep(0.8) or True, "quick": lambda: True}
+            )
+        }
+
+        assert results["slow"].success
+        assert results["slow"].metadata["near_timeout"]
+        assert "near_timeout" not in results["quick"].metadata
+
+    def test_shards_get_timeouts_for_their_files(self, tmp_path):
+        """Learned timeouts follow the number of files each shard checks."""
+        history = ToolHistory()
+        for count in range(10, 10 + 10 * MIN_TIMEOUT_SAMPLES, 10):
+            history.record(count, 0.5 * count, True)
+        executor = ParallelExecutor(tool_dependencies={"ruff": []}, max_workers=2)
+        executor.use_history({"ruff": history})
+        files = [tmp_path / f"f{i}.py" for i in range(100)]
+
+        results = executor.execute_tools({"ruff": ShardedTool(files, lambda s: True)})
+
+        assert results[0].metadata["shards"] == 2
+        assert results[0].metadata["timeout"] == pytest.approx(50.0)  # 2 x 25s
+
 
 class TestExecutionPlan:
     """Test execution plan generation and visualization."""
@@ -374,6 +840,57 @@ class TestExecutionPlan:
         assert stats["max_parallelism"] == 2
         assert stats["speedup_factor"] > 1.0
 
+    def test_statistics_follow_critical_path(self):
+        """Measured durations decide the critical path after a run."""
+        deps = {"a": [], "b": [], "c": ["a"]}
+        executor = ParallelExecutor(tool_dependencies=deps)
+        executor.durations.update({"a": 1.0, "b": 5.0, "c": 1.0})
+
+        path, seconds = executor.get_critical_path()
+        stats = executor.get_statistics()
+
+        assert (path, seconds) == (["b"], 5.0)
+        assert stats["critical_path"] == ["b"]
+        assert stats["parallel_time_estimate"] == 5.0
+        assert stats["sequential_time_estimate"] == 7.0
+        assert stats["speedup_factor"] == pytest.approx(1.4)
+
+    def test_predicted_wall_time(self):
+        """Prediction accounts for dependencies and worker count."""
+        deps = {"a": [], "b": [], "c": ["a"]}
+        durations = {"a": 1.0, "b": 2.0, "c": 3.0}
+
+        wide = ParallelExecutor(tool_dependencies=deps, max_workers=3)
+        wide.durations.update(durations)
+        narrow = ParallelExecutor(tool_dependencies=deps, max_workers=1)
+        narrow.durations.update(durations)
+
+        assert wide.predict_wall_time() == 4.0
+        assert narrow.predict_wall_time() == 6.0
+        assert wide.predict_wall_time(["b"]) == 2.0
+        assert wide.get_statistics()["predicted_wall_time"] == 4.0
+
+    def test_use_history(self):
+        """History seeds per-file-count estimates and failure rates."""
+        history = ToolHistory()
+        history.record(1, 1.0, True)
+        history.record(11, 2.0, False)
+
+        executor = ParallelExecutor(tool_dependencies={"mypy": []})
+        executor.use_history({"mypy": history}, {"mypy": 21})
+
+        assert executor.durations["mypy"] == pytest.approx(3.0)
+        assert executor.failure_rates["mypy"] == 0.5
+        assert executor.file_costs["mypy"] == pytest.approx((0.9, 0.1))
+
+    def test_durations_recorded(self):
+        """A run records each tool's measured duration."""
+        executor = ParallelExecutor(tool_dependencies={"a": [], "b": ["a"]})
+        executor.execute_tools({"a": lambda: True, "b": lambda: True})
+
+        assert set(executor.durations) == {"a", "b"}
+        assert executor.get_critical_path()[0] == ["a", "b"]
+
 
 class TestRealWorldScenario:
     """Test realistic validation scenarios."""
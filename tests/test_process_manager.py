@@ -529,3 +529,101 @@ def test_validation_run_with_error_details_serialization(process_manager):
     assert loaded_run.error_details[0]["file"] == "test.py"
     assert loaded_run.error_details[0]["line"] == 10
     assert loaded_run.error_details[0]["tool"] == "ruff"
+
+
+def test_record_and_get_tool_history(process_manager):
+    """Test per-tool timing history accumulates across runs."""
+    from src.huskycat.core.parallel_executor import ToolResult, ToolStatus
+
+    assert process_manager.get_tool_history() == {}
+
+    process_manager.record_tool_results(
+        [
+            ToolResult("mypy", True, 2.0, metadata={"files": 4}),
+            ToolResult("ruff", False, 0.1, metadata={"files": 4}),
+            ToolResult("bandit", False, 0.0, status=ToolStatus.SKIPPED),
+        ]
+    )
+    process_manager.record_tool_results(
+        [ToolResult("mypy", False, 4.0, metadata={"files": 8})]
+    )
+
+    history = process_manager.get_tool_history()
+    assert set(history) == {"mypy", "ruff"}
+    assert history["mypy"].samples == [[4, 2.0], [8, 4.0]]
+    assert history["mypy"].failure_rate == 0.5
+    assert history["mypy"].estimate(16) == pytest.approx(8.0)
+    assert history["ruff"].failure_rate == 1.0
+
+
+def test_timed_out_runs_do_not_raise_learned_timeouts(process_manager):
+    """Test runs cut off at their limit are not taken as their run time."""
+    from src.huskycat.core.parallel_executor import ToolResult, ToolStatus
+    from src.huskycat.core.timeouts import MIN_TIMEOUT_SAMPLES, TimeoutPolicy
+
+    process_manager.record_tool_results(
+        [ToolResult("mypy", True, 10.0, metadata={"files": 4})] * MIN_TIMEOUT_SAMPLES
+    )
+    policy = TimeoutPolicy(history=process_manager.get_tool_history())
+    limit = policy.limit("mypy", 4)
+
+    process_manager.record_tool_results(
+        [
+            ToolResult(
+                "mypy", False, limit, status=ToolStatus.TIMEOUT, metadata={"files": 4}
+            ),
+            ToolResult(
+                "mypy", False, 3.0, status=ToolStatus.CANCELLED, metadata={"files": 4}
+            ),
+        ]
+    )
+    history = process_manager.get_tool_history()
+    policy.use_history(history)
+
+    assert policy.limit("mypy", 4) == limit
+    assert history["mypy"].runs == MIN_TIMEOUT_SAMPLES + 1
+    assert history["mypy"].failures == 1
+
+
+def test_run_history_with_tool_history(process_manager):
+    """Test recorded tool history is not mistaken for a validation run."""
+    from src.huskycat.core.parallel_executor import ToolResult
+
+    for i in range(2):
+        process_manager.save_run(
+            ValidationRun(
+                run_id=f"run_{i}",
+                started=datetime.now().isoformat(),
+                completed=datetime.now().isoformat(),
+                success=True,
+            )
+        )
+        time.sleep(0.01)
+    process_manager.record_tool_results([ToolResult("ruff", True, 0.1)])
+
+    history = process_manager.get_run_history(limit=2)
+    assert [run.run_id for run in history] == ["run_1", "run_0"]
+
+    os.utime(process_manager.tool_history_file, (0, 0))
+    process_manager.cleanup_old_runs(max_age_days=1)
+    assert "ruff" in process_manager.get_tool_history()
+
+
+def test_tool_history_keeps_recent_samples():
+    """Test ToolHistory drops the oldest samples beyond the limit."""
+    from src.huskycat.core.process_manager import TOOL_HISTORY_SAMPLES, ToolHistory
+
+    history = ToolHistory()
+    for i in range(TOOL_HISTORY_SAMPLES + 5):
+        history.record(1, float(i), True)
+
+    assert len(history.samples) == TOOL_HISTORY_SAMPLES
+    assert history.samples[0] == [1, 5.0]
+    assert history.runs == TOOL_HISTORY_SAMPLES + 5
+    assert ToolHistory().estimate(3) is None
+
+
+def test_corrupt_tool_history_is_ignored(process_manager):
+    """Test unreadable tool history is treated as empty."""
+    process_manager.tool_history_file.write_text("{broken")
+    assert process_manager.get_tool_history() == {}
@@ -0,0 +1,77 @@
+"""Tests for resource budgets and measuring tool processes."""
+
+import os
+import sys
+
+import pytest
+
+from huskycat.core.cancellation import run_process
+from huskycat.core.resources import (
+    HEAVY_TOOL_MEMORY,
+    ResourceBudget,
+    ResourceMeter,
+    ToolUsage,
+    meter_scope,
+)
+
+GIB = 1024**3
+
+
+class TestResourceBudget:
+    def test_admits_within_budget(self):
+        budget = ResourceBudget(cpus=2, memory=GIB)
+        budget.start_run()
+        small = ToolUsage(cores=1, memory=100)
+
+        assert budget.admit("yamllint", small)
+        assert budget.admit("taplo", small)
+        assert not budget.admit("ruff", small)  # out of cores
+
+        budget.release("taplo", small)
+        assert budget.admit("ruff", small)
+
+    def test_memory_limit(self):
+        budget = ResourceBudget(cpus=8, memory=GIB)
+        budget.start_run()
+        big = ToolUsage(cores=1, memory=0.6 * GIB)
+
+        assert budget.admit("mypy", big)
+        assert not budget.admit("eslint", big)
+
+    def test_lone_tool_is_always_admitted(self):
+        budget = ResourceBudget(cpus=1, memory=GIB)
+        budget.start_run()
+        assert budget.admit("mypy", ToolUsage(cores=4, memory=8 * GIB))
+
+    def test_heavy_tool_instances_are_capped(self):
+        budget = ResourceBudget(cpus=16, memory=64 * GIB, heavy_limit=2)
+        budget.start_run()
+        heavy = ToolUsage(cores=1, memory=HEAVY_TOOL_MEMORY)
+        assert heavy.heavy
+
+        assert budget.admit("mypy", heavy)
+        assert budget.admit("mypy", heavy)
+        assert not budget.admit("mypy", heavy)
+        assert budget.admit("ansible-lint", heavy)
+
+    def test_start_run_reads_free_memory(self, monkeypatch):
+        monkeypatch.setattr(
+            "huskycat.core.resources.available_memory", lambda: 10 * GIB
+        )
+        budget = ResourceBudget(cpus=1)
+        budget.start_run()
+        assert budget.memory == pytest.approx(8 * GIB)
+
+
+@pytest.mark.skipif(not hasattr(os, "wait4"), reason="needs os.wait4")
+def test_run_process_measures_peak_rss():
+    """Processes run under a meter report their peak memory and CPU time."""
+    meter = ResourceMeter()
+    allocate = "x = bytearray(64 * 1024 * 1024); x[::4096] = b'1' * len(x[::4096])"
+    with meter_scope(meter):
+        result = run_process([sys.executable, "-c", allocate], capture_output=True)
+
+    assert result.returncode == 0
+    assert meter.processes == 1
+    assert meter.peak_rss >= 64 * 1024 * 1024
+    assert meter.cpu_seconds > 0
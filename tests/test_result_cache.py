@@ -0,0 +1,215 @@
+"""Tests for the content-addressed validation result cache."""
+
+import os
+import time
+from pathlib import Path
+from typing import List, Set
+from unittest.mock import patch
+
+import pytest
+
+from huskycat.commands.clean import CleanCommand
+from huskycat.core.result_cache import ResultCache, hash_config, hash_file
+from huskycat.unified_validation import ValidationEngine
+from huskycat.validators.base import ValidationResult, Validator
+from huskycat.validators.flake8 import Flake8Validator
+
+
+class CountingValidator(Validator):
+    """Validator that records which files it actually ran on"""
+
+    def __init__(self, auto_fix: bool = False):
+        super().__init__(auto_fix)
+        self.seen: List[Path] = []
+
+    @property
+    def name(self) -> str:
+        return "counting"
+
+    @property
+    def extensions(self) -> Set[str]:
+        return {".py"}
+
+    def get_version(self):
+        return "counting 1.0"
+
+    def validate(self, filepath: Path) -> ValidationResult:
+        self.seen.append(filepath)
+        bad = "bad" in filepath.read_text()
+        return ValidationResult(
+            tool=self.name,
+            filepath=str(filepath),
+            success=not bad,
+            errors=["Line 1: bad"] if bad else [],
+        )
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResultCache(cache_dir=tmp_path / "cache")
+
+
+class TestResultCache:
+    def test_key_depends_on_every_component(self):
+        base = ("ruff", "0.4", "cfg", "content", False, "src/a.py")
+        keys = {ResultCache.make_key(*base)}
+        changes = ["flake8", "0.5", "cfg2", "content2", True, "tests/a.py"]
+        for i, changed in enumerate(changes):
+            parts = list(base)
+            parts[i] = changed
+            keys.add(ResultCache.make_key(*parts))
+        assert len(keys) == 7
+        assert ResultCache.make_key(*base[:5], "./src/a.py") in keys
+
+    def test_round_trip_reports_requested_path(self, cache):
+        result = ValidationResult("ruff", "old.py", False, errors=["Line 1: x"])
+        cache.put("ab" * 32, result)
+
+        cached = cache.get("ab" * 32, "new.py")
+        assert cached.filepath == "new.py"
+        assert cached.errors == ["Line 1: x"]
+        assert cached.success is False
+        assert cache.hits == 1
+
+    def test_missing_and_corrupt_entries_are_misses(self, cache):
+        assert cache.get("cd" * 32, "a.py") is None
+        entry = cache.cache_dir / "ef" / f"{'ef' * 32}.json"
+        entry.parent.mkdir(parents=True)
+        entry.write_text("{not json")
+        assert cache.get("ef" * 32, "a.py") is None
+        assert cache.misses == 2
+
+    def test_prune_evicts_least_recently_used(self, cache):
+        result = ValidationResult("ruff", "a.py", True)
+        keys = [f"{i:02d}" * 32 for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.put(key, result)
+            entry = cache.cache_dir / key[:2] / f"{key}.json"
+            os.utime(entry, (time.time() - 100 + i, time.time() - 100 + i))
+
+        entry_size = cache.stats()["bytes"] // 3
+        cache.max_bytes = entry_size * 2
+        # Touch the oldest entry so the middle one becomes LRU
+        cache.get(keys[0], "a.py")
+
+        assert cache.prune() == 1
+        assert cache.get(keys[1], "a.py") is None
+        assert cache.get(keys[0], "a.py") is not None
+
+    def test_clear(self, cache):
+        cache.put("12" * 32, ValidationResult("ruff", "a.py", True))
+        assert cache.clear() == 1
+        assert cache.stats()["entries"] == 0
+
+
+class TestHashing:
+    def test_hash_file(self, tmp_path):
+        f = tmp_path / "a.py"
+        f.write_text("x = 1\n")
+        first = hash_file(f)
+        f.write_text("x = 2\n")
+        assert hash_file(f) != first
+        assert hash_file(tmp_path / "missing.py") is None
+
+    def test_hash_config_tracks_project_files(self, tmp_path):
+        before = hash_config({"timeout": 30}, root=tmp_path)
+        assert hash_config({"timeout": 60}, root=tmp_path) != before
+        (tmp_path / ".flake8").write_text("[flake8]\nmax-line-length = 100\n")
+        assert hash_config({"timeout": 30}, root=tmp_path) != before
+
+
+class TestEngineCaching:
+    @pytest.fixture
+    def engine(self, tmp_path):
+        with patch(
+            "huskycat.unified_validation.ValidationEngine._initialize_validators",
+            return_value=[CountingValidator()],
+        ):
+            return ValidationEngine(
+                use_cache=True, result_cache=ResultCache(tmp_path / "cache")
+            )
+
+    def test_unchanged_files_are_not_revalidated(self, engine, tmp_path):
+        good = tmp_path / "good.py"
+        bad = tmp_path / "bad.py"
+        good.write_text("x = 1\n")
+        bad.write_text("bad\n")
+
+        first = engine.validate_files([good, bad])
+        validator = engine.validators[0]
+        assert len(validator.seen) == 2
+
+        good.write_text("x = 2\n")
+        second = engine.validate_files([good, bad])
+
+        assert validator.seen[2:] == [good]
+        assert second[str(bad)][0].errors == first[str(bad)][0].errors
+        assert engine.result_cache.hits == 1
+
+    def test_same_content_at_two_paths(self, tmp_path, monkeypatch):
+        validator = Flake8Validator()
+        if not validator.is_available():
+            pytest.skip("flake8 not installed")
+        monkeypatch.chdir(tmp_path)
+        Path(".flake8").write_text("[flake8]\nper-file-ignores = tests/*:F401\n")
+        for directory in ("src", "tests"):
+            Path(directory).mkdir()
+            Path(directory, "x.py").write_text("import os\n")
+        files = [Path("src/x.py"), Path("tests/x.py")]
+
+        with patch(
+            "huskycat.unified_validation.ValidationEngine._initialize_validators",
+            return_value=[validator],
+        ):
+            engine = ValidationEngine(
+                use_cache=True, result_cache=ResultCache(tmp_path / "cache")
+            )
+        for _ in range(2):
+            results = engine.validate_files(files)
+            assert results["src/x.py"][0].success is False
+            assert results["tests/x.py"][0].success is True
+        assert engine.result_cache.hits == 2
+
+    def test_disabled_cache_always_runs(self, tmp_path):
+        with patch(
+            "huskycat.unified_validation.ValidationEngine._initialize_validators",
+            return_value=[CountingValidator()],
+        ):
+            engine = ValidationEngine(use_cache=False)
+        f = tmp_path / "a.py"
+        f.write_text("x = 1\n")
+
+        engine.validate_files([f])
+        engine.validate_files([f])
+        assert engine.result_cache is None
+        assert len(engine.validators[0].seen) == 2
+
+    def test_uncacheable_validator_always_runs(self, engine, tmp_path):
+        engine.validators[0].cacheable = False
+        f = tmp_path / "a.py"
+        f.write_text("x = 1\n")
+
+        engine.validate_files([f])
+        engine.validate_files([f])
+        assert len(engine.validators[0].seen) == 2
+
+    def test_feature_flag_disables_cache(self, monkeypatch):
+        monkeypatch.setenv("HUSKYCAT_FEATURE_CACHE_RESULTS", "false")
+        with patch(
+            "huskycat.unified_validation.ValidationEngine._initialize_validators",
+            return_value=[],
+        ):
+            assert ValidationEngine().result_cache is None
+
+
+class TestCleanCache:
+    def test_clean_cache_only_removes_results(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        ResultCache().put("34" * 32, ValidationResult("ruff", "a.py", True))
+        (tmp_path / "build").mkdir()
+
+        result = CleanCommand().execute(cache_only=True)
+
+        assert result.data["removed"] == 1
+        assert ResultCache().stats()["entries"] == 0
+        assert (tmp_path / "build").exists()
@@ -0,0 +1,63 @@
+"""Tests for incremental result output from the mode adapters."""
+
+import io
+import json
+
+from huskycat.core.adapters.base import JsonResultStream, ResultStream
+from huskycat.core.adapters.cli import CLIAdapter
+from huskycat.core.adapters.git_hooks import GitHooksAdapter
+from huskycat.core.adapters.pipeline import PipelineAdapter
+from huskycat.validators.base import ValidationResult
+
+RESULTS = {
+    "src/a.py": [
+        ValidationResult("ruff", "src/a.py", False, errors=["E501 line too long"]),
+        ValidationResult("mypy", "src/a.py", True, warnings=["note: untyped"]),
+    ],
+    "src/b.py": [ValidationResult("ruff", "src/b.py", True)],
+}
+SUMMARY = {"total_errors": 1, "total_warnings": 1, "files_checked": 2}
+
+
+def stream_all(stream):
+    for filepath, file_results in RESULTS.items():
+        stream.file(filepath, file_results)
+    stream.close(SUMMARY)
+
+
+class TestJsonResultStream:
+    def test_matches_format_output(self):
+        out = io.StringIO()
+        stream_all(JsonResultStream(out))
+        expected = PipelineAdapter().format_output(RESULTS, SUMMARY)
+        assert json.loads(out.getvalue()) == json.loads(expected)
+
+    def test_empty_run_is_valid_json(self):
+        out = io.StringIO()
+        JsonResultStream(out).close(SUMMARY)
+        assert json.loads(out.getvalue()) == {"results": {}, "summary": SUMMARY}
+
+    def test_files_are_written_as_they_finish(self):
+        out = io.StringIO()
+        stream = JsonResultStream(out)
+        stream.file("src/a.py", RESULTS["src/a.py"])
+        assert "E501 line too long" in out.getvalue()
+
+
+class TestAdapterStreams:
+    def test_pipeline_streams_json(self):
+        assert isinstance(PipelineAdapter().open_stream(io.StringIO()), ResultStream)
+
+    def test_cli_prints_only_files_with_issues(self):
+        out = io.StringIO()
+        stream = CLIAdapter().open_stream(out)
+        stream.color = False
+        stream_all(stream)
+        assert out.getvalue().splitlines() == [
+            "src/a.py",
+            "  ✗ [ruff] E501 line too long",
+            "  ⚠ [mypy] note: untyped",
+        ]
+
+    def test_git_hooks_do_not_stream(self):
+        assert GitHooksAdapter().open_stream(io.StringIO()) is None
@@ -0,0 +1,200 @@
+"""Tests for validating staged (index) content instead of the working tree."""
+
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Dict, Set
+from unittest.mock import patch
+
+import pytest
+
+from huskycat.core.result_cache import ResultCache
+from huskycat.core.staged_content import (
+    BlobReader,
+    StagedContent,
+    staged_files,
+)
+from huskycat.unified_validation import ValidationEngine
+from huskycat.validators import RuffValidator
+from huskycat.validators.base import ValidationResult, Validator
+
+
+def git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout
+
+
+class ContentValidator(Validator):
+    """Validator reading files from disk, recording what it saw"""
+
+    def __init__(self, auto_fix: bool = False):
+        super().__init__(auto_fix)
+        self.seen: Dict[str, str] = {}
+
+    @property
+    def name(self) -> str:
+        return "content"
+
+    @property
+    def extensions(self) -> Set[str]:
+        return {".py"}
+
+    def get_version(self):
+        return "content 1.0"
+
+    def validate(self, filepath: Path) -> ValidationResult:
+        text = filepath.read_text()
+        self.seen[str(filepath)] = text
+        bad = "bad" in text
+        return ValidationResult(
+            tool=self.name,
+            filepath=str(filepath),
+            success=not bad,
+            errors=[f"{filepath}:1: bad"] if bad else [],
+        )
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """Repository with src/app.py staged as 'bad', but fixed in the tree"""
+    root = tmp_path / "repo"
+    (root / "src").mkdir(parents=True)
+    git(root, "init", "-q")
+    git(root, "config", "user.email", "dev@example.com")
+    git(root, "config", "user.name", "dev")
+
+    (root / "src" / "app.py").write_text("x = 1\n")
+    (root / "gone.py").write_text("x = 1\n")
+    git(root, "add", ".")
+    git(root, "commit", "-qm", "initial")
+
+    (root / "src" / "app.py").write_text("bad = 1\n")
+    (root / "new.py").write_text("y = 2\n")
+    (root / "link.py").symlink_to("new.py")
+    git(root, "add", "src/app.py", "new.py", "link.py")
+    git(root, "rm", "-q", "gone.py")
+    (root / "src" / "app.py").write_text("x = 2\n")
+
+    monkeypatch.chdir(root)
+    return root
+
+
+class TestStagedFiles:
+    def test_lists_added_and_modified_regular_files(self, repo):
+        staged = {str(f.path): f for f in staged_files()}
+
+        assert sorted(staged) == ["new.py", str(Path("src/app.py"))]
+        app = staged[str(Path("src/app.py"))]
+        assert app.repo_path == "src/app.py"
+        assert app.blob == git(repo, "rev-parse", ":src/app.py").strip()
+        assert app.mode == "100644"
+
+    def test_paths_are_relative_to_cwd(self, repo):
+        staged = staged_files(repo / "src")
+        assert {str(f.path) for f in staged} == {
+            "app.py",
+            str(Path("..") / "new.py"),
+        }
+
+    def test_outside_repository(self, tmp_path):
+        assert staged_files(tmp_path) == []
+
+
+class TestBlobReader:
+    def test_reads_many_blobs_through_one_process(self, repo):
+        staged = {str(f.path): f for f in staged_files()}
+        with BlobReader() as reader:
+            assert reader.read(staged[str(Path("src/app.py"))].blob) == b"bad = 1\n"
+            process = reader._proc
+            assert reader.read(staged["new.py"].blob) == b"y = 2\n"
+            assert reader._proc is process
+        assert reader._proc is None
+
+    def test_missing_object(self, repo):
+        with BlobReader() as reader:
+            with pytest.raises(KeyError):
+                reader.read("0" * 40)
+
+
+class TestStagedContent:
+    def test_materialized_results_use_real_paths(self, repo):
+        validator = ContentValidator()
+        app = Path("src/app.py")
+
+        with StagedContent(staged_files()) as staged:
+            (result,) = staged.validate(validator, [app])
+            scratch = staged._scratch
+            assert scratch is not None
+
+        assert list(validator.seen.values()) == ["bad = 1\n"]
+        assert result.filepath == str(app)
+        assert result.errors == [f"{app}:1: bad"]
+        assert not scratch.exists()
+
+    def test_unstaged_files_are_read_from_disk(self, repo):
+        validator = ContentValidator()
+        other = repo / "other.py"
+        other.write_text("bad\n")
+
+        with StagedContent(staged_files()) as staged:
+            results = staged.validate(validator, [other, Path("new.py")])
+
+        assert [r.filepath for r in results] == [str(other), "new.py"]
+        assert [r.success for r in results] == [False, True]
+
+    @pytest.mark.skipif(shutil.which("ruff") is None, reason="ruff not installed")
+    def test_stdin_validators_receive_staged_content(self, repo):
+        (repo / "src" / "app.py").write_text("import os\n")
+        git(repo, "add", "src/app.py")
+        (repo / "src" / "app.py").write_text("x = 1\n")
+
+        validator = RuffValidator()
+        assert validator.can_validate_content()
+        with StagedContent(staged_files()) as staged:
+            (result,) = staged.validate(validator, [Path("src/app.py")])
+            assert staged._scratch is None
+
+        assert not result.success
+        assert any("imported but unused" in e for e in result.errors)
+
+    def test_fixers_need_files(self):
+        assert not RuffValidator(auto_fix=True).can_validate_content()
+        assert not ContentValidator().can_validate_content()
+
+
+class TestEngineStagedValidation:
+    @pytest.fixture
+    def engine(self, tmp_path):
+        with patch(
+            "huskycat.unified_validation.ValidationEngine._initialize_validators",
+            return_value=[ContentValidator()],
+        ):
+            return ValidationEngine(
+                use_cache=True, result_cache=ResultCache(tmp_path / "cache")
+            )
+
+    def test_validates_what_will_be_committed(self, repo, engine):
+        results = engine.validate_staged_files()
+
+        app = str(Path("src/app.py"))
+        assert sorted(results) == sorted([app, "new.py"])
+        assert not results[app][0].success
+        assert results[app][0].filepath == app
+
+    def test_blob_names_are_cache_keys(self, repo, engine):
+        engine.validate_staged_files()
+        with patch("huskycat.unified_validation.hash_file") as hash_file:
+            engine.validate_staged_files()
+        hash_file.assert_not_called()
+        assert engine.result_cache.hits == 2
+
+    def test_auto_fix_works_on_the_working_tree(self, repo, tmp_path):
+        with patch(
+            "huskycat.unified_validation.ValidationEngine._initialize_validators",
+            return_value=[ContentValidator(auto_fix=True)],
+        ):
+            engine = ValidationEngine(auto_fix=True, use_cache=False)
+        results = engine.validate_staged_files()
+
+        assert results[str(Path("src/app.py"))][0].success
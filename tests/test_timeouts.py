@@ -0,0 +1,98 @@
+"""Tests for per-tool timeouts learned from history."""
+
+from pathlib import Path
+
+import pytest
+
+from huskycat.core.cancellation import CancelToken, cancel_scope
+from huskycat.core.process_manager import ToolHistory
+from huskycat.core.timeouts import (
+    MAX_LEARNED_TIMEOUT,
+    MIN_LEARNED_TIMEOUT,
+    MIN_TIMEOUT_SAMPLES,
+    TimeoutPolicy,
+)
+from huskycat.unified_validation import ValidationEngine
+from huskycat.validators.ruff import RuffValidator
+
+
+def history_of(*samples):
+    history = ToolHistory()
+    for files, seconds in samples:
+        history.record(files, seconds, True)
+    return history
+
+
+class TestToolHistoryQuantile:
+    def test_scales_with_files(self):
+        # 1s fixed + 0.1s per file, one run 50% slower than predicted
+        history = history_of((10, 2.0), (20, 3.0), (30, 4.0), (40, 7.5))
+        fixed, per_file = history.costs()
+
+        p99 = history.quantile(0.99, 100)
+        assert p99 > fixed + per_file * 100
+        assert history.quantile(0.99, 200) > p99
+
+    def test_without_samples(self):
+        assert ToolHistory().quantile(0.99) is None
+
+
+class TestTimeoutPolicy:
+    def test_default_without_history(self):
+        policy = TimeoutPolicy()
+        assert policy.limit("ruff", 10, default=30) == 30
+
+        policy.use_history({"ruff": history_of((10, 1.0))})
+        assert policy.limit("ruff", 10, default=30) == 30  # too few runs
+
+    def test_learned_from_history(self):
+        history = history_of(*[(count, 0.5 * count) for count in range(10, 60, 10)])
+        assert len(history.samples) == MIN_TIMEOUT_SAMPLES
+        policy = TimeoutPolicy(history={"mypy": history})
+
+        assert policy.limit("mypy", 40) == pytest.approx(40.0)  # 2 x 20s
+        assert policy.limit("mypy", 200) == pytest.approx(200.0)
+
+    def test_learned_timeouts_are_bounded(self):
+        fast = history_of(*[(1, 0.1)] * MIN_TIMEOUT_SAMPLES)
+        slow = history_of(*[(1, 500.0)] * MIN_TIMEOUT_SAMPLES)
+        policy = TimeoutPolicy(history={"taplo": fast, "terraform": slow})
+
+        assert policy.limit("taplo") == MIN_LEARNED_TIMEOUT
+        assert policy.limit("terraform") == MAX_LEARNED_TIMEOUT
+
+    def test_override_wins(self):
+        history = history_of(*[(1, 20.0)] * MIN_TIMEOUT_SAMPLES)
+        policy = TimeoutPolicy(overrides={"mypy": 120}, history={"mypy": history})
+        assert policy.limit("mypy", 1000) == 120
+
+    def test_near_limit(self):
+        assert TimeoutPolicy.near_limit(24, 30)
+        assert not TimeoutPolicy.near_limit(10, 30)
+
+
+class TestValidatorTimeouts:
+    def test_stretched_to_executor_deadline(self):
+        validator = RuffValidator()
+        assert validator._timeout() == 30
+        assert validator._batch_timeout([Path("a.py"), Path("b.py")]) == 31
+
+        with cancel_scope(CancelToken(timeout=100)):
+            assert validator._timeout() > 90
+
+    def test_configured_timeouts(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".huskycat.yaml").write_text(
+            "tools:\n"
+            "  python:\n    tools: [ruff, black]\n    timeout: 90\n"
+            "  ruff:\n    timeout: 45\n"
+        )
+        engine = ValidationEngine(use_cache=False)
+        validators = {v.name: v for v in engine.validators}
+        if "ruff" not in validators:
+            pytest.skip("ruff not available")
+
+        assert engine.tool_timeouts()["ruff"] == 45
+        assert validators["ruff"].timeout == 45
+        if "black" in validators:
+            assert validators["black"].timeout == 90
@@ -0,0 +1,163 @@
+"""Tests for the tool availability and version cache."""
+
+import json
+import os
+from pathlib import Path
+from typing import Set
+from unittest.mock import patch
+
+import pytest
+
+from huskycat.commands.clean import CleanCommand
+from huskycat.core.tool_cache import ToolCache
+from huskycat.unified_validation import ValidationEngine
+from huskycat.validators.base import ValidationResult, Validator
+
+
+class ProbedValidator(Validator):
+    """Validator counting availability and version probes"""
+
+    def __init__(self, command: str = "probed-tool", available: bool = True):
+        super().__init__()
+        self._command = command
+        self.available = available
+        self.availability_probes = 0
+        self.version_probes = 0
+
+    @property
+    def name(self) -> str:
+        return "probed"
+
+    @property
+    def command(self) -> str:
+        return self._command
+
+    @property
+    def extensions(self) -> Set[str]:
+        return {".py"}
+
+    def is_available(self) -> bool:
+        self.availability_probes += 1
+        return self.available
+
+    def get_version(self):
+        if self._version is None:
+            self.version_probes += 1
+            self._version = "probed 1.0"
+        return self._version or None
+
+    def validate(self, filepath: Path) -> ValidationResult:
+        return ValidationResult(self.name, str(filepath), True)
+
+
+@pytest.fixture
+def tool_bin(tmp_path, monkeypatch):
+    """Directory on PATH holding an executable probed-tool"""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    tool = bin_dir / "probed-tool"
+    tool.write_text("#!/bin/sh\n")
+    tool.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    return tool
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    return tmp_path / "toolcache.json"
+
+
+class TestToolCache:
+    def test_probes_are_shared_across_processes(self, tool_bin, cache_file):
+        first = ProbedValidator()
+        cache = ToolCache(cache_file)
+        assert cache.is_available(first)
+        first.get_version()
+        cache.remember_versions([first])
+        cache.save()
+
+        # A fresh cache, as in a new process, needs no probes at all
+        second = ProbedValidator()
+        assert ToolCache(cache_file).is_available(second)
+        assert second.get_version() == "probed 1.0"
+        assert second.availability_probes == 0
+        assert second.version_probes == 0
+
+    def test_unavailable_tools_are_remembered(self, cache_file):
+        cache = ToolCache(cache_file)
+        missing = ProbedValidator("no-such-tool", available=False)
+        assert not cache.is_available(missing)
+        assert not cache.is_available(missing)
+        assert missing.availability_probes == 1
+
+    def test_changed_binary_is_probed_again(self, tool_bin, cache_file):
+        cache = ToolCache(cache_file)
+        cache.is_available(ProbedValidator())
+        cache.save()
+
+        tool_bin.write_text("#!/bin/sh\n# upgraded\n")
+        validator = ProbedValidator()
+        ToolCache(cache_file).is_available(validator)
+        assert validator.availability_probes == 1
+
+    def test_path_change_discards_entries(self, tool_bin, cache_file, monkeypatch):
+        cache = ToolCache(cache_file)
+        cache.is_available(ProbedValidator())
+
+        monkeypatch.setenv("PATH", os.environ["PATH"] + os.pathsep + "/opt/x")
+        validator = ProbedValidator()
+        cache.is_available(validator)
+        assert validator.availability_probes == 1
+
+    def test_entries_expire(self, tool_bin, cache_file):
+        cache = ToolCache(cache_file, ttl=0)
+        validator = ProbedValidator()
+        cache.is_available(validator)
+        cache.is_available(validator)
+        assert validator.availability_probes == 2
+
+    def test_invalidate(self, tool_bin, cache_file):
+        cache = ToolCache(cache_file)
+        cache.is_available(ProbedValidator())
+        cache.save()
+        assert cache_file.exists()
+
+        assert cache.invalidate()
+        assert not cache_file.exists()
+        validator = ProbedValidator()
+        cache.is_available(validator)
+        assert validator.availability_probes == 1
+
+    def test_corrupt_file_is_ignored(self, tool_bin, cache_file):
+        cache_file.write_text("{not json")
+        cache = ToolCache(cache_file)
+        assert cache.is_available(ProbedValidator())
+        cache.save()
+        assert json.loads(cache_file.read_text())["entries"]
+
+
+class TestEngineToolCache:
+    def test_engines_reuse_probes(self, cache_file):
+        cache = ToolCache(cache_file)
+        first = ValidationEngine(use_cache=False, tool_cache=cache)
+        probes = cache.misses
+
+        second = ValidationEngine(use_cache=False, tool_cache=cache)
+        assert cache.misses == probes
+        assert [v.name for v in second.validators] == [v.name for v in first.validators]
+        assert cache_file.exists()
+
+    def test_feature_flag_disables_cache(self, monkeypatch):
+        monkeypatch.setenv("HUSKYCAT_FEATURE_CACHE_TOOLS", "false")
+        assert ValidationEngine(use_cache=False).tool_cache is None
+
+    def test_clean_tools(self, tmp_path, monkeypatch, tool_bin):
+        cache = ToolCache(tmp_path / "toolcache.json")
+        cache.is_available(ProbedValidator())
+        cache.save()
+
+        with patch("huskycat.core.tool_cache.ToolCache.shared", return_value=cache):
+            result = CleanCommand().execute(tools_only=True)
+
+        assert result.data["removed"] is True
+        assert not cache.path.exists()
@@ -7,6 +7,7 @@ import pytest
 
 from huskycat.core.tool_selector import LintingMode
 from huskycat.unified_validation import ValidationEngine, ValidationResult
+from huskycat.validators.base import Validator
 
 
 class TestValidationEngineInit:
@@ -121,7 +122,239 @@ class TestLoadDockerLintValidator:
         # May or may not be available depending on environment
         assert result is not None or result is None
 
-    @patch("huskycat.unified_validation.ValidationEngine._load_dockerlint_validator", return_value=None)
+    @patch(
+        "huskycat.unified_validation.ValidationEngine._load_dockerlint_validator",
+        return_value=None,
+    )
     def test_load_failure(self, mock_load):
         engine = ValidationEngine()
         assert mock_load.return_value is None
+
+
+class _StubValidator:
+    """Minimal validator stand-in for scheduling tests."""
+
+    def __init__(self, name, auto_fix=False, batch_size=100, delay=0.0):
+        self.name = name
+        self.auto_fix = auto_fix
+        self.batch_size = batch_size
+        self.delay = delay
+        self.chunks = []
+
+    def validate_batch(self, files):
+        import threading
+        import time
+
+        time.sleep(self.delay)
+        self.chunks.append((list(files), threading.current_thread().name))
+        return [ValidationResult(self.name, str(f), True) for f in files]
+
+
+class TestConcurrentExecution:
+    """Test the engine's work pool."""
+
+    def test_max_workers_argument(self):
+        assert ValidationEngine(max_workers=3).max_workers == 3
+
+    def test_parallel_flag_disables_pool(self, monkeypatch):
+        monkeypatch.setenv("HUSKYCAT_FEATURE_PARALLEL_EXECUTION", "false")
+        assert ValidationEngine().max_workers == 1
+
+    def test_checkers_share_one_stage(self):
+        engine = ValidationEngine(max_workers=2)
+        checkers = [_StubValidator("flake8"), _StubValidator("mypy")]
+        assert engine._execution_stages(checkers) == [checkers]
+
+    def test_fixers_run_alone_in_dependency_order(self):
+        engine = ValidationEngine(max_workers=2)
+        flake8 = _StubValidator("flake8", auto_fix=True)
+        black = _StubValidator("python-black", auto_fix=True)
+        mypy = _StubValidator("mypy")
+        stages = engine._execution_stages([flake8, mypy, black])
+        assert stages == [[black], [flake8], [mypy]]
+
+    def test_split_work_fills_workers(self):
+        engine = ValidationEngine(max_workers=4)
+        files = [Path(f"f{i}.py") for i in range(10)]
+        chunks = engine._split_work(_StubValidator("ruff", batch_size=100), files)
+        assert [len(c) for c in chunks] == [3, 3, 3, 1]
+        chunks = engine._split_work(_StubValidator("ruff", batch_size=2), files)
+        assert all(len(c) == 2 for c in chunks)
+
+    def test_results_are_deterministic(self, tmp_path):
+        engine = ValidationEngine(max_workers=4, use_cache=False)
+        slow = _StubValidator("slow", delay=0.05)
+        fast = _StubValidator("fast")
+        files = [tmp_path / f"f{i}.py" for i in range(8)]
+
+        with patch.object(
+            engine, "_select_validators", return_value=([slow, fast], [])
+        ):
+            results = engine.validate_files(files)
+
+        assert list(results) == [str(f) for f in files]
+        assert all(
+            [r.tool for r in res] == ["slow", "fast"] for res in results.values()
+        )
+        # Work was split into chunks that ran on pool threads
+        assert len(slow.chunks) > 1
+        assert all(name != "MainThread" for _, name in slow.chunks)
+
+
+class TestStreamingResults:
+    """Test the iter_validate() and iter_file_results() generators."""
+
+    def test_fast_results_arrive_before_slow_ones(self, tmp_path):
+        engine = ValidationEngine(max_workers=2, use_cache=False)
+        slow = _StubValidator("slow", delay=0.2)
+        fast = _StubValidator("fast")
+        files = [tmp_path / "a.py"]
+
+        with patch.object(
+            engine, "_select_validators", return_value=([slow, fast], [])
+        ):
+            tools = [r.tool for r in engine.iter_validate(files)]
+
+        assert tools == ["fast", "slow"]
+
+    def test_file_results_keep_validator_order(self, tmp_path):
+        engine = ValidationEngine(max_workers=2, use_cache=False)
+        slow = _StubValidator("slow", delay=0.1)
+        fast = _StubValidator("fast")
+        files = [tmp_path / "a.py", tmp_path / "b.py"]
+
+        with patch.object(
+            engine, "_select_validators", return_value=([slow, fast], [])
+        ):
+            streamed = list(engine.iter_file_results(files))
+
+        assert sorted(key for key, _ in streamed) == [str(f) for f in files]
+        assert all([r.tool for r in res] == ["slow", "fast"] for _, res in streamed)
+
+    def test_directories_are_walked(self, tmp_path):
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "a.py").write_text("x = 1\n")
+        (tmp_path / "b.py").write_text("y = 2\n")
+        engine = ValidationEngine(max_workers=1, use_cache=False)
+        stub = _StubValidator("stub")
+
+        with patch.object(engine, "_select_validators", return_value=([stub], [])):
+            paths = {r.filepath for r in engine.iter_validate([tmp_path / "pkg"])}
+
+        assert paths == {str(tmp_path / "pkg" / "a.py")}
+
+    def test_abandoned_stream_stops_pending_work(self, tmp_path):
+        engine = ValidationEngine(max_workers=2, use_cache=False)
+        stub = _StubValidator("stub", batch_size=1, delay=0.05)
+        files = [tmp_path / f"f{i}.py" for i in range(20)]
+
+        with patch.object(engine, "_select_validators", return_value=([stub], [])):
+            stream = engine.iter_validate(files)
+            next(stream)
+            stream.close()
+
+        assert len(stub.chunks) < len(files)
+
+    def test_summary_can_be_built_incrementally(self):
+        engine = ValidationEngine(use_cache=False)
+        results = {
+            "a.py": [ValidationResult("ruff", "a.py", False, errors=["E1"])],
+            "b.py": [ValidationResult("black", "b.py", True, fixed=True)],
+        }
+        summary = engine.empty_summary()
+        for filepath, file_results in results.items():
+            engine.add_to_summary(summary, filepath, file_results)
+
+        assert summary == engine.get_summary(results)
+        assert summary["failed_file_list"] == ["a.py"]
+        assert summary["passed_files"] == 1
+
+
+class _RecordingValidator(Validator):
+    """Validator flagging files containing a marker; fixers remove it."""
+
+    def __init__(self, name, marker, auto_fix=False):
+        super().__init__(auto_fix)
+        self._name = name
+        self.marker = marker
+        self.calls = []
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def extensions(self):
+        return {".py"}
+
+    def validate(self, filepath):
+        self.calls.append((filepath.name, self.auto_fix))
+        text = filepath.read_text()
+        if self.marker not in text:
+            return ValidationResult(self.name, str(filepath), True)
+        if self.auto_fix:
+            filepath.write_text(text.replace(self.marker, ""))
+            return ValidationResult(self.name, str(filepath), True, fixed=True)
+        return ValidationResult(self.name, str(filepath), False, errors=["E1"])
+
+
+class TestApplyFixes:
+    """Test the fix pass after an accepted interactive auto-fix prompt."""
+
+    @pytest.fixture
+    def engine(self):
+        validators = [
+            _RecordingValidator("isort", "UNSORTED"),
+            _RecordingValidator("python-black", "UGLY"),
+            _RecordingValidator("mypy", "TYPO"),
+        ]
+        with patch.object(
+            ValidationEngine, "_initialize_validators", return_value=validators
+        ):
+            return ValidationEngine(use_cache=False, max_workers=1)
+
+    def test_fix_pass_is_targeted(self, engine, tmp_path):
+        fixable = tmp_path / "a.py"
+        clean = tmp_path / "b.py"
+        typo = tmp_path / "c.py"
+        fixable.write_text("UNSORTED\n")
+        clean.write_text("x = 1\n")
+        typo.write_text("TYPO\n")
+        results = engine.validate_files([fixable, clean, typo])
+        isort, black, mypy = engine.validators
+        for validator in engine.validators:
+            validator.calls.clear()
+
+        with patch.object(ValidationEngine, "_initialize_validators") as init:
+            fixed = engine._apply_fixes(results)
+        init.assert_not_called()
+
+        # Only the failing fixer ran in fix mode, and only the changed file
+        # was checked again by everything else
+        assert isort.calls == [("a.py", True)]
+        assert black.calls == [("a.py", False)]
+        assert mypy.calls == [("a.py", False)]
+        assert not isort.auto_fix
+
+        assert [r.tool for r in fixed[str(fixable)]] == [
+            "isort",
+            "python-black",
+            "mypy",
+        ]
+        assert fixed[str(fixable)][0].fixed
+        assert fixed[str(clean)] == results[str(clean)]
+        assert fixed[str(typo)] == results[str(typo)]
+        assert not fixed[str(typo)][2].success
+
+    def test_nothing_fixable(self, engine, tmp_path):
+        typo = tmp_path / "c.py"
+        typo.write_text("TYPO\n")
+        results = engine.validate_files([typo])
+
+        assert engine._count_fixable_issues(results) == 0
+        assert engine._apply_fixes(results) is results
+
+    def test_counts_black_failures(self, engine, tmp_path):
+        ugly = tmp_path / "a.py"
+        ugly.write_text("UGLY\n")
+        assert engine._count_fixable_issues(engine.validate_files([ugly])) == 1
@@ -0,0 +1,403 @@
+"""Tests for Validator.validate_batch() and the per-tool batch splitters.
+
+Each batched validator runs its tool once per chunk of files; these tests
+mock _execute_command and check that the combined output is attributed
+back to the right file.
+"""
+
+import json
+from pathlib import Path
+from typing import List, Set
+from unittest.mock import MagicMock, patch
+
+from huskycat.core.gpl_client import GPLSidecarError, GPLToolResult
+from huskycat.unified_validation import ValidationEngine
+from huskycat.validators.bandit import BanditValidator
+from huskycat.validators.base import (
+    BatchOutputError,
+    FileIndex,
+    ValidationResult,
+    Validator,
+)
+from huskycat.validators.black import BlackValidator
+from huskycat.validators.eslint import ESLintValidator
+from huskycat.validators.flake8 import Flake8Validator
+from huskycat.validators.hadolint import HadolintValidator
+from huskycat.validators.isort import IsortValidator
+from huskycat.validators.mypy import MypyValidator
+from huskycat.validators.ruff import RuffValidator
+from huskycat.validators.shellcheck import ShellcheckValidator
+from huskycat.validators.yamllint import YamlLintValidator
+
+FILES = [Path("pkg/a.py"), Path("pkg/b.py"), Path("c.py")]
+
+
+class RecordingValidator(Validator):
+    """Validator that records every validate() call"""
+
+    def __init__(self, auto_fix: bool = False):
+        super().__init__(auto_fix)
+        self.calls: List[Path] = []
+
+    @property
+    def name(self) -> str:
+        return "recording"
+
+    @property
+    def extensions(self) -> Set[str]:
+        return {".py"}
+
+    def validate(self, filepath: Path) -> ValidationResult:
+        self.calls.append(filepath)
+        return ValidationResult(tool=self.name, filepath=str(filepath), success=True)
+
+
+class TestFileIndex:
+    def test_relative_and_absolute_paths_match(self):
+        index = FileIndex(FILES)
+        assert index.lookup("pkg/a.py") == Path("pkg/a.py")
+        assert index.lookup(str(Path("pkg/a.py").resolve())) == Path("pkg/a.py")
+        assert index.lookup("./c.py") == Path("c.py")
+
+    def test_unknown_path(self):
+        assert FileIndex(FILES).lookup("other.py") is None
+        assert FileIndex(FILES).lookup("") is None
+
+
+class TestDefaultBatch:
+    def test_falls_back_to_validate_in_order(self):
+        v = RecordingValidator()
+        results = v.validate_batch(FILES)
+        assert v.calls == FILES
+        assert [r.filepath for r in results] == [str(f) for f in FILES]
+
+    def test_single_file_chunk_uses_validate(self):
+        v = RuffValidator()
+        with patch.object(RuffValidator, "validate") as mock_validate:
+            mock_validate.return_value = ValidationResult("ruff", "c.py", True)
+            v.validate_batch([Path("c.py")])
+        mock_validate.assert_called_once_with(Path("c.py"))
+
+    def test_chunks_by_batch_size(self):
+        v = RuffValidator()
+        v.batch_size = 2
+        with patch.object(RuffValidator, "_execute_command") as mock_exec:
+            mock_exec.return_value = MagicMock(returncode=0, stdout="[]")
+            results = v.validate_batch(FILES + [Path("d.py")])
+        assert mock_exec.call_count == 2
+        assert len(results) == 4
+
+    def test_batch_output_error_falls_back_per_file(self):
+        v = RuffValidator()
+        with patch.object(RuffValidator, "_validate_chunk") as mock_chunk, patch.object(
+            RuffValidator, "validate"
+        ) as mock_validate:
+            mock_chunk.side_effect = BatchOutputError("garbled")
+            mock_validate.side_effect = lambda f: ValidationResult("ruff", str(f), True)
+            results = v.validate_batch(FILES)
+        assert mock_validate.call_count == len(FILES)
+        assert all(r.success for r in results)
+
+
+class TestRuffBatch:
+    @patch.object(RuffValidator, "_execute_command")
+    def test_splits_json_by_filename(self, mock_exec):
+        report = [
+            {
+                "filename": str(Path("pkg/b.py").resolve()),
+                "location": {"row": 3},
+                "message": "unused import",
+            }
+        ]
+        mock_exec.return_value = MagicMock(returncode=1, stdout=json.dumps(report))
+        results = RuffValidator().validate_batch(FILES)
+
+        assert mock_exec.call_count == 1
+        assert [r.success for r in results] == [True, False, True]
+        assert results[1].errors == ["Line 3: unused import"]
+
+    @patch.object(RuffValidator, "_execute_command")
+    def test_exception_marks_every_file(self, mock_exec):
+        mock_exec.side_effect = RuntimeError("boom")
+        results = RuffValidator().validate_batch(FILES)
+        assert all(not r.success and r.errors == ["boom"] for r in results)
+
+
+class TestMypyBatch:
+    @patch.object(MypyValidator, "_execute_command")
+    def test_attributes_lines_and_ignores_other_modules(self, mock_exec):
+        stdout = "\n".join(
+            [
+                "pkg/a.py:2: error: Incompatible return value",
+                "pkg/a.py:2: note: See docs",
+                "vendored/lib.py:9: error: Not in this batch",
+            ]
+        )
+        mock_exec.return_value = MagicMock(returncode=1, stdout=stdout)
+        results = MypyValidator().validate_batch(FILES)
+
+        assert results[0].success is False
+        assert len(results[0].errors) == 1
+        assert len(results[0].warnings) == 1
+        assert results[1].success is True
+        assert results[2].success is True
+
+    @patch.object(MypyValidator, "validate")
+    @patch.object(MypyValidator, "_execute_command")
+    def test_fatal_exit_falls_back(self, mock_exec, mock_validate):
+        mock_exec.return_value = MagicMock(returncode=2, stdout="Duplicate module")
+        mock_validate.side_effect = lambda f: ValidationResult("mypy", str(f), True)
+        results = MypyValidator().validate_batch(FILES)
+        assert mock_validate.call_count == len(FILES)
+        assert len(results) == len(FILES)
+
+
+class TestFlake8Batch:
+    @patch.object(Flake8Validator, "_execute_command")
+    def test_splits_default_format(self, mock_exec):
+        mock_exec.return_value = MagicMock(
+            returncode=1, stdout="c.py:1:1: F401 'os' imported but unused\n"
+        )
+        results = Flake8Validator().validate_batch(FILES)
+        assert [r.success for r in results] == [True, True, False]
+        assert "F401" in results[2].errors[0]
+
+    @patch.object(Flake8Validator, "validate")
+    @patch.object(Flake8Validator, "_execute_command")
+    def test_unattributable_line_falls_back(self, mock_exec, mock_validate):
+        mock_exec.return_value = MagicMock(
+            returncode=1,
+            stdout=(
+                "c.py:1:1: F401 'os' imported but unused\n"
+                "other.py:2:1: E999 SyntaxError: invalid syntax\n"
+            ),
+        )
+        mock_validate.side_effect = lambda f: ValidationResult(
+            tool="flake8", filepath=str(f), success=False
+        )
+        results = Flake8Validator().validate_batch(FILES)
+        assert mock_validate.call_count == len(FILES)
+        assert [r.success for r in results] == [False, False, False]
+
+
+class TestBanditBatch:
+    @patch.object(BanditValidator, "_execute_command")
+    def test_splits_results_by_filename(self, mock_exec):
+        data = {
+            "results": [
+                {
+                    "filename": "./pkg/a.py",
+                    "line_number": 2,
+                    "test_name": "subprocess_popen_with_shell_equals_true",
+                    "issue_text": "shell=True",
+                    "issue_severity": "HIGH",
+                }
+            ]
+        }
+        mock_exec.return_value = MagicMock(returncode=1, stdout=json.dumps(data))
+        results = BanditValidator().validate_batch(FILES)
+        assert results[0].success is False
+        assert len(results[0].errors) == 1
+        assert results[1].success is True
+
+
+class TestESLintBatch:
+    @patch.object(ESLintValidator, "_execute_command")
+    def test_splits_by_file_path(self, mock_exec):
+        files = [Path("a.js"), Path("b.js")]
+        data = [
+            {"filePath": str(Path("a.js").resolve()), "messages": []},
+            {
+                "filePath": str(Path("b.js").resolve()),
+                "messages": [{"severity": 2, "message": "no-undef"}],
+            },
+        ]
+        mock_exec.return_value = MagicMock(returncode=1, stdout=json.dumps(data))
+        results = ESLintValidator().validate_batch(files)
+        assert results[0].success is True
+        assert results[1].errors == ["no-undef"]
+
+
+class TestShellcheckBatch:
+    @patch.object(ShellcheckValidator, "_execute_command")
+    def test_uses_json1_and_splits_comments(self, mock_exec):
+        files = [Path("a.sh"), Path("b.sh")]
+        data = {
+            "comments": [
+                {"file": "b.sh", "line": 4, "level": "error", "message": "bad"},
+                {"file": "b.sh", "line": 5, "level": "warning", "message": "meh"},
+            ]
+        }
+        mock_exec.return_value = MagicMock(returncode=1, stdout=json.dumps(data))
+        results = ShellcheckValidator().validate_batch(files)
+
+        assert "json1" in mock_exec.call_args[0][0]
+        assert results[0].success is True
+        assert results[1].errors == ["Line 4: bad"]
+        assert results[1].warnings == ["Line 5: meh"]
+
+
+def split_result(tool: str, exit_code: int, stdout: str = "") -> GPLToolResult:
+    return GPLToolResult(
+        tool=tool,
+        exit_code=exit_code,
+        stdout=stdout,
+        stderr="",
+        success=exit_code == 0,
+        duration_ms=1.0,
+    )
+
+
+class TestSidecarBatch:
+    """Chunks of GPL tools run once in the sidecar via execute_many"""
+
+    def test_hadolint_results_per_file(self):
+        files = [Path("Dockerfile"), Path("api/Dockerfile")]
+        sidecar = MagicMock()
+        sidecar.execute_many.return_value = {
+            "Dockerfile": split_result("hadolint", 0),
+            "api/Dockerfile": split_result(
+                "hadolint", 1, "api/Dockerfile:3 DL3008 warning: Pin versions\n"
+            ),
+        }
+        validator = HadolintValidator()
+        with patch.object(validator, "_batch_sidecar", return_value=sidecar):
+            results = validator.validate_batch(files)
+
+        assert sidecar.execute_many.call_count == 1
+        assert sidecar.execute_many.call_args[0] == (
+            "hadolint",
+            ["Dockerfile", "api/Dockerfile"],
+        )
+        assert results[0].success is True
+        assert results[1].warnings == ["api/Dockerfile:3 DL3008 warning: Pin versions"]
+
+    def test_yamllint_errors_and_warnings(self):
+        files = [Path("a.yaml"), Path("b.yaml")]
+        sidecar = MagicMock()
+        sidecar.execute_many.return_value = {
+            "a.yaml": split_result(
+                "yamllint", 1, "a.yaml:1:1: [error] syntax error (syntax)\n"
+            ),
+            "b.yaml": split_result("yamllint", 0, "b.yaml:2:3: [warning] long line\n"),
+        }
+        validator = YamlLintValidator()
+        with patch.object(validator, "_batch_sidecar", return_value=sidecar):
+            results = validator.validate_batch(files)
+
+        assert results[0].errors == ["a.yaml:1:1: [error] syntax error (syntax)"]
+        assert results[1].success is True
+
+    def test_split_failure_falls_back_per_file(self):
+        files = [Path("a.sh"), Path("b.sh")]
+        sidecar = MagicMock()
+        sidecar.execute_many.side_effect = GPLSidecarError("Cannot split output")
+        validator = ShellcheckValidator()
+        with patch.object(
+            validator, "_batch_sidecar", return_value=sidecar
+        ), patch.object(ShellcheckValidator, "validate") as mock_validate:
+            validator.validate_batch(files)
+
+        assert [c[0][0] for c in mock_validate.call_args_list] == files
+
+    def test_fixers_do_not_use_sidecar_batches(self):
+        with patch(
+            "huskycat.validators._utils.get_gpl_sidecar", return_value=MagicMock()
+        ):
+            assert YamlLintValidator(auto_fix=True)._batch_sidecar() is None
+            assert YamlLintValidator()._batch_sidecar() is not None
+            assert RuffValidator()._batch_sidecar() is None
+
+
+class TestBlackBatch:
+    @patch.object(BlackValidator, "_execute_command")
+    def test_would_reformat_lines(self, mock_exec):
+        mock_exec.return_value = MagicMock(
+            returncode=1,
+            stderr="would reformat pkg/b.py\n\nOh no!\n1 file would be reformatted",
+        )
+        results = BlackValidator().validate_batch(FILES)
+        assert [r.success for r in results] == [True, False, True]
+
+
+class TestIsortBatch:
+    def test_fix_runs_once_for_chunk(self, tmp_path):
+        files = [tmp_path / "a.py", tmp_path / "b.py"]
+        files[0].write_text("import os\n")
+        files[1].write_text("import sys\nimport os\n")
+
+        def sort(cmd, **kwargs):
+            files[1].write_text("import os\nimport sys\n")
+            return MagicMock(returncode=0, stderr="")
+
+        with patch.object(
+            IsortValidator, "_execute_command", side_effect=sort
+        ) as mock_exec:
+            results = IsortValidator(auto_fix=True).validate_batch(files)
+
+        assert mock_exec.call_count == 1
+        assert mock_exec.call_args_list[0][0][0][1:] == [str(f) for f in files]
+        assert [r.fixed for r in results] == [False, True]
+        assert all(r.success for r in results)
+
+    @patch.object(IsortValidator, "_execute_command")
+    def test_fix_failure_retries_unchanged_files(self, mock_exec):
+        mock_exec.return_value = MagicMock(returncode=1, stderr="error")
+        results = IsortValidator(auto_fix=True).validate_batch(FILES)
+
+        assert mock_exec.call_count == 1 + len(FILES)
+        assert not any(r.success for r in results)
+
+
+class TestEngineValidateFiles:
+    @patch(
+        "huskycat.unified_validation.ValidationEngine._load_dockerlint_validator",
+        return_value=None,
+    )
+    def test_one_batch_per_validator(self, _mock_loader):
+        engine = ValidationEngine()
+        recorder = RecordingValidator()
+        engine.validators = [recorder]
+
+        with patch.object(
+            RecordingValidator, "validate_batch", wraps=recorder.validate_batch
+        ) as mock_batch:
+            results = engine.validate_files(FILES + [Path("notes.txt")])
+
+        mock_batch.assert_called_once()
+        assert list(results) == [str(f) for f in FILES]
+        assert all(r[0].tool == "recording" for r in results.values())
+
+
+class TestSidecarContents:
+    """Staged contents of GPL tools go to the sidecar on stdin"""
+
+    def test_one_batch_request_per_chunk(self):
+        files = [Path("a.yaml"), Path("b.yaml")]
+        sidecar = MagicMock()
+        sidecar.execute_batch.return_value = [
+            split_result("yamllint", 1, "stdin:1:1: [error] syntax error (syntax)\n"),
+            split_result("yamllint", 0),
+        ]
+        validator = YamlLintValidator()
+        with patch.object(validator, "_gpl_sidecar", return_value=sidecar):
+            results = validator.validate_contents(files, [b"[\n", b"a: 1\n"])
+
+        (calls,), _ = sidecar.execute_batch.call_args
+        assert calls == [
+            ("yamllint", ["-f", "parsable", "-"], b"[\n"),
+            ("yamllint", ["-f", "parsable", "-"], b"a: 1\n"),
+        ]
+        assert [r.filepath for r in results] == ["a.yaml", "b.yaml"]
+        assert results[0].errors == ["stdin:1:1: [error] syntax error (syntax)"]
+        assert results[1].success is True
+
+    def test_sidecar_without_stdin_support(self):
+        sidecar = MagicMock()
+        validator = HadolintValidator()
+        with patch.object(validator, "_gpl_sidecar", return_value=sidecar):
+            sidecar.supports.return_value = False
+            assert not validator.can_validate_content()
+            sidecar.supports.return_value = True
+            assert validator.can_validate_content()
+        sidecar.supports.assert_called_with("stdin")
@@ -45,25 +45,37 @@ class TestIsortValidate:
         assert result.success is False
         assert "not properly sorted" in result.errors[0].lower()
 
-    @patch.object(IsortValidator, "_execute_command")
-    def test_failure_with_fix_success(self, mock_exec):
-        # First call (check) fails, second call (fix) succeeds
-        mock_exec.side_effect = [
-            MagicMock(returncode=1, stdout="diff"),
-            MagicMock(returncode=0),
-        ]
-        result = IsortValidator(auto_fix=True).validate(FP)
+    def test_fix_runs_once(self, tmp_path):
+        # One write-mode run; the content change marks the file as fixed
+        path = tmp_path / "test.py"
+        path.write_text("import sys\nimport os\n")
+
+        def sort(cmd, **kwargs):
+            path.write_text("import os\nimport sys\n")
+            return MagicMock(returncode=0, stderr="")
+
+        with patch.object(IsortValidator, "_execute_command", side_effect=sort) as mock_exec:
+            result = IsortValidator(auto_fix=True).validate(path)
+        assert mock_exec.call_count == 1
+        assert "--check-only" not in mock_exec.call_args[0][0]
         assert result.success is True
         assert result.fixed is True
 
+    @patch.object(IsortValidator, "_execute_command")
+    def test_fix_unchanged_file(self, mock_exec, tmp_path):
+        path = tmp_path / "test.py"
+        path.write_text("import os\n")
+        mock_exec.return_value = MagicMock(returncode=0, stderr="")
+        result = IsortValidator(auto_fix=True).validate(path)
+        assert result.success is True
+        assert result.fixed is False
+
     @patch.object(IsortValidator, "_execute_command")
     def test_failure_with_fix_failure(self, mock_exec):
-        mock_exec.side_effect = [
-            MagicMock(returncode=1, stdout=""),
-            MagicMock(returncode=1, stderr="error"),
-        ]
+        mock_exec.return_value = MagicMock(returncode=1, stderr="error")
         result = IsortValidator(auto_fix=True).validate(FP)
         assert result.success is False
+        assert result.messages == ["error"]
 
     @patch.object(IsortValidator, "_execute_command", side_effect=Exception("err"))
     def test_exception(self, mock_exec):
@@ -403,6 +415,24 @@ class TestAnsibleLintValidate:
         result = AnsibleLintValidator().validate(Path("/tmp/playbook.yml"))
         assert result.success is False
 
+    def test_fix_runs_once(self, tmp_path):
+        path = tmp_path / "playbook.yml"
+        path.write_text("- hosts: all\n")
+
+        def fix(cmd, **kwargs):
+            path.write_text("---\n- hosts: all\n")
+            return MagicMock(
+                returncode=2, stdout="", stderr="playbook.yml:2: name[play] unnamed"
+            )
+
+        with patch.object(AnsibleLintValidator, "_execute_command", side_effect=fix) as mock_exec:
+            result = AnsibleLintValidator(auto_fix=True).validate(path)
+        assert mock_exec.call_count == 1
+        assert "--fix" in mock_exec.call_args[0][0]
+        assert result.success is False
+        assert result.fixed is True
+        assert result.errors == ["playbook.yml:2: name[play] unnamed"]
+
     @patch.object(AnsibleLintValidator, "_execute_command", side_effect=Exception("err"))
     def test_exception(self, mock_exec):
         result = AnsibleLintValidator().validate(Path("/tmp/playbook.yml"))